@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark de bcrypt por factor de trabajo.
+
+Mide cuántos hashes por segundo hace un núcleo en cada coste y estima la
+capacidad de login del pool de hashing (procesos x hashes/s), para dimensionar
+PASSWORD_HASH_WORKERS y elegir PASSWORD_HASH_ROUNDS / PASSWORD_HASH_TARGET_MS.
+
+Uso:
+    python benchmarks/bench_bcrypt_costs.py
+    python benchmarks/bench_bcrypt_costs.py --min 10 --max 14 --samples 5 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.modules.User.domain.services.password_service import PasswordService  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Hashes/s de bcrypt por factor de trabajo")
+    parser.add_argument("--min", type=int, default=PasswordService.MIN_ROUNDS, help="Coste mínimo a medir")
+    parser.add_argument("--max", type=int, default=13, help="Coste máximo a medir")
+    parser.add_argument("--samples", type=int, default=3, help="Hashes medidos por coste")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Procesos del pool de hashing")
+    parser.add_argument("--target-ms", type=float, default=100, help="Objetivo para la calibración")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    print(f"{'coste':>6} {'ms/hash':>9} {'hashes/s':>9} {f'logins/s ({args.workers} proc)':>22}")
+    for rounds in range(args.min, args.max + 1):
+        started = time.perf_counter()
+        for _ in range(args.samples):
+            PasswordService.hash_password("Benchmark123!", rounds=rounds)
+        per_hash = (time.perf_counter() - started) / args.samples
+        print(f"{rounds:>6} {per_hash * 1000:>9.1f} {1 / per_hash:>9.2f} {args.workers / per_hash:>22.1f}")
+
+    calibrated = PasswordService.calibrate_rounds(args.target_ms)
+    print(f"\n✅ Coste calibrado para {args.target_ms:.0f} ms en esta máquina: {calibrated}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark de viajes a la base de datos en OrderRepository.get_all.
+
+Crea pedidos en una base SQLite temporal y mide cuántas consultas hace
+get_all() según crece el número de pedidos. Con la carga agrupada de items el
+número de viajes debe mantenerse constante (2 hasta 999 pedidos).
+
+Uso:
+    python benchmarks/bench_order_round_trips.py
+"""
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+_tmp_dir = tempfile.TemporaryDirectory()
+os.environ["TURSO_DATABASE_URL"] = f"file:{Path(_tmp_dir.name) / 'bench_orders.db'}"
+os.environ.setdefault("ENVIRONMENT", "development")
+
+from src.modules.Order.domain.entities.order import Order, OrderStatus, ServiceType  # noqa: E402
+from src.modules.Order.domain.entities.order_item import OrderItem  # noqa: E402
+from src.modules.Order.infrastructure.repositories.order_repository import OrderRepository  # noqa: E402
+from src.shared.infrastructure.database.migrations.migration_runner import run_migrations  # noqa: E402
+from src.shared.infrastructure.database.turso_connection import turso_db  # noqa: E402
+
+ORDER_COUNTS = (10, 100, 500)
+ITEMS_PER_ORDER = 4
+
+
+class CountingClient:
+    """Envoltorio del cliente que cuenta viajes a la base de datos."""
+
+    def __init__(self, client):
+        self.client = client
+        self.round_trips = 0
+
+    def execute(self, query, params=None):
+        self.round_trips += 1
+        return self.client.execute(query, params)
+
+    def batch(self, statements):
+        self.round_trips += 1
+        return self.client.batch(statements)
+
+
+def _build_order(waiter_id: str) -> Order:
+    order_id = str(uuid.uuid4())
+    items = [
+        OrderItem(
+            id=str(uuid.uuid4()),
+            order_id=order_id,
+            menu_item_id=f"menu-{index}",
+            menu_item_name=f"Plato {index}",
+            quantity=1,
+            unit_price=9.5,
+            subtotal=9.5,
+        )
+        for index in range(ITEMS_PER_ORDER)
+    ]
+    return Order(
+        id=order_id,
+        order_number=f"ORD-BENCH-{uuid.uuid4().hex[:12].upper()}",
+        customer_name="Cliente Benchmark",
+        table_number=1,
+        status=OrderStatus.PENDING,
+        service_type=ServiceType.DINE_IN,
+        waiter_id=waiter_id,
+        items=items,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+def main() -> None:
+    run_migrations(turso_db)
+    repo = OrderRepository()
+    counting = CountingClient(repo.db)
+
+    print(f"{'pedidos':>8} {'viajes':>7} {'ms':>9}")
+    round_trips = []
+    for order_count in ORDER_COUNTS:
+        waiter_id = f"waiter-bench-{order_count}"
+        repo.db = turso_db
+        repo.create_many([_build_order(waiter_id) for _ in range(order_count)])
+
+        repo.db = counting
+        counting.round_trips = 0
+        started = time.perf_counter()
+        orders = repo.get_all(waiter_id=waiter_id)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        assert len(orders) == order_count
+        assert all(len(order.items) == ITEMS_PER_ORDER for order in orders)
+        round_trips.append(counting.round_trips)
+        print(f"{order_count:>8} {counting.round_trips:>7} {elapsed_ms:>9.1f}")
+
+    turso_db.close()
+    assert len(set(round_trips)) == 1, f"El número de viajes crece con los pedidos: {round_trips}"
+    print(f"\n✅ Viajes constantes ({round_trips[0]}) independientemente del número de pedidos")
+
+
+if __name__ == "__main__":
+    main()
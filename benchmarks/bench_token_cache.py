@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark de get_current_user con y sin la caché de JWT verificados.
+
+Resuelve la dependencia muchas veces con el mismo token: sin caché cada
+llamada verifica la firma HMAC y decodifica el token; con caché solo se
+calcula el sha256 del token y se consulta la LRU.
+
+Uso:
+    python benchmarks/bench_token_cache.py [iteraciones]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+_tmp_dir = tempfile.TemporaryDirectory()
+os.environ["TURSO_DATABASE_URL"] = f"file:{Path(_tmp_dir.name) / 'bench_tokens.db'}"
+os.environ.setdefault("ENVIRONMENT", "development")
+
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+
+from src.modules.User.infrastructure.api.auth_router import auth_service, get_current_user, token_cache  # noqa: E402
+
+
+def _run(credentials: HTTPAuthorizationCredentials, iterations: int, cached: bool) -> float:
+    token_cache.clear()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if not cached:
+            token_cache.clear()
+        get_current_user(credentials)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    token = auth_service.generate_token("user-bench", "bench@kitchai.com", "uuid-role-waiter")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    uncached_us = _run(credentials, iterations, cached=False)
+    cached_us = _run(credentials, iterations, cached=True)
+
+    print(f"{'modo':>10} {'µs/llamada':>11}")
+    print(f"{'sin caché':>10} {uncached_us:>11.2f}")
+    print(f"{'con caché':>10} {cached_us:>11.2f}")
+    print(f"\n✅ {uncached_us / cached_us:.1f}x más rápido con caché ({iterations} llamadas)")
+    print(f"   {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,32 @@
-import asyncio
 from datetime import datetime
 
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse, JSONResponse
 
 from src.modules.Inventory.application.usecases.inventory_usecases import InventoryService
+from src.shared.infrastructure.config.settings import settings
 from src.shared.infrastructure.database.turso_connection import turso_db
 from src.shared.infrastructure.database.migrations.migration_runner import run_migrations
-from src.modules.User.infrastructure.api.auth_router import router as auth_router
+from src.modules.User.infrastructure.api.auth_router import (
+    router as auth_router,
+    email_rate_limiter,
+    ip_rate_limiter,
+    login_attempt_writer,
+    password_hasher,
+    revoked_sessions,
+    session_repository,
+    token_cache,
+)
 from src.modules.User.infrastructure.api.roles_router import router as roles_router
+from src.modules.User.infrastructure.api.users_router import router as users_router
+from src.modules.User.infrastructure.api.dependencies import permission_matrix
+from src.modules.User.infrastructure.audit import LoginAttemptRetention
+from src.modules.User.infrastructure.hashing import PasswordHashCostStore
 from src.modules.Order.infrastructure.api.order_router import order_router
+from src.modules.Order.infrastructure.api.order_stream_router import order_stream_router
+from src.modules.Order.infrastructure.events.order_event_publisher import order_event_broker
 from src.modules.Inventory.infrastructure.api.inventory_router import inventory_router
+from src.shared.infrastructure.scheduler import JobScheduler
 
 # Configuración de la aplicación con metadata para Swagger/OpenAPI
 app = FastAPI(
@@ -66,6 +82,10 @@ app = FastAPI(
             "name": "Roles y Permisos",
             "description": "Gestión de roles, permisos y asignación de roles a usuarios"
         },
+        {
+            "name": "Usuarios",
+            "description": "Administración de usuarios: alta masiva de empleados"
+        },
         {
             "name": "Salud",
             "description": "Endpoints para verificar el estado del sistema"
@@ -80,10 +100,13 @@ app = FastAPI(
 # Incluir routers de módulos
 app.include_router(auth_router)
 app.include_router(roles_router)
+app.include_router(users_router)
+# Antes de order_router: /api/orders/stream no debe capturarse como /api/orders/{order_id}
+app.include_router(order_stream_router)
 app.include_router(order_router)
 app.include_router(inventory_router)
 
-inventory_daily_check_task: asyncio.Task | None = None
+job_scheduler: JobScheduler | None = None
 
 
 def _ensure_table_columns(table_name: str, required_columns: dict[str, str]) -> None:
@@ -148,25 +171,84 @@ def _ensure_inventory_alerts_compatibility_schema() -> None:
     )
 
 
-async def _run_daily_inventory_low_stock_check() -> None:
-    """Ejecuta verificacion diaria de stock minimo y crea alertas internas."""
-    service = InventoryService()
-    while True:
-        try:
-            check_date = datetime.now().date().isoformat()
-            created = service.run_daily_low_stock_check(check_date=check_date)
-            print(f"🔎 Verificacion diaria de stock ejecutada ({check_date}). Alertas creadas: {created}")
-        except Exception as e:
-            print(f"⚠️  Error en verificacion diaria de stock: {e}")
+def _run_daily_inventory_low_stock_check() -> int:
+    """Ejecuta verificacion diaria de stock minimo y crea alertas internas (trabajo programado)."""
+    check_date = datetime.now().date().isoformat()
+    created = InventoryService().run_daily_low_stock_check(check_date=check_date)
+    print(f"🔎 Verificacion diaria de stock ejecutada ({check_date}). Alertas creadas: {created}")
+    return created
+
+
+login_attempt_retention = LoginAttemptRetention(
+    retention_days=settings.LOGIN_ATTEMPTS_RETENTION_DAYS,
+    batch_size=settings.LOGIN_ATTEMPTS_PURGE_BATCH_SIZE,
+    max_batches=settings.LOGIN_ATTEMPTS_PURGE_MAX_BATCHES,
+)
+
+
+def _run_login_attempt_retention() -> dict:
+    """Resume por dia los intentos de login y borra los vencidos por lotes (trabajo programado)."""
+    result = login_attempt_retention.run()
+    print(
+        f"🧹 Retencion de login_attempts: resumido hasta {result['rolled_up_through']}, "
+        f"borrados {result['purged']} en {result['batches']} lote(s)"
+    )
+    return result
+
+
+def _run_session_cleanup() -> dict:
+    """Borra por lotes las sesiones expiradas y reconstruye el filtro de revocadas (trabajo programado)."""
+    now = datetime.now()
+    batch_size = max(1, settings.SESSIONS_PURGE_BATCH_SIZE)
+    purged, batches = 0, 0
+    while batches < max(1, settings.SESSIONS_PURGE_MAX_BATCHES):
+        deleted = session_repository.purge_expired(now, batch_size)
+        batches += 1
+        purged += deleted
+        if deleted < batch_size:
+            break
+    # Las revocaciones de sesiones ya expiradas salen del filtro en memoria
+    revoked_count = revoked_sessions.load()
+    print(
+        f"🧹 Limpieza de sesiones: borradas {purged} expiradas en {batches} lote(s), "
+        f"{revoked_count} revocadas en el filtro"
+    )
+    return {"purged": purged, "batches": batches, "revoked": revoked_count}
+
 
-        await asyncio.sleep(60 * 60 * 24)
+def _start_job_scheduler() -> JobScheduler:
+    """Registra los trabajos programados y arranca el planificador en su propio hilo."""
+    scheduler = JobScheduler(
+        poll_interval_seconds=settings.SCHEDULER_POLL_SECONDS,
+        max_workers=settings.SCHEDULER_MAX_WORKERS,
+        default_lease_seconds=settings.SCHEDULER_LEASE_SECONDS,
+    )
+    scheduler.add_job(
+        "inventory_daily_low_stock_check",
+        settings.INVENTORY_DAILY_CHECK_CRON,
+        _run_daily_inventory_low_stock_check,
+    )
+    scheduler.add_job(
+        "login_attempts_retention",
+        settings.LOGIN_ATTEMPTS_RETENTION_CRON,
+        _run_login_attempt_retention,
+    )
+    scheduler.add_job(
+        "sessions_cleanup",
+        settings.SESSIONS_CLEANUP_CRON,
+        _run_session_cleanup,
+    )
+    scheduler.start()
+    return scheduler
 
 
 @app.on_event("startup")
 async def startup_event():
     """Evento que se ejecuta al iniciar la aplicación."""
-    global inventory_daily_check_task
+    global job_scheduler
     print("🚀 Iniciando KitchAI...")
+    # Hilo que inserta en lotes los intentos de login encolados
+    login_attempt_writer.start()
     # La conexión ya se inicializa automáticamente con el import
     # Asegurar que los roles básicos existan en la base de datos.
     try:
@@ -256,8 +338,37 @@ async def startup_event():
             )
         print("✅ Asociaciones rol-permiso creadas")
 
-        inventory_daily_check_task = asyncio.create_task(_run_daily_inventory_low_stock_check())
-        print("✅ Scheduler de verificacion diaria de stock inicializado")
+        # Bits de la máscara de permisos (claim "perms" del JWT) para los permisos nuevos
+        permission_matrix.permission_repository.assign_missing_bits()
+
+        # Cargar la matriz rol -> permisos en memoria (autorización sin consultas por petición)
+        permission_matrix.load()
+        permission_matrix.start_auto_refresh(settings.PERMISSION_VERSION_REFRESH_SECONDS)
+        print(f"✅ Matriz de permisos cargada ({permission_matrix.stats()['roles']} roles)")
+
+        # Sesiones revocadas en memoria: get_current_user no consulta la base
+        revoked_count = revoked_sessions.load()
+        revoked_sessions.start_auto_refresh(settings.SESSION_REVOCATION_REFRESH_SECONDS)
+        print(f"✅ Filtro de sesiones revocadas cargado ({revoked_count} sesiones)")
+
+        # Levantar los procesos de bcrypt antes de recibir logins
+        password_hasher.start()
+        if not settings.PASSWORD_HASH_ROUNDS:
+            # Un solo coste para todos los workers: se calibra una vez y se guarda en la base
+            password_hasher.calibrate_shared(
+                PasswordHashCostStore(),
+                settings.PASSWORD_HASH_TARGET_MS,
+                settings.PASSWORD_HASH_MIN_ROUNDS,
+                settings.PASSWORD_HASH_MAX_ROUNDS,
+            )
+        print(
+            f"✅ Pool de hashing de contraseñas iniciado ({password_hasher.max_workers} procesos, "
+            f"bcrypt coste {password_hasher.rounds})"
+        )
+
+        if settings.SCHEDULER_ENABLED:
+            job_scheduler = _start_job_scheduler()
+            print(f"✅ Planificador de trabajos inicializado (stock minimo: '{settings.INVENTORY_DAILY_CHECK_CRON}')")
     except Exception as e:
         print(f"⚠️  Error al inicializar roles: {e}")
 
@@ -265,14 +376,18 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Evento que se ejecuta al cerrar la aplicación."""
-    global inventory_daily_check_task
+    global job_scheduler
     print("👋 Cerrando KitchAI...")
-    if inventory_daily_check_task:
-        inventory_daily_check_task.cancel()
-        try:
-            await inventory_daily_check_task
-        except asyncio.CancelledError:
-            pass
+    if job_scheduler:
+        job_scheduler.stop()
+        job_scheduler = None
+    password_hasher.shutdown()
+    permission_matrix.stop_auto_refresh()
+    revoked_sessions.stop_auto_refresh()
+    # Cerrar las conexiones SSE / WebSocket de pedidos
+    order_event_broker.close()
+    # Escribir los intentos de login pendientes antes de cerrar la conexión
+    login_attempt_writer.stop()
     turso_db.close()
 
 
@@ -327,6 +442,9 @@ def health_check():
     Verifica:
     - Estado de la aplicación
     - Conexión a la base de datos Turso
+    - Uso del pool de conexiones
+    - Estado de la réplica local de lectura (si está habilitada)
+    - Estado del planificador de trabajos en segundo plano
     
     Returns:
         Estado del sistema y sus componentes
@@ -338,6 +456,9 @@ def health_check():
         return {
             "status": "healthy",
             "database": "connected",
+            "database_pool": turso_db.pool_stats(),
+            "database_replica": turso_db.replica_stats(),
+            "scheduler": job_scheduler.stats() if job_scheduler else {"running": False},
             "message": "KitchAI está funcionando correctamente"
         }
     except Exception as e:
@@ -346,3 +467,32 @@ def health_check():
             "database": "disconnected",
             "error": str(e)
         }
+
+
+@app.get("/metrics", response_class=JSONResponse, tags=["Salud"])
+def metrics():
+    """
+    Métricas internas de rendimiento.
+
+    - `password_hashing`: profundidad de la cola de bcrypt, procesos ocupados,
+      rechazos (503) y latencias (total y de cálculo)
+    - `token_cache`: aciertos/fallos de la caché de JWT verificados
+    - `login_audit`: buffer de intentos de login (pendientes, escritos, descartados)
+    - `login_attempts_retention`: ejecuciones del resumen diario y filas borradas por TTL
+    - `auth_rate_limit`: solicitudes de autenticación permitidas/rechazadas por IP y por email
+    - `revoked_sessions`: filtro de sesiones revocadas (tamaño, comprobaciones, falsos positivos del Bloom)
+    - `permission_matrix`: comprobaciones y recargas de la matriz de permisos
+    - `order_stream`: suscriptores SSE / WebSocket, eventos publicados y consumidores expulsados
+    - `database_pool`: uso del pool de conexiones
+    """
+    return {
+        "password_hashing": password_hasher.stats(),
+        "token_cache": token_cache.stats(),
+        "login_audit": login_attempt_writer.stats(),
+        "login_attempts_retention": login_attempt_retention.stats(),
+        "auth_rate_limit": {"ip": ip_rate_limiter.stats(), "email": email_rate_limiter.stats()},
+        "revoked_sessions": revoked_sessions.stats(),
+        "permission_matrix": permission_matrix.stats(),
+        "order_stream": order_event_broker.stats(),
+        "database_pool": turso_db.pool_stats(),
+    }
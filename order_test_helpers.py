@@ -0,0 +1,66 @@
+"""
+Utilidades compartidas por los tests de pedidos.
+Crean insumos reales en inventario y pedidos que los consumen, para que
+pending -> preparing pueda descontar stock.
+No lleva el prefijo test_ para que pytest no lo recoja como test.
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+import uuid
+
+from src.modules.Inventory.domain.entities.inventory_item import InventoryItem
+from src.modules.Inventory.infrastructure.repositories.inventory_repository import InventoryRepository
+from src.modules.Order.application.dto.order_request import OrderItemRequestDTO, OrderRequestDTO
+from src.modules.Order.application.usecases.order_usecases import OrderService
+from src.modules.Order.domain.entities.order import Order, ServiceType
+
+
+def create_stock_item(quantity: float = 10) -> InventoryItem:
+    """Crear un insumo con `quantity` unidades en inventario."""
+    now = datetime.now()
+    return InventoryRepository().create(InventoryItem(
+        id=str(uuid.uuid4()),
+        name=f"Insumo {uuid.uuid4().hex[:6]}",
+        category="test",
+        current_quantity=quantity,
+        minimum_stock=0,
+        unit="u",
+        created_at=now,
+        updated_at=now,
+    ))
+
+
+def create_order(
+    service: OrderService,
+    stock_item: Optional[InventoryItem] = None,
+    service_type: ServiceType = ServiceType.DINE_IN,
+    quantity: int = 2,
+    stock_quantity: float = 10,
+    waiter_id: str = "waiter-test",
+) -> Tuple[Order, InventoryItem]:
+    """
+    Crear un pedido de un solo ítem que consume `quantity` unidades de un insumo.
+
+    Args:
+        service: Servicio de pedidos
+        stock_item: Insumo del ítem (si falta se crea uno con `stock_quantity` unidades)
+        service_type: Modalidad del pedido
+        quantity: Unidades del ítem
+        stock_quantity: Stock del insumo creado cuando no se pasa `stock_item`
+        waiter_id: Usuario que crea el pedido (actor del evento order.created)
+
+    Returns:
+        Tupla (pedido creado, insumo que consume)
+    """
+    stock_item = stock_item or create_stock_item(stock_quantity)
+    order = service.create_order(waiter_id, OrderRequestDTO(
+        customer_name="Cliente de prueba",
+        customer_phone="+1000000000",
+        table_number=5,
+        service_type=service_type,
+        items=[OrderItemRequestDTO(
+            menu_item_id=stock_item.id, menu_item_name=stock_item.name, quantity=quantity, unit_price=7.0
+        )],
+    ))
+    return order, stock_item
@@ -0,0 +1,27 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class StockShortage(BaseModel):
+    inventory_item_id: str
+    name: Optional[str] = None
+    available: Optional[float] = None
+    requested: float
+
+
+class InsufficientStockError(ValueError):
+    """Una o mas lineas no tienen stock suficiente; no se desconto ninguna."""
+
+    def __init__(self, shortages: List[StockShortage]):
+        self.shortages = shortages
+        super().__init__("; ".join(self._describe(shortage) for shortage in shortages))
+
+    @staticmethod
+    def _describe(shortage: StockShortage) -> str:
+        if shortage.available is None:
+            return f"No existe articulo de inventario ({shortage.inventory_item_id})"
+        return (
+            f"Stock insuficiente para '{shortage.name}'. "
+            f"Disponible: {shortage.available}, requerido: {shortage.requested}"
+        )
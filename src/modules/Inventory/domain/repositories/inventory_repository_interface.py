@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.modules.Inventory.domain.entities.inventory_alert import InventoryAlert
 from src.modules.Inventory.domain.entities.inventory_item import InventoryItem
@@ -14,6 +14,10 @@ class IInventoryRepository(ABC):
     def get_by_id(self, item_id: str) -> Optional[InventoryItem]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, item_ids: List[str]) -> Dict[str, InventoryItem]:
+        pass
+
     @abstractmethod
     def get_all(self) -> List[InventoryItem]:
         pass
@@ -31,7 +35,15 @@ class IInventoryRepository(ABC):
         pass
 
     @abstractmethod
-    def deduct_stock(self, item_id: str, quantity: float) -> InventoryItem:
+    def deduct_stock(self, item_id: str, quantity: float) -> Optional[InventoryItem]:
+        pass
+
+    @abstractmethod
+    def deduct_stock_bulk(self, lines: List[Tuple[str, float]]) -> List[InventoryItem]:
+        pass
+
+    @abstractmethod
+    def create_low_stock_alerts_for_order(self, order_id: str, item_ids: List[str]) -> None:
         pass
 
     @abstractmethod
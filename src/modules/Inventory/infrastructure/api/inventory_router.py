@@ -9,25 +9,17 @@ from src.modules.Inventory.application.dto.inventory_request import (
 from src.modules.Inventory.application.dto.inventory_alert_response import InventoryAlertResponseDTO
 from src.modules.Inventory.application.dto.inventory_response import InventoryItemResponseDTO
 from src.modules.Inventory.application.usecases.inventory_usecases import InventoryService
-from src.modules.User.infrastructure.api.auth_router import get_current_user
+from src.modules.User.infrastructure.api.dependencies import require_permission
 
 
 inventory_router = APIRouter(prefix="/api/inventory", tags=["Inventario"])
 
-ADMIN_ROLE_ID = "uuid-role-admin"
-
-
-def _require_admin(user: dict) -> None:
-    if user.get("role_id") != ADMIN_ROLE_ID:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Solo administradores pueden gestionar el inventario",
-        )
+# Todos los endpoints de inventario exigen el permiso manage_inventory
+require_manage_inventory = require_permission("manage_inventory")
 
 
 @inventory_router.post("/", response_model=InventoryItemResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_inventory_item(request: CreateInventoryItemRequestDTO, user=Depends(get_current_user)):
-    _require_admin(user)
+def create_inventory_item(request: CreateInventoryItemRequestDTO, user=Depends(require_manage_inventory)):
     service = InventoryService()
     try:
         return service.create_item(request)
@@ -36,15 +28,13 @@ def create_inventory_item(request: CreateInventoryItemRequestDTO, user=Depends(g
 
 
 @inventory_router.get("/", response_model=List[InventoryItemResponseDTO])
-def list_inventory_items(user=Depends(get_current_user)):
-    _require_admin(user)
+def list_inventory_items(user=Depends(require_manage_inventory)):
     service = InventoryService()
     return service.get_items()
 
 
 @inventory_router.get("/alerts", response_model=List[InventoryAlertResponseDTO])
-def list_inventory_alerts(user=Depends(get_current_user)):
-    _require_admin(user)
+def list_inventory_alerts(user=Depends(require_manage_inventory)):
     service = InventoryService()
     return service.get_active_alerts()
 
@@ -52,16 +42,14 @@ def list_inventory_alerts(user=Depends(get_current_user)):
 @inventory_router.get("/alerts/dashboard", response_model=List[InventoryAlertResponseDTO])
 def list_inventory_alerts_dashboard(
     only_active: bool = Query(default=False, description="Si es true, solo retorna alertas no resueltas"),
-    user=Depends(get_current_user),
+    user=Depends(require_manage_inventory),
 ):
-    _require_admin(user)
     service = InventoryService()
     return service.get_active_alerts() if only_active else service.get_all_alerts()
 
 
 @inventory_router.put("/alerts/{alert_id}/view", response_model=InventoryAlertResponseDTO)
-def mark_inventory_alert_as_viewed(alert_id: str, user=Depends(get_current_user)):
-    _require_admin(user)
+def mark_inventory_alert_as_viewed(alert_id: str, user=Depends(require_manage_inventory)):
     service = InventoryService()
     try:
         return service.mark_alert_as_viewed(alert_id)
@@ -70,8 +58,7 @@ def mark_inventory_alert_as_viewed(alert_id: str, user=Depends(get_current_user)
 
 
 @inventory_router.put("/alerts/{alert_id}/resolve", response_model=InventoryAlertResponseDTO)
-def mark_inventory_alert_as_resolved(alert_id: str, user=Depends(get_current_user)):
-    _require_admin(user)
+def mark_inventory_alert_as_resolved(alert_id: str, user=Depends(require_manage_inventory)):
     service = InventoryService()
     try:
         return service.mark_alert_as_resolved(alert_id)
@@ -80,8 +67,7 @@ def mark_inventory_alert_as_resolved(alert_id: str, user=Depends(get_current_use
 
 
 @inventory_router.post("/alerts/daily-check", status_code=status.HTTP_200_OK)
-def run_daily_stock_alert_check(user=Depends(get_current_user)):
-    _require_admin(user)
+def run_daily_stock_alert_check(user=Depends(require_manage_inventory)):
     service = InventoryService()
     created_count = service.run_daily_low_stock_check()
     return {
@@ -91,8 +77,7 @@ def run_daily_stock_alert_check(user=Depends(get_current_user)):
 
 
 @inventory_router.get("/{item_id}", response_model=InventoryItemResponseDTO)
-def get_inventory_item(item_id: str, user=Depends(get_current_user)):
-    _require_admin(user)
+def get_inventory_item(item_id: str, user=Depends(require_manage_inventory)):
     service = InventoryService()
     item = service.get_item_by_id(item_id)
     if not item:
@@ -107,9 +92,8 @@ def get_inventory_item(item_id: str, user=Depends(get_current_user)):
 def update_inventory_item(
     item_id: str,
     request: UpdateInventoryItemRequestDTO,
-    user=Depends(get_current_user),
+    user=Depends(require_manage_inventory),
 ):
-    _require_admin(user)
     service = InventoryService()
     try:
         return service.update_item(item_id, request)
@@ -120,8 +104,7 @@ def update_inventory_item(
 
 
 @inventory_router.delete("/{item_id}", status_code=status.HTTP_200_OK)
-def delete_inventory_item(item_id: str, user=Depends(get_current_user)):
-    _require_admin(user)
+def delete_inventory_item(item_id: str, user=Depends(require_manage_inventory)):
     service = InventoryService()
     try:
         service.delete_item(item_id)
@@ -1,13 +1,22 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import uuid
 
 from src.modules.Inventory.domain.entities.inventory_alert import InventoryAlert
 from src.modules.Inventory.domain.entities.inventory_item import InventoryItem
+from src.modules.Inventory.domain.entities.stock_shortage import InsufficientStockError, StockShortage
 from src.modules.Inventory.domain.repositories.inventory_repository_interface import (
     IInventoryRepository,
 )
 from src.shared.infrastructure.database.turso_connection import get_turso_client
+from src.shared.infrastructure.database.unit_of_work import current_unit_of_work
+
+# UUID v4 generado por SQLite (para inserciones set-based)
+SQL_UUID4 = (
+    "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+    "substr(lower(hex(randomblob(2))), 2) || '-' || substr('89ab', 1 + (abs(random()) % 4), 1) || "
+    "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6)))"
+)
 
 
 class InventoryRepository(IInventoryRepository):
@@ -49,6 +58,23 @@ class InventoryRepository(IInventoryRepository):
 
         return self._map_to_entity(result.rows[0])
 
+    def get_by_ids(self, item_ids: List[str]) -> Dict[str, InventoryItem]:
+        unique_ids = list(dict.fromkeys(item_ids))
+        if not unique_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in unique_ids)
+        result = self.client.execute(
+            f"""
+            SELECT id, name, category, current_quantity, minimum_stock, unit, created_at, updated_at
+            FROM inventory_items
+            WHERE id IN ({placeholders})
+            """,
+            unique_ids,
+        )
+        items = [self._map_to_entity(row) for row in result.rows]
+        return {item.id: item for item in items}
+
     def get_all(self) -> List[InventoryItem]:
         result = self.client.execute(
             """
@@ -89,40 +115,125 @@ class InventoryRepository(IInventoryRepository):
         return True
 
     def exists_by_name(self, name: str, excluding_id: Optional[str] = None) -> bool:
-        query = "SELECT COUNT(*) FROM inventory_items WHERE LOWER(name) = LOWER(?)"
+        # LOWER(name) usa idx_inventory_items_name_lower; EXISTS se detiene en la primera coincidencia
+        query = "SELECT 1 FROM inventory_items WHERE LOWER(name) = LOWER(?)"
         params = [name]
 
         if excluding_id:
             query += " AND id <> ?"
             params.append(excluding_id)
 
-        result = self.client.execute(query, params)
+        result = self.client.execute(f"SELECT EXISTS ({query})", params)
         return result.rows[0][0] > 0
 
-    def deduct_stock(self, item_id: str, quantity: float) -> InventoryItem:
-        item = self.get_by_id(item_id)
-        if not item:
-            raise ValueError(f"Articulo de inventario con ID {item_id} no encontrado")
-
-        if quantity <= 0:
-            raise ValueError("La cantidad a descontar debe ser mayor que cero")
-
-        if item.current_quantity < quantity:
-            raise ValueError(
-                f"Stock insuficiente para '{item.name}'. Disponible: {item.current_quantity}, requerido: {quantity}"
+    def deduct_stock(self, item_id: str, quantity: float) -> Optional[InventoryItem]:
+        updated_items = self.deduct_stock_bulk([(item_id, quantity)])
+        return updated_items[0] if updated_items else None
+
+    def deduct_stock_bulk(self, lines: List[Tuple[str, float]]) -> List[InventoryItem]:
+        """
+        Descontar stock de varias lineas en un unico batch atomico.
+
+        Cada articulo se descuenta con un UPDATE condicional (current_quantity >= ?)
+        seguido de una guarda que aborta el batch completo si el UPDATE no afecto
+        ninguna fila, asi nunca quedan descuentos parciales ni se pisan descuentos
+        concurrentes. Solo si falla se lee el inventario para informar que lineas
+        no tenian stock (InsufficientStockError).
+
+        Returns:
+            Articulos con el stock ya descontado (RETURNING). Dentro de una
+            UnitOfWork el batch se difiere y se devuelve una lista vacia.
+        """
+        requested: Dict[str, float] = {}
+        for item_id, quantity in lines:
+            if quantity <= 0:
+                raise ValueError("La cantidad a descontar debe ser mayor que cero")
+            requested[item_id] = requested.get(item_id, 0) + quantity
+
+        if not requested:
+            return []
+
+        updated_at = datetime.now().isoformat()
+        statements = []
+        for item_id, quantity in requested.items():
+            statements.append((
+                """
+                UPDATE inventory_items
+                SET current_quantity = current_quantity - ?,
+                    updated_at = ?
+                WHERE id = ? AND current_quantity >= ?
+                RETURNING id, name, category, current_quantity, minimum_stock, unit, created_at, updated_at
+                """,
+                [quantity, updated_at, item_id, quantity],
+            ))
+            # changes() = 0 -> se inserta ok = 0, el CHECK (ok = 1) falla y se revierte el batch
+            statements.append(("INSERT INTO stock_deduction_guard (ok) SELECT 0 WHERE changes() = 0", []))
+
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.on_failure(lambda error: self._raise_stock_shortages(requested))
+
+        try:
+            results = self.client.batch(statements)
+        except Exception:
+            self._raise_stock_shortages(requested)
+            raise
+
+        return [self._map_to_entity(result.rows[0]) for result in results[::2] if result.rows]
+
+    def _raise_stock_shortages(self, requested: Dict[str, float]) -> None:
+        """Lanzar InsufficientStockError con las lineas sin stock (si las hay)."""
+        items = self.get_by_ids(list(requested))
+        shortages = []
+        for item_id, quantity in requested.items():
+            item = items.get(item_id)
+            if item is None:
+                shortages.append(StockShortage(inventory_item_id=item_id, requested=quantity))
+            elif item.current_quantity < quantity:
+                shortages.append(StockShortage(
+                    inventory_item_id=item_id,
+                    name=item.name,
+                    available=item.current_quantity,
+                    requested=quantity,
+                ))
+        if shortages:
+            raise InsufficientStockError(shortages)
+
+    def create_low_stock_alerts_for_order(self, order_id: str, item_ids: List[str]) -> None:
+        """Crear en una sola sentencia alertas LOW_STOCK para los articulos del pedido en stock minimo."""
+        unique_ids = list(dict.fromkeys(item_ids))
+        if not unique_ids:
+            return
+
+        placeholders = ", ".join("?" for _ in unique_ids)
+        self.client.execute(
+            f"""
+            INSERT INTO inventory_alerts (
+                id, inventory_item_id, order_id, alert_type, message,
+                current_quantity, minimum_stock, is_viewed, is_resolved,
+                check_date, created_at, viewed_at, resolved_at
             )
-
-        updated_item = InventoryItem(
-            id=item.id,
-            name=item.name,
-            category=item.category,
-            current_quantity=item.current_quantity - quantity,
-            minimum_stock=item.minimum_stock,
-            unit=item.unit,
-            created_at=item.created_at,
-            updated_at=datetime.now(),
+            SELECT
+                {SQL_UUID4},
+                id,
+                ?,
+                'LOW_STOCK',
+                'Articulo ''' || name || ''' en stock minimo o por debajo (actual: '
+                    || current_quantity || ' ' || unit || ', minimo: ' || minimum_stock || ' ' || unit || ')',
+                current_quantity,
+                minimum_stock,
+                0,
+                0,
+                NULL,
+                ?,
+                NULL,
+                NULL
+            FROM inventory_items
+            WHERE id IN ({placeholders})
+              AND current_quantity <= minimum_stock
+            """,
+            [order_id, datetime.now().isoformat(), *unique_ids],
         )
-        return self.update(updated_item)
 
     def create_alert(self, alert: InventoryAlert) -> InventoryAlert:
         alert_id = alert.id or str(uuid.uuid4())
@@ -215,58 +326,43 @@ class InventoryRepository(IInventoryRepository):
         return self._get_alert_by_id(alert_id)
 
     def create_daily_low_stock_alerts(self, check_date: str) -> int:
-        low_stock_items = self.client.execute(
-            """
-            SELECT id, name, current_quantity, minimum_stock, unit
+        """
+        Crear en una sola sentencia las alertas diarias de stock minimo.
+
+        El indice unico (inventory_item_id, alert_type, check_date) hace la
+        operacion idempotente: repetir la verificacion del mismo dia no duplica
+        alertas. Devuelve el numero de alertas creadas.
+        """
+        result = self.client.execute(
+            f"""
+            INSERT INTO inventory_alerts (
+                id, inventory_item_id, order_id, alert_type, message,
+                current_quantity, minimum_stock, is_viewed, is_resolved,
+                check_date, created_at, viewed_at, resolved_at
+            )
+            SELECT
+                {SQL_UUID4},
+                id,
+                NULL,
+                'DAILY_MIN_STOCK',
+                'Verificacion diaria: ''' || name || ''' en stock minimo o por debajo (actual: '
+                    || current_quantity || ' ' || unit || ', minimo: ' || minimum_stock || ' ' || unit || ')',
+                current_quantity,
+                minimum_stock,
+                0,
+                0,
+                ?,
+                ?,
+                NULL,
+                NULL
             FROM inventory_items
             WHERE current_quantity <= minimum_stock
-            """
+            ON CONFLICT (inventory_item_id, alert_type, check_date) WHERE check_date IS NOT NULL DO NOTHING
+            RETURNING id
+            """,
+            [check_date, datetime.now().isoformat()],
         )
-
-        created_count = 0
-        for row in low_stock_items.rows:
-            item_id = row[0]
-            item_name = row[1]
-            current_quantity = row[2]
-            minimum_stock = row[3]
-            unit = row[4]
-
-            existing_daily = self.client.execute(
-                """
-                SELECT COUNT(*)
-                FROM inventory_alerts
-                WHERE inventory_item_id = ?
-                  AND alert_type = 'DAILY_MIN_STOCK'
-                  AND check_date = ?
-                """,
-                [item_id, check_date],
-            )
-            if existing_daily.rows[0][0] > 0:
-                continue
-
-            self.create_alert(
-                InventoryAlert(
-                    id=str(uuid.uuid4()),
-                    inventory_item_id=item_id,
-                    order_id=None,
-                    alert_type="DAILY_MIN_STOCK",
-                    message=(
-                        f"Verificacion diaria: '{item_name}' en stock minimo o por debajo "
-                        f"(actual: {current_quantity} {unit}, minimo: {minimum_stock} {unit})"
-                    ),
-                    current_quantity=current_quantity,
-                    minimum_stock=minimum_stock,
-                    is_viewed=False,
-                    is_resolved=False,
-                    check_date=check_date,
-                    created_at=datetime.now(),
-                    viewed_at=None,
-                    resolved_at=None,
-                )
-            )
-            created_count += 1
-
-        return created_count
+        return len(result.rows)
 
     def is_order_inventory_processed(self, order_id: str) -> bool:
         result = self.client.execute(
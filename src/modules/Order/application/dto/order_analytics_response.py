@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import date, datetime
+
+class OrderEventResponseDTO(BaseModel):
+    seq: int
+    event_type: str
+    from_status: Optional[str] = None
+    to_status: str
+    version: Optional[int] = None
+    actor_id: Optional[str] = None
+    preparation_time: Optional[int] = None
+    total_time: Optional[int] = None
+    payload: Optional[dict] = None
+    occurred_at: datetime
+
+class OrderHistoryResponseDTO(BaseModel):
+    order_id: str
+    events: List[OrderEventResponseDTO]
+
+class OrderStatusBoardResponseDTO(BaseModel):
+    # service_type -> status -> pedidos
+    by_service_type: Dict[str, Dict[str, int]]
+    totals: Dict[str, int]
+
+class OrderTimingStatsResponseDTO(BaseModel):
+    service_type: str
+    day: date
+    ready_count: int
+    avg_preparation_time: Optional[float] = None
+    max_preparation_time: Optional[int] = None
+    completed_count: int
+    avg_total_time: Optional[float] = None
+    max_total_time: Optional[int] = None
+    cancelled_count: int
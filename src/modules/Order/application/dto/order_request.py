@@ -17,7 +17,18 @@ class OrderRequestDTO(BaseModel):
     service_type: ServiceType
     items: List[OrderItemRequestDTO]
 
+class OrderCreateBatchRequestDTO(BaseModel):
+    orders: List[OrderRequestDTO]
+
 class OrderStatusUpdateRequestDTO(BaseModel):
     new_status: str
     cancellation_reason: Optional[str] = None
+    # Versión del pedido que vio el cliente; si ya cambió se responde 409
+    expected_version: Optional[int] = None
+
+
+class OrderStatusBatchItemRequestDTO(OrderStatusUpdateRequestDTO):
+    order_id: str
 
+class OrderStatusBatchRequestDTO(BaseModel):
+    updates: List[OrderStatusBatchItemRequestDTO]
@@ -38,4 +38,23 @@ class OrderResponseDTO(BaseModel):
     completed_at: Optional[datetime] = None
     preparation_time: Optional[int] = None
     total_time: Optional[int] = None
-    items: List[OrderItemResponseDTO] = []
\ No newline at end of file
+    version: int = 1
+    items: List[OrderItemResponseDTO] = []
+
+class OrderPageResponseDTO(BaseModel):
+    items: List[OrderResponseDTO]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    limit: int
+
+class OrderStatusBatchResultDTO(BaseModel):
+    order_id: str
+    # 200 aplicado, 400 transición no válida, 404 no existe, 409 versión distinta, 500 error inesperado
+    status_code: int
+    error: Optional[str] = None
+    order: Optional[OrderResponseDTO] = None
+
+class OrderStatusBatchResponseDTO(BaseModel):
+    results: List[OrderStatusBatchResultDTO]
+    applied: int
+    failed: int
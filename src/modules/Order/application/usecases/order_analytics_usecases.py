@@ -0,0 +1,67 @@
+from src.modules.Order.infrastructure.repositories.order_event_repository import OrderEventRepository
+from src.modules.Order.application.dto.order_analytics_response import (
+    OrderEventResponseDTO,
+    OrderHistoryResponseDTO,
+    OrderStatusBoardResponseDTO,
+    OrderTimingStatsResponseDTO,
+)
+from src.modules.Order.domain.entities.order import ServiceType
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import List, Optional
+
+MAX_STATS_DAYS = 366
+
+class OrderAnalyticsService:
+    """
+    Analíticas de pedidos sobre el historial (order_events) y sus proyecciones
+    precalculadas, sin recorrer la tabla orders.
+    """
+
+    def __init__(self):
+        self.repo = OrderEventRepository()
+
+    def get_order_history(self, order_id: str) -> Optional[OrderHistoryResponseDTO]:
+        events = self.repo.get_history(order_id)
+        if not events:
+            return None
+        return OrderHistoryResponseDTO(
+            order_id=order_id,
+            events=[OrderEventResponseDTO(**event.model_dump()) for event in events],
+        )
+
+    def get_status_board(self) -> OrderStatusBoardResponseDTO:
+        by_service_type = defaultdict(dict)
+        totals = defaultdict(int)
+        for service_type, status, order_count in self.repo.get_status_counts():
+            by_service_type[service_type][status] = order_count
+            totals[status] += order_count
+        return OrderStatusBoardResponseDTO(by_service_type=dict(by_service_type), totals=dict(totals))
+
+    def get_timing_stats(
+        self,
+        days: int = 7,
+        service_type: Optional[ServiceType] = None,
+        today: Optional[date] = None,
+    ) -> List[OrderTimingStatsResponseDTO]:
+        if days < 1 or days > MAX_STATS_DAYS:
+            raise ValueError(f"days debe estar entre 1 y {MAX_STATS_DAYS}")
+        since = (today or date.today()) - timedelta(days=days - 1)
+        rows = self.repo.get_timing_stats(since, service_type.value if service_type else None)
+        return [self._to_timing_dto(row) for row in rows]
+
+    @staticmethod
+    def _to_timing_dto(row) -> OrderTimingStatsResponseDTO:
+        (service_type, day, ready_count, preparation_time_total, preparation_time_max,
+         completed_count, total_time_total, total_time_max, cancelled_count) = row
+        return OrderTimingStatsResponseDTO(
+            service_type=service_type,
+            day=date.fromisoformat(day),
+            ready_count=ready_count,
+            avg_preparation_time=round(preparation_time_total / ready_count, 1) if ready_count else None,
+            max_preparation_time=preparation_time_max if ready_count else None,
+            completed_count=completed_count,
+            avg_total_time=round(total_time_total / completed_count, 1) if completed_count else None,
+            max_total_time=total_time_max if completed_count else None,
+            cancelled_count=cancelled_count,
+        )
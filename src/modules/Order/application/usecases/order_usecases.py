@@ -1,20 +1,69 @@
 from src.modules.Order.infrastructure.repositories.order_repository import OrderRepository
-from src.modules.Order.application.dto.order_request import OrderRequestDTO, OrderStatusUpdateRequestDTO
-from src.modules.Order.application.dto.order_response import OrderResponseDTO, OrderItemResponseDTO
+from src.modules.Order.application.dto.order_request import (
+    OrderRequestDTO,
+    OrderStatusBatchItemRequestDTO,
+    OrderStatusUpdateRequestDTO,
+)
+from src.modules.Order.application.dto.order_response import (
+    OrderItemResponseDTO,
+    OrderPageResponseDTO,
+    OrderResponseDTO,
+    OrderStatusBatchResponseDTO,
+    OrderStatusBatchResultDTO,
+)
 from src.modules.Order.domain.entities.order import Order, OrderStatus, ServiceType
+from src.modules.Order.domain.entities.order_conflict import OrderVersionConflictError
 from src.modules.Order.domain.entities.order_item import OrderItem
 from src.modules.Order.domain.services.order_status_service import OrderStatusService
+from src.modules.Order.infrastructure.events.order_event_publisher import OrderEventPublisher
 from src.modules.Inventory.application.usecases.inventory_order_sync_usecase import InventoryOrderSyncService
+from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.database.unit_of_work import UnitOfWork
+import base64
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# Intentos del batch de cambios de estado cuando otro pedido cambia entre lectura y escritura
+MAX_STATUS_BATCH_ATTEMPTS = 3
 
 class OrderService:
     def __init__(self):
         self.repo = OrderRepository()
         self.inventory_sync_service = InventoryOrderSyncService()
+        # Avisos en tiempo real a las pantallas de cocina / meseros (SSE y WebSocket)
+        self.events = OrderEventPublisher()
 
     def create_order(self, waiter_id: str, request: OrderRequestDTO) -> OrderResponseDTO:
+        saved_order = self.repo.create(self._build_order(waiter_id, request))
+        response = self._to_response_dto(saved_order)
+        self.events.order_created(response.model_dump(mode="json"))
+        return response
+
+    def create_orders(self, waiter_id: str, requests: List[OrderRequestDTO]) -> List[OrderResponseDTO]:
+        """
+        Crear varios pedidos en un único batch atómico (POST /api/orders/batch):
+        se crean todos o ninguno.
+
+        Raises:
+            ValueError: Lista vacía o más de ORDER_CREATE_BATCH_MAX_SIZE pedidos
+        """
+        if not requests:
+            raise ValueError("Se requiere al menos un pedido")
+        if len(requests) > settings.ORDER_CREATE_BATCH_MAX_SIZE:
+            raise ValueError(
+                f"Máximo {settings.ORDER_CREATE_BATCH_MAX_SIZE} pedidos por solicitud (se recibieron {len(requests)})"
+            )
+        orders = [self._build_order(waiter_id, request) for request in requests]
+        saved_orders = self.repo.create_many(orders)
+        responses = [self._to_response_dto(order) for order in saved_orders]
+        for response in responses:
+            self.events.order_created(response.model_dump(mode="json"))
+        return responses
+
+    def _build_order(self, waiter_id: str, request: OrderRequestDTO) -> Order:
         order_id = str(uuid.uuid4())
         order_number = f"ORD-{datetime.now().year}-{str(uuid.uuid4())[:8].upper()}"
 
@@ -60,54 +109,317 @@ class OrderService:
             updated_at=datetime.now()
         )
 
-        saved_order = self.repo.create(order)
-        return self._to_response_dto(saved_order)
+        return order
 
     def update_order_status(self, order_id: str, request: OrderStatusUpdateRequestDTO, user_id: str) -> OrderResponseDTO:
-        # Obtener el pedido actual
-        order = self.repo.get_by_id(order_id)
-        if not order:
-            raise ValueError(f"Pedido con ID {order_id} no encontrado")
+        new_status = self._parse_new_status(request)
+
+        # Solo pending -> preparing necesita los items (descuento de inventario); el resto
+        # de transiciones es un único UPDATE condicional que valida y devuelve el pedido.
+        if new_status == OrderStatus.PREPARING:
+            saved_order = self._start_preparation(order_id, request, user_id)
+        else:
+            saved_order = self.repo.transition_status(
+                order_id,
+                new_status,
+                changed_at=datetime.now(),
+                user_id=user_id,
+                cancellation_reason=request.cancellation_reason,
+                expected_version=request.expected_version,
+            )
+            if saved_order is None:
+                self._raise_transition_failure(order_id, new_status, request, user_id)
+
+        OrderStatusService.notify_status_change(saved_order)
+        response = self._to_response_dto(saved_order)
+        self.events.status_changed(response.model_dump(mode="json"))
+        return response
 
-        # Validar el nuevo estado
+    @staticmethod
+    def _parse_new_status(request: OrderStatusUpdateRequestDTO) -> OrderStatus:
+        """Validar el nuevo estado y el motivo de cancelación de la solicitud."""
         try:
             new_status = OrderStatus(request.new_status.lower())
         except ValueError:
             raise ValueError(f"Estado '{request.new_status}' no válido. Estados permitidos: {[s.value for s in OrderStatus]}")
 
-        # Validar transición
+        if new_status == OrderStatus.CANCELLED and not request.cancellation_reason:
+            raise ValueError("Se requiere motivo de cancelación")
+        return new_status
+
+    def update_orders_status(
+        self, requests: List[OrderStatusBatchItemRequestDTO], user_id: str
+    ) -> OrderStatusBatchResponseDTO:
+        """
+        Aplicar varios cambios de estado (p. ej. el pase de cocina marcando tickets como ready).
+
+        Lee todos los pedidos con sus items en una pasada, valida cada cambio con
+        OrderStatusService y confirma los válidos en un único batch: el UPDATE
+        condicional de cada pedido (con la versión leída) y el descuento de
+        inventario de los que pasan a preparing. Si el batch se revierte porque
+        algún pedido cambió entre la lectura y la escritura, se revalida con el
+        estado nuevo y se reintenta. Si se revierte por otra causa (p. ej. falta
+        de stock), cada cambio se aplica por separado para que el error quede
+        solo en su pedido.
+
+        Returns:
+            Resultado por pedido, en el orden de la solicitud
+        """
+        if not requests:
+            raise ValueError("Se requiere al menos un cambio de estado")
+        if len(requests) > settings.ORDER_STATUS_BATCH_MAX_SIZE:
+            raise ValueError(
+                f"Máximo {settings.ORDER_STATUS_BATCH_MAX_SIZE} cambios por solicitud (se recibieron {len(requests)})"
+            )
+
+        results: Dict[int, OrderStatusBatchResultDTO] = {}
+        pending: List[Tuple[int, OrderStatusBatchItemRequestDTO, OrderStatus]] = []
+        seen_order_ids = set()
+        for index, request in enumerate(requests):
+            if request.order_id in seen_order_ids:
+                results[index] = self._batch_failure(request.order_id, 400, "El pedido aparece más de una vez en la solicitud")
+                continue
+            seen_order_ids.add(request.order_id)
+            try:
+                pending.append((index, request, self._parse_new_status(request)))
+            except ValueError as e:
+                results[index] = self._batch_failure(request.order_id, 400, str(e))
+
+        applied: List[Tuple[int, str]] = []
+        for _ in range(MAX_STATUS_BATCH_ATTEMPTS):
+            if not pending:
+                break
+            orders = self.repo.get_many([request.order_id for _, request, _ in pending])
+            changes = []
+            for index, request, new_status in pending:
+                order = orders.get(request.order_id)
+                if order is None:
+                    results[index] = self._batch_failure(request.order_id, 404, f"Pedido con ID {request.order_id} no encontrado")
+                    continue
+                try:
+                    changes.append((index, request, new_status, order, self._prepare_batch_change(order, request, new_status, user_id)))
+                except OrderVersionConflictError as e:
+                    results[index] = self._batch_failure(request.order_id, 409, str(e))
+                except ValueError as e:
+                    results[index] = self._batch_failure(request.order_id, 400, str(e))
+
+            pending = []
+            if not changes:
+                break
+            try:
+                self._commit_status_batch(changes, user_id)
+                applied = [(index, request.order_id) for index, request, *_ in changes]
+                break
+            except Exception:
+                pending = [(index, request, new_status) for index, request, new_status, _, _ in changes]
+                current = self.repo.get_many([order.id for *_, order, _ in changes], include_items=False)
+                if all(order.id in current and current[order.id].version == order.version for *_, order, _ in changes):
+                    # Nadie cambió los pedidos: el fallo es de algún cambio concreto (p. ej. stock)
+                    break
+
+        # Cambios que no se pudieron aplicar en lote: uno por uno, con su propio error.
+        # Un error inesperado tampoco corta el bucle: los anteriores ya están confirmados
+        # y el cliente debe saber cuáles se aplicaron.
+        for index, request, _ in pending:
+            try:
+                results[index] = OrderStatusBatchResultDTO(
+                    order_id=request.order_id,
+                    status_code=200,
+                    order=self.update_order_status(request.order_id, request, user_id),
+                )
+            except OrderVersionConflictError as e:
+                results[index] = self._batch_failure(request.order_id, 409, str(e))
+            except ValueError as e:
+                results[index] = self._batch_failure(request.order_id, 400, str(e))
+            except Exception as e:
+                results[index] = self._batch_failure(request.order_id, 500, f"Error interno del servidor: {str(e)}")
+
+        saved_orders = self.repo.get_many([order_id for _, order_id in applied])
+        for index, order_id in applied:
+            saved_order = saved_orders[order_id]
+            OrderStatusService.notify_status_change(saved_order)
+            response = self._to_response_dto(saved_order)
+            self.events.status_changed(response.model_dump(mode="json"))
+            results[index] = OrderStatusBatchResultDTO(order_id=order_id, status_code=200, order=response)
+
+        ordered = [results[index] for index in range(len(requests))]
+        applied_count = sum(1 for result in ordered if result.status_code == 200)
+        return OrderStatusBatchResponseDTO(results=ordered, applied=applied_count, failed=len(ordered) - applied_count)
+
+    @staticmethod
+    def _prepare_batch_change(
+        order: Order, request: OrderStatusBatchItemRequestDTO, new_status: OrderStatus, user_id: str
+    ) -> Order:
+        """Validar un cambio del batch contra el pedido leído y devolver el pedido ya cambiado."""
+        if request.expected_version is not None and request.expected_version != order.version:
+            raise OrderVersionConflictError(order.id, request.expected_version, order.version, order.status.value)
         is_valid, error_msg = OrderStatusService.validate_transition(order, new_status)
         if not is_valid:
             raise ValueError(error_msg)
-
-        # Validar cancelación si aplica
         if new_status == OrderStatus.CANCELLED:
             can_cancel, cancel_error = OrderStatusService.can_cancel(order)
             if not can_cancel:
                 raise ValueError(cancel_error)
+        updated_order = OrderStatusService.apply_status_change(order, new_status, user_id, request.cancellation_reason)
+        updated_order.version = order.version + 1
+        return updated_order
 
-        # Aplicar el cambio de estado
-        updated_order = OrderStatusService.apply_status_change(
-            order, new_status, user_id, request.cancellation_reason
-        )
+    def _commit_status_batch(self, changes: list, user_id: str) -> None:
+        """
+        Confirmar los cambios validados en un único batch. Cada UPDATE exige la
+        versión leída: si algún pedido cambió, la guarda revierte el batch entero.
+        """
+        changed_at = datetime.now()
+        with UnitOfWork():
+            for _, request, new_status, order, updated_order in changes:
+                self.repo.transition_status(
+                    order.id,
+                    new_status,
+                    changed_at=changed_at,
+                    user_id=user_id,
+                    cancellation_reason=request.cancellation_reason,
+                    expected_version=order.version,
+                )
+                if new_status == OrderStatus.PREPARING:
+                    self.inventory_sync_service.apply_stock_discount_for_confirmed_order(
+                        updated_order, triggered_status=OrderStatus.PREPARING.value
+                    )
+
+    @staticmethod
+    def _batch_failure(order_id: str, status_code: int, error: str) -> OrderStatusBatchResultDTO:
+        return OrderStatusBatchResultDTO(order_id=order_id, status_code=status_code, error=error)
 
-        # CA1 y CA3: al confirmar el pedido (pending -> preparing) descontar inventario inmediatamente.
-        if order.status == OrderStatus.PENDING and new_status == OrderStatus.PREPARING:
+    def _start_preparation(self, order_id: str, request: OrderStatusUpdateRequestDTO, user_id: str) -> Order:
+        """pending -> preparing: descuenta inventario y cambia el estado en un único batch."""
+        order = self.repo.get_by_id(order_id)
+        if not order:
+            raise ValueError(f"Pedido con ID {order_id} no encontrado")
+        if request.expected_version is not None and request.expected_version != order.version:
+            raise OrderVersionConflictError(order_id, request.expected_version, order.version, order.status.value)
+
+        is_valid, error_msg = OrderStatusService.validate_transition(order, OrderStatus.PREPARING)
+        if not is_valid:
+            raise ValueError(error_msg)
+        updated_order = OrderStatusService.apply_status_change(order, OrderStatus.PREPARING, user_id)
+        updated_order.version = order.version + 1
+
+        # Descuento de inventario y cambio de estado se confirman juntos en un
+        # único batch: o se aplican ambos o ninguno. El UPDATE exige la versión
+        # leída, así que si otra solicitud cambió el pedido no se descuenta nada.
+        with UnitOfWork() as unit_of_work:
+            self.repo.transition_status(
+                order_id,
+                OrderStatus.PREPARING,
+                changed_at=updated_order.updated_at,
+                user_id=user_id,
+                expected_version=order.version,
+            )
+            unit_of_work.on_failure(
+                lambda error: self._raise_transition_failure(
+                    order_id, OrderStatus.PREPARING, request, user_id,
+                    expected_version=order.version, items=order.items, within_batch=True,
+                )
+            )
+            # CA1 y CA3: al confirmar el pedido (pending -> preparing) descontar inventario inmediatamente.
             self.inventory_sync_service.apply_stock_discount_for_confirmed_order(
-                updated_order, triggered_status=new_status.value
+                updated_order, triggered_status=OrderStatus.PREPARING.value
             )
+        return updated_order
 
-        # Guardar en la base de datos
-        saved_order = self.repo.update_status_with_details(updated_order)
-        return self._to_response_dto(saved_order)
+    def _raise_transition_failure(
+        self,
+        order_id: str,
+        new_status: OrderStatus,
+        request: OrderStatusUpdateRequestDTO,
+        user_id: str,
+        expected_version: Optional[int] = None,
+        items: Optional[List[OrderItem]] = None,
+        within_batch: bool = False,
+    ) -> None:
+        """
+        Explicar por qué el UPDATE condicional no cambió ninguna fila.
+
+        Relee solo la cabecera del pedido (camino de error) y lanza el mismo
+        ValueError que la validación en Python, u OrderVersionConflictError si el
+        pedido cambió. Dentro de un batch, si el pedido sigue como se leyó, el
+        fallo vino de otra sentencia (p. ej. stock) y no se lanza nada.
+        """
+        expected_version = expected_version if expected_version is not None else request.expected_version
+        current = self.repo.get_by_id(order_id, include_items=False)
+        if current is None:
+            raise ValueError(f"Pedido con ID {order_id} no encontrado")
+        if expected_version is not None and current.version != expected_version:
+            raise OrderVersionConflictError(order_id, expected_version, current.version, current.status.value)
+
+        if items is not None:
+            current.items = items
+        is_valid, error_msg = OrderStatusService.validate_transition(current, new_status)
+        if not is_valid:
+            raise ValueError(error_msg)
+        if new_status == OrderStatus.CANCELLED:
+            can_cancel, cancel_error = OrderStatusService.can_cancel(current)
+            if not can_cancel:
+                raise ValueError(cancel_error)
+        OrderStatusService.apply_status_change(current, new_status, user_id, request.cancellation_reason)
+
+        if not within_batch:
+            # La transición es válida con el estado actual: el pedido cambió entre el UPDATE y la lectura
+            raise OrderVersionConflictError(order_id, expected_version, current.version, current.status.value)
 
     def get_order_by_id(self, order_id: str) -> Optional[OrderResponseDTO]:
         order = self.repo.get_by_id(order_id)
         return self._to_response_dto(order) if order else None
 
-    def get_orders_by_waiter(self, waiter_id: str) -> list[OrderResponseDTO]:
-        orders = self.repo.get_all(waiter_id=waiter_id)
-        return [self._to_response_dto(order) for order in orders]
+    def list_orders_page(
+        self,
+        waiter_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        status: Optional[OrderStatus] = None,
+        service_type: Optional[ServiceType] = None,
+        table_number: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> OrderPageResponseDTO:
+        """Listar los pedidos del mesero por páginas (más recientes primero)."""
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"El límite debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        # Se pide un pedido de más para saber si existe una página siguiente
+        orders = self.repo.get_page(
+            waiter_id=waiter_id,
+            limit=limit + 1,
+            after=self._decode_cursor(cursor) if cursor else None,
+            status=status.value if status else None,
+            service_type=service_type.value if service_type else None,
+            table_number=table_number,
+            created_from=created_from,
+            created_to=created_to,
+        )
+        has_more = len(orders) > limit
+        orders = orders[:limit]
+
+        return OrderPageResponseDTO(
+            items=[self._to_response_dto(order) for order in orders],
+            next_cursor=self._encode_cursor(orders[-1]) if has_more else None,
+            has_more=has_more,
+            limit=limit,
+        )
+
+    @staticmethod
+    def _encode_cursor(order: Order) -> str:
+        raw = f"{order.created_at.isoformat()}|{order.id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, str]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            created_at, order_id = raw.split("|", 1)
+            datetime.fromisoformat(created_at)
+        except (ValueError, UnicodeError):
+            raise ValueError("Cursor de paginación inválido")
+        return created_at, order_id
 
     def _to_response_dto(self, order: Order) -> OrderResponseDTO:
         """Convierte entidad Order a DTO de respuesta"""
@@ -137,6 +449,7 @@ class OrderService:
             completed_at=order.completed_at,
             preparation_time=order.preparation_time,
             total_time=order.total_time,
+            version=order.version,
             items=[
                 OrderItemResponseDTO(
                     id=item.id,
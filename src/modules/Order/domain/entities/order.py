@@ -43,5 +43,6 @@ class Order(BaseModel):
     completed_at: Optional[datetime] = None
     preparation_time: Optional[int] = None  # in seconds
     total_time: Optional[int] = None  # in seconds
+    version: int = 1  # se incrementa en cada cambio de estado (concurrencia optimista)
     items: List[OrderItem] = []
 
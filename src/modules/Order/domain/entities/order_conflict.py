@@ -0,0 +1,15 @@
+from typing import Optional
+
+
+class OrderVersionConflictError(ValueError):
+    """El pedido cambió desde que se leyó; el cambio de estado no se aplicó."""
+
+    def __init__(self, order_id: str, expected_version: Optional[int], current_version: int, current_status: str):
+        self.order_id = order_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+        self.current_status = current_status
+        super().__init__(
+            f"El pedido {order_id} fue modificado por otra solicitud "
+            f"(versión actual {current_version}, estado {current_status}). Vuelve a cargarlo e inténtalo de nuevo"
+        )
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+ORDER_CREATED_EVENT = "order.created"
+ORDER_STATUS_CHANGED_EVENT = "order.status_changed"
+
+class OrderEvent(BaseModel):
+    """Evento del historial de un pedido (order_events, solo inserción)."""
+    seq: int
+    event_id: str
+    order_id: str
+    event_type: str
+    from_status: Optional[str] = None
+    to_status: str
+    service_type: str
+    version: Optional[int] = None
+    actor_id: Optional[str] = None
+    preparation_time: Optional[int] = None
+    total_time: Optional[int] = None
+    payload: Optional[dict] = None
+    occurred_at: datetime
@@ -1,19 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
-
-class OrderItem(BaseModel):
-    id: str
-    order_id: str
-    menu_item_id: str
-    menu_item_name: str
-    quantity: int
-    unit_price: float
-    subtotal: float
-    special_notes: Optional[str] = None
-
-    class Config:
-        from_attributes = True
+from pydantic import BaseModel, Field
 from typing import Optional
+from datetime import datetime
 
 class OrderItem(BaseModel):
     id: str
@@ -24,6 +11,7 @@ class OrderItem(BaseModel):
     unit_price: float
     subtotal: float
     special_notes: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.now)
 
     class Config:
         from_attributes = True
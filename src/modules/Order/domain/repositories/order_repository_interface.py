@@ -1,16 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from src.modules.Order.domain.entities.order import Order
 
 class IOrderRepository(ABC):
     @abstractmethod
     def create(self, order: Order) -> Order: pass
+
+    @abstractmethod
+    def create_many(self, orders: List[Order]) -> List[Order]: pass
     
     @abstractmethod
     def get_by_id(self, order_id: str) -> Optional[Order]: pass
+
+    @abstractmethod
+    def get_many(self, order_ids: List[str], include_items: bool = True) -> Dict[str, Order]: pass
     
     @abstractmethod
     def get_all(self, waiter_id: Optional[str] = None) -> List[Order]: pass
     
+    @abstractmethod
+    def get_page(
+        self,
+        waiter_id: Optional[str],
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        status: Optional[str] = None,
+        service_type: Optional[str] = None,
+        table_number: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[Order]: pass
+
     @abstractmethod
     def update_status(self, order_id: str, status: str) -> bool: pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from src.modules.Order.domain.entities.order import Order, OrderStatus, ServiceType
 
 class OrderStatusService:
@@ -30,6 +30,19 @@ class OrderStatusService:
         }
     }
 
+    @staticmethod
+    def allowed_sources(new_status: OrderStatus) -> List[Tuple[ServiceType, OrderStatus]]:
+        """
+        Pares (modalidad, estado actual) desde los que se puede pasar a new_status.
+        Los usa el UPDATE condicional para validar la transición en SQL.
+        """
+        return [
+            (service_type, current_status)
+            for service_type, transitions in OrderStatusService.VALID_TRANSITIONS.items()
+            for current_status, targets in transitions.items()
+            if new_status in targets
+        ]
+
     @staticmethod
     def validate_transition(order: Order, new_status: OrderStatus) -> Tuple[bool, str]:
         """
@@ -64,11 +77,32 @@ class OrderStatusService:
         else:  # TAKEOUT or DELIVERY
             return OrderStatus.DELIVERED
 
+    @staticmethod
+    def notify_status_change(order: Order) -> None:
+        """Avisa a cocina / meseros del nuevo estado del pedido"""
+        if order.status == OrderStatus.PREPARING:
+            print(f"🔔 Notificación a cocina: Pedido {order.order_number} ({order.service_type.value}) iniciado preparación")
+
+        elif order.status == OrderStatus.READY:
+            if order.service_type == ServiceType.DINE_IN:
+                print(f"🔔 Notificación a mesero: Pedido {order.order_number} listo para servir en mesa {order.table_number}")
+            else:  # TAKEOUT or DELIVERY
+                action = "recoger" if order.service_type == ServiceType.TAKEOUT else "entregar"
+                print(f"🔔 Notificación: Pedido {order.order_number} listo para {action}")
+
+        elif order.status in [OrderStatus.SERVED, OrderStatus.DELIVERED]:
+            status_text = "servido" if order.status == OrderStatus.SERVED else "entregado"
+            print(f"✅ Pedido {order.order_number} {status_text}")
+
+        elif order.status == OrderStatus.CANCELLED:
+            print(f"❌ Pedido {order.order_number} cancelado por {order.cancelled_by}: {order.cancellation_reason}")
+
     @staticmethod
     def apply_status_change(order: Order, new_status: OrderStatus, user_id: str,
                           cancellation_reason: Optional[str] = None) -> Order:
         """
-        Aplica el cambio de estado con toda la lógica de negocio
+        Aplica el cambio de estado con toda la lógica de negocio.
+        No envía avisos: se llama a notify_status_change una vez guardado el cambio.
         """
         now = datetime.now()
         updated_order = order.model_copy()  # Crear copia para no modificar el original
@@ -81,7 +115,6 @@ class OrderStatusService:
             # Validar que tenga items
             if not order.items:
                 raise ValueError("No se puede iniciar preparación: el pedido no tiene items")
-            print(f"🔔 Notificación a cocina: Pedido {updated_order.order_number} ({updated_order.service_type.value}) iniciado preparación")
 
         elif new_status == OrderStatus.READY:
             # CA4: Al cambiar a 'ready'
@@ -90,12 +123,6 @@ class OrderStatusService:
             updated_order.ready_at = now
             updated_order.preparation_time = int((now - updated_order.preparation_started_at).total_seconds())
 
-            if updated_order.service_type == ServiceType.DINE_IN:
-                print(f"🔔 Notificación a mesero: Pedido {updated_order.order_number} listo para servir en mesa {updated_order.table_number}")
-            else:  # TAKEOUT or DELIVERY
-                action = "recoger" if updated_order.service_type == ServiceType.TAKEOUT else "entregar"
-                print(f"🔔 Notificación: Pedido {updated_order.order_number} listo para {action}")
-
         elif new_status in [OrderStatus.SERVED, OrderStatus.DELIVERED]:
             # CA5: Al cambiar a estado final
             if not updated_order.ready_at:
@@ -106,9 +133,6 @@ class OrderStatusService:
             if updated_order.payment_status == "PENDING":
                 updated_order.payment_status = "PAID"
 
-            status_text = "servido" if new_status == OrderStatus.SERVED else "entregado"
-            print(f"✅ Pedido {updated_order.order_number} {status_text}")
-
         elif new_status == OrderStatus.CANCELLED:
             # CA6: Al cambiar a 'cancelled'
             if not cancellation_reason:
@@ -116,7 +140,6 @@ class OrderStatusService:
             updated_order.cancelled_at = now
             updated_order.cancelled_by = user_id
             updated_order.cancellation_reason = cancellation_reason
-            print(f"❌ Pedido {updated_order.order_number} cancelado por {user_id}: {cancellation_reason}")
 
         return updated_order
         """
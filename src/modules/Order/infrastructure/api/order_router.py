@@ -1,33 +1,102 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from src.modules.Order.application.usecases.order_usecases import OrderService
-from src.modules.Order.application.dto.order_request import OrderRequestDTO, OrderStatusUpdateRequestDTO
-from src.modules.Order.application.dto.order_response import OrderResponseDTO
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from src.modules.Order.application.usecases.order_usecases import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, OrderService
+from src.modules.Order.application.usecases.order_analytics_usecases import MAX_STATS_DAYS, OrderAnalyticsService
+from src.modules.Order.application.dto.order_analytics_response import (
+    OrderHistoryResponseDTO,
+    OrderStatusBoardResponseDTO,
+    OrderTimingStatsResponseDTO,
+)
+from src.modules.Order.application.dto.order_request import (
+    OrderCreateBatchRequestDTO,
+    OrderRequestDTO,
+    OrderStatusBatchRequestDTO,
+    OrderStatusUpdateRequestDTO,
+)
+from src.modules.Order.application.dto.order_response import (
+    OrderPageResponseDTO,
+    OrderResponseDTO,
+    OrderStatusBatchResponseDTO,
+)
 from src.modules.User.infrastructure.api.auth_router import get_current_user
-from src.modules.Order.domain.entities.order import ServiceType
-from typing import List
+from src.modules.User.infrastructure.api.dependencies import require_permission
+from src.modules.Order.domain.entities.order import OrderStatus, ServiceType
+from src.modules.Order.domain.entities.order_conflict import OrderVersionConflictError
+from datetime import datetime
+from typing import List, Optional
 
 order_router = APIRouter(prefix="/api/orders", tags=["Orders"])
 
-@order_router.post("/", response_model=OrderResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_order(request: OrderRequestDTO, user = Depends(get_current_user)):
-    """Crear un nuevo pedido"""
-    # Validaciones específicas por tipo de servicio
+def _validate_service_requirements(request: OrderRequestDTO, prefix: str = "") -> None:
+    """Validaciones específicas por tipo de servicio (400 si falta la mesa o el teléfono)"""
     if request.service_type == ServiceType.DINE_IN:
         if not request.table_number:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Para pedidos en mesa se requiere especificar el número de mesa"
+                detail=f"{prefix}Para pedidos en mesa se requiere especificar el número de mesa"
             )
     elif request.service_type in [ServiceType.TAKEOUT, ServiceType.DELIVERY]:
         if not request.customer_phone:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Para pedidos {'para llevar' if request.service_type == ServiceType.TAKEOUT else 'a domicilio'} se requiere el teléfono del cliente"
+                detail=f"{prefix}Para pedidos {'para llevar' if request.service_type == ServiceType.TAKEOUT else 'a domicilio'} se requiere el teléfono del cliente"
             )
 
+@order_router.post("/", response_model=OrderResponseDTO, status_code=status.HTTP_201_CREATED)
+def create_order(request: OrderRequestDTO, user = Depends(get_current_user)):
+    """Crear un nuevo pedido"""
+    _validate_service_requirements(request)
+
     service = OrderService()
     return service.create_order(waiter_id=user["id"], request=request)
 
+@order_router.post("/batch", response_model=List[OrderResponseDTO], status_code=status.HTTP_201_CREATED)
+def create_orders(request: OrderCreateBatchRequestDTO, user = Depends(require_permission("manage_orders"))):
+    """
+    Crear varios pedidos a la vez (p. ej. cargar los pedidos tomados sin conexión)
+
+    - **orders**: Lista de pedidos con los mismos campos que `POST /api/orders/`
+      (máximo `ORDER_CREATE_BATCH_MAX_SIZE`)
+
+    Se crean todos en una única transacción o ninguno: si un pedido no es válido
+    responde 400 indicando su posición. Requiere el permiso `manage_orders`.
+    """
+    for index, order_request in enumerate(request.orders):
+        _validate_service_requirements(order_request, prefix=f"Pedido {index}: ")
+    try:
+        service = OrderService()
+        return service.create_orders(waiter_id=user["id"], requests=request.orders)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@order_router.post("/status:batch", response_model=OrderStatusBatchResponseDTO)
+def update_orders_status(request: OrderStatusBatchRequestDTO, user = Depends(get_current_user)):
+    """
+    Cambiar el estado de varios pedidos a la vez (p. ej. el pase de cocina marcando tickets como ready)
+
+    - **updates**: Lista de `{order_id, new_status, expected_version, cancellation_reason}`, mismos
+      campos que `PUT /api/orders/{order_id}/status` (máximo `ORDER_STATUS_BATCH_MAX_SIZE`)
+
+    Los cambios válidos se aplican juntos en una única transacción. Cada resultado trae su
+    `status_code`: 200 aplicado (con el pedido), 400 transición no válida, 404 no existe,
+    409 `expected_version` desactualizada, 500 error inesperado en ese pedido. La respuesta es 200 aunque algunos fallen.
+    """
+    try:
+        service = OrderService()
+        return service.update_orders_status(request.updates, user["id"])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error interno del servidor: {str(e)}"
+        )
+
 @order_router.put("/{order_id}/status", response_model=OrderResponseDTO)
 def update_order_status(order_id: str, request: OrderStatusUpdateRequestDTO, user = Depends(get_current_user)):
     """
@@ -38,10 +107,17 @@ def update_order_status(order_id: str, request: OrderStatusUpdateRequestDTO, use
         - Para DINE_IN: pending, preparing, ready, served, cancelled
         - Para TAKEOUT/DELIVERY: pending, preparing, ready, delivered, cancelled
     - **cancellation_reason**: Requerido solo cuando new_status es 'cancelled'
+    - **expected_version**: Opcional; `version` del pedido que tiene el cliente.
+      Si otra solicitud lo cambió antes, responde 409 sin aplicar nada
     """
     try:
         service = OrderService()
         return service.update_order_status(order_id, request, user["id"])
+    except OrderVersionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,6 +129,42 @@ def update_order_status(order_id: str, request: OrderStatusUpdateRequestDTO, use
             detail=f"Error interno del servidor: {str(e)}"
         )
 
+@order_router.get("/stats/status", response_model=OrderStatusBoardResponseDTO)
+def get_status_board(user = Depends(require_permission("view_reports"))):
+    """Pedidos por modalidad y estado actual (proyección order_status_counts)"""
+    return OrderAnalyticsService().get_status_board()
+
+@order_router.get("/stats/timing", response_model=List[OrderTimingStatsResponseDTO])
+def get_timing_stats(
+    days: int = Query(default=7, ge=1, le=MAX_STATS_DAYS, description="Días hacia atrás, incluido hoy"),
+    service_type: Optional[ServiceType] = Query(default=None, description="Filtrar por tipo de servicio"),
+    user = Depends(require_permission("view_reports")),
+):
+    """
+    Tiempos de preparación y totales por modalidad y día (proyección order_timing_stats)
+
+    - **avg_preparation_time / max_preparation_time**: segundos de preparing a ready
+    - **avg_total_time / max_total_time**: segundos desde la creación hasta served/delivered
+    """
+    try:
+        return OrderAnalyticsService().get_timing_stats(days=days, service_type=service_type)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@order_router.get("/{order_id}/events", response_model=OrderHistoryResponseDTO)
+def get_order_history(order_id: str, user = Depends(get_current_user)):
+    """Historial de eventos de un pedido (creación y cada cambio de estado, en orden)"""
+    history = OrderAnalyticsService().get_order_history(order_id)
+    if not history:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pedido con ID {order_id} no encontrado"
+        )
+    return history
+
 @order_router.get("/{order_id}", response_model=OrderResponseDTO)
 def get_order(order_id: str, user = Depends(get_current_user)):
     """Obtener detalles de un pedido específico"""
@@ -65,8 +177,38 @@ def get_order(order_id: str, user = Depends(get_current_user)):
         )
     return order
 
-@order_router.get("/", response_model=List[OrderResponseDTO])
-def get_orders(user = Depends(get_current_user)):
-    """Obtener todos los pedidos del mesero actual"""
-    service = OrderService()
-    return service.get_orders_by_waiter(user["id"])
\ No newline at end of file
+@order_router.get("/", response_model=OrderPageResponseDTO)
+def get_orders(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Pedidos por página"),
+    cursor: Optional[str] = Query(default=None, description="Valor next_cursor de la página anterior"),
+    status_filter: Optional[OrderStatus] = Query(default=None, alias="status", description="Filtrar por estado"),
+    service_type: Optional[ServiceType] = Query(default=None, description="Filtrar por tipo de servicio"),
+    table_number: Optional[int] = Query(default=None, description="Filtrar por número de mesa"),
+    created_from: Optional[datetime] = Query(default=None, description="Creados desde (inclusive)"),
+    created_to: Optional[datetime] = Query(default=None, description="Creados hasta (inclusive)"),
+    user = Depends(get_current_user),
+):
+    """
+    Obtener los pedidos del mesero actual, paginados (más recientes primero)
+
+    - **limit**: Tamaño de página (máximo 200)
+    - **cursor**: Enviar el `next_cursor` de la respuesta anterior para obtener la página siguiente
+    - **status / service_type / table_number / created_from / created_to**: Filtros opcionales
+    """
+    try:
+        service = OrderService()
+        return service.list_orders_page(
+            waiter_id=user["id"],
+            limit=limit,
+            cursor=cursor,
+            status=status_filter,
+            service_type=service_type,
+            table_number=table_number,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
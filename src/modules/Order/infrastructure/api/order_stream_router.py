@@ -0,0 +1,238 @@
+"""
+Streaming de pedidos en tiempo real (SSE y WebSocket) - Capa de Infraestructura.
+
+Las pantallas de cocina y de meseros se suscriben una vez y reciben cada pedido
+nuevo (order.created) y cada cambio de estado (order.status_changed) con el
+pedido completo, en lugar de consultar GET /api/orders cada pocos segundos.
+
+Filtros:
+- Rol: quien tiene el permiso view_reports (admin, employee: pantallas de cocina)
+  ve todos los pedidos y puede filtrar por waiter_id. El resto solo ve sus pedidos.
+- Estación: `station=kitchen` o `station=pass` elige los estados que interesan a
+  cada puesto. `status` y `service_type` filtran de forma explícita.
+
+Reanudación: cada evento lleva un id "<época>-<secuencia>". Al reconectar se
+envía el último recibido (cabecera Last-Event-ID o `last_event_id`) y llegan los
+eventos perdidos. Si ya no están en el historial, o el id es de otra época
+(reinicio del servidor u otro worker), se envía `resync` y el cliente debe
+recargar los pedidos.
+
+Sesión: en cada evento y en cada keepalive se vuelve a comprobar que la sesión
+del token no se haya cerrado; si se cerró se envía `revoked` y se corta el stream.
+"""
+import json
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.modules.Order.domain.entities.order import OrderStatus, ServiceType
+from src.modules.Order.infrastructure.events.order_event_publisher import order_event_broker
+from src.modules.User.infrastructure.api.auth_router import get_current_user, permission_matrix, revoked_sessions
+from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.events import BrokerEvent, SubscriptionClosed
+
+order_stream_router = APIRouter(prefix="/api/orders", tags=["Orders"])
+
+# Estados que muestra cada estación
+STATIONS: Dict[str, Set[str]] = {
+    # Cocina: lo que hay que preparar y lo que sale de la pantalla (listo / cancelado)
+    "kitchen": {OrderStatus.PENDING.value, OrderStatus.PREPARING.value, OrderStatus.READY.value, OrderStatus.CANCELLED.value},
+    # Pase / meseros: lo que está listo para servir o entregar
+    "pass": {OrderStatus.READY.value, OrderStatus.SERVED.value, OrderStatus.DELIVERED.value, OrderStatus.CANCELLED.value},
+}
+
+# Permiso que permite ver los pedidos de todos los meseros
+VIEW_ALL_ORDERS_PERMISSION = "view_reports"
+
+# Código de cierre del WebSocket cuando se expulsa a un consumidor lento (1013 = reintentar más tarde)
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+def _can_view_all_orders(user: Dict[str, Any]) -> bool:
+    permissions = user.get("permissions")
+    if permissions is not None:
+        return VIEW_ALL_ORDERS_PERMISSION in permissions
+    return permission_matrix.has_permission(user.get("role_id"), VIEW_ALL_ORDERS_PERMISSION)
+
+
+def _build_filter(
+    user: Dict[str, Any],
+    station: Optional[str],
+    statuses: Optional[List[str]],
+    service_types: Optional[List[str]],
+    waiter_id: Optional[str],
+):
+    """
+    Construir el filtro de eventos del usuario.
+
+    Raises:
+        ValueError: Estación, estado o modalidad desconocidos
+        PermissionError: Un usuario sin view_reports pide los pedidos de otro mesero
+    """
+    if _can_view_all_orders(user):
+        allowed_waiter = waiter_id
+    else:
+        if waiter_id is not None and waiter_id != user["id"]:
+            raise PermissionError("Solo puedes ver tus propios pedidos")
+        allowed_waiter = user["id"]
+
+    allowed_statuses: Optional[Set[str]] = None
+    if station is not None:
+        if station not in STATIONS:
+            raise ValueError(f"Estación '{station}' no válida. Estaciones: {sorted(STATIONS)}")
+        allowed_statuses = set(STATIONS[station])
+    if statuses:
+        requested = {OrderStatus(value.lower()).value for value in statuses}
+        allowed_statuses = requested if allowed_statuses is None else allowed_statuses & requested
+    allowed_service_types = {ServiceType(value.lower()).value for value in service_types} if service_types else None
+
+    def predicate(event: BrokerEvent) -> bool:
+        attributes = event.attributes
+        if allowed_waiter is not None and attributes.get("waiter_id") != allowed_waiter:
+            return False
+        if allowed_statuses is not None and attributes.get("status") not in allowed_statuses:
+            return False
+        if allowed_service_types is not None and attributes.get("service_type") not in allowed_service_types:
+            return False
+        return True
+
+    return predicate
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[str]:
+    # Un id desconocido no es un error: el broker responde con resync
+    if value is None or value.strip() == "":
+        return None
+    return value.strip()
+
+
+def _session_revoked(user: Dict[str, Any]) -> bool:
+    """La sesión del token se cerró después del handshake (comprobación en memoria)."""
+    session_id = user.get("session_id")
+    return session_id is not None and revoked_sessions.is_revoked(session_id)
+
+
+def _sse_message(event_type: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+@order_stream_router.get("/stream")
+async def stream_orders(
+    request: Request,
+    station: Optional[str] = Query(default=None, description="kitchen o pass"),
+    status_filter: Optional[List[str]] = Query(default=None, alias="status", description="Estados a recibir"),
+    service_type: Optional[List[str]] = Query(default=None, description="Modalidades a recibir"),
+    waiter_id: Optional[str] = Query(default=None, description="Solo pedidos de este mesero (requiere view_reports)"),
+    last_event_id: Optional[str] = Query(default=None, description="Último id recibido (alternativa a Last-Event-ID)"),
+    last_event_id_header: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+    user = Depends(get_current_user),
+):
+    """
+    Eventos de pedidos por Server-Sent Events (text/event-stream)
+
+    - `order.created` / `order.status_changed`: `data` es el pedido completo
+    - `resync`: el id de reanudación ya no está disponible; recargar `GET /api/orders`
+    - `evicted`: la conexión se quedó atrás y se cerró; reconectar con Last-Event-ID
+    - `revoked`: la sesión se cerró; el stream termina
+    - Comentarios `: keepalive` cada ORDER_STREAM_KEEPALIVE_SECONDS sin eventos
+    """
+    try:
+        predicate = _build_filter(user, station, status_filter, service_type, waiter_id)
+        resume_from = _parse_event_id(last_event_id_header or last_event_id)
+    except PermissionError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def event_stream():
+        # Se suscribe al empezar a enviar: si el cliente se va antes, no queda suscripción huérfana
+        subscription = order_event_broker.subscribe(predicate, resume_from)
+        try:
+            yield "retry: 3000\n\n"
+            if subscription.resync_required:
+                yield _sse_message("resync", {"last_event_id": order_event_broker.last_event_id})
+            while not await request.is_disconnected():
+                try:
+                    event = await subscription.get(timeout=settings.ORDER_STREAM_KEEPALIVE_SECONDS)
+                except SubscriptionClosed as closed:
+                    yield _sse_message("evicted", {"reason": closed.reason})
+                    break
+                if _session_revoked(user):
+                    yield _sse_message("revoked", {"detail": "La sesión fue cerrada"})
+                    break
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse_message(event.type, event.to_message(), event.id)
+        finally:
+            order_event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@order_stream_router.websocket("/ws")
+async def order_events_websocket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(default=None, description="JWT (los navegadores no envían cabeceras en WebSocket)"),
+    station: Optional[str] = Query(default=None),
+    status_filter: Optional[List[str]] = Query(default=None, alias="status"),
+    service_type: Optional[List[str]] = Query(default=None),
+    waiter_id: Optional[str] = Query(default=None),
+    last_event_id: Optional[str] = Query(default=None),
+):
+    """
+    Eventos de pedidos por WebSocket: mismos filtros y reanudación que /stream.
+    Cada mensaje es JSON {"id", "type", "created_at", "data"}; además `resync`,
+    `keepalive`, `evicted` (seguido de cierre 1013) y `revoked` (seguido de cierre 1008).
+    """
+    authorization = websocket.headers.get("authorization", "")
+    if not token and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    try:
+        # get_current_user es síncrona (puede consultar la base): fuera del event loop
+        user = await run_in_threadpool(
+            get_current_user, HTTPAuthorizationCredentials(scheme="Bearer", credentials=token or "")
+        )
+        predicate = _build_filter(user, station, status_filter, service_type, waiter_id)
+        resume_from = _parse_event_id(last_event_id)
+    except (HTTPException, PermissionError, ValueError) as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(getattr(e, "detail", e))[:120])
+        return
+
+    # Suscribirse antes de aceptar: ningún evento posterior al handshake se pierde
+    subscription = order_event_broker.subscribe(predicate, resume_from)
+    try:
+        await websocket.accept()
+        if subscription.resync_required:
+            await websocket.send_json({"type": "resync", "last_event_id": order_event_broker.last_event_id})
+        while True:
+            try:
+                event = await subscription.get(timeout=settings.ORDER_STREAM_KEEPALIVE_SECONDS)
+            except SubscriptionClosed as closed:
+                await websocket.send_json({"type": "evicted", "reason": closed.reason})
+                await websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER)
+                break
+            if _session_revoked(user):
+                await websocket.send_json({"type": "revoked", "detail": "La sesión fue cerrada"})
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                break
+            if event is None:
+                await websocket.send_json({"type": "keepalive"})
+                continue
+            await websocket.send_json(event.to_message())
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        order_event_broker.unsubscribe(subscription)
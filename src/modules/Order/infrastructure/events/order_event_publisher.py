@@ -0,0 +1,56 @@
+"""
+Publicación de eventos de pedidos - Capa de Infraestructura.
+
+Las tablets de cocina y de meseros reciben los pedidos nuevos y los cambios de
+estado por SSE / WebSocket (order_stream_router) en lugar de consultar
+GET /api/orders cada pocos segundos. OrderService publica aquí después de
+confirmar cada escritura en la base.
+"""
+from typing import Any, Dict, Optional
+
+from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.events import BrokerEvent, EventBroker
+
+ORDER_CREATED = "order.created"
+ORDER_STATUS_CHANGED = "order.status_changed"
+
+# Broker compartido por los publicadores (OrderService) y los endpoints de streaming
+order_event_broker = EventBroker(
+    history_size=settings.ORDER_STREAM_HISTORY_SIZE,
+    max_queue_size=settings.ORDER_STREAM_QUEUE_SIZE,
+)
+
+
+class OrderEventPublisher:
+    """
+    Publica eventos de pedidos con los atributos por los que filtran los suscriptores
+    (waiter_id, service_type, status).
+
+    Attributes:
+        broker: Broker donde se publican los eventos
+    """
+
+    def __init__(self, broker: Optional[EventBroker] = None):
+        self.broker = broker or order_event_broker
+
+    def order_created(self, order: Dict[str, Any]) -> Optional[BrokerEvent]:
+        return self._publish(ORDER_CREATED, order)
+
+    def status_changed(self, order: Dict[str, Any]) -> Optional[BrokerEvent]:
+        return self._publish(ORDER_STATUS_CHANGED, order)
+
+    def _publish(self, event_type: str, order: Dict[str, Any]) -> Optional[BrokerEvent]:
+        """Publicar sin interrumpir la petición: el pedido ya está guardado."""
+        try:
+            return self.broker.publish(
+                event_type,
+                order,
+                attributes={
+                    "waiter_id": order.get("waiter_id"),
+                    "service_type": order.get("service_type"),
+                    "status": order.get("status"),
+                },
+            )
+        except Exception as e:
+            print(f"⚠️  No se pudo publicar el evento {event_type}: {e}")
+            return None
@@ -0,0 +1,183 @@
+"""
+Historial de pedidos y proyecciones - Capa de Infraestructura.
+
+order_events es un registro de solo inserción: un evento por creación y por
+cambio de estado, escrito en el mismo batch que la escritura del pedido
+(OrderRepository.create_many / transition_status), por lo que nunca diverge de
+la tabla orders. Con él se mantienen de forma incremental, en ese mismo batch:
+
+- order_status_counts: pedidos por modalidad y estado actual (tableros en vivo)
+- order_timing_stats: tiempos de preparación y totales por modalidad y día
+
+Las analíticas leen estas tablas compactas en lugar de recorrer orders.
+rebuild_projections() las recalcula desde el historial completo.
+"""
+import json
+import uuid
+from collections import Counter
+from datetime import date
+from typing import List, Optional, Tuple
+
+from src.modules.Order.domain.entities.order import Order, OrderStatus
+from src.modules.Order.domain.entities.order_event import ORDER_CREATED_EVENT, OrderEvent
+from src.shared.infrastructure.database.turso_connection import get_turso_client
+
+ORDER_EVENT_COLUMNS = (
+    "event_id", "order_id", "event_type", "from_status", "to_status", "service_type",
+    "version", "actor_id", "preparation_time", "total_time", "payload", "occurred_at",
+)
+
+# Estados cuyo evento suma a order_timing_stats
+TIMED_STATUSES = (OrderStatus.READY, OrderStatus.SERVED, OrderStatus.DELIVERED, OrderStatus.CANCELLED)
+
+STATUS_COUNT_UPSERT = """
+    ON CONFLICT (service_type, status) DO UPDATE SET order_count = order_count + excluded.order_count
+"""
+
+# Columnas de order_timing_stats calculadas desde eventos de order_events
+TIMING_STATS_SELECT = """service_type, substr(occurred_at, 1, 10),
+       SUM(to_status = 'ready'),
+       SUM(CASE WHEN to_status = 'ready' THEN COALESCE(preparation_time, 0) ELSE 0 END),
+       MAX(CASE WHEN to_status = 'ready' THEN COALESCE(preparation_time, 0) ELSE 0 END),
+       SUM(to_status IN ('served', 'delivered')),
+       SUM(CASE WHEN to_status IN ('served', 'delivered') THEN COALESCE(total_time, 0) ELSE 0 END),
+       MAX(CASE WHEN to_status IN ('served', 'delivered') THEN COALESCE(total_time, 0) ELSE 0 END),
+       SUM(to_status = 'cancelled')"""
+
+TIMING_STATS_COLUMNS = """service_type, day, ready_count, preparation_time_total, preparation_time_max,
+    completed_count, total_time_total, total_time_max, cancelled_count"""
+
+
+def created_event_rows(orders: List[Order]) -> List[list]:
+    """Filas de order_events (order.created) para pedidos nuevos."""
+    return [
+        [
+            str(uuid.uuid4()), order.id, ORDER_CREATED_EVENT, None, order.status.value,
+            order.service_type.value, order.version, order.waiter_id, None, None, None,
+            order.created_at.isoformat(),
+        ]
+        for order in orders
+    ]
+
+
+def created_projection_statements(orders: List[Order]) -> List[Tuple[str, list]]:
+    """Sumar los pedidos nuevos a order_status_counts (una sentencia multi-fila)."""
+    counts = Counter((order.service_type.value, order.status.value) for order in orders)
+    if not counts:
+        return []
+    query = (
+        "INSERT INTO order_status_counts (service_type, status, order_count) VALUES "
+        + ", ".join("(?, ?, ?)" for _ in counts)
+        + STATUS_COUNT_UPSERT
+    )
+    params = [value for (service_type, status), count in counts.items() for value in (service_type, status, count)]
+    return [(query, params)]
+
+
+def transition_projection_statements(event_id: str, new_status: OrderStatus) -> List[Tuple[str, list]]:
+    """
+    Aplicar el evento `event_id` a las proyecciones.
+
+    Las sentencias leen el evento recién insertado en el mismo batch: si la
+    transición no se aplicó (no hay evento) no cambian nada.
+    """
+    statements = [
+        ("""
+            UPDATE order_status_counts SET order_count = order_count - 1
+            WHERE (service_type, status) IN (SELECT service_type, from_status FROM order_events WHERE event_id = ?)
+        """, [event_id]),
+        (f"""
+            INSERT INTO order_status_counts (service_type, status, order_count)
+            SELECT service_type, to_status, 1 FROM order_events WHERE event_id = ?
+            {STATUS_COUNT_UPSERT}
+        """, [event_id]),
+    ]
+    if new_status in TIMED_STATUSES:
+        statements.append((f"""
+            INSERT INTO order_timing_stats ({TIMING_STATS_COLUMNS})
+            SELECT {TIMING_STATS_SELECT}
+            FROM order_events WHERE event_id = ?
+            -- Sin GROUP BY el agregado devolvería una fila de NULL cuando no hay evento
+            GROUP BY service_type
+            ON CONFLICT (service_type, day) DO UPDATE SET
+                ready_count = ready_count + excluded.ready_count,
+                preparation_time_total = preparation_time_total + excluded.preparation_time_total,
+                preparation_time_max = MAX(preparation_time_max, excluded.preparation_time_max),
+                completed_count = completed_count + excluded.completed_count,
+                total_time_total = total_time_total + excluded.total_time_total,
+                total_time_max = MAX(total_time_max, excluded.total_time_max),
+                cancelled_count = cancelled_count + excluded.cancelled_count
+        """, [event_id]))
+    return statements
+
+
+class OrderEventRepository:
+    """Lecturas del historial y de las proyecciones de pedidos."""
+
+    def __init__(self):
+        self.db = get_turso_client()
+
+    def get_history(self, order_id: str) -> List[OrderEvent]:
+        """Eventos de un pedido en el orden en que ocurrieron."""
+        rows = self.db.execute(f"""
+            SELECT seq, {", ".join(ORDER_EVENT_COLUMNS)}
+            FROM order_events WHERE order_id = ? ORDER BY seq
+        """, [order_id]).fetchall()
+        return [self._map_event(row) for row in rows]
+
+    def get_status_counts(self) -> List[Tuple[str, str, int]]:
+        """(service_type, status, order_count) de los estados con pedidos."""
+        rows = self.db.execute("""
+            SELECT service_type, status, order_count FROM order_status_counts
+            WHERE order_count > 0 ORDER BY service_type, status
+        """).fetchall()
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    def get_timing_stats(self, since: date, service_type: Optional[str] = None) -> List[tuple]:
+        """Filas de order_timing_stats desde `since` (inclusive), más recientes primero."""
+        query = f"SELECT {TIMING_STATS_COLUMNS} FROM order_timing_stats WHERE day >= ?"
+        params: list = [since.isoformat()]
+        if service_type:
+            query += " AND service_type = ?"
+            params.append(service_type)
+        query += " ORDER BY day DESC, service_type"
+        return [tuple(row) for row in self.db.execute(query, params).fetchall()]
+
+    def rebuild_projections(self) -> None:
+        """Recalcular ambas proyecciones desde order_events en un único batch atómico."""
+        self.db.batch([
+            ("DELETE FROM order_status_counts", []),
+            ("""
+                INSERT INTO order_status_counts (service_type, status, order_count)
+                SELECT service_type, to_status, COUNT(*)
+                FROM order_events e
+                WHERE seq = (SELECT MAX(seq) FROM order_events WHERE order_id = e.order_id)
+                GROUP BY service_type, to_status
+            """, []),
+            ("DELETE FROM order_timing_stats", []),
+            (f"""
+                INSERT INTO order_timing_stats ({TIMING_STATS_COLUMNS})
+                SELECT {TIMING_STATS_SELECT}
+                FROM order_events
+                WHERE event_type = 'order.status_changed'
+                GROUP BY service_type, substr(occurred_at, 1, 10)
+            """, []),
+        ])
+
+    @staticmethod
+    def _map_event(row) -> OrderEvent:
+        return OrderEvent(
+            seq=row[0],
+            event_id=row[1],
+            order_id=row[2],
+            event_type=row[3],
+            from_status=row[4],
+            to_status=row[5],
+            service_type=row[6],
+            version=row[7],
+            actor_id=row[8],
+            preparation_time=row[9],
+            total_time=row[10],
+            payload=json.loads(row[11]) if row[11] else None,
+            occurred_at=row[12],
+        )
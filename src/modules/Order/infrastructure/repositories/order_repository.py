@@ -1,124 +1,150 @@
-from typing import List, Optional
+import json
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
 from src.modules.Order.domain.repositories.order_repository_interface import IOrderRepository
 from src.modules.Order.domain.entities.order import Order, OrderStatus, ServiceType
+from src.modules.Order.domain.entities.order_event import ORDER_STATUS_CHANGED_EVENT
 from src.modules.Order.domain.entities.order_item import OrderItem
+from src.modules.Order.domain.services.order_status_service import OrderStatusService
+from src.modules.Order.infrastructure.repositories.order_event_repository import (
+    ORDER_EVENT_COLUMNS,
+    created_event_rows,
+    created_projection_statements,
+    transition_projection_statements,
+)
 from src.shared.infrastructure.database.turso_connection import get_turso_client
+from src.shared.infrastructure.database.unit_of_work import current_unit_of_work
 from datetime import datetime
 
+ORDER_COLUMNS = (
+    "id", "order_number", "customer_name", "customer_phone", "table_number",
+    "status", "service_type", "total_amount", "tax_amount", "discount_amount", "final_amount",
+    "payment_status", "payment_method", "special_instructions", "waiter_id",
+    "created_at", "updated_at",
+)
+
+ORDER_ITEM_COLUMNS = (
+    "id", "order_id", "menu_item_id", "menu_item_name", "quantity",
+    "unit_price", "subtotal", "special_notes", "created_at",
+)
+
+ORDER_SELECT_COLUMNS = """id, order_number, customer_name, customer_phone, table_number,
+                   status, service_type, total_amount, tax_amount, discount_amount, final_amount,
+                   payment_status, payment_method, special_instructions, waiter_id,
+                   cancelled_by, cancelled_at, cancellation_reason,
+                   created_at, updated_at, preparation_started_at, ready_at,
+                   completed_at, preparation_time, total_time, version"""
+
+ORDER_ITEM_SELECT_COLUMNS = """order_id, id, menu_item_id, menu_item_name, quantity, unit_price,
+                       subtotal, special_notes, created_at"""
+
+# Segundos completos como int(timedelta.total_seconds()) (ROUND quita el ruido de julianday)
+PREPARATION_TIME_SQL = "CAST(ROUND((julianday(?) - julianday(preparation_started_at)) * 86400, 3) AS INTEGER)"
+TOTAL_TIME_SQL = "CAST(ROUND((julianday(?) - julianday(created_at)) * 86400, 3) AS INTEGER)"
+
+# Máximo de parámetros por sentencia; 999 es el límite más bajo de SQLite/libSQL.
+MAX_PARAMS_PER_STATEMENT = 999
+
+
+def build_multi_row_insert(table: str, columns: Sequence[str], rows: List[list]) -> List[Tuple[str, list]]:
+    """
+    Construir sentencias INSERT multi-fila (VALUES (...), (...)) para un batch.
+
+    Las filas se reparten en varias sentencias para no superar
+    MAX_PARAMS_PER_STATEMENT parámetros en ninguna.
+    """
+    rows_per_statement = max(1, MAX_PARAMS_PER_STATEMENT // len(columns))
+    row_placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+    statements = []
+    for start in range(0, len(rows), rows_per_statement):
+        chunk = rows[start:start + rows_per_statement]
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+            + ", ".join(row_placeholders for _ in chunk)
+        )
+        statements.append((query, [value for row in chunk for value in row]))
+    return statements
+
+
 class OrderRepository(IOrderRepository):
     def __init__(self):
         self.db = get_turso_client()
 
     def create(self, order: Order) -> Order:
-        # Insertar pedido
-        self.db.execute("""
-            INSERT INTO orders (
-                id, order_number, customer_name, customer_phone, table_number,
-                status, service_type, total_amount, tax_amount, discount_amount, final_amount,
-                payment_status, payment_method, special_instructions, waiter_id,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, [
-            order.id, order.order_number, order.customer_name, order.customer_phone,
-            order.table_number, order.status.value, order.service_type.value, order.total_amount, order.tax_amount,
-            order.discount_amount, order.final_amount, order.payment_status,
-            order.payment_method, order.special_instructions, order.waiter_id,
-            order.created_at.isoformat(), order.updated_at.isoformat()
-        ])
+        # Cabecera e items viajan en un único batch atómico
+        self.create_many([order])
+        return order
+
+    def create_many(self, orders: List[Order]) -> List[Order]:
+        """
+        Insertar varios pedidos con sus items en un único batch atómico, junto con
+        su evento order.created y el ajuste de order_status_counts.
+        """
+        if not orders:
+            return orders
 
-        # Insertar items del pedido
-        for item in order.items:
-            self.db.execute("""
-                INSERT INTO order_items (
-                    id, order_id, menu_item_id, menu_item_name, quantity,
-                    unit_price, subtotal, special_notes, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+        order_rows = [
+            [
+                order.id, order.order_number, order.customer_name, order.customer_phone,
+                order.table_number, order.status.value, order.service_type.value, order.total_amount, order.tax_amount,
+                order.discount_amount, order.final_amount, order.payment_status,
+                order.payment_method, order.special_instructions, order.waiter_id,
+                order.created_at.isoformat(), order.updated_at.isoformat()
+            ]
+            for order in orders
+        ]
+        item_rows = [
+            [
                 item.id, order.id, item.menu_item_id, item.menu_item_name,
                 item.quantity, item.unit_price, item.subtotal,
                 item.special_notes, item.created_at.isoformat()
-            ])
+            ]
+            for order in orders
+            for item in order.items
+        ]
 
-        return order
+        statements = build_multi_row_insert("orders", ORDER_COLUMNS, order_rows)
+        if item_rows:
+            statements += build_multi_row_insert("order_items", ORDER_ITEM_COLUMNS, item_rows)
+        statements += build_multi_row_insert("order_events", ORDER_EVENT_COLUMNS, created_event_rows(orders))
+        statements += created_projection_statements(orders)
+        self.db.batch(statements)
+        return orders
 
-    def get_by_id(self, order_id: str) -> Optional[Order]:
+    def get_by_id(self, order_id: str, include_items: bool = True) -> Optional[Order]:
         # Obtener pedido
-        order_result = self.db.execute("""
-            SELECT id, order_number, customer_name, customer_phone, table_number,
-                   status, service_type, total_amount, tax_amount, discount_amount, final_amount,
-                   payment_status, payment_method, special_instructions, waiter_id,
-                   cancelled_by, cancelled_at, cancellation_reason,
-                   created_at, updated_at, preparation_started_at, ready_at,
-                   completed_at, preparation_time, total_time
+        order_result = self.db.execute(f"""
+            SELECT {ORDER_SELECT_COLUMNS}
             FROM orders WHERE id = ?
         """, [order_id]).fetchone()
 
         if not order_result:
             return None
 
-        # Obtener items del pedido
-        items_result = self.db.execute("""
-            SELECT id, menu_item_id, menu_item_name, quantity, unit_price,
-                   subtotal, special_notes, created_at
-            FROM order_items WHERE order_id = ? ORDER BY created_at
-        """, [order_id]).fetchall()
-
-        # Convertir items
-        items = []
-        for item_row in items_result:
-            items.append(OrderItem(
-                id=item_row[0],
-                order_id=order_id,
-                menu_item_id=item_row[1],
-                menu_item_name=item_row[2],
-                quantity=item_row[3],
-                unit_price=item_row[4],
-                subtotal=item_row[5],
-                special_notes=item_row[6],
-                created_at=datetime.fromisoformat(item_row[7])
-            ))
+        items = self._get_items_by_order_ids([order_id]).get(order_id, []) if include_items else []
+        return self._map_order(order_result, items)
 
-        # Convertir timestamps
-        def parse_datetime(value):
-            return datetime.fromisoformat(value) if value else None
+    def get_many(self, order_ids: List[str], include_items: bool = True) -> Dict[str, Order]:
+        """Obtener varios pedidos por id con IN (...) por bloques, indexados por id."""
+        orders: Dict[str, Order] = {}
+        rows = []
+        for start in range(0, len(order_ids), MAX_PARAMS_PER_STATEMENT):
+            chunk = order_ids[start:start + MAX_PARAMS_PER_STATEMENT]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows += self.db.execute(f"""
+                SELECT {ORDER_SELECT_COLUMNS}
+                FROM orders WHERE id IN ({placeholders})
+            """, chunk).fetchall()
 
-        return Order(
-            id=order_result[0],
-            order_number=order_result[1],
-            customer_name=order_result[2],
-            customer_phone=order_result[3],
-            table_number=order_result[4],
-            status=OrderStatus(order_result[5]),
-            service_type=ServiceType(order_result[6]),
-            total_amount=order_result[7],
-            tax_amount=order_result[8],
-            discount_amount=order_result[9],
-            final_amount=order_result[10],
-            payment_status=order_result[11],
-            payment_method=order_result[12],
-            special_instructions=order_result[13],
-            waiter_id=order_result[14],
-            cancelled_by=order_result[15],
-            cancelled_at=parse_datetime(order_result[16]),
-            cancellation_reason=order_result[17],
-            created_at=parse_datetime(order_result[18]),
-            updated_at=parse_datetime(order_result[19]),
-            preparation_started_at=parse_datetime(order_result[20]),
-            ready_at=parse_datetime(order_result[21]),
-            completed_at=parse_datetime(order_result[22]),
-            preparation_time=order_result[23],
-            total_time=order_result[24],
-            items=items
-        )
+        items_by_order = self._get_items_by_order_ids([row[0] for row in rows]) if include_items else {}
+        for row in rows:
+            orders[row[0]] = self._map_order(row, items_by_order.get(row[0], []))
+        return orders
 
     def get_all(self, waiter_id: Optional[str] = None) -> List[Order]:
-        query = """
-            SELECT id, order_number, customer_name, customer_phone, table_number,
-                   status, service_type, total_amount, tax_amount, discount_amount, final_amount,
-                   payment_status, payment_method, special_instructions, waiter_id,
-                   cancelled_by, cancelled_at, cancellation_reason,
-                   created_at, updated_at, preparation_started_at, ready_at,
-                   completed_at, preparation_time, total_time
+        query = f"""
+            SELECT {ORDER_SELECT_COLUMNS}
             FROM orders
         """
         params = []
@@ -130,93 +156,271 @@ class OrderRepository(IOrderRepository):
         query += " ORDER BY created_at DESC"
 
         results = self.db.execute(query, params).fetchall()
-        orders = []
 
-        for row in results:
-            # Obtener items para cada pedido
-            items_result = self.db.execute("""
-                SELECT id, menu_item_id, menu_item_name, quantity, unit_price,
-                       subtotal, special_notes, created_at
-                FROM order_items WHERE order_id = ? ORDER BY created_at
-            """, [row[0]]).fetchall()
+        # Items de todos los pedidos en un número acotado de consultas (no una por pedido)
+        items_by_order = self._get_items_by_order_ids([row[0] for row in results])
+        return [self._map_order(row, items_by_order.get(row[0], [])) for row in results]
+
+    def get_page(
+        self,
+        waiter_id: Optional[str],
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        status: Optional[str] = None,
+        service_type: Optional[str] = None,
+        table_number: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[Order]:
+        """
+        Obtener una página de pedidos ordenada por (created_at, id) descendente.
+
+        Paginación por clave (keyset): after es el (created_at, id) del último
+        pedido de la página anterior, por lo que el coste no depende de cuántas
+        páginas se hayan recorrido.
+        """
+        conditions = []
+        params = []
+
+        if waiter_id:
+            conditions.append("waiter_id = ?")
+            params.append(waiter_id)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if service_type:
+            conditions.append("service_type = ?")
+            params.append(service_type)
+        if table_number is not None:
+            conditions.append("table_number = ?")
+            params.append(table_number)
+        if created_from:
+            conditions.append("created_at >= ?")
+            params.append(created_from.isoformat())
+        if created_to:
+            conditions.append("created_at <= ?")
+            params.append(created_to.isoformat())
+        if after:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend(after)
+
+        query = f"""
+            SELECT {ORDER_SELECT_COLUMNS}
+            FROM orders
+        """
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        results = self.db.execute(query, params).fetchall()
+        items_by_order = self._get_items_by_order_ids([row[0] for row in results])
+        return [self._map_order(row, items_by_order.get(row[0], [])) for row in results]
+
+    def _get_items_by_order_ids(self, order_ids: List[str]) -> Dict[str, List[OrderItem]]:
+        """Obtener los items de varios pedidos con IN (...) por bloques, agrupados por pedido."""
+        items_by_order: Dict[str, List[OrderItem]] = defaultdict(list)
+        for start in range(0, len(order_ids), MAX_PARAMS_PER_STATEMENT):
+            chunk = order_ids[start:start + MAX_PARAMS_PER_STATEMENT]
+            placeholders = ", ".join("?" for _ in chunk)
+            items_result = self.db.execute(f"""
+                SELECT {ORDER_ITEM_SELECT_COLUMNS}
+                FROM order_items WHERE order_id IN ({placeholders}) ORDER BY created_at
+            """, chunk).fetchall()
 
-            items = []
             for item_row in items_result:
-                items.append(OrderItem(
-                    id=item_row[0],
-                    order_id=row[0],
-                    menu_item_id=item_row[1],
-                    menu_item_name=item_row[2],
-                    quantity=item_row[3],
-                    unit_price=item_row[4],
-                    subtotal=item_row[5],
-                    special_notes=item_row[6],
-                    created_at=datetime.fromisoformat(item_row[7])
-                ))
-
-            def parse_datetime(value):
-                return datetime.fromisoformat(value) if value else None
-
-            orders.append(Order(
-                id=row[0],
-                order_number=row[1],
-                customer_name=row[2],
-                customer_phone=row[3],
-                table_number=row[4],
-                status=OrderStatus(row[5]),
-                service_type=ServiceType(row[6]),
-                total_amount=row[7],
-                tax_amount=row[8],
-                discount_amount=row[9],
-                final_amount=row[10],
-                payment_status=row[11],
-                payment_method=row[12],
-                special_instructions=row[13],
-                waiter_id=row[14],
-                cancelled_by=row[15],
-                cancelled_at=parse_datetime(row[16]),
-                cancellation_reason=row[17],
-                created_at=parse_datetime(row[18]),
-                updated_at=parse_datetime(row[19]),
-                preparation_started_at=parse_datetime(row[20]),
-                ready_at=parse_datetime(row[21]),
-                completed_at=parse_datetime(row[22]),
-                preparation_time=row[23],
-                total_time=row[24],
-                items=items
-            ))
+                items_by_order[item_row[0]].append(self._map_item(item_row))
+        return items_by_order
 
-        return orders
+    @staticmethod
+    def _map_item(item_row) -> OrderItem:
+        return OrderItem(
+            id=item_row[1],
+            order_id=item_row[0],
+            menu_item_id=item_row[2],
+            menu_item_name=item_row[3],
+            quantity=item_row[4],
+            unit_price=item_row[5],
+            subtotal=item_row[6],
+            special_notes=item_row[7],
+            created_at=datetime.fromisoformat(item_row[8])
+        )
+
+    @staticmethod
+    def _map_order(row, items: List[OrderItem]) -> Order:
+        # Convertir timestamps
+        def parse_datetime(value):
+            return datetime.fromisoformat(value) if value else None
+
+        return Order(
+            id=row[0],
+            order_number=row[1],
+            customer_name=row[2],
+            customer_phone=row[3],
+            table_number=row[4],
+            status=OrderStatus(row[5]),
+            service_type=ServiceType(row[6]),
+            total_amount=row[7],
+            tax_amount=row[8],
+            discount_amount=row[9],
+            final_amount=row[10],
+            payment_status=row[11],
+            payment_method=row[12],
+            special_instructions=row[13],
+            waiter_id=row[14],
+            cancelled_by=row[15],
+            cancelled_at=parse_datetime(row[16]),
+            cancellation_reason=row[17],
+            created_at=parse_datetime(row[18]),
+            updated_at=parse_datetime(row[19]),
+            preparation_started_at=parse_datetime(row[20]),
+            ready_at=parse_datetime(row[21]),
+            completed_at=parse_datetime(row[22]),
+            preparation_time=row[23],
+            total_time=row[24],
+            version=row[25],
+            items=items
+        )
 
     def update_status(self, order_id: str, status: str) -> bool:
-        """Método legacy para compatibilidad"""
-        self.db.execute(
-            "UPDATE orders SET status = ?, updated_at = ? WHERE id = ?",
-            [status, datetime.now().isoformat(), order_id]
+        """Método legacy para compatibilidad: pasa por transition_status para registrar el evento"""
+        return self.transition_status(order_id, OrderStatus(status), datetime.now()) is not None
+
+    def transition_status(
+        self,
+        order_id: str,
+        new_status: OrderStatus,
+        changed_at: datetime,
+        user_id: Optional[str] = None,
+        cancellation_reason: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Order]:
+        """
+        Cambiar el estado con un único UPDATE condicional, sin leer antes el pedido.
+
+        El WHERE valida en SQL la transición (VALID_TRANSITIONS según la modalidad),
+        sus requisitos (p. ej. ready exige preparation_started_at) y, si se indica,
+        la versión. Los tiempos se calculan en la propia sentencia y el pedido
+        actualizado vuelve con RETURNING; sus items se leen en el mismo batch.
+
+        En el mismo batch, antes del UPDATE, se inserta el evento en order_events
+        con las mismas condiciones (así conserva el estado anterior) y después se
+        actualizan las proyecciones a partir de ese evento.
+
+        Dentro de una UnitOfWork las sentencias se encolan con una guarda tras el
+        UPDATE que revierte todo el batch si no cambió ninguna fila, y devuelve None.
+
+        Returns:
+            Pedido actualizado, o None si la condición no se cumplió (no existe,
+            transición no válida, requisito no cumplido o versión distinta)
+        """
+        event_id = str(uuid.uuid4())
+        event_insert, update = self._build_transition_statements(
+            event_id, order_id, new_status, changed_at, user_id, cancellation_reason, expected_version
         )
-        return True
-
-    def update_status_with_details(self, order: Order) -> Order:
-        """Actualiza el estado del pedido con todos los campos adicionales"""
-        self.db.execute("""
-            UPDATE orders SET
-                status = ?, updated_at = ?, preparation_started_at = ?,
-                ready_at = ?, completed_at = ?, preparation_time = ?,
-                total_time = ?, cancelled_by = ?, cancelled_at = ?,
-                cancellation_reason = ?, payment_status = ?
-            WHERE id = ?
+        projections = transition_projection_statements(event_id, new_status)
+
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.add(*event_insert)
+            unit_of_work.add(*update)
+            # changes() = 0 -> se inserta ok = 0, el CHECK (ok = 1) falla y se revierte el batch
+            unit_of_work.add("INSERT INTO order_transition_guard (ok) SELECT 0 WHERE changes() = 0")
+            for statement in projections:
+                unit_of_work.add(*statement)
+            return None
+
+        results = self.db.batch([
+            event_insert,
+            update,
+            *projections,
+            (f"""
+                SELECT {ORDER_ITEM_SELECT_COLUMNS}
+                FROM order_items WHERE order_id = ? ORDER BY created_at
+            """, [order_id]),
+        ])
+        update_result, items_result = results[1], results[-1]
+        order_row = update_result.fetchone()
+        if not order_row:
+            return None
+        return self._map_order(order_row, [self._map_item(item_row) for item_row in items_result.fetchall()])
+
+    @staticmethod
+    def _build_transition_statements(
+        event_id: str,
+        order_id: str,
+        new_status: OrderStatus,
+        changed_at: datetime,
+        user_id: Optional[str],
+        cancellation_reason: Optional[str],
+        expected_version: Optional[int],
+    ) -> Tuple[Tuple[str, list], Tuple[str, list]]:
+        """
+        Construir el INSERT del evento y el UPDATE ... WHERE ... RETURNING de una
+        transición de estado, ambos con las mismas condiciones.
+        """
+        now = changed_at.isoformat()
+        assignments = ["status = ?", "updated_at = ?", "version = version + 1"]
+        params: list = [new_status.value, now]
+        conditions = []
+        condition_params: list = []
+        preparation_time_sql, preparation_time_params = "NULL", []
+        total_time_sql, total_time_params = "NULL", []
+        payload = None
+
+        if new_status == OrderStatus.PREPARING:
+            assignments.append("preparation_started_at = ?")
+            params.append(now)
+        elif new_status == OrderStatus.READY:
+            assignments += ["ready_at = ?", f"preparation_time = {PREPARATION_TIME_SQL}"]
+            params += [now, now]
+            preparation_time_sql, preparation_time_params = PREPARATION_TIME_SQL, [now]
+            conditions.append("preparation_started_at IS NOT NULL")
+        elif new_status in (OrderStatus.SERVED, OrderStatus.DELIVERED):
+            assignments += [
+                "completed_at = ?",
+                f"total_time = {TOTAL_TIME_SQL}",
+                "payment_status = CASE WHEN payment_status = 'PENDING' THEN 'PAID' ELSE payment_status END",
+            ]
+            params += [now, now]
+            total_time_sql, total_time_params = TOTAL_TIME_SQL, [now]
+            conditions.append("ready_at IS NOT NULL")
+        elif new_status == OrderStatus.CANCELLED:
+            assignments += ["cancelled_at = ?", "cancelled_by = ?", "cancellation_reason = ?"]
+            params += [now, user_id, cancellation_reason]
+            payload = json.dumps({"cancellation_reason": cancellation_reason}, ensure_ascii=False)
+
+        sources = OrderStatusService.allowed_sources(new_status)
+        if sources:
+            conditions.append(
+                "(service_type, status) IN (VALUES " + ", ".join("(?, ?)" for _ in sources) + ")"
+            )
+            for service_type, current_status in sources:
+                condition_params += [service_type.value, current_status.value]
+        else:
+            # Ningún estado lleva a new_status (p. ej. pending): la transición nunca es válida
+            conditions.append("0")
+        if expected_version is not None:
+            conditions.append("version = ?")
+            condition_params.append(expected_version)
+
+        where = f"id = ? AND {' AND '.join(conditions)}"
+        where_params = [order_id] + condition_params
+
+        # status / version son los previos al UPDATE: from_status y la versión resultante
+        event_insert = (f"""
+            INSERT INTO order_events ({", ".join(ORDER_EVENT_COLUMNS)})
+            SELECT ?, id, ?, status, ?, service_type, version + 1, ?,
+                   {preparation_time_sql}, {total_time_sql}, ?, ?
+            FROM orders WHERE {where}
         """, [
-            order.status.value,
-            order.updated_at.isoformat() if order.updated_at else None,
-            order.preparation_started_at.isoformat() if order.preparation_started_at else None,
-            order.ready_at.isoformat() if order.ready_at else None,
-            order.completed_at.isoformat() if order.completed_at else None,
-            order.preparation_time,
-            order.total_time,
-            order.cancelled_by,
-            order.cancelled_at.isoformat() if order.cancelled_at else None,
-            order.cancellation_reason,
-            order.payment_status,
-            order.id
+            event_id, ORDER_STATUS_CHANGED_EVENT, new_status.value, user_id,
+            *preparation_time_params, *total_time_params, payload, now,
+            *where_params,
         ])
-        return order
+        update = (f"""
+            UPDATE orders SET {", ".join(assignments)}
+            WHERE {where}
+            RETURNING {ORDER_SELECT_COLUMNS}
+        """, params + where_params)
+        return event_insert, update
@@ -7,6 +7,8 @@ from .register_request import RegisterRequest
 from .login_request import LoginRequest
 from .user_response import UserResponse
 from .auth_response import AuthResponse
+from .refresh_request import RefreshRequest
+from .bulk_register import BulkRegisterRequest, BulkRegisterResponse, BulkRegisterRowResult
 from .change_role_request import ChangeRoleRequest
 from .permission_response import PermissionResponse, RolePermissionsResponse
 
@@ -15,6 +17,10 @@ __all__ = [
     "LoginRequest",
     "UserResponse",
     "AuthResponse",
+    "RefreshRequest",
+    "BulkRegisterRequest",
+    "BulkRegisterResponse",
+    "BulkRegisterRowResult",
     "ChangeRoleRequest",
     "PermissionResponse",
     "RolePermissionsResponse"
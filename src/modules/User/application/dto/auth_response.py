@@ -1,6 +1,8 @@
 """
 DTO AuthResponse - Respuesta exitosa de autenticación con token JWT.
 """
+from typing import Optional
+
 from pydantic import BaseModel, Field
 from .user_response import UserResponse
 
@@ -13,6 +15,7 @@ class AuthResponse(BaseModel):
     Attributes:
         access_token: Token JWT para autenticación en futuras peticiones
         token_type: Tipo de token (siempre "bearer")
+        refresh_token: Token para renovar el access token en /api/auth/refresh (rota en cada uso)
         user: Información del usuario autenticado
     """
     access_token: str = Field(
@@ -25,6 +28,11 @@ class AuthResponse(BaseModel):
         description="Tipo de token (Bearer)"
     )
     
+    refresh_token: Optional[str] = Field(
+        default=None,
+        description="Refresh token de la sesión; se reemplaza en cada renovación"
+    )
+    
     user: UserResponse = Field(
         ...,
         description="Información del usuario autenticado"
@@ -36,6 +44,7 @@ class AuthResponse(BaseModel):
                 {
                     "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                     "token_type": "bearer",
+                    "refresh_token": "0b6c5a5e-8f4e-4d1a-9d53-1c2f3a4b5c6d.Zq3xV...",
                     "user": {
                         "id": "550e8400-e29b-41d4-a716-446655440000",
                         "name": "Juan Pérez",
@@ -0,0 +1,78 @@
+"""
+DTOs de alta masiva de usuarios - Solicitud JSON y reporte por fila.
+"""
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class BulkRegisterRequest(BaseModel):
+    """
+    DTO para el alta masiva en JSON (también se acepta CSV, ver el endpoint).
+    Cada fila tiene los campos de RegisterRequest y se valida por separado:
+    una fila inválida no impide crear las demás.
+    
+    Attributes:
+        users: Filas con name, email, phone (opcional), password y role (opcional)
+    """
+    users: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        description="Usuarios a registrar"
+    )
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "users": [
+                        {
+                            "name": "Ana Gómez",
+                            "email": "ana.gomez@example.com",
+                            "phone": "+18295550001",
+                            "password": "SecurePass123!",
+                            "role": "employee"
+                        },
+                        {
+                            "name": "Luis Díaz",
+                            "email": "luis.diaz@example.com",
+                            "password": "OtraPass123!"
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class BulkRegisterRowResult(BaseModel):
+    """
+    Resultado de una fila del alta masiva.
+    
+    Attributes:
+        row: Número de fila (desde 1, sin contar la cabecera en CSV)
+        email: Email de la fila (si se pudo leer)
+        status: "created" o "error"
+        user_id: ID del usuario creado
+        error: Motivo del rechazo
+    """
+    row: int = Field(..., description="Número de fila (desde 1)")
+    email: Optional[str] = Field(None, description="Email de la fila")
+    status: str = Field(..., description="created o error")
+    user_id: Optional[str] = Field(None, description="ID del usuario creado")
+    error: Optional[str] = Field(None, description="Motivo del rechazo")
+
+
+class BulkRegisterResponse(BaseModel):
+    """
+    Reporte del alta masiva.
+    
+    Attributes:
+        total: Filas recibidas
+        created: Usuarios creados
+        failed: Filas rechazadas
+        results: Resultado de cada fila, en el orden recibido
+    """
+    total: int = Field(..., description="Filas recibidas")
+    created: int = Field(..., description="Usuarios creados")
+    failed: int = Field(..., description="Filas rechazadas")
+    results: List[BulkRegisterRowResult] = Field(..., description="Resultado por fila")
@@ -0,0 +1,45 @@
+"""
+DTOs del historial de login - Intentos recientes y contadores diarios de un email.
+"""
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class LoginAttemptEntry(BaseModel):
+    """
+    Intento de login individual (tabla login_attempts, se conserva
+    LOGIN_ATTEMPTS_RETENTION_DAYS días).
+    """
+    id: str
+    email: str
+    success: bool
+    ip_address: Optional[str] = None
+    created_at: str
+
+
+class LoginAttemptDailyStats(BaseModel):
+    """
+    Contadores de un día e IP (tabla login_attempt_daily_stats). Incluye los
+    días cuyos intentos individuales ya se borraron.
+    """
+    day: str
+    email: str
+    ip_address: Optional[str] = None
+    success_count: int
+    failure_count: int
+    first_attempt_at: str
+    last_attempt_at: str
+
+
+class LoginHistoryResponse(BaseModel):
+    """
+    DTO de respuesta de GET /api/users/login-history.
+
+    Attributes:
+        email: Email consultado
+        recent_attempts: Últimos intentos, del más reciente al más antiguo
+        daily_stats: Contadores por día e IP de los últimos `days` días
+    """
+    email: str
+    recent_attempts: List[LoginAttemptEntry] = Field(default_factory=list)
+    daily_stats: List[LoginAttemptDailyStats] = Field(default_factory=list)
@@ -0,0 +1,28 @@
+"""
+DTO RefreshRequest - Datos requeridos para renovar la sesión.
+"""
+from pydantic import BaseModel, Field
+
+
+class RefreshRequest(BaseModel):
+    """
+    DTO para la solicitud de renovación de tokens.
+    
+    Attributes:
+        refresh_token: Refresh token recibido en el login o en la última renovación
+    """
+    refresh_token: str = Field(
+        ...,
+        min_length=1,
+        description="Refresh token vigente de la sesión"
+    )
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "refresh_token": "0b6c5a5e-8f4e-4d1a-9d53-1c2f3a4b5c6d.Zq3xV..."
+                }
+            ]
+        }
+    }
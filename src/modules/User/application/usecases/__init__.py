@@ -5,5 +5,13 @@ Los casos de uso implementan la lógica de negocio de la aplicación.
 from .register_user import RegisterUserUseCase
 from .login_user import LoginUserUseCase
 from .update_user_role import UpdateUserRoleUseCase
+from .refresh_session import RefreshSessionUseCase
+from .bulk_register_users import BulkRegisterUsersUseCase
 
-__all__ = ["RegisterUserUseCase", "LoginUserUseCase", "UpdateUserRoleUseCase"]
+__all__ = [
+    "RegisterUserUseCase",
+    "LoginUserUseCase",
+    "UpdateUserRoleUseCase",
+    "RefreshSessionUseCase",
+    "BulkRegisterUsersUseCase",
+]
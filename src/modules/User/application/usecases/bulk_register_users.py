@@ -0,0 +1,151 @@
+"""
+Caso de Uso: Alta masiva de usuarios (apertura de una sucursal).
+Valida todas las filas, comprueba los emails existentes en una sola consulta,
+hashea las contraseñas en paralelo en el pool y guarda con INSERTs por lotes.
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from src.modules.User.domain.entities.user import User
+from src.modules.User.domain.value_objects.email import Email
+from src.modules.User.domain.value_objects.password import Password
+from src.modules.User.infrastructure.repositories.user_repository import UserRepository
+from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
+from src.modules.User.infrastructure.hashing.password_hashing_executor import PasswordHashingExecutor
+from src.modules.User.application.dto.register_request import RegisterRequest
+from src.modules.User.application.dto.bulk_register import BulkRegisterResponse, BulkRegisterRowResult
+
+
+class BulkRegisterUsersUseCase:
+    """
+    Caso de uso para registrar muchos usuarios en una solicitud.
+    
+    Flujo:
+    1. Validar cada fila (mismas reglas que el registro individual)
+    2. Rechazar emails repetidos dentro del lote
+    3. Comprobar los emails ya registrados en una consulta por bloque
+    4. Hashear las contraseñas válidas en paralelo
+    5. Guardar los usuarios con INSERTs de varias filas
+    
+    Cada fila se informa por separado: una fila inválida no impide crear las demás.
+    Si la cola de hashing está saturada no se crea ninguna fila y se propaga
+    PasswordHashingSaturatedError (503: reintentar el lote completo).
+    Las consultas usan el pool asíncrono: no bloquean el event loop.
+    
+    Attributes:
+        user_repository: Repositorio de usuarios
+        role_repository: Repositorio de roles
+        password_hasher: Pool de hashing donde se hashean las contraseñas
+    """
+    
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        role_repository: RoleRepository,
+        password_hasher: PasswordHashingExecutor
+    ):
+        """Inicializar el caso de uso con sus dependencias."""
+        self.user_repository = user_repository
+        self.role_repository = role_repository
+        self.password_hasher = password_hasher
+    
+    async def execute(self, rows: List[Dict[str, Any]]) -> BulkRegisterResponse:
+        """
+        Ejecutar el alta masiva.
+        
+        Args:
+            rows: Filas con los campos de RegisterRequest
+        
+        Returns:
+            Reporte con el resultado de cada fila
+        """
+        results: List[BulkRegisterRowResult] = []
+        pending: List[tuple] = []  # (resultado, solicitud validada, role_id)
+        role_ids = {role.name: role.id for role in await self.role_repository.find_all_async()}
+        seen_emails = set()
+        
+        # 1-2. Validación por fila y duplicados dentro del lote
+        for index, row in enumerate(rows, start=1):
+            result = BulkRegisterRowResult(row=index, email=self._raw_email(row), status="error")
+            results.append(result)
+            try:
+                request = RegisterRequest.model_validate(row)
+                email = Email(request.email).value
+                Password(request.password)
+            except ValidationError as e:
+                result.error = "; ".join(self._format_validation_error(error) for error in e.errors())
+                continue
+            except ValueError as e:
+                result.error = str(e)
+                continue
+            
+            result.email = email
+            role_id = role_ids.get(request.role)
+            if role_id is None:
+                result.error = f"El rol '{request.role}' no existe en el sistema"
+            elif email.lower() in seen_emails:
+                result.error = f"El email {email} está repetido en el lote"
+            else:
+                seen_emails.add(email.lower())
+                pending.append((result, request, role_id))
+        
+        # 3. Emails ya registrados (una consulta por bloque, con índice sobre LOWER(email))
+        existing = await self.user_repository.find_existing_emails_async([result.email for result, _, _ in pending])
+        to_hash = []
+        for result, request, role_id in pending:
+            if result.email.lower() in existing:
+                result.error = f"El email {result.email} ya está registrado en el sistema"
+            else:
+                to_hash.append((result, request, role_id))
+        
+        # 4. Hash en paralelo en el pool de procesos (con la cola saturada se propaga el 503)
+        hashes = await self.password_hasher.hash_many([request.password for _, request, _ in to_hash])
+        users = []
+        for (result, request, role_id), password_hash in zip(to_hash, hashes):
+            if isinstance(password_hash, BaseException):
+                result.error = "No se pudo procesar la contraseña. Intenta nuevamente con esta fila."
+                continue
+            now = datetime.now()
+            user = User(
+                id=str(uuid.uuid4()),
+                name=request.name,
+                email=result.email,
+                phone=request.phone,
+                password_hash=password_hash,
+                role_id=role_id,
+                created_at=now,
+                updated_at=now
+            )
+            result.user_id = user.id
+            users.append((result, user))
+        
+        # 5. INSERTs por lotes; una fila omitida por conflicto se registró en paralelo
+        inserted = await self.user_repository.save_many_async([user for _, user in users]) if users else set()
+        for result, user in users:
+            if user.id in inserted:
+                result.status = "created"
+            else:
+                result.user_id = None
+                result.error = f"El email {result.email} ya está registrado en el sistema"
+        
+        created = sum(result.status == "created" for result in results)
+        return BulkRegisterResponse(
+            total=len(results),
+            created=created,
+            failed=len(results) - created,
+            results=results
+        )
+    
+    @staticmethod
+    def _raw_email(row: Dict[str, Any]) -> Optional[str]:
+        email = row.get("email") if isinstance(row, dict) else None
+        return email if isinstance(email, str) else None
+    
+    @staticmethod
+    def _format_validation_error(error: Dict[str, Any]) -> str:
+        field = ".".join(str(part) for part in error.get("loc", ())) or "fila"
+        message = error.get("msg", "valor inválido").removeprefix("Value error, ")
+        return f"{field}: {message}"
@@ -6,9 +6,12 @@ from typing import Optional, Tuple
 from datetime import datetime
 
 from src.modules.User.domain.entities.user import User
-from src.modules.User.domain.services.password_service import PasswordService
 from src.modules.User.infrastructure.repositories.user_repository import UserRepository
-from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+from src.modules.User.infrastructure.audit import LoginAttemptAuditWriter
+from src.modules.User.infrastructure.hashing.password_hashing_executor import (
+    PasswordHashingExecutor,
+    PasswordHashingSaturatedError,
+)
 from src.modules.User.application.dto.login_request import LoginRequest
 
 
@@ -20,8 +23,8 @@ class LoginUserUseCase:
     1. Buscar usuario por email
     2. Verificar si la cuenta está bloqueada
     3. Verificar la contraseña
-    4. Actualizar intentos de login
-    5. Registrar el intento en el historial
+    4. Actualizar intentos de login (y rehashear si cambió el factor de trabajo)
+    5. Registrar el intento en el historial (encolado, se escribe en lotes)
     
     Implementa el requisito CA3:
     - Si el login falla 5 veces consecutivas, la cuenta se bloquea por 15 minutos
@@ -29,8 +32,8 @@ class LoginUserUseCase:
     
     Attributes:
         user_repository: Repositorio de usuarios
-        login_attempt_repository: Repositorio de intentos de login
-        password_service: Servicio para verificar contraseñas
+        login_attempt_writer: Buffer de auditoría de intentos de login
+        password_hasher: Pool de hashing donde se verifican las contraseñas
     """
     
     MAX_FAILED_ATTEMPTS = 5
@@ -39,22 +42,22 @@ class LoginUserUseCase:
     def __init__(
         self,
         user_repository: UserRepository,
-        login_attempt_repository: LoginAttemptRepository,
-        password_service: PasswordService
+        login_attempt_writer: LoginAttemptAuditWriter,
+        password_hasher: PasswordHashingExecutor
     ):
         """
         Inicializar el caso de uso con sus dependencias.
         
         Args:
             user_repository: Repositorio de usuarios
-            login_attempt_repository: Repositorio de intentos de login
-            password_service: Servicio de contraseñas
+            login_attempt_writer: Buffer de auditoría (no bloquea la petición)
+            password_hasher: Pool de hashing (bcrypt fuera del event loop)
         """
         self.user_repository = user_repository
-        self.login_attempt_repository = login_attempt_repository
-        self.password_service = password_service
+        self.login_attempt_writer = login_attempt_writer
+        self.password_hasher = password_hasher
     
-    def execute(self, request: LoginRequest, ip_address: Optional[str] = None) -> Tuple[Optional[User], str, int]:
+    async def execute(self, request: LoginRequest, ip_address: Optional[str] = None) -> Tuple[Optional[User], str, int]:
         """
         Ejecutar el caso de uso de login.
         
@@ -68,12 +71,12 @@ class LoginUserUseCase:
             - (None, "mensaje", 401) si las credenciales son inválidas
             - (None, "mensaje", 429) si la cuenta está bloqueada
         """
-        # 1. Buscar usuario por email
-        user = self.user_repository.find_by_email(request.email)
+        # 1. Buscar usuario por email (las consultas usan el pool asíncrono: no bloquean el event loop)
+        user = await self.user_repository.find_by_email_async(request.email)
         
         if not user:
             # Registrar intento fallido (usuario no existe)
-            self.login_attempt_repository.save_attempt(
+            self.login_attempt_writer.enqueue(
                 email=request.email,
                 success=False,
                 ip_address=ip_address
@@ -87,7 +90,7 @@ class LoginUserUseCase:
             minutes_remaining = int(remaining_time // 60)
             
             # Registrar intento mientras está bloqueado
-            self.login_attempt_repository.save_attempt(
+            self.login_attempt_writer.enqueue(
                 email=request.email,
                 success=False,
                 ip_address=ip_address
@@ -99,8 +102,8 @@ class LoginUserUseCase:
                 429  # Too Many Requests
             )
         
-        # 3. Verificar la contraseña
-        password_is_valid = self.password_service.verify_password(
+        # 3. Verificar la contraseña (en el pool de procesos, sin bloquear el event loop)
+        password_is_valid = await self.password_hasher.verify_password(
             plain_password=request.password,
             hashed_password=user.password_hash
         )
@@ -111,10 +114,10 @@ class LoginUserUseCase:
             user.increment_failed_attempts(max_attempts=self.MAX_FAILED_ATTEMPTS)
             
             # Actualizar en base de datos
-            self.user_repository.update(user)
+            await self.user_repository.update_async(user)
             
             # Registrar intento fallido
-            self.login_attempt_repository.save_attempt(
+            self.login_attempt_writer.enqueue(
                 email=request.email,
                 success=False,
                 ip_address=ip_address
@@ -140,10 +143,20 @@ class LoginUserUseCase:
         # 4. Login exitoso
         # Resetear intentos fallidos
         user.reset_failed_attempts()
-        self.user_repository.update(user)
+
+        # Si el hash se generó con otro factor de trabajo, rehashear con el actual
+        # aprovechando que tenemos la contraseña en claro (se guarda en el mismo UPDATE)
+        if self.password_hasher.needs_rehash(user.password_hash):
+            try:
+                user.password_hash = await self.password_hasher.hash_password(request.password)
+            except PasswordHashingSaturatedError:
+                # Con la cola saturada se deja para el próximo login: no se penaliza al usuario
+                pass
+
+        await self.user_repository.update_async(user)
         
         # 5. Registrar intento exitoso
-        self.login_attempt_repository.save_attempt(
+        self.login_attempt_writer.enqueue(
             email=request.email,
             success=True,
             ip_address=ip_address
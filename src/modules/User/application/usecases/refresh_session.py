@@ -0,0 +1,86 @@
+"""
+Caso de Uso: Renovar una sesión con su refresh token.
+Evita repetir el login (y su verificación bcrypt) cuando expira el access token.
+"""
+from typing import Optional, Tuple
+
+from src.modules.User.domain.entities.session import Session
+from src.modules.User.domain.entities.user import User
+from src.modules.User.infrastructure.authorization.revoked_session_filter import RevokedSessionFilter
+from src.modules.User.infrastructure.repositories.session_repository import SessionRepository
+from src.modules.User.infrastructure.repositories.user_repository import UserRepository
+
+
+class RefreshSessionUseCase:
+    """
+    Caso de uso para renovar una sesión.
+
+    Flujo:
+    1. Extraer el ID de sesión del refresh token y buscar la sesión
+    2. Si el token no es el vigente (reutilización de uno ya rotado), revocar la sesión
+    3. Rotar el refresh token (UPDATE condicional: solo una renovación gana)
+    4. Cargar el usuario para emitir el nuevo access token
+
+    Attributes:
+        session_repository: Repositorio de sesiones
+        user_repository: Repositorio de usuarios
+        revoked_sessions: Filtro en memoria de sesiones revocadas
+    """
+
+    INVALID_TOKEN_MESSAGE = "Refresh token inválido o expirado. Inicia sesión nuevamente."
+
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        user_repository: UserRepository,
+        revoked_sessions: RevokedSessionFilter
+    ):
+        """Inicializar el caso de uso con sus dependencias."""
+        self.session_repository = session_repository
+        self.user_repository = user_repository
+        self.revoked_sessions = revoked_sessions
+
+    def execute(self, refresh_token: str) -> Tuple[Optional[User], Optional[str], Optional[str], Optional[str]]:
+        """
+        Ejecutar la renovación.
+
+        Args:
+            refresh_token: Refresh token entregado en el login o la renovación anterior
+
+        Returns:
+            Tupla (usuario, ID de sesión, nuevo refresh token, mensaje de error)
+            - (User, sid, token, None) si la renovación es válida
+            - (None, None, None, "mensaje") en cualquier otro caso (401)
+        """
+        # 1. Buscar la sesión
+        session_id = Session.parse_session_id(refresh_token)
+        if session_id is None or self.revoked_sessions.is_revoked(session_id):
+            return None, None, None, self.INVALID_TOKEN_MESSAGE
+
+        session = self.session_repository.find_by_id(session_id)
+        if session is None or not session.is_active():
+            return None, None, None, self.INVALID_TOKEN_MESSAGE
+
+        # 2. Un refresh token ya rotado indica que pudo ser robado: se cierra la sesión
+        presented_hash = Session.hash_token(refresh_token)
+        if presented_hash != session.refresh_token_hash:
+            self._revoke(session_id)
+            return None, None, None, self.INVALID_TOKEN_MESSAGE
+
+        # 3. Rotar; si otra renovación ganó con el mismo token, es reutilización
+        new_refresh_token = Session.new_refresh_token(session_id)
+        if not self.session_repository.rotate(session_id, presented_hash, Session.hash_token(new_refresh_token)):
+            self._revoke(session_id)
+            return None, None, None, self.INVALID_TOKEN_MESSAGE
+
+        # 4. Usuario actual (su rol pudo cambiar desde el login)
+        user = self.user_repository.find_by_id(session.user_id)
+        if user is None:
+            self._revoke(session_id)
+            return None, None, None, self.INVALID_TOKEN_MESSAGE
+
+        return user, session_id, new_refresh_token, None
+
+    def _revoke(self, session_id: str) -> None:
+        self.session_repository.revoke(session_id)
+        self.revoked_sessions.add(session_id)
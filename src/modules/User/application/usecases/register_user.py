@@ -8,9 +8,9 @@ from datetime import datetime
 from src.modules.User.domain.entities.user import User
 from src.modules.User.domain.value_objects.email import Email
 from src.modules.User.domain.value_objects.password import Password
-from src.modules.User.domain.services.password_service import PasswordService
 from src.modules.User.infrastructure.repositories.user_repository import UserRepository
 from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
+from src.modules.User.infrastructure.hashing.password_hashing_executor import PasswordHashingExecutor
 from src.modules.User.application.dto.register_request import RegisterRequest
 
 
@@ -29,14 +29,14 @@ class RegisterUserUseCase:
     Attributes:
         user_repository: Repositorio de usuarios
         role_repository: Repositorio de roles
-        password_service: Servicio para hashear contraseñas
+        password_hasher: Pool de hashing donde se hashean las contraseñas
     """
     
     def __init__(
         self,
         user_repository: UserRepository,
         role_repository: RoleRepository,
-        password_service: PasswordService
+        password_hasher: PasswordHashingExecutor
     ):
         """
         Inicializar el caso de uso con sus dependencias.
@@ -44,13 +44,13 @@ class RegisterUserUseCase:
         Args:
             user_repository: Repositorio de usuarios
             role_repository: Repositorio de roles
-            password_service: Servicio de contraseñas
+            password_hasher: Pool de hashing (bcrypt fuera del event loop)
         """
         self.user_repository = user_repository
         self.role_repository = role_repository
-        self.password_service = password_service
+        self.password_hasher = password_hasher
     
-    def execute(self, request: RegisterRequest) -> tuple[User, str | None]:
+    async def execute(self, request: RegisterRequest) -> tuple[User, str | None]:
         """
         Ejecutar el caso de uso de registro.
         
@@ -65,13 +65,14 @@ class RegisterUserUseCase:
             Exception: Si hay errores en la base de datos
         """
         # 1. Validar que el email no esté registrado
+        # (las consultas usan el pool asíncrono: no bloquean el event loop)
         email = Email(request.email)
-        if self.user_repository.email_exists(email.value):
+        if await self.user_repository.email_exists_async(email.value):
             raise ValueError(f"El email {email.value} ya está registrado en el sistema")
         
         # 2. Determinar rol (si no se especificó, usamos waiter por defecto)
         requested_role = request.role if request.role is not None else 'waiter'
-        role = self.role_repository.find_by_name(requested_role)
+        role = await self.role_repository.find_by_name_async(requested_role)
         if not role:
             raise ValueError(f"El rol '{requested_role}' no existe en el sistema")
         
@@ -79,8 +80,8 @@ class RegisterUserUseCase:
         # El value object Password ya valida las reglas
         password = Password(request.password)
         
-        # 4. Hashear la contraseña
-        password_hash = self.password_service.hash_password(password.value)
+        # 4. Hashear la contraseña (en el pool de procesos, sin bloquear el event loop)
+        password_hash = await self.password_hasher.hash_password(password.value)
         
         # 5. Crear la entidad User
         user = User(
@@ -98,7 +99,7 @@ class RegisterUserUseCase:
         
         # 6. Guardar en la base de datos
         try:
-            saved_user = self.user_repository.save(user)
+            saved_user = await self.user_repository.save_async(user)
             return saved_user, None
         except Exception as e:
             print(f"❌ Error al guardar usuario: {str(e)}")
@@ -2,9 +2,12 @@
 Caso de Uso: Cambiar el rol de un usuario.
 Implementa la lógica de negocio para actualizar el rol de un usuario existente.
 """
+from typing import List, Optional
+
 from src.modules.User.domain.entities.user import User
 from src.modules.User.infrastructure.repositories.user_repository import UserRepository
 from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
+from src.modules.User.infrastructure.repositories.session_repository import SessionRepository
 from src.modules.User.application.dto.change_role_request import ChangeRoleRequest
 
 
@@ -17,20 +20,27 @@ class UpdateUserRoleUseCase:
     2. Validar que exista el nuevo rol
     3. Actualizar el rol del usuario
     4. Guardar en la base de datos
+    5. Si el rol cambió, revocar las sesiones abiertas del usuario para que
+       vuelva a iniciar sesión con los permisos del rol nuevo
 
     Attributes:
         user_repository: Repositorio de usuarios
         role_repository: Repositorio de roles
+        session_repository: Repositorio de sesiones (opcional)
+        revoked_session_ids: Sesiones revocadas en la última ejecución
     """
 
     def __init__(
         self,
         user_repository: UserRepository,
-        role_repository: RoleRepository
+        role_repository: RoleRepository,
+        session_repository: Optional[SessionRepository] = None
     ):
         """Inicializar el caso de uso."""
         self.user_repository = user_repository
         self.role_repository = role_repository
+        self.session_repository = session_repository
+        self.revoked_session_ids: List[str] = []
 
     def execute(self, user_id: str, request: ChangeRoleRequest) -> tuple[User, str | None]:
         """
@@ -57,12 +67,18 @@ class UpdateUserRoleUseCase:
             raise ValueError(f"El rol '{request.role}' no existe en el sistema")
 
         # 3. Actualizar el rol del usuario
+        previous_role_id = user.role_id
         user.role_id = new_role.id
 
         # 4. Guardar en la base de datos
         try:
             updated_user = self.user_repository.update(user)
-            return updated_user, None
         except Exception as e:
             print(f"❌ Error al actualizar rol del usuario: {str(e)}")
             raise Exception("Error al actualizar el rol del usuario.")
+
+        # 5. Cerrar las sesiones abiertas con el rol anterior
+        self.revoked_session_ids = []
+        if self.session_repository and previous_role_id != new_role.id:
+            self.revoked_session_ids = self.session_repository.revoke_all_for_user(user.id)
+        return updated_user, None
@@ -5,5 +5,6 @@ Aquí se definen las entidades principales del módulo de usuarios.
 from .user import User
 from .role import Role
 from .permission import Permission
+from .session import Session
 
-__all__ = ["User", "Role", "Permission"]
+__all__ = ["User", "Role", "Permission", "Session"]
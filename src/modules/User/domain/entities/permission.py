@@ -3,6 +3,7 @@ Entidad Permission - Representa un permiso en el sistema.
 """
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 
 @dataclass
@@ -17,8 +18,10 @@ class Permission:
         name: Nombre del permiso (único)
         description: Descripción del permiso
         created_at: Fecha de creación
+        bit: Posición del permiso en la máscara de permisos del JWT
     """
     id: str
     name: str
     description: str = None  # type: ignore
     created_at: datetime = None  # type: ignore
+    bit: Optional[int] = None
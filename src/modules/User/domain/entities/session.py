@@ -0,0 +1,77 @@
+"""
+Entidad Session - Sesión de refresh token de un usuario.
+Cada login abre una sesión; su refresh token rota en cada renovación y el
+access token lleva el ID de la sesión (claim "sid") para poder revocarla.
+"""
+import hashlib
+import secrets
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+
+@dataclass
+class Session:
+    """
+    Entidad que representa una sesión abierta.
+
+    El refresh token nunca se guarda: solo su hash SHA-256.
+
+    Attributes:
+        id: Identificador de la sesión (claim "sid" de los access tokens)
+        user_id: Usuario dueño de la sesión
+        refresh_token_hash: Hash del refresh token vigente
+        expires_at: Fecha a partir de la cual no se puede renovar
+        ip_address: IP desde la que se abrió (auditoría)
+        created_at: Fecha de apertura
+        rotated_at: Última renovación
+        revoked_at: Fecha de revocación (logout o reutilización detectada)
+    """
+    id: str
+    user_id: str
+    refresh_token_hash: str
+    expires_at: datetime
+    ip_address: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    rotated_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+
+    @staticmethod
+    def hash_token(refresh_token: str) -> str:
+        """Hash con el que se guarda y se busca un refresh token."""
+        return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def new_refresh_token(session_id: str) -> str:
+        """Refresh token opaco: "<id de sesión>.<secreto aleatorio>"."""
+        return f"{session_id}.{secrets.token_urlsafe(32)}"
+
+    @staticmethod
+    def parse_session_id(refresh_token: str) -> Optional[str]:
+        """ID de sesión de un refresh token (None si el formato no es válido)."""
+        session_id, separator, secret = refresh_token.partition(".")
+        return session_id if separator and session_id and secret else None
+
+    @classmethod
+    def open(cls, user_id: str, expires_in_days: float, ip_address: Optional[str] = None) -> Tuple["Session", str]:
+        """
+        Abrir una sesión nueva.
+
+        Returns:
+            Tupla (sesión, refresh token en claro para entregar al cliente)
+        """
+        session_id = str(uuid.uuid4())
+        refresh_token = cls.new_refresh_token(session_id)
+        session = cls(
+            id=session_id,
+            user_id=user_id,
+            refresh_token_hash=cls.hash_token(refresh_token),
+            expires_at=datetime.now() + timedelta(days=expires_in_days),
+            ip_address=ip_address,
+        )
+        return session, refresh_token
+
+    def is_active(self) -> bool:
+        """La sesión se puede renovar: no está revocada ni expirada."""
+        return self.revoked_at is None and datetime.now() < self.expires_at
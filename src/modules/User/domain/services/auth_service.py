@@ -24,7 +24,10 @@ class AuthService:
         self.algorithm = algorithm
     
     def generate_token(self, user_id: str, email: str, role_id: str, 
-                       expires_in_minutes: int = 60) -> str:
+                       expires_in_minutes: int = 60,
+                       permissions_mask: Optional[int] = None,
+                       permissions_version: Optional[int] = None,
+                       session_id: Optional[str] = None) -> str:
         """
         Generar un token JWT para un usuario autenticado.
         
@@ -33,6 +36,9 @@ class AuthService:
             email: Email del usuario
             role_id: ID del rol del usuario
             expires_in_minutes: Tiempo de expiración en minutos (por defecto 60)
+            permissions_mask: Máscara de bits de los permisos del rol (claim "perms", en hexadecimal)
+            permissions_version: Versión de permisos del rol al emitir el token (claim "pv")
+            session_id: Sesión de refresh token a la que pertenece (claim "sid")
         
         Returns:
             Token JWT como string
@@ -48,6 +54,12 @@ class AuthService:
             "exp": expiration,
             "iat": datetime.utcnow()  # Issued at (emitido en)
         }
+        if permissions_mask is not None:
+            payload["perms"] = format(permissions_mask, "x")
+        if permissions_version is not None:
+            payload["pv"] = permissions_version
+        if session_id is not None:
+            payload["sid"] = session_id
         
         # Generar y retornar el token
         token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
@@ -90,10 +102,14 @@ class AuthService:
         if payload is None:
             return None
         
-        # Generar un nuevo token con los mismos datos
+        # Generar un nuevo token con los mismos datos (incluidos los claims de
+        # permisos: si la versión quedó obsoleta, el token renovado también se rechaza)
         return self.generate_token(
             user_id=payload["user_id"],
             email=payload["email"],
             role_id=payload["role_id"],
-            expires_in_minutes=expires_in_minutes
+            expires_in_minutes=expires_in_minutes,
+            permissions_mask=int(payload["perms"], 16) if "perms" in payload else None,
+            permissions_version=payload.get("pv"),
+            session_id=payload.get("sid")
         )
@@ -2,23 +2,38 @@
 Servicio de dominio PasswordService.
 Maneja el hashing y verificación de contraseñas usando bcrypt.
 """
+import re
+import time
+from typing import Optional
+
 import bcrypt
 
+# $2b$12$<salt+hash>: el factor de trabajo va entre el segundo y el tercer "$"
+BCRYPT_COST_PATTERN = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
 
 class PasswordService:
     """
     Servicio para manejar el hashing y verificación de contraseñas.
     Utiliza bcrypt para garantizar seguridad en el almacenamiento.
     """
+
+    # Factor de trabajo por defecto cuando no se calibra
+    DEFAULT_ROUNDS = 12
+    # Límites de la calibración: nunca por debajo del coste por defecto
+    MIN_ROUNDS = 12
+    MAX_ROUNDS = 16
     
     @staticmethod
-    def hash_password(password: str) -> str:
+    def hash_password(password: str, rounds: int = DEFAULT_ROUNDS) -> str:
         """
         Generar un hash seguro de una contraseña.
-        Utiliza bcrypt con un factor de trabajo de 12 (recomendado).
+        Utiliza bcrypt con el factor de trabajo indicado (12 por defecto; en la
+        API se usa el calibrado al arrancar, ver calibrate_rounds).
         
         Args:
             password: Contraseña en texto plano
+            rounds: Factor de trabajo de bcrypt (cada +1 duplica el coste)
         
         Returns:
             Hash de la contraseña en formato string
@@ -31,12 +46,69 @@ class PasswordService:
         password_bytes = password.encode('utf-8')
         
         # Generar el salt y crear el hash
-        # El factor de trabajo 12 es un balance entre seguridad y rendimiento
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=rounds)
         hashed = bcrypt.hashpw(password_bytes, salt)
         
         # Retornar como string
         return hashed.decode('utf-8')
+
+    @staticmethod
+    def get_rounds(hashed_password: str) -> Optional[int]:
+        """
+        Obtener el factor de trabajo con el que se generó un hash.
+
+        Returns:
+            Factor de trabajo, o None si el hash no tiene formato bcrypt
+        """
+        match = BCRYPT_COST_PATTERN.match(hashed_password or "")
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def needs_rehash(hashed_password: str, rounds: int) -> bool:
+        """
+        Indica si el hash se generó con un factor de trabajo menor que `rounds`.
+        Un hash más costoso se conserva: rehashear nunca baja el coste.
+        """
+        stored_rounds = PasswordService.get_rounds(hashed_password)
+        return stored_rounds is None or stored_rounds < rounds
+
+    @staticmethod
+    def measure_hash_time(rounds: int, samples: int = 2) -> float:
+        """Segundos que tarda un hash con el factor indicado (mejor de `samples` intentos)."""
+        best = float("inf")
+        for _ in range(samples):
+            started = time.perf_counter()
+            bcrypt.hashpw(b"calibration-password", bcrypt.gensalt(rounds=rounds))
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    @staticmethod
+    def calibrate_rounds(
+        target_ms: float,
+        min_rounds: int = MIN_ROUNDS,
+        max_rounds: int = MAX_ROUNDS,
+    ) -> int:
+        """
+        Elegir el mayor factor de trabajo cuyo hash tarda como mucho `target_ms`
+        en esta máquina (nunca menos de `min_rounds`).
+
+        Se mide desde el mínimo hacia arriba. Cada nivel duplica el coste, así
+        que solo se mide el siguiente si la estimación (el doble del actual)
+        no supera claramente el objetivo.
+
+        Example:
+            >>> PasswordService.calibrate_rounds(target_ms=300)
+            12
+        """
+        rounds = min_rounds
+        elapsed_ms = PasswordService.measure_hash_time(rounds) * 1000
+        while rounds < max_rounds and elapsed_ms * 2 <= target_ms * 1.25:
+            next_elapsed_ms = PasswordService.measure_hash_time(rounds + 1) * 1000
+            if next_elapsed_ms > target_ms:
+                break
+            rounds += 1
+            elapsed_ms = next_elapsed_ms
+        return rounds
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
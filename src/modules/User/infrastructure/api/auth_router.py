@@ -2,22 +2,33 @@
 Router de autenticación - Endpoints para registro y login.
 Define los endpoints HTTP para el módulo de autenticación.
 """
+import math
+
 from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 
 from src.modules.User.application.dto.register_request import RegisterRequest
 from src.modules.User.application.dto.login_request import LoginRequest
 from src.modules.User.application.dto.user_response import UserResponse
 from src.modules.User.application.dto.auth_response import AuthResponse
+from src.modules.User.application.dto.refresh_request import RefreshRequest
 from src.modules.User.application.usecases.register_user import RegisterUserUseCase
 from src.modules.User.application.usecases.login_user import LoginUserUseCase
+from src.modules.User.application.usecases.refresh_session import RefreshSessionUseCase
+from src.modules.User.domain.entities.session import Session
+from src.modules.User.domain.entities.user import User
 from src.modules.User.infrastructure.repositories.user_repository import UserRepository
 from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
 from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
 from src.modules.User.infrastructure.repositories.permission_repository import PermissionRepository
-from src.modules.User.domain.services.password_service import PasswordService
+from src.modules.User.infrastructure.repositories.session_repository import SessionRepository
 from src.modules.User.domain.services.auth_service import AuthService
+from src.modules.User.infrastructure.hashing import PasswordHashingExecutor, PasswordHashingSaturatedError
+from src.modules.User.infrastructure.authorization import PermissionMatrix, RevokedSessionFilter
+from src.modules.User.infrastructure.audit import LoginAttemptAuditWriter
 from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.rate_limit import SlidingWindowRateLimiter
 
 
 # Crear el router con prefijo /api/auth
@@ -26,24 +37,120 @@ router = APIRouter(
     tags=["Autenticación"],
     responses={
         401: {"description": "No autorizado"},
-        429: {"description": "Demasiados intentos - Cuenta bloqueada"}
+        429: {"description": "Demasiados intentos - Cuenta bloqueada"},
+        503: {"description": "Servicio de autenticación saturado - Reintentar"}
     }
 )
 
 # Inicializar servicios y repositorios
-password_service = PasswordService()
+# bcrypt se ejecuta en un pool de procesos acotado (ver main.py: arranque y /metrics)
+password_hasher = PasswordHashingExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS or None,
+    max_queue_size=settings.PASSWORD_HASH_MAX_QUEUE,
+    rounds=settings.PASSWORD_HASH_ROUNDS or None,
+)
 auth_service = AuthService(
     secret_key=settings.JWT_SECRET_KEY,
     algorithm=settings.JWT_ALGORITHM
 )
 user_repository = UserRepository()
 role_repository = RoleRepository()
-login_attempt_repository = LoginAttemptRepository()
+# Intentos de login: se encolan en memoria y se insertan en lotes (ver main.py: arranque y cierre)
+login_attempt_writer = LoginAttemptAuditWriter(
+    LoginAttemptRepository(),
+    max_buffer_size=settings.LOGIN_AUDIT_BUFFER_SIZE,
+    batch_size=settings.LOGIN_AUDIT_BATCH_SIZE,
+    flush_interval_ms=settings.LOGIN_AUDIT_FLUSH_INTERVAL_MS,
+)
+# Matriz rol -> permisos compartida: claims del JWT y require_permission (dependencies.py)
+permission_matrix = PermissionMatrix()
+# Sesiones de refresh token y filtro en memoria de las revocadas (claim "sid")
+session_repository = SessionRepository()
+revoked_sessions = RevokedSessionFilter(
+    session_repository,
+    capacity=settings.SESSION_REVOCATION_FILTER_CAPACITY,
+)
+
+
+# Limitadores en memoria por IP y por email: frenan la fuerza bruta antes de
+# tocar la base o bcrypt (también contra emails inexistentes)
+ip_rate_limiter = SlidingWindowRateLimiter(
+    limit=settings.AUTH_RATE_LIMIT_PER_IP if settings.AUTH_RATE_LIMIT_ENABLED else 0,
+    window_seconds=settings.AUTH_RATE_LIMIT_WINDOW_SECONDS,
+)
+email_rate_limiter = SlidingWindowRateLimiter(
+    limit=settings.AUTH_RATE_LIMIT_PER_EMAIL if settings.AUTH_RATE_LIMIT_ENABLED else 0,
+    window_seconds=settings.AUTH_RATE_LIMIT_WINDOW_SECONDS,
+)
+
+
+def _enforce_rate_limit(limiter: SlidingWindowRateLimiter, key: Optional[str]) -> None:
+    """429 con Retry-After si la clave superó su límite en la ventana."""
+    if key is None or limiter.hit(key):
+        return
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Demasiadas solicitudes. Intenta nuevamente más tarde.",
+        headers={"Retry-After": str(max(1, math.ceil(limiter.retry_after(key))))},
+    )
+
+
+def _hashing_saturated(error: PasswordHashingSaturatedError) -> HTTPException:
+    """503 con Retry-After cuando la cola de hashing está llena."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
+def _refresh_permission_versions() -> None:
+    """
+    Revisar las versiones de permisos antes de emitir un token, para no emitir
+    una obsoleta (login y refresh ya consultan la base). Es una consulta
+    síncrona: desde código async se ejecuta en el threadpool.
+    """
+    try:
+        permission_matrix.refresh_if_changed()
+    except Exception as e:
+        print(f"⚠️  No se pudieron revisar las versiones de permisos: {e}")
+
+
+def _issue_tokens(user: User, session_id: str, refresh_token: str) -> AuthResponse:
+    """Access token (con permisos del rol y sesión) y refresh token para la respuesta."""
+    permissions_mask, permissions_version = permission_matrix.claims_for_role(user.role_id)
+    access_token = auth_service.generate_token(
+        user_id=user.id,
+        email=user.email,
+        role_id=user.role_id,
+        expires_in_minutes=settings.JWT_EXPIRATION_MINUTES,
+        permissions_mask=permissions_mask,
+        permissions_version=permissions_version,
+        session_id=session_id
+    )
+    return AuthResponse(
+        access_token=access_token,
+        token_type="bearer",
+        refresh_token=refresh_token,
+        user=UserResponse(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            phone=user.phone,
+            role_id=user.role_id,
+            created_at=user.created_at
+        )
+    )
 
 
 def get_client_ip(request: Request) -> Optional[str]:
     """
     Obtener la dirección IP del cliente.
+
+    X-Forwarded-For lo escribe el cliente, así que solo se usa si la conexión
+    viene de un proxy de confianza (TRUSTED_PROXY_IPS). En ese caso la IP del
+    cliente es la primera, leyendo de derecha a izquierda, que no es un proxy de
+    confianza: lo que esté más a la izquierda lo pudo inventar el cliente.
     
     Args:
         request: Objeto Request de FastAPI
@@ -51,13 +158,17 @@ def get_client_ip(request: Request) -> Optional[str]:
     Returns:
         Dirección IP del cliente
     """
-    # Intentar obtener IP de headers (si hay proxy)
+    peer_ip = request.client.host if request.client else None
+    trusted_proxies = settings.trusted_proxy_ips
     forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(",")[0]
+    if forwarded and peer_ip in trusted_proxies:
+        addresses = [address.strip() for address in forwarded.split(",") if address.strip()]
+        for address in reversed(addresses):
+            if address not in trusted_proxies:
+                return address
     
     # Obtener IP directa
-    return request.client.host if request.client else None
+    return peer_ip
 
 
 @router.post(
@@ -101,34 +212,40 @@ def get_client_ip(request: Request) -> Optional[str]:
             }
         },
         400: {"description": "Datos inválidos o email ya registrado"},
-        500: {"description": "Error interno del servidor"}
+        500: {"description": "Error interno del servidor"},
+        503: {"description": "Servicio de autenticación saturado"}
     }
 )
-async def register(request_data: RegisterRequest):
+async def register(request_data: RegisterRequest, request: Request):
     """
     Endpoint POST /api/auth/register
     Registra un nuevo usuario en el sistema.
     
     Args:
         request_data: Datos del usuario a registrar
+        request: Objeto Request para obtener IP
     
     Returns:
         Usuario creado (sin contraseña)
     
     Raises:
         HTTPException 400: Si hay errores de validación
+        HTTPException 429: Si la IP superó el límite de solicitudes
         HTTPException 500: Si hay errores en el servidor
+        HTTPException 503: Si la cola de hashing está saturada
     """
     try:
+        _enforce_rate_limit(ip_rate_limiter, get_client_ip(request))
+
         # Crear instancia del caso de uso
         register_use_case = RegisterUserUseCase(
             user_repository=user_repository,
             role_repository=role_repository,
-            password_service=password_service
+            password_hasher=password_hasher
         )
         
         # Ejecutar el caso de uso
-        user, error = register_use_case.execute(request_data)
+        user, error = await register_use_case.execute(request_data)
         
         if error:
             raise HTTPException(
@@ -152,6 +269,8 @@ async def register(request_data: RegisterRequest):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHashingSaturatedError as e:
+        raise _hashing_saturated(e)
     except HTTPException:
         # Re-lanzar excepciones HTTP
         raise
@@ -170,7 +289,8 @@ async def register(request_data: RegisterRequest):
     status_code=status.HTTP_200_OK,
     summary="Iniciar sesión",
     description="""
-    Autentica un usuario con sus credenciales y retorna un token JWT.
+    Autentica un usuario con sus credenciales y retorna un token JWT y un
+    refresh token (ver `POST /api/auth/refresh`).
     
     **Criterios de Aceptación:**
     - CA3: Si falla 5 veces consecutivas, la cuenta se bloquea por 15 minutos
@@ -180,6 +300,7 @@ async def register(request_data: RegisterRequest):
     **Seguridad:**
     - Registra todos los intentos de login (exitosos y fallidos)
     - Bloqueo automático tras 5 intentos fallidos consecutivos
+    - Límite de solicitudes por IP y por email en memoria (429 con `Retry-After`), antes de consultar la base
     - Contador de intentos se resetea tras login exitoso
     """,
     responses={
@@ -190,6 +311,7 @@ async def register(request_data: RegisterRequest):
                     "example": {
                         "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                         "token_type": "bearer",
+                        "refresh_token": "0b6c5a5e-8f4e-4d1a-9d53-1c2f3a4b5c6d.Zq3xV...",
                         "user": {
                             "id": "550e8400-e29b-41d4-a716-446655440000",
                             "name": "Juan Pérez",
@@ -203,8 +325,9 @@ async def register(request_data: RegisterRequest):
             }
         },
         401: {"description": "Credenciales inválidas"},
-        429: {"description": "Cuenta bloqueada - Demasiados intentos fallidos"},
-        500: {"description": "Error interno del servidor"}
+        429: {"description": "Cuenta bloqueada o límite de solicitudes superado"},
+        500: {"description": "Error interno del servidor"},
+        503: {"description": "Servicio de autenticación saturado"}
     }
 )
 async def login(request_data: LoginRequest, request: Request):
@@ -221,22 +344,27 @@ async def login(request_data: LoginRequest, request: Request):
     
     Raises:
         HTTPException 401: Si las credenciales son inválidas
-        HTTPException 429: Si la cuenta está bloqueada
+        HTTPException 429: Si la cuenta está bloqueada o se superó el límite de solicitudes
         HTTPException 500: Si hay errores en el servidor
+        HTTPException 503: Si la cola de hashing está saturada
     """
     try:
         # Obtener IP del cliente para auditoría
         client_ip = get_client_ip(request)
+
+        # Límite por IP y por email antes de cualquier consulta o hash
+        _enforce_rate_limit(ip_rate_limiter, client_ip)
+        _enforce_rate_limit(email_rate_limiter, request_data.email.lower())
         
         # Crear instancia del caso de uso
         login_use_case = LoginUserUseCase(
             user_repository=user_repository,
-            login_attempt_repository=login_attempt_repository,
-            password_service=password_service
+            login_attempt_writer=login_attempt_writer,
+            password_hasher=password_hasher
         )
         
         # Ejecutar el caso de uso
-        user, error, status_code = login_use_case.execute(
+        user, error, status_code = await login_use_case.execute(
             request=request_data,
             ip_address=client_ip
         )
@@ -248,30 +376,15 @@ async def login(request_data: LoginRequest, request: Request):
                 detail=error
             )
         
-        # Generar token JWT
-        access_token = auth_service.generate_token(
-            user_id=user.id,
-            email=user.email,
-            role_id=user.role_id,
-            expires_in_minutes=settings.JWT_EXPIRATION_MINUTES
-        )
-        
-        # Mapear a DTO de respuesta
-        user_response = UserResponse(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            phone=user.phone,
-            role_id=user.role_id,
-            created_at=user.created_at
-        )
-        
-        return AuthResponse(
-            access_token=access_token,
-            token_type="bearer",
-            user=user_response
-        )
+        # Abrir la sesión de refresh token y generar los tokens
+        # (consultas fuera del event loop: no frenan las demás peticiones durante el login)
+        session, refresh_token = Session.open(user.id, settings.REFRESH_TOKEN_EXPIRATION_DAYS, client_ip)
+        await session_repository.save_async(session)
+        await run_in_threadpool(_refresh_permission_versions)
+        return _issue_tokens(user, session.id, refresh_token)
         
+    except PasswordHashingSaturatedError as e:
+        raise _hashing_saturated(e)
     except HTTPException:
         # Re-lanzar excepciones HTTP
         raise
@@ -284,52 +397,206 @@ async def login(request_data: LoginRequest, request: Request):
         )
 
 
+@router.post(
+    "/refresh",
+    response_model=AuthResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Renovar el token",
+    description="""
+    Emite un nuevo access token a partir del refresh token de la sesión, sin
+    repetir la verificación de la contraseña.
+    
+    - El refresh token **rota**: la respuesta trae uno nuevo y el anterior deja de servir
+    - Presentar un refresh token ya usado revoca la sesión completa (posible robo)
+    - El access token nuevo refleja el rol y los permisos actuales del usuario
+    """,
+    responses={
+        200: {"description": "Tokens renovados"},
+        401: {"description": "Refresh token inválido, expirado o revocado"},
+        429: {"description": "Límite de solicitudes superado"}
+    }
+)
+def refresh(request_data: RefreshRequest, request: Request):
+    """
+    Endpoint POST /api/auth/refresh
+    Renueva el access token y rota el refresh token.
+    
+    Args:
+        request_data: Refresh token vigente
+        request: Objeto Request para obtener IP
+    
+    Returns:
+        Nuevo access token, nuevo refresh token y datos del usuario
+    
+    Raises:
+        HTTPException 401: Si el refresh token no es válido
+        HTTPException 429: Si la IP superó el límite de solicitudes
+    """
+    _enforce_rate_limit(ip_rate_limiter, get_client_ip(request))
+
+    refresh_use_case = RefreshSessionUseCase(
+        session_repository=session_repository,
+        user_repository=user_repository,
+        revoked_sessions=revoked_sessions
+    )
+    user, session_id, refresh_token, error = refresh_use_case.execute(request_data.refresh_token)
+    if error:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=error
+        )
+    _refresh_permission_versions()
+    return _issue_tokens(user, session_id, refresh_token)
+
+
 # Dependency para obtener el usuario actual desde JWT
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hashlib
+import threading
+import time
 import jwt
-from typing import Dict
+from typing import Any, Dict
+
+from src.shared.infrastructure.cache import TTLLRUCache
 
 security = HTTPBearer()
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, str]:
-    """
-    Dependency para obtener el usuario actual desde el token JWT.
+# Tokens ya verificados (clave: sha256 del token) hasta su `exp`: las peticiones
+# repetidas (p. ej. tablets de cocina consultando pedidos) no repiten la verificación HMAC
+token_cache: TTLLRUCache[Dict[str, Any]] = TTLLRUCache(max_entries=settings.JWT_CACHE_MAX_ENTRIES)
 
-    Args:
-        credentials: Credenciales HTTP Bearer con el token JWT
 
-    Returns:
-        Dict con información del usuario: {"id": user_id, "email": email, "role_id": role_id}
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
-    Raises:
-        HTTPException: Si el token es inválido o expirado
+
+def _decode_current_user(token: str) -> Dict[str, Any]:
+    """Verificar el token y extraer el usuario; guarda el resultado en token_cache."""
+    payload = jwt.decode(
+        token,
+        settings.JWT_SECRET_KEY,
+        algorithms=[settings.JWT_ALGORITHM]
+    )
+
+    # Extraer información del usuario
+    user_id = payload.get("user_id")
+    email = payload.get("email")
+    role_id = payload.get("role_id")
+
+    if not user_id or not email:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido: falta información del usuario"
+        )
+
+    # Tokens emitidos antes de los claims de permisos: permissions=None y
+    # require_permission consulta la matriz en memoria
+    permissions_claim = payload.get("perms")
+    current_user = {
+        "id": user_id,
+        "email": email,
+        "role_id": role_id,
+        "permissions": (
+            permission_matrix.decode_mask(int(permissions_claim, 16))
+            if permissions_claim is not None else None
+        ),
+        "permissions_version": payload.get("pv"),
+        "session_id": payload.get("sid")
+    }
+
+    # Nunca más allá del `exp` del token ni del TTL máximo configurado
+    expires_at = time.time() + settings.JWT_CACHE_MAX_TTL_SECONDS
+    if payload.get("exp") is not None:
+        expires_at = min(expires_at, float(payload["exp"]))
+    token_cache.set(_token_cache_key(token), current_user, expires_at)
+    return current_user
+
+
+# Última recarga de la matriz provocada por un token con una versión más nueva
+_token_refresh_lock = threading.Lock()
+_last_token_refresh = 0.0
+
+
+def _refresh_for_newer_token() -> None:
     """
+    Recargar la matriz porque un token trae una versión más nueva que la local.
+    Como mucho una vez cada PERMISSION_VERSION_REFRESH_SECONDS (mínimo 1 s):
+    los tokens no pueden convertir el camino de cada petición en consultas.
+    """
+    global _last_token_refresh
+    now = time.monotonic()
+    with _token_refresh_lock:
+        if now - _last_token_refresh < max(1.0, settings.PERMISSION_VERSION_REFRESH_SECONDS):
+            return
+        _last_token_refresh = now
     try:
-        # Decodificar el token JWT
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        permission_matrix.refresh_if_changed()
+    except Exception as e:
+        print(f"⚠️  No se pudieron revisar las versiones de permisos: {e}")
+
 
-        # Extraer información del usuario
-        user_id = payload.get("user_id")
-        email = payload.get("email")
-        role_id = payload.get("role_id")
+def _ensure_token_is_current(current_user: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    401 si la sesión del token fue revocada, si su rol no existe en la matriz
+    o si el token se emitió con una versión de permisos anterior a la vigente
+    del rol (todo en memoria).
 
-        if not user_id or not email:
+    Un token con una versión más nueva viene de un worker que ya vio el cambio
+    antes que este: se acepta (sus permisos firmados son los nuevos) y se
+    recarga la matriz, con un límite de una recarga por intervalo. Un rol
+    desconocido no provoca recargas: la revisión periódica lo incorporará.
+    """
+    session_id = current_user["session_id"]
+    if session_id is not None and revoked_sessions.is_revoked(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="La sesión fue cerrada. Inicia sesión nuevamente."
+        )
+    token_version = current_user["permissions_version"]
+    if token_version is not None:
+        current_version = permission_matrix.role_version(current_user["role_id"])
+        if current_version is not None and token_version > current_version:
+            _refresh_for_newer_token()
+        elif current_version is None or token_version < current_version:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token inválido: falta información del usuario"
+                detail="Los permisos de tu rol cambiaron. Renueva el token o inicia sesión nuevamente."
             )
+    # Copia: el llamador no debe poder alterar la entrada compartida
+    return dict(current_user)
+
+
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+    """
+    Dependency para obtener el usuario actual desde el token JWT.
+
+    Los tokens ya verificados se sirven desde token_cache hasta su expiración.
+    En cada petición (también en los aciertos de caché) se comprueba, sin tocar
+    la base, que la sesión no esté revocada y que la versión de permisos del
+    token no sea anterior a la de la matriz en memoria.
 
-        return {
-            "id": user_id,
-            "email": email,
-            "role_id": role_id
-        }
+    Args:
+        credentials: Credenciales HTTP Bearer con el token JWT
+
+    Returns:
+        Dict con información del usuario: {"id", "email", "role_id",
+        "permissions" (frozenset de nombres o None), "permissions_version",
+        "session_id"}
 
+    Raises:
+        HTTPException: Si el token es inválido, expirado, de una sesión revocada
+            o con permisos obsoletos
+    """
+    cached_user = token_cache.get(_token_cache_key(credentials.credentials))
+    if cached_user is not None:
+        return _ensure_token_is_current(cached_user)
+
+    try:
+        return _ensure_token_is_current(_decode_current_user(credentials.credentials))
+
+    except HTTPException:
+        raise
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -345,3 +612,34 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Error de autenticación: {str(e)}"
         )
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Cerrar sesión",
+    description="""
+    Revoca la sesión del access token: su refresh token deja de servir y los
+    access tokens de la sesión se rechazan de inmediato (401) en este proceso
+    y, como mucho tras `SESSION_REVOCATION_REFRESH_SECONDS`, en los demás workers.
+    """,
+    responses={
+        204: {"description": "Sesión cerrada"},
+        401: {"description": "Token inválido o expirado"}
+    }
+)
+def logout(current_user: Dict[str, Any] = Depends(get_current_user)) -> None:
+    """
+    Endpoint POST /api/auth/logout
+    Revoca la sesión del usuario autenticado.
+    
+    Args:
+        current_user: Usuario del token (incluye "session_id")
+    """
+    session_id = current_user.get("session_id")
+    if session_id is None:
+        # Token emitido antes de las sesiones: no hay nada que revocar
+        return None
+    session_repository.revoke(session_id)
+    revoked_sessions.add(session_id)
+    return None
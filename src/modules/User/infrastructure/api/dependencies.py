@@ -0,0 +1,45 @@
+"""
+Dependencias de autorización para los routers.
+
+Uso:
+    @router.post("/", dependencies=[Depends(require_permission("manage_inventory"))])
+
+    @router.get("/")
+    def endpoint(user=Depends(require_permission("manage_inventory"))):
+        ...
+"""
+from typing import Any, Callable, Dict
+
+from fastapi import Depends, HTTPException, status
+
+from src.modules.User.infrastructure.api.auth_router import get_current_user, permission_matrix
+
+
+def require_permission(permission_name: str) -> Callable[..., Dict[str, Any]]:
+    """
+    Crear una dependencia que exige un permiso al usuario autenticado.
+
+    Args:
+        permission_name: Nombre del permiso (p. ej. "manage_inventory")
+
+    Returns:
+        Dependencia que devuelve el usuario actual o lanza 403
+    """
+
+    def dependency(user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, Any]:
+        # Los permisos del token (ya validados contra la versión del rol) no
+        # requieren la matriz; los tokens antiguos sin claim sí la consultan
+        permissions = user.get("permissions")
+        if permissions is not None:
+            allowed = permission_name in permissions
+        else:
+            allowed = permission_matrix.has_permission(user.get("role_id"), permission_name)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"No tienes el permiso requerido: {permission_name}",
+            )
+        return user
+
+    dependency.__name__ = f"require_{permission_name}"
+    return dependency
@@ -2,7 +2,7 @@
 Router de gestión de roles - Endpoints para administrar roles y permisos.
 Define los endpoints HTTP para listar, asignar roles y ver permisos.
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 
 from src.modules.User.application.dto.permission_response import (
@@ -15,6 +15,8 @@ from src.modules.User.application.usecases.update_user_role import UpdateUserRol
 from src.modules.User.infrastructure.repositories.user_repository import UserRepository
 from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
 from src.modules.User.infrastructure.repositories.permission_repository import PermissionRepository
+from src.modules.User.infrastructure.api.auth_router import revoked_sessions, session_repository
+from src.modules.User.infrastructure.api.dependencies import require_permission
 
 
 # Crear router para endpoints de roles
@@ -115,6 +117,98 @@ async def get_role_permissions(role_id: str):
         )
 
 
+def _role_permissions_response(role_id: str) -> RolePermissionsResponse:
+    """Validar el rol y devolverlo con sus permisos actuales."""
+    role = role_repository.find_by_id(role_id)
+    if not role:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"El rol '{role_id}' no existe"
+        )
+    return RolePermissionsResponse(
+        id=role.id,
+        name=role.name,
+        description=role.description,
+        permissions=[
+            PermissionResponse(
+                id=perm.id,
+                name=perm.name,
+                description=perm.description,
+                created_at=perm.created_at
+            )
+            for perm in permission_repository.find_by_role_id(role_id)
+        ]
+    )
+
+
+def _find_permission_or_404(permission_name: str):
+    permission = permission_repository.find_by_name(permission_name)
+    if not permission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"El permiso '{permission_name}' no existe"
+        )
+    return permission
+
+
+@router.post(
+    "/{role_id}/permissions/{permission_name}",
+    response_model=RolePermissionsResponse,
+    summary="Asignar un permiso a un rol",
+    description="Asigna un permiso a un rol. Requiere el permiso **manage_users**. "
+                "La matriz de permisos en memoria se recarga de inmediato.",
+    responses={403: {"description": "Sin permiso manage_users"}}
+)
+async def assign_permission_to_role(
+    role_id: str,
+    permission_name: str,
+    user=Depends(require_permission("manage_users"))
+):
+    """
+    Asigna un permiso a un rol (idempotente).
+
+    Args:
+        role_id: ID del rol
+        permission_name: Nombre del permiso (p. ej. manage_inventory)
+
+    Returns:
+        Rol con sus permisos actualizados
+    """
+    _role_permissions_response(role_id)
+    permission = _find_permission_or_404(permission_name)
+    permission_repository.assign_to_role(role_id, permission.id)
+    return _role_permissions_response(role_id)
+
+
+@router.delete(
+    "/{role_id}/permissions/{permission_name}",
+    response_model=RolePermissionsResponse,
+    summary="Quitar un permiso a un rol",
+    description="Quita un permiso a un rol. Requiere el permiso **manage_users**. "
+                "La matriz de permisos en memoria se recarga de inmediato.",
+    responses={403: {"description": "Sin permiso manage_users"}}
+)
+async def revoke_permission_from_role(
+    role_id: str,
+    permission_name: str,
+    user=Depends(require_permission("manage_users"))
+):
+    """
+    Quita un permiso a un rol (idempotente).
+
+    Args:
+        role_id: ID del rol
+        permission_name: Nombre del permiso
+
+    Returns:
+        Rol con sus permisos actualizados
+    """
+    _role_permissions_response(role_id)
+    permission = _find_permission_or_404(permission_name)
+    permission_repository.revoke_from_role(role_id, permission.id)
+    return _role_permissions_response(role_id)
+
+
 @router.get(
     "/permissions/",
     response_model=List[PermissionResponse],
@@ -179,6 +273,9 @@ async def update_user_role(user_id: str, request: ChangeRoleRequest):
         user_id: ID del usuario
         request: DTO con el nuevo rol
 
+    Si el rol cambia, las sesiones abiertas del usuario se revocan: sus
+    tokens dejan de valer y debe iniciar sesión de nuevo con el rol nuevo.
+
     Returns:
         Datos del usuario actualizado
 
@@ -190,10 +287,12 @@ async def update_user_role(user_id: str, request: ChangeRoleRequest):
     try:
         use_case = UpdateUserRoleUseCase(
             user_repository=user_repository,
-            role_repository=role_repository
+            role_repository=role_repository,
+            session_repository=session_repository
         )
 
         user, error = use_case.execute(user_id, request)
+        revoked_sessions.add_many(use_case.revoked_session_ids)
 
         if error:
             raise HTTPException(
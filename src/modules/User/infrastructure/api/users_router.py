@@ -0,0 +1,200 @@
+"""
+Router de gestión de usuarios - Alta masiva de empleados e historial de login.
+Define los endpoints HTTP de administración de usuarios.
+"""
+import csv
+import io
+import json
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
+
+from src.modules.User.application.dto.bulk_register import BulkRegisterRequest, BulkRegisterResponse
+from src.modules.User.application.dto.login_history import LoginHistoryResponse
+from src.modules.User.application.usecases.bulk_register_users import BulkRegisterUsersUseCase
+from src.modules.User.infrastructure.api.auth_router import (
+    _hashing_saturated,
+    password_hasher,
+    role_repository,
+    user_repository,
+)
+from src.modules.User.infrastructure.api.dependencies import require_permission
+from src.modules.User.infrastructure.hashing import PasswordHashingSaturatedError
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+from src.shared.infrastructure.config.settings import settings
+
+
+# Crear router con prefijo /api/users
+router = APIRouter(
+    prefix="/api/users",
+    tags=["Usuarios"],
+    responses={
+        401: {"description": "No autorizado"},
+        403: {"description": "Sin permiso manage_users"}
+    }
+)
+
+CSV_COLUMNS = ("name", "email", "phone", "password", "role")
+
+# Límites de GET /login-history
+MAX_LOGIN_HISTORY_DAYS = 365
+MAX_LOGIN_HISTORY_ATTEMPTS = 200
+
+login_attempt_repository = LoginAttemptRepository()
+
+
+def _parse_csv(body: bytes) -> List[Dict[str, Any]]:
+    """Filas de un CSV con cabecera; las celdas vacías se omiten (p. ej. rol por defecto)."""
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("El CSV debe estar codificado en UTF-8")
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise ValueError("El CSV está vacío")
+    headers = [(header or "").strip().lower() for header in reader.fieldnames]
+    missing = {"name", "email", "password"} - set(headers)
+    if missing:
+        raise ValueError(f"Faltan columnas en el CSV: {', '.join(sorted(missing))}")
+    reader.fieldnames = headers
+    return [
+        {key: value.strip() for key, value in row.items() if key in CSV_COLUMNS and value and value.strip()}
+        for row in reader
+    ]
+
+
+def _parse_json(body: bytes) -> List[Dict[str, Any]]:
+    """Filas de {"users": [...]} (o directamente una lista)."""
+    try:
+        payload = json.loads(body or b"null")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON inválido: {e.msg}")
+    if isinstance(payload, list):
+        payload = {"users": payload}
+    try:
+        return BulkRegisterRequest.model_validate(payload).users
+    except ValidationError:
+        raise ValueError('El cuerpo debe ser {"users": [ ... ]} con al menos un usuario')
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkRegisterResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Alta masiva de empleados",
+    description=f"""
+    Registra muchos usuarios en una solicitud (p. ej. al abrir una sucursal).
+    Requiere el permiso **manage_users**.
+    
+    **Formatos aceptados:**
+    - `application/json`: `{{"users": [{{"name", "email", "phone", "password", "role"}}, ...]}}`
+    - `text/csv`: cabecera `name,email,phone,password,role` (`phone` y `role` opcionales)
+    
+    **Proceso:**
+    - Cada fila se valida con las mismas reglas que `POST /api/auth/register`
+    - Los emails existentes se comprueban en una sola consulta
+    - Las contraseñas se hashean en paralelo en el pool de procesos
+    - Los usuarios se insertan en lotes
+    
+    Responde 200 con el resultado de cada fila: las filas inválidas no impiden
+    crear las demás. Máximo `BULK_REGISTER_MAX_ROWS` filas ({settings.BULK_REGISTER_MAX_ROWS}).
+    """,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": BulkRegisterRequest.model_json_schema()},
+                "text/csv": {
+                    "schema": {"type": "string"},
+                    "example": "name,email,phone,password,role\nAna Gómez,ana.gomez@example.com,,SecurePass123!,employee\n"
+                },
+            },
+        }
+    },
+    responses={
+        200: {"description": "Reporte por fila"},
+        400: {"description": "Cuerpo ilegible, vacío o con demasiadas filas"},
+        503: {"description": "Servicio de autenticación saturado"}
+    }
+)
+async def bulk_register(request: Request, user=Depends(require_permission("manage_users"))):
+    """
+    Endpoint POST /api/users/bulk
+    Registra varios usuarios y devuelve un reporte por fila.
+    
+    Args:
+        request: Solicitud con el cuerpo JSON o CSV
+        user: Usuario autenticado con permiso manage_users
+    
+    Returns:
+        Reporte con el resultado de cada fila
+    
+    Raises:
+        HTTPException 400: Si el cuerpo no se puede leer o excede el máximo de filas
+        HTTPException 503: Si la cola de hashing está saturada
+    """
+    try:
+        body = await request.body()
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        rows = _parse_csv(body) if content_type in ("text/csv", "application/csv") else _parse_json(body)
+        if not rows:
+            raise ValueError("No se recibió ningún usuario")
+        if len(rows) > settings.BULK_REGISTER_MAX_ROWS:
+            raise ValueError(f"Máximo {settings.BULK_REGISTER_MAX_ROWS} usuarios por solicitud (se recibieron {len(rows)})")
+        
+        use_case = BulkRegisterUsersUseCase(
+            user_repository=user_repository,
+            role_repository=role_repository,
+            password_hasher=password_hasher
+        )
+        return await use_case.execute(rows)
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except PasswordHashingSaturatedError as e:
+        raise _hashing_saturated(e)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Error en alta masiva: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error al procesar el alta masiva. Por favor, intente nuevamente."
+        )
+
+
+@router.get(
+    "/login-history",
+    response_model=LoginHistoryResponse,
+    summary="Historial de login de un email",
+    responses={
+        200: {"description": "Intentos recientes y contadores diarios"}
+    }
+)
+def get_login_history(
+    email: str = Query(..., min_length=3, description="Email consultado (sin distinguir mayúsculas)"),
+    days: int = Query(default=30, ge=1, le=MAX_LOGIN_HISTORY_DAYS, description="Días de contadores, incluido hoy"),
+    limit: int = Query(default=20, ge=1, le=MAX_LOGIN_HISTORY_ATTEMPTS, description="Intentos individuales a devolver"),
+    user=Depends(require_permission("manage_users")),
+):
+    """
+    Endpoint GET /api/users/login-history
+    Auditoría de accesos de un email. Requiere el permiso manage_users.
+    
+    - **recent_attempts**: últimos intentos individuales (se conservan
+      `LOGIN_ATTEMPTS_RETENTION_DAYS` días)
+    - **daily_stats**: éxitos y fallos por día e IP, también de los días cuyos
+      intentos ya se borraron (resumen diario de la retención)
+    
+    Los intentos del día en curso aparecen en recent_attempts; sus contadores
+    diarios se escriben con el resumen nocturno.
+    """
+    return LoginHistoryResponse(
+        email=email.strip().lower(),
+        recent_attempts=login_attempt_repository.get_attempts_by_email(email, limit=limit),
+        daily_stats=login_attempt_repository.get_daily_stats(email, days=days),
+    )
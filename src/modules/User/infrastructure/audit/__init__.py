@@ -0,0 +1,7 @@
+"""
+Auditoría de intentos de login: escritura diferida en lotes y retención.
+"""
+from .login_attempt_retention import LoginAttemptRetention
+from .login_attempt_writer import LoginAttemptAuditWriter
+
+__all__ = ["LoginAttemptAuditWriter", "LoginAttemptRetention"]
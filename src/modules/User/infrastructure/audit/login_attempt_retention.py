@@ -0,0 +1,107 @@
+"""
+Retención de intentos de login - Capa de Infraestructura.
+
+login_attempts recibe una fila por cada intento, también el ruido de bots que
+prueban contraseñas, y sin limpieza crece para siempre. Este trabajo, que el
+planificador ejecuta una vez al día:
+
+1. Resume los días completos aún no resumidos en login_attempt_daily_stats
+   (éxitos y fallos por día, email e IP), que conserva el historial de auditoría.
+2. Borra en lotes acotados las filas con más de `retention_days` días, sin pasar
+   nunca del último día resumido, para que ningún intento se pierda sin contar.
+
+Los lotes son DELETE cortos (`batch_size` filas) para no bloquear las escrituras
+del login, y `max_batches` limita el trabajo de una ejecución: si queda algo
+pendiente se borra en la siguiente.
+"""
+import threading
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+
+
+class LoginAttemptRetention:
+    """
+    Resumen diario y borrado por TTL de login_attempts.
+
+    Attributes:
+        repository: Repositorio de intentos de login
+        retention_days: Días que se conservan las filas de login_attempts
+        batch_size: Filas borradas por sentencia DELETE
+        max_batches: Máximo de lotes borrados por ejecución
+    """
+
+    def __init__(
+        self,
+        repository: Optional[LoginAttemptRepository] = None,
+        retention_days: int = 30,
+        batch_size: int = 1000,
+        max_batches: int = 100,
+    ):
+        self.repository = repository or LoginAttemptRepository()
+        self.retention_days = max(1, retention_days)
+        self.batch_size = max(1, batch_size)
+        self.max_batches = max(1, max_batches)
+        # Evita dos ejecuciones simultáneas en el mismo proceso
+        self._lock = threading.Lock()
+        self._runs_total = 0
+        self._rolled_up_total = 0
+        self._purged_total = 0
+        self._last_run_at: Optional[str] = None
+
+    def run(self, now: Optional[datetime] = None) -> dict:
+        """
+        Resumir los días completos pendientes y borrar las filas vencidas.
+
+        Args:
+            now: Momento de referencia (por defecto, ahora)
+
+        Returns:
+            Resumen de la ejecución (filas resumidas, borradas y lotes)
+        """
+        now = now or datetime.now()
+        today = now.date()
+        with self._lock:
+            watermark = self.repository.get_rollup_watermark()
+            since = watermark + timedelta(days=1) if watermark else None
+            rolled_up = 0
+            if since is None or since < today:
+                rolled_up = self.repository.rollup_days(since, today)
+                watermark = today - timedelta(days=1)
+
+            cutoff = self._purge_cutoff(now, watermark)
+            purged, batches = 0, 0
+            while batches < self.max_batches:
+                deleted = self.repository.purge_before(cutoff, self.batch_size)
+                batches += 1
+                purged += deleted
+                if deleted < self.batch_size:
+                    break
+
+            self._runs_total += 1
+            self._rolled_up_total += rolled_up
+            self._purged_total += purged
+            self._last_run_at = now.isoformat()
+            return {
+                "rolled_up_through": watermark.isoformat(),
+                "rolled_up_rows": rolled_up,
+                "purged": purged,
+                "batches": batches,
+                "cutoff": cutoff.isoformat(),
+            }
+
+    def _purge_cutoff(self, now: datetime, watermark: date) -> datetime:
+        """Límite del borrado: el TTL, pero nunca más allá del último día resumido."""
+        ttl_cutoff = now - timedelta(days=self.retention_days)
+        rolled_up_cutoff = datetime.combine(watermark + timedelta(days=1), datetime.min.time())
+        return min(ttl_cutoff, rolled_up_cutoff)
+
+    def stats(self) -> dict:
+        return {
+            "retention_days": self.retention_days,
+            "runs_total": self._runs_total,
+            "rolled_up_rows_total": self._rolled_up_total,
+            "purged_total": self._purged_total,
+            "last_run_at": self._last_run_at,
+        }
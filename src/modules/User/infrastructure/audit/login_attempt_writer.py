@@ -0,0 +1,150 @@
+"""
+Escritor de auditoría de intentos de login - Capa de Infraestructura.
+
+Antes cada login hacía un INSERT en login_attempts dentro de la petición,
+también para los atacantes que prueban emails inexistentes. Ahora el login solo
+encola el intento en un buffer en memoria (sin esperar a la base) y un hilo lo
+vacía con INSERTs de varias filas cada `batch_size` intentos o cada
+`flush_interval_ms`, lo que ocurra primero.
+
+El buffer es acotado: si se llena (base caída o lenta durante un ataque) los
+intentos nuevos se descartan y se cuentan en lugar de consumir memoria sin
+límite. Al cerrar la aplicación (stop) se vacía lo pendiente.
+
+El bloqueo de cuentas no depende de esta tabla (usa users.failed_login_attempts),
+así que el retraso de la auditoría no afecta a la seguridad del login.
+"""
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Optional, Tuple
+
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+
+LoginAttemptRecord = Tuple[str, bool, Optional[str], datetime]
+
+
+class LoginAttemptAuditWriter:
+    """
+    Buffer acotado de intentos de login con vaciado en lotes en segundo plano.
+
+    Attributes:
+        repository: Repositorio donde se insertan los lotes
+        max_buffer_size: Intentos que pueden esperar en memoria; por encima se descartan
+        batch_size: Intentos por INSERT y umbral que adelanta el vaciado
+        flush_interval_ms: Espera máxima de un intento en el buffer
+    """
+
+    def __init__(
+        self,
+        repository: Optional[LoginAttemptRepository] = None,
+        max_buffer_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval_ms: float = 500,
+    ):
+        self.repository = repository or LoginAttemptRepository()
+        self.max_buffer_size = max_buffer_size
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_ms = flush_interval_ms
+        self._buffer: Deque[LoginAttemptRecord] = deque()
+        self._condition = threading.Condition()
+        # Serializa los vaciados (hilo de fondo, flush() manual y stop())
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._enqueued_total = 0
+        self._written_total = 0
+        self._dropped_total = 0
+        self._failed_total = 0
+        self._batches_total = 0
+        self._last_flush_ms: Optional[float] = None
+
+    def enqueue(self, email: str, success: bool, ip_address: Optional[str] = None) -> bool:
+        """
+        Encolar un intento sin bloquear; la fecha es la del intento, no la de escritura.
+
+        Returns:
+            False si el buffer estaba lleno y el intento se descartó
+        """
+        record = (email, success, ip_address, datetime.now())
+        with self._condition:
+            if len(self._buffer) >= self.max_buffer_size:
+                self._dropped_total += 1
+                return False
+            self._buffer.append(record)
+            self._enqueued_total += 1
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+        return True
+
+    def start(self) -> None:
+        """Arrancar el hilo que vacía el buffer."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._loop, name="login-audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        """Detener el hilo y escribir todo lo pendiente."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Escribir ya todo lo que hay en el buffer, en lotes de `batch_size`. Devuelve lo escrito."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._condition:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if not batch:
+                    return written
+                written += self._write(batch)
+
+    def stats(self) -> dict:
+        with self._condition:
+            pending = len(self._buffer)
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "pending": pending,
+            "max_buffer_size": self.max_buffer_size,
+            "batch_size": self.batch_size,
+            "flush_interval_ms": self.flush_interval_ms,
+            "enqueued_total": self._enqueued_total,
+            "written_total": self._written_total,
+            "dropped_total": self._dropped_total,
+            "failed_total": self._failed_total,
+            "batches_total": self._batches_total,
+            "last_flush_ms": self._last_flush_ms,
+        }
+
+    def _loop(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        while True:
+            with self._condition:
+                if not self._stopping and len(self._buffer) < self.batch_size:
+                    self._condition.wait(interval)
+                stopping = self._stopping
+            if stopping:
+                return
+            self.flush()
+
+    def _write(self, batch: list) -> int:
+        started = time.perf_counter()
+        try:
+            self.repository.save_attempts(batch)
+        except Exception as e:
+            # La auditoría nunca interrumpe el login: el lote se pierde y se contabiliza
+            self._failed_total += len(batch)
+            print(f"⚠️  No se pudo guardar un lote de {len(batch)} intentos de login: {e}")
+            return 0
+        self._batches_total += 1
+        self._written_total += len(batch)
+        self._last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+        return len(batch)
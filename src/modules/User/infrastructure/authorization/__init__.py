@@ -0,0 +1,7 @@
+"""
+Autorización basada en permisos (RBAC).
+"""
+from .permission_matrix import PermissionMatrix, PermissionSnapshot
+from .revoked_session_filter import RevokedSessionFilter
+
+__all__ = ["PermissionMatrix", "PermissionSnapshot", "RevokedSessionFilter"]
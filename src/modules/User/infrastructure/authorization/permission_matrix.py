@@ -0,0 +1,169 @@
+"""
+Matriz de permisos RBAC en memoria - Capa de Infraestructura.
+
+Carga una vez la relación rol -> permisos (roles, permissions, role_permissions)
+y la guarda como bitsets: cada permiso tiene un bit y cada rol una máscara.
+Comprobar un permiso es una búsqueda en diccionario y un AND de bits, sin
+consultar la base de datos en el camino de la petición.
+
+La matriz se recarga cuando PermissionRepository avisa de una escritura
+(asignar / quitar permisos a un rol). Si la recarga falla se conserva la
+matriz anterior. stop_auto_refresh() deja de escuchar esos avisos.
+
+El bit de cada permiso está persistido (permissions.bit), así que la máscara de
+un rol también sirve como claim compacto en el JWT. Cada rol tiene además una
+versión de permisos (roles.permissions_version): un token emitido con otra
+versión se rechaza. Como otros workers pueden cambiar permisos, un hilo revisa
+periódicamente las versiones (una consulta pequeña) y recarga si cambiaron.
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from src.modules.User.infrastructure.repositories.permission_repository import PermissionRepository
+from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
+
+
+@dataclass(frozen=True)
+class PermissionSnapshot:
+    """Estado inmutable de la matriz; se reemplaza completo al recargar."""
+    bits: Dict[str, int] = field(default_factory=dict)
+    role_masks: Dict[str, int] = field(default_factory=dict)
+    role_versions: Dict[str, int] = field(default_factory=dict)
+
+
+class PermissionMatrix:
+    """
+    Matriz rol -> permisos con comprobaciones O(1).
+
+    Attributes:
+        role_repository: Repositorio de roles
+        permission_repository: Repositorio de permisos
+    """
+
+    def __init__(
+        self,
+        role_repository: Optional[RoleRepository] = None,
+        permission_repository: Optional[PermissionRepository] = None,
+    ):
+        self.role_repository = role_repository or RoleRepository()
+        self.permission_repository = permission_repository or PermissionRepository()
+        self._snapshot: Optional[PermissionSnapshot] = None
+        self._lock = threading.Lock()
+        self._loads_total = 0
+        self._checks_total = 0
+        self._denied_total = 0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+        PermissionRepository.add_change_listener(self.invalidate)
+
+    def load(self) -> PermissionSnapshot:
+        """Leer roles y permisos de la base y reemplazar la matriz."""
+        with self._lock:
+            bits = {
+                permission.name: permission.bit
+                for permission in self.permission_repository.find_all()
+                if permission.bit is not None
+            }
+
+            role_versions = self.role_repository.get_permission_versions()
+            role_masks = {}
+            for role_id in role_versions:
+                mask = 0
+                for permission in self.permission_repository.find_by_role_id(role_id):
+                    if permission.name in bits:
+                        mask |= 1 << bits[permission.name]
+                role_masks[role_id] = mask
+
+            self._snapshot = PermissionSnapshot(bits=bits, role_masks=role_masks, role_versions=role_versions)
+            self._loads_total += 1
+            return self._snapshot
+
+    def refresh_if_changed(self) -> bool:
+        """Recargar solo si alguna versión de permisos cambió en la base (p. ej. desde otro worker)."""
+        snapshot = self._snapshot
+        if snapshot is not None and self.role_repository.get_permission_versions() == snapshot.role_versions:
+            return False
+        self.load()
+        return True
+
+    def start_auto_refresh(self, interval_seconds: float) -> None:
+        """Arrancar el hilo que revisa las versiones de permisos cada `interval_seconds`."""
+        if interval_seconds <= 0 or (self._refresh_thread and self._refresh_thread.is_alive()):
+            return
+        self._stop_refresh.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, args=(interval_seconds,), name="permission-matrix-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_auto_refresh(self, timeout: float = 5) -> None:
+        """Detener el hilo de revisión y dejar de recargar tras las escrituras de permisos."""
+        PermissionRepository.remove_change_listener(self.invalidate)
+        self._stop_refresh.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout)
+            self._refresh_thread = None
+
+    def invalidate(self) -> None:
+        """
+        Recargar la matriz (se llama tras escribir roles/permisos).
+
+        load() solo reemplaza la matriz si la lectura termina bien: si la base
+        falla se sigue usando la anterior (las peticiones no consultan la base)
+        y la revisión periódica la recargará.
+        """
+        try:
+            self.load()
+        except Exception as e:
+            print(f"⚠️  No se pudo recargar la matriz de permisos: {e}")
+
+    def has_permission(self, role_id: Optional[str], permission_name: str) -> bool:
+        """Indica si el rol tiene el permiso (False si el rol o el permiso no existen)."""
+        snapshot = self._snapshot or self.load()
+        self._checks_total += 1
+        bit = snapshot.bits.get(permission_name)
+        allowed = bit is not None and bool(snapshot.role_masks.get(role_id, 0) >> bit & 1)
+        if not allowed:
+            self._denied_total += 1
+        return allowed
+
+    def permissions_for_role(self, role_id: str) -> List[str]:
+        """Nombres de los permisos del rol según la matriz."""
+        snapshot = self._snapshot or self.load()
+        mask = snapshot.role_masks.get(role_id, 0)
+        return [name for name, bit in snapshot.bits.items() if mask >> bit & 1]
+
+    def claims_for_role(self, role_id: Optional[str]) -> Tuple[int, int]:
+        """Máscara de permisos y versión del rol, para incluirlas en el JWT."""
+        snapshot = self._snapshot or self.load()
+        return snapshot.role_masks.get(role_id, 0), snapshot.role_versions.get(role_id, 0)
+
+    def role_version(self, role_id: Optional[str]) -> Optional[int]:
+        """Versión de permisos vigente del rol (None si el rol no existe)."""
+        snapshot = self._snapshot or self.load()
+        return snapshot.role_versions.get(role_id)
+
+    def decode_mask(self, mask: int) -> FrozenSet[str]:
+        """Nombres de los permisos presentes en una máscara."""
+        snapshot = self._snapshot or self.load()
+        return frozenset(name for name, bit in snapshot.bits.items() if mask >> bit & 1)
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "loaded": snapshot is not None,
+            "roles": len(snapshot.role_masks) if snapshot else 0,
+            "permissions": len(snapshot.bits) if snapshot else 0,
+            "loads_total": self._loads_total,
+            "checks_total": self._checks_total,
+            "denied_total": self._denied_total,
+            "auto_refresh": bool(self._refresh_thread and self._refresh_thread.is_alive()),
+        }
+
+    def _refresh_loop(self, interval_seconds: float) -> None:
+        while not self._stop_refresh.wait(interval_seconds):
+            try:
+                self.refresh_if_changed()
+            except Exception as e:
+                print(f"⚠️  No se pudieron revisar las versiones de permisos: {e}")
@@ -0,0 +1,146 @@
+"""
+Filtro de sesiones revocadas - Capa de Infraestructura.
+
+get_current_user comprueba en cada petición si la sesión del token (claim
+"sid") fue revocada, sin ir a la base: un filtro de Bloom descarta casi todas
+las sesiones válidas con unos pocos bits y, si dice "quizá", decide el
+conjunto exacto. Se carga al arrancar con las sesiones revocadas que aún no
+expiraron, se actualiza al revocar en este proceso y un hilo trae
+periódicamente las revocaciones hechas por otros workers.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Set
+
+from src.modules.User.infrastructure.repositories.session_repository import SessionRepository
+from src.shared.infrastructure.cache import BloomFilter
+
+
+class RevokedSessionFilter:
+    """
+    Conjunto de IDs de sesión revocados con prefiltro de Bloom.
+
+    Attributes:
+        session_repository: Repositorio de sesiones (carga y sincronización)
+        capacity: Revocaciones previstas; al superarlas el filtro se reconstruye
+            con el doble, y cada load() vuelve a partir de la configurada
+        false_positive_rate: Tasa de "quizá" del filtro de Bloom
+    """
+
+    # Margen al pedir las revocaciones recientes (relojes de distintos workers)
+    SYNC_OVERLAP = timedelta(seconds=5)
+
+    def __init__(
+        self,
+        session_repository: Optional[SessionRepository] = None,
+        capacity: int = 100000,
+        false_positive_rate: float = 0.01,
+    ):
+        self.session_repository = session_repository or SessionRepository()
+        self.capacity = capacity
+        self._initial_capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, false_positive_rate)
+        self._revoked: Set[str] = set()
+        self._last_sync: Optional[datetime] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+        self._checks_total = 0
+        self._bloom_hits_total = 0
+        self._revoked_hits_total = 0
+
+    def load(self) -> int:
+        """
+        Reconstruir el filtro con las sesiones revocadas que aún no expiraron.
+
+        Las revocaciones ya expiradas se descartan y la capacidad vuelve a la
+        configurada, así el conjunto y el Bloom no crecen indefinidamente.
+        """
+        started = datetime.now()
+        session_ids = [session_id for session_id, _ in self.session_repository.find_revoked_ids()]
+        with self._lock:
+            self.capacity = self._initial_capacity
+            self._rebuild(session_ids)
+            self._last_sync = started
+        return len(session_ids)
+
+    def sync(self) -> int:
+        """Añadir las revocaciones hechas desde la última sincronización (p. ej. en otro worker)."""
+        if self._last_sync is None:
+            return self.load()
+        started = datetime.now()
+        rows = self.session_repository.find_revoked_ids(revoked_since=self._last_sync - self.SYNC_OVERLAP)
+        self.add_many(session_id for session_id, _ in rows)
+        self._last_sync = started
+        return len(rows)
+
+    def add(self, session_id: str) -> None:
+        """Marcar una sesión como revocada en este proceso."""
+        self.add_many([session_id])
+
+    def add_many(self, session_ids: Iterable[str]) -> None:
+        with self._lock:
+            for session_id in session_ids:
+                if session_id in self._revoked:
+                    continue
+                if len(self._revoked) >= self.capacity:
+                    # Se duplica la capacidad para mantener la tasa de falsos positivos
+                    self.capacity *= 2
+                    self._rebuild(self._revoked)
+                self._revoked.add(session_id)
+                self._bloom.add(session_id)
+
+    def is_revoked(self, session_id: str) -> bool:
+        """Comprobación en memoria: Bloom primero y, si dice "quizá", el conjunto exacto."""
+        self._checks_total += 1
+        if not self._bloom.might_contain(session_id):
+            return False
+        self._bloom_hits_total += 1
+        revoked = session_id in self._revoked
+        self._revoked_hits_total += revoked
+        return revoked
+
+    def start_auto_refresh(self, interval_seconds: float) -> None:
+        """Arrancar el hilo que sincroniza las revocaciones cada `interval_seconds`."""
+        if interval_seconds <= 0 or (self._refresh_thread and self._refresh_thread.is_alive()):
+            return
+        self._stop_refresh.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, args=(interval_seconds,), name="revoked-session-sync", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_auto_refresh(self, timeout: float = 5) -> None:
+        self._stop_refresh.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout)
+            self._refresh_thread = None
+
+    def stats(self) -> dict:
+        return {
+            "revoked": len(self._revoked),
+            "capacity": self.capacity,
+            "bloom_size_bits": self._bloom.size_bits,
+            "checks_total": self._checks_total,
+            # "quizá" del Bloom que resultaron no estar revocados
+            "false_positives_total": self._bloom_hits_total - self._revoked_hits_total,
+            "revoked_hits_total": self._revoked_hits_total,
+            "last_sync": self._last_sync.isoformat() if self._last_sync else None,
+            "auto_refresh": bool(self._refresh_thread and self._refresh_thread.is_alive()),
+        }
+
+    def _rebuild(self, session_ids: Iterable[str]) -> None:
+        session_ids = set(session_ids)
+        self.capacity = max(self.capacity, len(session_ids) * 2)
+        bloom = BloomFilter(self.capacity, self.false_positive_rate)
+        for session_id in session_ids:
+            bloom.add(session_id)
+        self._bloom, self._revoked = bloom, session_ids
+
+    def _refresh_loop(self, interval_seconds: float) -> None:
+        while not self._stop_refresh.wait(interval_seconds):
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"⚠️  No se pudieron sincronizar las sesiones revocadas: {e}")
@@ -0,0 +1,7 @@
+"""
+Hashing de contraseñas fuera del event loop (pool de procesos acotado).
+"""
+from .hash_cost_store import PasswordHashCostStore
+from .password_hashing_executor import PasswordHashingExecutor, PasswordHashingSaturatedError
+
+__all__ = ["PasswordHashCostStore", "PasswordHashingExecutor", "PasswordHashingSaturatedError"]
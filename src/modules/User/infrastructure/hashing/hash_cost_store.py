@@ -0,0 +1,51 @@
+"""
+Coste de bcrypt compartido entre workers (tabla app_settings).
+
+Si cada worker calibrara por su cuenta podrían elegir costes distintos y un
+mismo usuario se rehashearía de uno a otro en cada login. El primer worker que
+calibra guarda el coste con un INSERT que no pisa un valor existente. Los
+demás, y los reinicios posteriores, leen ese valor.
+"""
+from datetime import datetime
+from typing import Optional
+
+
+class PasswordHashCostStore:
+    """
+    Lectura y escritura del coste calibrado.
+
+    Attributes:
+        key: Clave en app_settings
+    """
+
+    DEFAULT_KEY = "password_hash_rounds"
+
+    def __init__(self, client=None, key: str = DEFAULT_KEY):
+        if client is None:
+            from src.shared.infrastructure.database.turso_connection import get_turso_client
+
+            client = get_turso_client()
+        self.client = client
+        self.key = key
+
+    def get(self) -> Optional[int]:
+        """Coste guardado, o None si todavía no se calibró."""
+        result = self.client.execute("SELECT value FROM app_settings WHERE key = ?", [self.key])
+        return int(result.rows[0][0]) if result.rows else None
+
+    def save_if_absent(self, rounds: int) -> int:
+        """
+        Guardar el coste si nadie lo guardó antes.
+
+        Returns:
+            Coste vigente: el recién guardado o el que otro worker guardó primero
+        """
+        self.client.execute(
+            """
+            INSERT INTO app_settings (key, value, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT (key) DO NOTHING
+            """,
+            [self.key, str(rounds), datetime.now().isoformat()],
+        )
+        return self.get()
@@ -0,0 +1,239 @@
+"""
+Ejecutor de hashing de contraseñas - Capa de Infraestructura.
+
+bcrypt (coste 12) tarda ~250 ms de CPU por llamada. Ejecutarlo dentro de un
+endpoint async bloquea el event loop y detiene todas las demás peticiones, por
+eso el hashing y la verificación se envían a un pool de procesos dedicado
+(dimensionado a los núcleos) y se esperan con await.
+
+La cola es acotada: si ya hay demasiados cálculos pendientes se rechaza la
+petición con PasswordHashingSaturatedError (503 en la API) en lugar de dejar
+que la latencia crezca sin límite durante un pico de logins.
+
+El factor de trabajo de bcrypt se calibra una sola vez (calibrate_shared) para
+que un hash tarde aproximadamente el objetivo configurado. El resultado se
+guarda en la base y todos los workers usan el mismo coste.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from src.modules.User.domain.services.password_service import PasswordService
+from src.modules.User.infrastructure.hashing import worker
+
+
+class PasswordHashingSaturatedError(Exception):
+    """La cola de hashing está llena; el cliente debe reintentar más tarde."""
+
+
+def _latency_summary(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    """Resumen en milisegundos (media, p50, p95, p99, máximo) de una ventana de muestras."""
+    if not samples:
+        return {"count": 0, "avg_ms": None, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 2)
+
+    return {
+        "count": len(ordered),
+        "avg_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class PasswordHashingExecutor:
+    """
+    Pool de procesos acotado para bcrypt.
+
+    Attributes:
+        max_workers: Procesos del pool (por defecto, núcleos disponibles)
+        max_queue_size: Cálculos que pueden esperar además de los que ya se
+            ejecutan; por encima se rechaza con PasswordHashingSaturatedError
+        rounds: Factor de trabajo de bcrypt para los hashes nuevos
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: int = 32,
+        rounds: Optional[int] = None,
+        latency_window: int = 1024,
+        start_method: str = "spawn",
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_size = max_queue_size
+        self.rounds = rounds or PasswordService.DEFAULT_ROUNDS
+        self.calibrated_hash_ms: Optional[float] = None
+        # spawn: los hijos no heredan hilos ni conexiones del proceso de la API
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted_total = 0
+        self._completed_total = 0
+        self._rejected_total = 0
+        self._errors_total = 0
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._compute_times: Deque[float] = deque(maxlen=latency_window)
+
+    def start(self) -> None:
+        """Crear el pool y levantar sus procesos para que el primer login no pague el arranque."""
+        pool = self._get_pool()
+        for future in [pool.submit(worker.warm_up) for _ in range(self.max_workers)]:
+            future.result()
+
+    def calibrate(
+        self,
+        target_ms: float,
+        min_rounds: int = PasswordService.MIN_ROUNDS,
+        max_rounds: int = PasswordService.MAX_ROUNDS,
+    ) -> int:
+        """
+        Fijar el factor de trabajo cuyo hash tarda como mucho `target_ms` en un
+        proceso del pool. Devuelve el factor elegido.
+        """
+        future = self._get_pool().submit(worker.calibrate_rounds, target_ms, min_rounds, max_rounds)
+        self.rounds, hash_seconds = future.result()
+        self.calibrated_hash_ms = round(hash_seconds * 1000, 2)
+        return self.rounds
+
+    def calibrate_shared(
+        self,
+        store,
+        target_ms: float,
+        min_rounds: int = PasswordService.MIN_ROUNDS,
+        max_rounds: int = PasswordService.MAX_ROUNDS,
+    ) -> int:
+        """
+        Usar el coste guardado en `store` (PasswordHashCostStore). Si no hay
+        ninguno, calibrar y guardarlo. Si otro worker lo guardó antes, se usa
+        el suyo. Nunca se baja de `min_rounds`.
+        """
+        rounds = store.get()
+        if rounds is None:
+            rounds = store.save_if_absent(self.calibrate(target_ms, min_rounds, max_rounds))
+        self.rounds = max(rounds, min_rounds)
+        return self.rounds
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Indica si un hash almacenado usa un factor de trabajo menor que el actual."""
+        return PasswordService.needs_rehash(hashed_password, self.rounds)
+
+    async def hash_password(self, password: str) -> str:
+        """Hashear una contraseña en el pool con el factor de trabajo actual."""
+        return await self._run(worker.hash_password_timed, password, self.rounds)
+
+    async def hash_many(self, passwords: List[str]) -> List[Union[str, BaseException]]:
+        """
+        Hashear varias contraseñas en paralelo en el pool (alta masiva).
+
+        Como mucho `max_workers` a la vez: el lote ocupa los procesos pero no
+        llena la cola, que queda libre para los logins concurrentes.
+
+        Returns:
+            Un hash o la excepción correspondiente por contraseña, en el mismo orden
+
+        Raises:
+            PasswordHashingSaturatedError: Si la cola rechazó alguna contraseña
+                (el llamador responde 503 en lugar de informar errores por fila)
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def hash_one(password: str) -> str:
+            async with semaphore:
+                return await self.hash_password(password)
+
+        results = await asyncio.gather(*(hash_one(password) for password in passwords), return_exceptions=True)
+        saturated = next((r for r in results if isinstance(r, PasswordHashingSaturatedError)), None)
+        if saturated is not None:
+            raise saturated
+        return results
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Verificar una contraseña contra su hash en el pool."""
+        return await self._run(worker.verify_password_timed, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """Métricas: profundidad de cola, procesos ocupados, contadores y latencias."""
+        with self._lock:
+            in_flight = self._in_flight
+            latencies = deque(self._latencies)
+            compute_times = deque(self._compute_times)
+            counters = {
+                "submitted_total": self._submitted_total,
+                "completed_total": self._completed_total,
+                "rejected_total": self._rejected_total,
+                "errors_total": self._errors_total,
+            }
+        return {
+            "rounds": self.rounds,
+            "calibrated_hash_ms": self.calibrated_hash_ms,
+            "workers": self.max_workers,
+            "busy_workers": min(in_flight, self.max_workers),
+            "queue_depth": max(0, in_flight - self.max_workers),
+            "max_queue_size": self.max_queue_size,
+            **counters,
+            # Latencia total (espera en cola + cálculo) y solo cálculo
+            "latency": _latency_summary(latencies),
+            "compute_time": _latency_summary(compute_times),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._mp_context)
+            return self._pool
+
+    def _reserve_slot(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue_size:
+                self._rejected_total += 1
+                raise PasswordHashingSaturatedError(
+                    "El servicio de autenticación está saturado. Intenta nuevamente en unos segundos."
+                )
+            self._in_flight += 1
+            self._submitted_total += 1
+
+    async def _run(self, func: Callable[..., Tuple[Any, float]], *args: Any) -> Any:
+        self._reserve_slot()
+        started = time.perf_counter()
+        try:
+            pool = self._get_pool()
+            try:
+                result, compute_time = await asyncio.wrap_future(pool.submit(func, *args))
+            except BrokenProcessPool:
+                # Un proceso murió: se descarta el pool para recrearlo en la próxima llamada
+                with self._lock:
+                    if self._pool is pool:
+                        self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+                self._errors_total += 1
+            raise
+
+        with self._lock:
+            self._in_flight -= 1
+            self._completed_total += 1
+            self._latencies.append(time.perf_counter() - started)
+            self._compute_times.append(compute_time)
+        return result
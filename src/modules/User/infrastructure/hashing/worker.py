@@ -0,0 +1,35 @@
+"""
+Funciones que se ejecutan dentro de los procesos del pool de hashing.
+Viven en un módulo ligero (solo bcrypt) para que los procesos hijos arranquen
+rápido y no abran conexiones ni carguen la configuración de la aplicación.
+"""
+import os
+import time
+from typing import Tuple
+
+from src.modules.User.domain.services.password_service import PasswordService
+
+
+def hash_password_timed(password: str, rounds: int) -> Tuple[str, float]:
+    """Hashear la contraseña y devolver (hash, segundos de CPU empleados)."""
+    started = time.perf_counter()
+    hashed = PasswordService.hash_password(password, rounds=rounds)
+    return hashed, time.perf_counter() - started
+
+
+def verify_password_timed(plain_password: str, hashed_password: str) -> Tuple[bool, float]:
+    """Verificar la contraseña y devolver (resultado, segundos empleados)."""
+    started = time.perf_counter()
+    is_valid = PasswordService.verify_password(plain_password, hashed_password)
+    return is_valid, time.perf_counter() - started
+
+
+def calibrate_rounds(target_ms: float, min_rounds: int, max_rounds: int) -> Tuple[int, float]:
+    """Calibrar el factor de trabajo en un proceso del pool (donde se hashea de verdad)."""
+    rounds = PasswordService.calibrate_rounds(target_ms, min_rounds, max_rounds)
+    return rounds, PasswordService.measure_hash_time(rounds, samples=1)
+
+
+def warm_up() -> int:
+    """Tarea vacía para levantar los procesos del pool al arrancar."""
+    return os.getpid()
@@ -6,5 +6,12 @@ from .user_repository import UserRepository
 from .role_repository import RoleRepository
 from .login_attempt_repository import LoginAttemptRepository
 from .permission_repository import PermissionRepository
+from .session_repository import SessionRepository
 
-__all__ = ["UserRepository", "RoleRepository", "LoginAttemptRepository", "PermissionRepository"]
+__all__ = [
+    "UserRepository",
+    "RoleRepository",
+    "LoginAttemptRepository",
+    "PermissionRepository",
+    "SessionRepository",
+]
@@ -1,8 +1,8 @@
 """
 Repositorio LoginAttemptRepository - Registro de intentos de login.
 """
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
 from src.shared.infrastructure.database.turso_connection import get_turso_client
 import uuid
 
@@ -45,6 +45,34 @@ class LoginAttemptRepository:
             print(f"Error al guardar intento de login: {str(e)}")
             # No lanzamos excepción para no interrumpir el flujo de autenticación
     
+    def save_attempts(self, attempts: Sequence[Tuple[str, bool, Optional[str], datetime]]) -> int:
+        """
+        Registrar varios intentos de login con un único INSERT de varias filas.
+        Lo usa LoginAttemptAuditWriter al vaciar su buffer.
+        
+        Args:
+            attempts: Tuplas (email, success, ip_address, created_at)
+        
+        Returns:
+            Número de intentos insertados
+        
+        Raises:
+            Exception: Si falla la inserción (el escritor lo contabiliza)
+        """
+        if not attempts:
+            return 0
+
+        params = []
+        for email, success, ip_address, created_at in attempts:
+            params.extend([str(uuid.uuid4()), email, 1 if success else 0, ip_address, created_at.isoformat()])
+
+        placeholders = ", ".join(["(?, ?, ?, ?, ?)"] * len(attempts))
+        self.client.execute(
+            f"INSERT INTO login_attempts (id, email, success, ip_address, created_at) VALUES {placeholders}",
+            params
+        )
+        return len(attempts)
+    
     def get_recent_failed_attempts(self, email: str, minutes: int = 15) -> int:
         """
         Obtener el número de intentos fallidos recientes para un email.
@@ -57,16 +85,17 @@ class LoginAttemptRepository:
             Número de intentos fallidos en el período especificado
         """
         try:
-            # Calcular el timestamp de hace X minutos
-            time_threshold = datetime.now().timestamp() - (minutes * 60)
+            # Fecha de hace X minutos en el mismo formato que created_at (ISO, hora local),
+            # para que el rango use idx_login_attempts_email_lower_created
+            time_threshold = (datetime.now() - timedelta(minutes=minutes)).isoformat()
             
             result = self.client.execute(
                 """
                 SELECT COUNT(*) 
                 FROM login_attempts 
                 WHERE LOWER(email) = LOWER(?) 
+                  AND created_at >= ?
                   AND success = 0 
-                  AND created_at >= datetime(?, 'unixepoch')
                 """,
                 [email, time_threshold]
             )
@@ -114,3 +143,131 @@ class LoginAttemptRepository:
         except Exception as e:
             print(f"Error al obtener historial de intentos: {str(e)}")
             return []
+
+    def get_rollup_watermark(self) -> Optional[date]:
+        """
+        Último día completo resumido en login_attempt_daily_stats.
+        
+        Returns:
+            Fecha del último día resumido, o None si nunca se ha resumido
+        """
+        result = self.client.execute(
+            "SELECT rolled_up_through FROM login_attempt_rollup_state WHERE id = 1"
+        )
+        if not result.rows:
+            return None
+        return date.fromisoformat(result.rows[0][0])
+    
+    def rollup_days(self, since: Optional[date], until: date) -> int:
+        """
+        Resumir los intentos de los días [since, until) por día, email e IP y
+        avanzar la marca de agua hasta el día anterior a `until`, en un solo lote.
+        
+        Cada día se recalcula completo (el upsert reemplaza los contadores), así
+        que repetir el resumen de un día con todas sus filas no duplica nada.
+        
+        Args:
+            since: Primer día a resumir (None = desde el intento más antiguo)
+            until: Primer día que NO se resume (normalmente hoy, aún incompleto)
+        
+        Returns:
+            Número de filas (día, email, IP) escritas en el resumen
+        """
+        # created_at es ISO en hora local, así que 'YYYY-MM-DD' sirve como límite del rango
+        results = self.client.batch([
+            (
+                """
+                INSERT INTO login_attempt_daily_stats
+                    (day, email, ip_address, success_count, failure_count, first_attempt_at, last_attempt_at)
+                SELECT substr(created_at, 1, 10),
+                       LOWER(email),
+                       COALESCE(ip_address, ''),
+                       SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN success = 1 THEN 0 ELSE 1 END),
+                       MIN(created_at),
+                       MAX(created_at)
+                FROM login_attempts
+                WHERE created_at >= ? AND created_at < ?
+                GROUP BY substr(created_at, 1, 10), LOWER(email), COALESCE(ip_address, '')
+                ON CONFLICT (day, email, ip_address) DO UPDATE SET
+                    success_count = excluded.success_count,
+                    failure_count = excluded.failure_count,
+                    first_attempt_at = excluded.first_attempt_at,
+                    last_attempt_at = excluded.last_attempt_at
+                """,
+                [since.isoformat() if since else "", until.isoformat()]
+            ),
+            (
+                """
+                INSERT INTO login_attempt_rollup_state (id, rolled_up_through, updated_at)
+                VALUES (1, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    rolled_up_through = MAX(rolled_up_through, excluded.rolled_up_through),
+                    updated_at = excluded.updated_at
+                """,
+                [(until - timedelta(days=1)).isoformat(), datetime.now().isoformat()]
+            ),
+        ])
+        return results[0].rows_affected
+    
+    def purge_before(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        Borrar un lote de hasta `batch_size` intentos anteriores a `cutoff`,
+        empezando por los más antiguos. Lotes pequeños mantienen cortas las
+        transacciones para no bloquear las escrituras del login.
+        
+        Args:
+            cutoff: Se borran los intentos con created_at anterior a esta fecha
+            batch_size: Máximo de filas borradas en esta llamada
+        
+        Returns:
+            Número de intentos borrados
+        """
+        result = self.client.execute(
+            """
+            DELETE FROM login_attempts
+            WHERE id IN (
+                SELECT id FROM login_attempts
+                WHERE created_at < ?
+                ORDER BY created_at
+                LIMIT ?
+            )
+            """,
+            [cutoff.isoformat(), batch_size]
+        )
+        return result.rows_affected
+    
+    def get_daily_stats(self, email: str, days: int = 30) -> List[dict]:
+        """
+        Obtener los contadores diarios de intentos de un email (incluye días ya
+        borrados de login_attempts).
+        
+        Args:
+            email: Email del usuario
+            days: Número de días hacia atrás
+        
+        Returns:
+            Lista de contadores por día e IP, del más reciente al más antiguo
+        """
+        since = (date.today() - timedelta(days=days)).isoformat()
+        result = self.client.execute(
+            """
+            SELECT day, email, ip_address, success_count, failure_count, first_attempt_at, last_attempt_at
+            FROM login_attempt_daily_stats
+            WHERE email = LOWER(?) AND day >= ?
+            ORDER BY day DESC, ip_address
+            """,
+            [email, since]
+        )
+        return [
+            {
+                "day": row[0],
+                "email": row[1],
+                "ip_address": row[2] or None,
+                "success_count": row[3],
+                "failure_count": row[4],
+                "first_attempt_at": row[5],
+                "last_attempt_at": row[6],
+            }
+            for row in result.rows
+        ]
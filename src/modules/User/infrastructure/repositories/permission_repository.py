@@ -1,24 +1,89 @@
 """
 Repositorio PermissionRepository - Manejo de persistencia de permisos.
 """
-from typing import Optional, List
+from typing import Callable, Optional, List
 from src.modules.User.domain.entities.permission import Permission
 from src.shared.infrastructure.database.turso_connection import get_turso_client
 from datetime import datetime
+import uuid
 
 
 class PermissionRepository:
     """Repositorio para manejar la persistencia de permisos en la base de datos."""
 
+    # Callbacks avisados tras cada escritura en permissions / role_permissions
+    # (p. ej. para invalidar la matriz de permisos en memoria)
+    _change_listeners: List[Callable[[], None]] = []
+
     def __init__(self):
         """Inicializar el repositorio con conexión a la BD."""
         self.client = get_turso_client()
 
+    @classmethod
+    def add_change_listener(cls, listener: Callable[[], None]) -> None:
+        """Registrar un callback que se ejecuta tras escribir roles/permisos."""
+        cls._change_listeners.append(listener)
+
+    @classmethod
+    def remove_change_listener(cls, listener: Callable[[], None]) -> None:
+        """Quitar un callback registrado con add_change_listener (si está)."""
+        if listener in cls._change_listeners:
+            cls._change_listeners.remove(listener)
+
+    @classmethod
+    def notify_change(cls) -> None:
+        """Avisar a los listeners de que cambió la relación rol-permiso."""
+        for listener in list(cls._change_listeners):
+            listener()
+
+    def assign_to_role(self, role_id: str, permission_id: str) -> bool:
+        """
+        Asignar un permiso a un rol.
+
+        Returns:
+            True si se creó la asignación, False si ya existía
+        """
+        result, _ = self.client.batch([
+            (
+                """
+                INSERT INTO role_permissions (id, role_id, permission_id)
+                VALUES (?, ?, ?)
+                ON CONFLICT (role_id, permission_id) DO NOTHING
+                RETURNING id
+                """,
+                [str(uuid.uuid4()), role_id, permission_id]
+            ),
+            self._bump_version_statement(role_id),
+        ])
+        created = bool(result.rows)
+        if created:
+            self.notify_change()
+        return created
+
+    def revoke_from_role(self, role_id: str, permission_id: str) -> bool:
+        """
+        Quitar un permiso a un rol.
+
+        Returns:
+            True si se eliminó la asignación, False si no existía
+        """
+        result, _ = self.client.batch([
+            (
+                "DELETE FROM role_permissions WHERE role_id = ? AND permission_id = ? RETURNING id",
+                [role_id, permission_id]
+            ),
+            self._bump_version_statement(role_id),
+        ])
+        removed = bool(result.rows)
+        if removed:
+            self.notify_change()
+        return removed
+
     def find_by_id(self, permission_id: str) -> Optional[Permission]:
         """Buscar un permiso por su ID."""
         try:
             result = self.client.execute(
-                "SELECT id, name, description, created_at FROM permissions WHERE id = ?",
+                "SELECT id, name, description, created_at, bit FROM permissions WHERE id = ?",
                 [permission_id]
             )
             if not result.rows:
@@ -33,7 +98,7 @@ class PermissionRepository:
         """Buscar un permiso por su nombre."""
         try:
             result = self.client.execute(
-                "SELECT id, name, description, created_at FROM permissions WHERE LOWER(name) = LOWER(?)",
+                "SELECT id, name, description, created_at, bit FROM permissions WHERE LOWER(name) = LOWER(?)",
                 [name]
             )
             if not result.rows:
@@ -48,7 +113,7 @@ class PermissionRepository:
         """Obtener todos los permisos disponibles."""
         try:
             result = self.client.execute(
-                "SELECT id, name, description, created_at FROM permissions ORDER BY name"
+                "SELECT id, name, description, created_at, bit FROM permissions ORDER BY name"
             )
             return [self._map_to_entity(row) for row in result.rows]
         except Exception as e:
@@ -60,7 +125,7 @@ class PermissionRepository:
         try:
             result = self.client.execute(
                 """
-                SELECT DISTINCT p.id, p.name, p.description, p.created_at
+                SELECT DISTINCT p.id, p.name, p.description, p.created_at, p.bit
                 FROM permissions p
                 INNER JOIN role_permissions rp ON p.id = rp.permission_id
                 WHERE rp.role_id = ?
@@ -73,11 +138,40 @@ class PermissionRepository:
             print(f"Error al obtener permisos del rol: {str(e)}")
             return []
 
+    @staticmethod
+    def _bump_version_statement(role_id: str):
+        """Incrementar permissions_version del rol solo si la sentencia anterior cambió filas."""
+        return (
+            "UPDATE roles SET permissions_version = permissions_version + 1 WHERE id = ? AND changes() > 0",
+            [role_id]
+        )
+
+    def assign_missing_bits(self) -> int:
+        """
+        Asignar posición en la máscara a los permisos que no la tienen
+        (creados después de la migración), a continuación del mayor bit usado.
+
+        Returns:
+            Número de permisos actualizados
+        """
+        result = self.client.execute(
+            "SELECT id, (SELECT COALESCE(MAX(bit), -1) FROM permissions) FROM permissions WHERE bit IS NULL ORDER BY name"
+        )
+        if not result.rows:
+            return 0
+        next_bit = result.rows[0][1] + 1
+        self.client.batch([
+            ("UPDATE permissions SET bit = ? WHERE id = ? AND bit IS NULL", [next_bit + index, row[0]])
+            for index, row in enumerate(result.rows)
+        ])
+        return len(result.rows)
+
     def _map_to_entity(self, row) -> Permission:
         """Mapear una fila a una entidad Permission."""
         return Permission(
             id=row[0],
             name=row[1],
             description=row[2],
-            created_at=datetime.fromisoformat(row[3]) if isinstance(row[3], str) else row[3]
+            created_at=datetime.fromisoformat(row[3]) if isinstance(row[3], str) else row[3],
+            bit=row[4]
         )
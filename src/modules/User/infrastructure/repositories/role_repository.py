@@ -1,7 +1,7 @@
 """
 Repositorio RoleRepository - Manejo de persistencia de roles.
 """
-from typing import Optional, List
+from typing import Dict, Optional, List
 from src.modules.User.domain.entities.role import Role
 from src.shared.infrastructure.database.turso_connection import get_turso_client
 from datetime import datetime
@@ -67,6 +67,18 @@ class RoleRepository:
             print(f"Error al buscar rol por nombre: {str(e)}")
             return None
     
+    async def find_by_name_async(self, name: str) -> Optional[Role]:
+        """Versión asíncrona de find_by_name() para los endpoints async (no bloquea el event loop)."""
+        try:
+            result = await self.client.execute_async(
+                "SELECT id, name, description, created_at FROM roles WHERE LOWER(name) = LOWER(?)",
+                [name]
+            )
+            return self._map_to_entity(result.rows[0]) if result.rows else None
+        except Exception as e:
+            print(f"Error al buscar rol por nombre: {str(e)}")
+            return None
+    
     def find_all(self) -> List[Role]:
         """
         Obtener todos los roles disponibles en el sistema.
@@ -84,6 +96,27 @@ class RoleRepository:
             print(f"Error al obtener todos los roles: {str(e)}")
             return []
     
+    async def find_all_async(self) -> List[Role]:
+        """Versión asíncrona de find_all() para los endpoints async (no bloquea el event loop)."""
+        try:
+            result = await self.client.execute_async(
+                "SELECT id, name, description, created_at FROM roles ORDER BY name"
+            )
+            return [self._map_to_entity(row) for row in result.rows]
+        except Exception as e:
+            print(f"Error al obtener todos los roles: {str(e)}")
+            return []
+    
+    def get_permission_versions(self) -> Dict[str, int]:
+        """
+        Obtener la versión de permisos de cada rol.
+
+        Returns:
+            Diccionario {role_id: permissions_version}
+        """
+        result = self.client.execute("SELECT id, permissions_version FROM roles")
+        return {row[0]: row[1] for row in result.rows}
+    
     def _map_to_entity(self, row) -> Role:
         """
         Mapear una fila de la base de datos a una entidad Role.
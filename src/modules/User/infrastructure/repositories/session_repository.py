@@ -0,0 +1,157 @@
+"""
+Repositorio SessionRepository - Persistencia de sesiones de refresh token.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from src.modules.User.domain.entities.session import Session
+from src.shared.infrastructure.database.turso_connection import get_turso_client
+
+
+class SessionRepository:
+    """
+    Repositorio de la tabla sessions.
+    La rotación y la revocación son UPDATE condicionales con RETURNING: dos
+    renovaciones simultáneas con el mismo refresh token no pueden ganar ambas.
+    """
+
+    def __init__(self, client=None):
+        """Inicializar el repositorio con la conexión a la base de datos."""
+        self.client = client or get_turso_client()
+
+    _INSERT_SESSION = """
+        INSERT INTO sessions (id, user_id, refresh_token_hash, ip_address, created_at, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def save(self, session: Session) -> Session:
+        """Guardar una sesión nueva."""
+        self.client.execute(self._INSERT_SESSION, self._insert_params(session))
+        return session
+
+    async def save_async(self, session: Session) -> Session:
+        """Versión asíncrona de save() para el login (no bloquea el event loop)."""
+        await self.client.execute_async(self._INSERT_SESSION, self._insert_params(session))
+        return session
+
+    def find_by_id(self, session_id: str) -> Optional[Session]:
+        result = self.client.execute(
+            """
+            SELECT id, user_id, refresh_token_hash, ip_address, created_at, expires_at, rotated_at, revoked_at
+            FROM sessions
+            WHERE id = ?
+            """,
+            [session_id]
+        )
+        return self._map_to_entity(result.rows[0]) if result.rows else None
+
+    def rotate(self, session_id: str, current_hash: str, new_hash: str) -> bool:
+        """
+        Reemplazar el refresh token de una sesión activa.
+
+        Returns:
+            False si la sesión no existe, está revocada o expirada, o el
+            refresh token presentado ya no es el vigente
+        """
+        now = datetime.now().isoformat()
+        result = self.client.execute(
+            """
+            UPDATE sessions
+            SET refresh_token_hash = ?, rotated_at = ?
+            WHERE id = ?
+              AND refresh_token_hash = ?
+              AND revoked_at IS NULL
+              AND expires_at > ?
+            RETURNING id
+            """,
+            [new_hash, now, session_id, current_hash, now]
+        )
+        return bool(result.rows)
+
+    def revoke(self, session_id: str) -> bool:
+        """Revocar una sesión. Devuelve False si ya estaba revocada o no existe."""
+        result = self.client.execute(
+            "UPDATE sessions SET revoked_at = ? WHERE id = ? AND revoked_at IS NULL RETURNING id",
+            [datetime.now().isoformat(), session_id]
+        )
+        return bool(result.rows)
+
+    def revoke_all_for_user(self, user_id: str) -> List[str]:
+        """Revocar todas las sesiones abiertas de un usuario. Devuelve sus IDs."""
+        result = self.client.execute(
+            "UPDATE sessions SET revoked_at = ? WHERE user_id = ? AND revoked_at IS NULL RETURNING id",
+            [datetime.now().isoformat(), user_id]
+        )
+        return [row[0] for row in result.rows]
+
+    def find_revoked_ids(self, revoked_since: Optional[datetime] = None) -> List[Tuple[str, str]]:
+        """
+        Sesiones revocadas que aún no expiraron (sus access tokens podrían seguir vigentes).
+
+        Args:
+            revoked_since: Solo las revocadas a partir de esta fecha (sincronización incremental)
+
+        Returns:
+            Lista de (id, revoked_at)
+        """
+        query = "SELECT id, revoked_at FROM sessions WHERE revoked_at IS NOT NULL AND expires_at > ?"
+        params = [datetime.now().isoformat()]
+        if revoked_since is not None:
+            query += " AND revoked_at >= ?"
+            params.append(revoked_since.isoformat())
+        result = self.client.execute(query, params)
+        return [(row[0], row[1]) for row in result.rows]
+
+    def purge_expired(self, now: datetime, batch_size: int) -> int:
+        """
+        Borrar un lote de hasta `batch_size` sesiones expiradas antes de `now`,
+        empezando por las más antiguas. Una sesión expirada ya no se puede
+        renovar y sus access tokens vencieron, así que tampoco hace falta
+        recordarla como revocada.
+
+        Args:
+            now: Se borran las sesiones con expires_at anterior a esta fecha
+            batch_size: Máximo de filas borradas en esta llamada
+
+        Returns:
+            Número de sesiones borradas
+        """
+        result = self.client.execute(
+            """
+            DELETE FROM sessions
+            WHERE id IN (
+                SELECT id FROM sessions
+                WHERE expires_at < ?
+                ORDER BY expires_at
+                LIMIT ?
+            )
+            """,
+            [now.isoformat(), batch_size]
+        )
+        return result.rows_affected
+
+    @staticmethod
+    def _insert_params(session: Session) -> list:
+        return [
+            session.id,
+            session.user_id,
+            session.refresh_token_hash,
+            session.ip_address,
+            session.created_at.isoformat(),
+            session.expires_at.isoformat(),
+        ]
+
+    def _map_to_entity(self, row) -> Session:
+        def to_datetime(value):
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+        return Session(
+            id=row[0],
+            user_id=row[1],
+            refresh_token_hash=row[2],
+            ip_address=row[3],
+            created_at=to_datetime(row[4]),
+            expires_at=to_datetime(row[5]),
+            rotated_at=to_datetime(row[6]),
+            revoked_at=to_datetime(row[7]),
+        )
@@ -1,7 +1,7 @@
 """
 Repositorio UserRepository - Manejo de persistencia de usuarios.
 """
-from typing import Optional
+from typing import Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 from src.modules.User.domain.entities.user import User
 from src.shared.infrastructure.database.turso_connection import get_turso_client
@@ -11,7 +11,37 @@ class UserRepository:
     """
     Repositorio para manejar la persistencia de usuarios en la base de datos.
     Implementa operaciones CRUD y consultas específicas del dominio.
+
+    Los métodos `*_async` usan `execute_async` del pool: los llaman los
+    endpoints async (login, registro, alta masiva) sin bloquear el event loop.
+    """
+
+    _SELECT_USER = """
+        SELECT id, name, email, phone, password_hash, role_id,
+               failed_login_attempts, locked_until, created_at, updated_at
+        FROM users
+    """
+    _INSERT_USER = """
+        INSERT INTO users (
+            id, name, email, phone, password_hash, role_id,
+            failed_login_attempts, locked_until, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
+    _UPDATE_USER = """
+        UPDATE users SET
+            name = ?,
+            phone = ?,
+            password_hash = ?,
+            role_id = ?,
+            failed_login_attempts = ?,
+            locked_until = ?,
+            updated_at = ?
+        WHERE id = ?
+    """
+    _EMAIL_EXISTS = (
+        # idx_users_email_lower; EXISTS se detiene en la primera coincidencia
+        "SELECT EXISTS (SELECT 1 FROM users WHERE LOWER(email) = LOWER(?))"
+    )
     
     def __init__(self):
         """Inicializar el repositorio con la conexión a la base de datos."""
@@ -31,26 +61,16 @@ class UserRepository:
             Exception: Si hay un error al guardar
         """
         try:
-            self.client.execute(
-                """
-                INSERT INTO users (
-                    id, name, email, phone, password_hash, role_id,
-                    failed_login_attempts, locked_until, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    user.id,
-                    user.name,
-                    user.email,
-                    user.phone,
-                    user.password_hash,
-                    user.role_id,
-                    user.failed_login_attempts,
-                    user.locked_until.isoformat() if user.locked_until else None,
-                    user.created_at.isoformat(),
-                    user.updated_at.isoformat()
-                ]
-            )
+            self.client.execute(self._INSERT_USER, self._insert_params(user))
+            return user
+        except Exception as e:
+            print(f"Error al guardar usuario: {str(e)}")
+            raise
+
+    async def save_async(self, user: User) -> User:
+        """Versión asíncrona de save()."""
+        try:
+            await self.client.execute_async(self._INSERT_USER, self._insert_params(user))
             return user
         except Exception as e:
             print(f"Error al guardar usuario: {str(e)}")
@@ -70,29 +90,16 @@ class UserRepository:
             Exception: Si hay un error al actualizar
         """
         try:
-            self.client.execute(
-                """
-                UPDATE users SET
-                    name = ?,
-                    phone = ?,
-                    password_hash = ?,
-                    role_id = ?,
-                    failed_login_attempts = ?,
-                    locked_until = ?,
-                    updated_at = ?
-                WHERE id = ?
-                """,
-                [
-                    user.name,
-                    user.phone,
-                    user.password_hash,
-                    user.role_id,
-                    user.failed_login_attempts,
-                    user.locked_until.isoformat() if user.locked_until else None,
-                    user.updated_at.isoformat(),
-                    user.id
-                ]
-            )
+            self.client.execute(self._UPDATE_USER, self._update_params(user))
+            return user
+        except Exception as e:
+            print(f"Error al actualizar usuario: {str(e)}")
+            raise
+
+    async def update_async(self, user: User) -> User:
+        """Versión asíncrona de update()."""
+        try:
+            await self.client.execute_async(self._UPDATE_USER, self._update_params(user))
             return user
         except Exception as e:
             print(f"Error al actualizar usuario: {str(e)}")
@@ -109,15 +116,7 @@ class UserRepository:
             Entidad User si se encuentra, None en caso contrario
         """
         try:
-            result = self.client.execute(
-                """
-                SELECT id, name, email, phone, password_hash, role_id,
-                       failed_login_attempts, locked_until, created_at, updated_at
-                FROM users
-                WHERE id = ?
-                """,
-                [user_id]
-            )
+            result = self.client.execute(self._SELECT_USER + " WHERE id = ?", [user_id])
             
             if not result.rows:
                 return None
@@ -138,15 +137,7 @@ class UserRepository:
             Entidad User si se encuentra, None en caso contrario
         """
         try:
-            result = self.client.execute(
-                """
-                SELECT id, name, email, phone, password_hash, role_id,
-                       failed_login_attempts, locked_until, created_at, updated_at
-                FROM users
-                WHERE LOWER(email) = LOWER(?)
-                """,
-                [email]
-            )
+            result = self.client.execute(self._SELECT_USER + " WHERE LOWER(email) = LOWER(?)", [email])
             
             if not result.rows:
                 return None
@@ -155,6 +146,15 @@ class UserRepository:
         except Exception as e:
             print(f"Error al buscar usuario por email: {str(e)}")
             return None
+
+    async def find_by_email_async(self, email: str) -> Optional[User]:
+        """Versión asíncrona de find_by_email()."""
+        try:
+            result = await self.client.execute_async(self._SELECT_USER + " WHERE LOWER(email) = LOWER(?)", [email])
+            return self._map_to_entity(result.rows[0]) if result.rows else None
+        except Exception as e:
+            print(f"Error al buscar usuario por email: {str(e)}")
+            return None
     
     def email_exists(self, email: str) -> bool:
         """
@@ -167,16 +167,129 @@ class UserRepository:
             True si el email existe, False en caso contrario
         """
         try:
-            result = self.client.execute(
-                "SELECT COUNT(*) FROM users WHERE LOWER(email) = LOWER(?)",
-                [email]
-            )
+            result = self.client.execute(self._EMAIL_EXISTS, [email])
             count = result.rows[0][0]
             return count > 0
         except Exception as e:
             print(f"Error al verificar existencia de email: {str(e)}")
             return False
+
+    async def email_exists_async(self, email: str) -> bool:
+        """Versión asíncrona de email_exists()."""
+        try:
+            result = await self.client.execute_async(self._EMAIL_EXISTS, [email])
+            return result.rows[0][0] > 0
+        except Exception as e:
+            print(f"Error al verificar existencia de email: {str(e)}")
+            return False
+    
+    # Filas por sentencia en las operaciones masivas (10 parámetros por usuario)
+    BULK_CHUNK_SIZE = 90
+
+    def find_existing_emails(self, emails: List[str]) -> Set[str]:
+        """
+        Buscar en una sola consulta (por bloque) cuáles emails ya están registrados.
+        Usa idx_users_email_lower.
+        
+        Args:
+            emails: Emails a comprobar
+        
+        Returns:
+            Conjunto de los emails existentes, en minúsculas
+        """
+        existing: Set[str] = set()
+        for query, params in self._existing_emails_statements(emails):
+            result = self.client.execute(query, params)
+            existing.update(row[0] for row in result.rows)
+        return existing
+
+    async def find_existing_emails_async(self, emails: List[str]) -> Set[str]:
+        """Versión asíncrona de find_existing_emails()."""
+        existing: Set[str] = set()
+        for query, params in self._existing_emails_statements(emails):
+            result = await self.client.execute_async(query, params)
+            existing.update(row[0] for row in result.rows)
+        return existing
     
+    def save_many(self, users: List[User]) -> Set[str]:
+        """
+        Guardar varios usuarios con INSERTs de varias filas.
+        Si otro proceso registró el mismo email entre la validación y el
+        INSERT, esa fila se omite (ON CONFLICT DO NOTHING) en lugar de
+        abortar el lote.
+        
+        Args:
+            users: Entidades User a guardar
+        
+        Returns:
+            IDs de los usuarios efectivamente insertados
+        """
+        inserted: Set[str] = set()
+        for query, params in self._save_many_statements(users):
+            result = self.client.execute(query, params)
+            inserted.update(row[0] for row in result.rows)
+        return inserted
+
+    async def save_many_async(self, users: List[User]) -> Set[str]:
+        """Versión asíncrona de save_many()."""
+        inserted: Set[str] = set()
+        for query, params in self._save_many_statements(users):
+            result = await self.client.execute_async(query, params)
+            inserted.update(row[0] for row in result.rows)
+        return inserted
+
+    def _existing_emails_statements(self, emails: List[str]) -> Iterator[Tuple[str, list]]:
+        """Un SELECT ... IN (...) por bloque de BULK_CHUNK_SIZE emails."""
+        for start in range(0, len(emails), self.BULK_CHUNK_SIZE):
+            chunk = emails[start:start + self.BULK_CHUNK_SIZE]
+            placeholders = ", ".join(["LOWER(?)"] * len(chunk))
+            yield f"SELECT LOWER(email) FROM users WHERE LOWER(email) IN ({placeholders})", chunk
+
+    def _save_many_statements(self, users: List[User]) -> Iterator[Tuple[str, list]]:
+        """Un INSERT de varias filas por bloque de BULK_CHUNK_SIZE usuarios."""
+        for start in range(0, len(users), self.BULK_CHUNK_SIZE):
+            chunk = users[start:start + self.BULK_CHUNK_SIZE]
+            params = []
+            for user in chunk:
+                params.extend(self._insert_params(user))
+            placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
+            yield f"""
+                INSERT INTO users (
+                    id, name, email, phone, password_hash, role_id,
+                    failed_login_attempts, locked_until, created_at, updated_at
+                ) VALUES {placeholders}
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """, params
+    
+    @staticmethod
+    def _insert_params(user: User) -> list:
+        return [
+            user.id,
+            user.name,
+            user.email,
+            user.phone,
+            user.password_hash,
+            user.role_id,
+            user.failed_login_attempts,
+            user.locked_until.isoformat() if user.locked_until else None,
+            user.created_at.isoformat(),
+            user.updated_at.isoformat()
+        ]
+
+    @staticmethod
+    def _update_params(user: User) -> list:
+        return [
+            user.name,
+            user.phone,
+            user.password_hash,
+            user.role_id,
+            user.failed_login_attempts,
+            user.locked_until.isoformat() if user.locked_until else None,
+            user.updated_at.isoformat(),
+            user.id
+        ]
+
     def _map_to_entity(self, row) -> User:
         """
         Mapear una fila de la base de datos a una entidad User.
@@ -0,0 +1,7 @@
+"""
+Cachés en memoria del proceso.
+"""
+from src.shared.infrastructure.cache.bloom_filter import BloomFilter
+from src.shared.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+__all__ = ["BloomFilter", "TTLLRUCache"]
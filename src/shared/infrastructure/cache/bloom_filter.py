@@ -0,0 +1,46 @@
+"""
+Filtro de Bloom - Capa de Infraestructura.
+
+Conjunto probabilístico compacto: `might_contain` nunca da falsos negativos y
+da falsos positivos con la probabilidad configurada. Sirve como primer paso
+barato antes de una comprobación exacta (la mayoría de las consultas son de
+elementos ausentes y se resuelven con unos pocos bits).
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom con doble hashing sobre BLAKE2b.
+
+    Attributes:
+        capacity: Elementos previstos
+        false_positive_rate: Probabilidad de falso positivo con `capacity` elementos
+        size_bits: Bits del filtro
+        hash_count: Posiciones por elemento
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if capacity <= 0 or not 0 < false_positive_rate < 1:
+            raise ValueError("capacity debe ser mayor que 0 y false_positive_rate estar entre 0 y 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.size_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        return all(self._bits[position >> 3] >> (position & 7) & 1 for position in self._positions(item))
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size_bits for index in range(self.hash_count)]
@@ -14,13 +14,61 @@ ENV_FILE = BASE_DIR / ".env"
 load_dotenv(ENV_FILE, override=True)
 
 
+def _env_bool(name: str, default: str = "false") -> bool:
+    """Leer una variable de entorno booleana (true/false, 1/0, yes/no)."""
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
 class Settings:
     """Configuración de la aplicación."""
     
     # Database
+    # URL remota (libsql://, https://) o archivo local (file:kitchai.db, sqlite:///kitchai.db)
     TURSO_DATABASE_URL: str = os.getenv("TURSO_DATABASE_URL", "")
     TURSO_AUTH_TOKEN: str = os.getenv("TURSO_AUTH_TOKEN", "")
-    
+    # Base de datos local usada en desarrollo cuando no hay TURSO_DATABASE_URL
+    LOCAL_DATABASE_URL: str = f"file:{BASE_DIR / 'kitchai.db'}"
+
+    # Driver SQLite local (URLs file: / sqlite:)
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE_KIB: int = int(os.getenv("SQLITE_CACHE_SIZE_KIB", "20000"))
+
+    # Pool de conexiones a la base de datos
+    DB_POOL_MIN_SIZE: int = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    DB_POOL_MAX_SIZE: int = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "10"))
+    DB_POOL_IDLE_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_IDLE_TIMEOUT_SECONDS", "300"))
+    DB_POOL_HEALTH_CHECK_INTERVAL_SECONDS: float = float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL_SECONDS", "30"))
+
+    # Réplica local embebida: lecturas servidas desde un archivo SQLite local
+    DB_REPLICA_ENABLED: bool = _env_bool("DB_REPLICA_ENABLED")
+    DB_REPLICA_PATH: str = os.getenv("DB_REPLICA_PATH", str(BASE_DIR / "kitchai_replica.db"))
+    DB_REPLICA_SYNC_INTERVAL_SECONDS: float = float(os.getenv("DB_REPLICA_SYNC_INTERVAL_SECONDS", "60"))
+    DB_REPLICA_SYNC_ON_WRITE: bool = _env_bool("DB_REPLICA_SYNC_ON_WRITE", "true")
+    # Tablas replicadas separadas por coma; "*" replica todas
+    DB_REPLICA_TABLES: str = os.getenv("DB_REPLICA_TABLES", "roles,permissions,role_permissions")
+
+    # Pool de procesos para bcrypt (hash / verificación de contraseñas)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))  # 0 = núcleos disponibles
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = int(os.getenv("PASSWORD_HASH_RETRY_AFTER_SECONDS", "1"))
+    # Factor de trabajo fijo; 0 = calibrar una vez (se guarda en app_settings) para tardar ~PASSWORD_HASH_TARGET_MS
+    PASSWORD_HASH_ROUNDS: int = int(os.getenv("PASSWORD_HASH_ROUNDS", "0"))
+    PASSWORD_HASH_TARGET_MS: float = float(os.getenv("PASSWORD_HASH_TARGET_MS", "100"))
+    PASSWORD_HASH_MIN_ROUNDS: int = int(os.getenv("PASSWORD_HASH_MIN_ROUNDS", "12"))
+    PASSWORD_HASH_MAX_ROUNDS: int = int(os.getenv("PASSWORD_HASH_MAX_ROUNDS", "16"))
+
+    # Planificador de trabajos en segundo plano
+    SCHEDULER_ENABLED: bool = _env_bool("SCHEDULER_ENABLED", "true")
+    SCHEDULER_POLL_SECONDS: float = float(os.getenv("SCHEDULER_POLL_SECONDS", "30"))
+    SCHEDULER_MAX_WORKERS: int = int(os.getenv("SCHEDULER_MAX_WORKERS", "2"))
+    SCHEDULER_LEASE_SECONDS: float = float(os.getenv("SCHEDULER_LEASE_SECONDS", "600"))
+    # Verificacion diaria de stock minimo (cron de 5 campos, hora local)
+    INVENTORY_DAILY_CHECK_CRON: str = os.getenv("INVENTORY_DAILY_CHECK_CRON", "0 6 * * *")
+
     # Application
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     
@@ -28,16 +76,59 @@ class Settings:
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     JWT_EXPIRATION_MINUTES: int = int(os.getenv("JWT_EXPIRATION_MINUTES", "60"))
+    # Caché de tokens verificados (0 = desactivada); cada entrada vive hasta el exp del token
+    JWT_CACHE_MAX_ENTRIES: int = int(os.getenv("JWT_CACHE_MAX_ENTRIES", "10000"))
+    JWT_CACHE_MAX_TTL_SECONDS: float = float(os.getenv("JWT_CACHE_MAX_TTL_SECONDS", "900"))
+    # Cada cuántos segundos se revisan las versiones de permisos de los roles (0 = solo cambios locales)
+    PERMISSION_VERSION_REFRESH_SECONDS: float = float(os.getenv("PERMISSION_VERSION_REFRESH_SECONDS", "30"))
+    # Sesiones de refresh token y filtro en memoria de las revocadas
+    REFRESH_TOKEN_EXPIRATION_DAYS: float = float(os.getenv("REFRESH_TOKEN_EXPIRATION_DAYS", "14"))
+    SESSION_REVOCATION_REFRESH_SECONDS: float = float(os.getenv("SESSION_REVOCATION_REFRESH_SECONDS", "30"))
+    SESSION_REVOCATION_FILTER_CAPACITY: int = int(os.getenv("SESSION_REVOCATION_FILTER_CAPACITY", "100000"))
+    # Limpieza programada: borrado por lotes de sesiones expiradas y recarga del filtro
+    SESSIONS_PURGE_BATCH_SIZE: int = int(os.getenv("SESSIONS_PURGE_BATCH_SIZE", "1000"))
+    SESSIONS_PURGE_MAX_BATCHES: int = int(os.getenv("SESSIONS_PURGE_MAX_BATCHES", "100"))
+    SESSIONS_CLEANUP_CRON: str = os.getenv("SESSIONS_CLEANUP_CRON", "45 3 * * *")
+    # Máximo de pedidos por solicitud en POST /api/orders/batch
+    ORDER_CREATE_BATCH_MAX_SIZE: int = int(os.getenv("ORDER_CREATE_BATCH_MAX_SIZE", "50"))
+    # Máximo de cambios por solicitud en POST /api/orders/status:batch
+    ORDER_STATUS_BATCH_MAX_SIZE: int = int(os.getenv("ORDER_STATUS_BATCH_MAX_SIZE", "100"))
+    # Máximo de usuarios por solicitud en el alta masiva (POST /api/users/bulk)
+    BULK_REGISTER_MAX_ROWS: int = int(os.getenv("BULK_REGISTER_MAX_ROWS", "500"))
+    # Auditoría de intentos de login: buffer en memoria vaciado en lotes
+    LOGIN_AUDIT_BUFFER_SIZE: int = int(os.getenv("LOGIN_AUDIT_BUFFER_SIZE", "10000"))
+    LOGIN_AUDIT_BATCH_SIZE: int = int(os.getenv("LOGIN_AUDIT_BATCH_SIZE", "100"))
+    LOGIN_AUDIT_FLUSH_INTERVAL_MS: float = float(os.getenv("LOGIN_AUDIT_FLUSH_INTERVAL_MS", "500"))
+    # Retención de login_attempts: resumen diario por email/IP y borrado de filas vencidas por lotes
+    LOGIN_ATTEMPTS_RETENTION_DAYS: int = int(os.getenv("LOGIN_ATTEMPTS_RETENTION_DAYS", "30"))
+    LOGIN_ATTEMPTS_PURGE_BATCH_SIZE: int = int(os.getenv("LOGIN_ATTEMPTS_PURGE_BATCH_SIZE", "1000"))
+    LOGIN_ATTEMPTS_PURGE_MAX_BATCHES: int = int(os.getenv("LOGIN_ATTEMPTS_PURGE_MAX_BATCHES", "100"))
+    LOGIN_ATTEMPTS_RETENTION_CRON: str = os.getenv("LOGIN_ATTEMPTS_RETENTION_CRON", "30 3 * * *")
+    # Límite de solicitudes de login/registro por IP y de login por email (ventana deslizante en memoria)
+    AUTH_RATE_LIMIT_ENABLED: bool = _env_bool("AUTH_RATE_LIMIT_ENABLED", "true")
+    AUTH_RATE_LIMIT_WINDOW_SECONDS: float = float(os.getenv("AUTH_RATE_LIMIT_WINDOW_SECONDS", "60"))
+    AUTH_RATE_LIMIT_PER_IP: int = int(os.getenv("AUTH_RATE_LIMIT_PER_IP", "30"))
+    AUTH_RATE_LIMIT_PER_EMAIL: int = int(os.getenv("AUTH_RATE_LIMIT_PER_EMAIL", "10"))
+    # IPs de los proxies de confianza (separadas por coma); solo a ellos se les acepta X-Forwarded-For
+    TRUSTED_PROXY_IPS: str = os.getenv("TRUSTED_PROXY_IPS", "")
+
+    # Streaming de pedidos (SSE / WebSocket) para las pantallas de cocina y meseros
+    ORDER_STREAM_HISTORY_SIZE: int = int(os.getenv("ORDER_STREAM_HISTORY_SIZE", "1000"))
+    ORDER_STREAM_QUEUE_SIZE: int = int(os.getenv("ORDER_STREAM_QUEUE_SIZE", "256"))
+    ORDER_STREAM_KEEPALIVE_SECONDS: float = float(os.getenv("ORDER_STREAM_KEEPALIVE_SECONDS", "15"))
     
     def __init__(self):
         """Validar que las variables necesarias estén configuradas."""
         if not self.TURSO_DATABASE_URL:
-            raise ValueError(
-                f"TURSO_DATABASE_URL no está configurada en el archivo .env\n"
-                f"Buscando en: {ENV_FILE}\n"
-                f"Archivo existe: {ENV_FILE.exists()}"
-            )
-        if not self.TURSO_AUTH_TOKEN:
+            if not self.is_development:
+                raise ValueError(
+                    f"TURSO_DATABASE_URL no está configurada en el archivo .env\n"
+                    f"Buscando en: {ENV_FILE}\n"
+                    f"Archivo existe: {ENV_FILE.exists()}"
+                )
+            self.TURSO_DATABASE_URL = self.LOCAL_DATABASE_URL
+            print(f"⚠️  TURSO_DATABASE_URL no configurada. Usando base de datos local: {self.TURSO_DATABASE_URL}")
+        if not self.is_local_database and not self.TURSO_AUTH_TOKEN:
             raise ValueError("TURSO_AUTH_TOKEN no está configurado en el archivo .env")
         
         # Validar configuración JWT en producción
@@ -50,6 +141,23 @@ class Settings:
             self.JWT_SECRET_KEY = secrets.token_urlsafe(32)
             print("⚠️  JWT_SECRET_KEY no configurado. Usando clave temporal para desarrollo.")
     
+    @property
+    def is_local_database(self) -> bool:
+        """Verificar si la base de datos es un archivo SQLite local (file: / sqlite:)."""
+        return self.TURSO_DATABASE_URL.strip().lower().startswith(("file:", "sqlite:"))
+
+    @property
+    def replica_tables(self) -> list[str] | None:
+        """Tablas configuradas para la réplica local (None = todas)."""
+        if self.DB_REPLICA_TABLES.strip() == "*":
+            return None
+        return [table.strip() for table in self.DB_REPLICA_TABLES.split(",") if table.strip()]
+
+    @property
+    def trusted_proxy_ips(self) -> frozenset[str]:
+        """Proxies de confianza configurados (vacío = se ignora X-Forwarded-For)."""
+        return frozenset(ip.strip() for ip in self.TRUSTED_PROXY_IPS.split(",") if ip.strip())
+
     @property
     def is_production(self) -> bool:
         """Verificar si el entorno es producción."""
@@ -0,0 +1,339 @@
+"""
+Pool de conexiones asíncrono para Turso DB (LibSQL) - Capa de Infraestructura.
+
+Mantiene un conjunto acotado de clientes libsql reutilizables. Cada consulta
+toma un cliente del pool (acquire), lo usa y lo devuelve (release), de modo que
+las peticiones concurrentes viajan en paralelo en lugar de encolarse sobre una
+única conexión. Incluye health checks de conexiones ociosas y expulsión de las
+que superan el tiempo máximo de inactividad.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Deque, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PoolTimeoutError(TimeoutError):
+    """No se pudo obtener una conexión libre dentro del tiempo de espera."""
+
+
+class PoolClosedError(RuntimeError):
+    """Se intentó usar un pool que ya fue cerrado."""
+
+
+class PooledConnection:
+    """
+    Envoltorio de un cliente libsql administrado por el pool.
+
+    Attributes:
+        client: Cliente libsql asíncrono
+        created_at: Momento de creación (time.monotonic)
+        last_used_at: Última vez que se devolvió al pool
+        last_checked_at: Último health check exitoso
+    """
+
+    __slots__ = ("client", "created_at", "last_used_at", "last_checked_at")
+
+    def __init__(self, client: Any):
+        now = time.monotonic()
+        self.client = client
+        self.created_at = now
+        self.last_used_at = now
+        self.last_checked_at = now
+
+    @property
+    def is_closed(self) -> bool:
+        """Indica si el cliente subyacente ya está cerrado."""
+        return bool(getattr(self.client, "closed", False))
+
+
+class AsyncConnectionPool:
+    """
+    Pool asíncrono y acotado de clientes libsql.
+
+    Todas las operaciones deben ejecutarse en el mismo event loop en el que se
+    abrió el pool (ver EventLoopThread para usarlo desde código síncrono).
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 10.0,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+    ):
+        """
+        Inicializar el pool (sin abrir conexiones todavía).
+
+        Args:
+            connect: Corrutina fábrica que crea un nuevo cliente libsql
+            min_size: Conexiones que se mantienen abiertas aunque estén ociosas
+            max_size: Número máximo de conexiones simultáneas
+            acquire_timeout: Segundos máximos de espera por una conexión libre
+            idle_timeout: Segundos de inactividad tras los que se cierra una conexión
+            health_check_interval: Segundos de inactividad tras los que se
+                verifica la conexión con SELECT 1 antes de reutilizarla
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser al menos 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size debe estar entre 0 y max_size")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: Deque[PooledConnection] = deque()
+        self._size = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Métricas básicas
+        self._acquired_total = 0
+        self._created_total = 0
+        self._discarded_total = 0
+        self._evicted_total = 0
+        self._timeouts_total = 0
+
+    async def open(self) -> None:
+        """Abrir las conexiones mínimas e iniciar la tarea de expulsión de ociosas."""
+        self._semaphore = asyncio.Semaphore(self.max_size)
+        for _ in range(self.min_size):
+            self._idle.append(await self._create_connection())
+        if self.idle_timeout > 0:
+            self._reaper_task = asyncio.create_task(self._reap_idle_connections())
+
+    async def acquire(self) -> PooledConnection:
+        """
+        Obtener una conexión del pool.
+
+        Returns:
+            Conexión lista para usarse. Debe devolverse con release().
+
+        Raises:
+            PoolTimeoutError: Si no hay conexiones libres dentro del tiempo de espera.
+            PoolClosedError: Si el pool está cerrado.
+        """
+        if self._closed or self._semaphore is None:
+            raise PoolClosedError("El pool de conexiones está cerrado")
+
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._timeouts_total += 1
+            raise PoolTimeoutError(
+                f"No hay conexiones libres tras {self.acquire_timeout}s (max_size={self.max_size})"
+            )
+
+        try:
+            connection = await self._take_healthy_idle_connection()
+            if connection is None:
+                connection = await self._create_connection()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._acquired_total += 1
+        return connection
+
+    async def release(self, connection: PooledConnection, discard: bool = False) -> None:
+        """
+        Devolver una conexión al pool.
+
+        Args:
+            connection: Conexión obtenida con acquire()
+            discard: Si es True la conexión se cierra en lugar de reutilizarse
+        """
+        try:
+            if discard or self._closed or connection.is_closed:
+                self._discarded_total += 1
+                await self._close_connection(connection)
+            else:
+                connection.last_used_at = time.monotonic()
+                self._idle.append(connection)
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[PooledConnection]:
+        """Context manager que adquiere y libera una conexión automáticamente."""
+        connection = await self.acquire()
+        discard = False
+        try:
+            yield connection
+        except BaseException as e:
+            discard = self._is_connection_error(e) or connection.is_closed
+            raise
+        finally:
+            await self.release(connection, discard=discard)
+
+    async def execute(self, stmt: Any, args: Any = None) -> Any:
+        """Ejecutar una sentencia SQL usando una conexión del pool."""
+        async with self.connection() as connection:
+            return await connection.client.execute(stmt, args)
+
+    async def batch(self, stmts: List[Any]) -> List[Any]:
+        """Ejecutar varias sentencias como un lote atómico en una sola conexión."""
+        async with self.connection() as connection:
+            return await connection.client.batch(stmts)
+
+    async def close(self) -> None:
+        """Cerrar todas las conexiones ociosas y detener la expulsión periódica."""
+        self._closed = True
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+        while self._idle:
+            await self._close_connection(self._idle.pop())
+
+    def stats(self) -> dict:
+        """Obtener métricas del pool (tamaño, ociosas, en uso y contadores)."""
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": self._size - len(self._idle),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "acquired_total": self._acquired_total,
+            "created_total": self._created_total,
+            "discarded_total": self._discarded_total,
+            "evicted_total": self._evicted_total,
+            "timeouts_total": self._timeouts_total,
+        }
+
+    async def _take_healthy_idle_connection(self) -> Optional[PooledConnection]:
+        """Tomar la conexión ociosa más reciente (LIFO) que pase el health check."""
+        while self._idle:
+            connection = self._idle.pop()
+            if await self._is_healthy(connection):
+                return connection
+            self._discarded_total += 1
+            await self._close_connection(connection)
+        return None
+
+    async def _is_healthy(self, connection: PooledConnection) -> bool:
+        """Verificar con SELECT 1 las conexiones que llevan tiempo sin usarse."""
+        if connection.is_closed:
+            return False
+
+        now = time.monotonic()
+        if now - connection.last_checked_at < self.health_check_interval:
+            return True
+
+        try:
+            await connection.client.execute("SELECT 1")
+        except Exception as e:
+            print(f"⚠️  Conexión descartada por health check fallido: {str(e)}")
+            return False
+
+        connection.last_checked_at = now
+        return True
+
+    async def _create_connection(self) -> PooledConnection:
+        client = await self._connect()
+        self._size += 1
+        self._created_total += 1
+        return PooledConnection(client)
+
+    async def _close_connection(self, connection: PooledConnection) -> None:
+        self._size -= 1
+        try:
+            await connection.client.close()
+        except Exception as e:
+            print(f"⚠️  Error al cerrar conexión del pool: {str(e)}")
+
+    async def _reap_idle_connections(self) -> None:
+        """Cerrar periódicamente las conexiones ociosas que superan idle_timeout."""
+        interval = max(self.idle_timeout / 2, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle_connections()
+
+    def evict_idle_connections(self) -> int:
+        """
+        Expulsar las conexiones ociosas vencidas respetando min_size.
+
+        Returns:
+            Número de conexiones expulsadas.
+        """
+        now = time.monotonic()
+        survivors: Deque[PooledConnection] = deque()
+        expired: List[PooledConnection] = []
+
+        # Las más antiguas están al inicio de la cola (LIFO por el final)
+        while self._idle:
+            connection = self._idle.popleft()
+            can_shrink = self._size - len(expired) > self.min_size
+            if can_shrink and now - connection.last_used_at >= self.idle_timeout:
+                expired.append(connection)
+            else:
+                survivors.append(connection)
+        self._idle = survivors
+
+        for connection in expired:
+            self._evicted_total += 1
+            asyncio.ensure_future(self._close_connection(connection))
+        return len(expired)
+
+    @staticmethod
+    def _is_connection_error(error: BaseException) -> bool:
+        """Distinguir errores de transporte (conexión inservible) de errores SQL."""
+        return isinstance(error, (ConnectionError, OSError, asyncio.TimeoutError))
+
+
+class EventLoopThread:
+    """
+    Hilo dedicado con su propio event loop.
+
+    Permite que el código síncrono (repositorios ejecutados en el threadpool de
+    FastAPI) envíe corrutinas al pool y espere su resultado sin bloquear a
+    otros hilos: varias peticiones pueden tener consultas en vuelo a la vez.
+    """
+
+    def __init__(self, name: str = "turso-db-loop"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Ejecutar una corrutina en el loop dedicado y esperar su resultado."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("No se puede esperar sincrónicamente desde el propio hilo del pool")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Ejecutar una corrutina en el loop dedicado desde otro event loop."""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    def stop(self) -> None:
+        """Detener el loop y esperar a que termine el hilo."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
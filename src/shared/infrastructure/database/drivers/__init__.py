@@ -0,0 +1,18 @@
+"""
+Drivers de base de datos.
+Cada driver implementa la misma interfaz (execute, execute_async, batch) sobre
+un motor distinto; el driver se elige según el esquema de la URL.
+"""
+from .base import DatabaseDriver, QueryResult
+from .factory import create_driver, is_local_url
+from .libsql_driver import LibsqlDriver
+from .sqlite_driver import SQLiteDriver
+
+__all__ = [
+    "DatabaseDriver",
+    "QueryResult",
+    "LibsqlDriver",
+    "SQLiteDriver",
+    "create_driver",
+    "is_local_url",
+]
@@ -0,0 +1,87 @@
+"""
+Interfaz común de los drivers de base de datos - Capa de Infraestructura.
+
+Los repositorios solo dependen de esta interfaz: execute() / batch() devuelven
+un QueryResult con la misma forma que el ResultSet de libsql (.rows, .columns,
+.rows_affected, .last_insert_rowid) más fetchone() / fetchall().
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from libsql_client import ResultSet, Row
+
+
+class QueryResult(ResultSet):
+    """
+    Resultado de una sentencia SQL, independiente del driver.
+
+    Cada fila es un libsql_client.Row: admite acceso por índice y por nombre.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_values(
+        cls,
+        columns: Sequence[str],
+        values: List[Tuple[Any, ...]],
+        rows_affected: int = 0,
+        last_insert_rowid: Optional[int] = None,
+    ) -> "QueryResult":
+        """Construir un resultado a partir de columnas y tuplas de valores."""
+        columns = tuple(columns)
+        column_idxs: Dict[str, int] = {name: idx for idx, name in enumerate(columns)}
+        return cls(
+            columns,
+            [Row(column_idxs, tuple(row)) for row in values],
+            rows_affected,
+            last_insert_rowid,
+        )
+
+    @classmethod
+    def from_result_set(cls, result: ResultSet) -> "QueryResult":
+        """Adaptar un ResultSet de libsql_client."""
+        if isinstance(result, cls):
+            return result
+        return cls(result.columns, result.rows, result.rows_affected, result.last_insert_rowid)
+
+    def fetchone(self) -> Optional[Row]:
+        """Primera fila del resultado, o None si no hay filas."""
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self) -> List[Row]:
+        """Todas las filas del resultado."""
+        return self.rows
+
+
+class DatabaseDriver(ABC):
+    """
+    Driver de base de datos.
+
+    Attributes:
+        name: Nombre corto del motor (aparece en logs y métricas)
+        is_local: True si la base de datos está en el disco local
+    """
+
+    name: str = "base"
+    is_local: bool = False
+
+    @abstractmethod
+    def execute(self, query: str, params: Optional[list] = None) -> QueryResult:
+        """Ejecutar una sentencia SQL."""
+
+    @abstractmethod
+    async def execute_async(self, query: str, params: Optional[list] = None) -> QueryResult:
+        """Ejecutar una sentencia SQL desde código asíncrono sin bloquear el event loop."""
+
+    @abstractmethod
+    def batch(self, statements: List) -> List[QueryResult]:
+        """Ejecutar varias sentencias (str o tuplas (sql, params)) de forma atómica."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Métricas del driver."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Liberar todas las conexiones."""
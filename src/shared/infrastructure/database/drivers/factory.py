@@ -0,0 +1,55 @@
+"""
+Selección del driver de base de datos según el esquema de la URL.
+"""
+from typing import Optional
+
+from src.shared.infrastructure.database.drivers.base import DatabaseDriver
+
+LOCAL_SCHEMES = ("file:", "sqlite:")
+
+
+def is_local_url(url: str) -> bool:
+    """Indica si la URL apunta a un archivo SQLite local (file: o sqlite:)."""
+    return url.strip().lower().startswith(LOCAL_SCHEMES)
+
+
+def create_driver(url: str, auth_token: Optional[str] = None, config=None) -> DatabaseDriver:
+    """
+    Crear el driver adecuado para la URL.
+
+    Args:
+        url: URL de la base de datos. file: / sqlite: usan el driver SQLite
+            local; cualquier otro esquema (libsql:, https:, wss:...) usa libsql.
+        auth_token: Token de autenticación (solo para URLs remotas)
+        config: Objeto de configuración con los ajustes DB_POOL_* / SQLITE_*
+            (por defecto, la configuración global de la aplicación)
+
+    Returns:
+        Driver conectado y listo para usar.
+    """
+    if config is None:
+        from src.shared.infrastructure.config.settings import settings as config
+
+    if is_local_url(url):
+        from src.shared.infrastructure.database.drivers.sqlite_driver import SQLiteDriver
+
+        return SQLiteDriver(
+            url,
+            journal_mode=config.SQLITE_JOURNAL_MODE,
+            synchronous=config.SQLITE_SYNCHRONOUS,
+            mmap_size=config.SQLITE_MMAP_SIZE,
+            busy_timeout_ms=config.SQLITE_BUSY_TIMEOUT_MS,
+            cache_size_kib=config.SQLITE_CACHE_SIZE_KIB,
+        )
+
+    from src.shared.infrastructure.database.drivers.libsql_driver import LibsqlDriver
+
+    return LibsqlDriver(
+        url,
+        auth_token=auth_token,
+        min_size=config.DB_POOL_MIN_SIZE,
+        max_size=config.DB_POOL_MAX_SIZE,
+        acquire_timeout=config.DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+        idle_timeout=config.DB_POOL_IDLE_TIMEOUT_SECONDS,
+        health_check_interval=config.DB_POOL_HEALTH_CHECK_INTERVAL_SECONDS,
+    )
@@ -0,0 +1,86 @@
+"""
+Driver libsql (Turso remoto) - Capa de Infraestructura.
+
+Fachada síncrona sobre un pool asíncrono de clientes libsql que vive en un
+event loop dedicado (ver connection_pool.py).
+"""
+from typing import List, Optional
+
+from libsql_client import create_client
+
+from src.shared.infrastructure.database.connection_pool import AsyncConnectionPool, EventLoopThread
+from src.shared.infrastructure.database.drivers.base import DatabaseDriver, QueryResult
+
+
+class LibsqlDriver(DatabaseDriver):
+    """Driver para bases de datos Turso/libsql accesibles por red."""
+
+    name = "libsql"
+    is_local = False
+
+    def __init__(
+        self,
+        url: str,
+        auth_token: Optional[str] = None,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 10.0,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+    ):
+        """
+        Abrir el pool de conexiones.
+
+        Args:
+            url: URL de la base de datos (libsql://, https://, wss://...)
+            auth_token: Token de autenticación de Turso
+            min_size / max_size / acquire_timeout / idle_timeout /
+            health_check_interval: Parámetros del pool (ver AsyncConnectionPool)
+        """
+        self.url = url
+        self._auth_token = auth_token
+        self._loop_thread = EventLoopThread(name="turso-db-pool")
+        self._pool = AsyncConnectionPool(
+            connect=self._create_client,
+            min_size=min_size,
+            max_size=max_size,
+            acquire_timeout=acquire_timeout,
+            idle_timeout=idle_timeout,
+            health_check_interval=health_check_interval,
+        )
+        try:
+            self._loop_thread.run(self._pool.open())
+        except Exception:
+            self._loop_thread.stop()
+            raise
+
+    async def _create_client(self):
+        """Crear un cliente libsql asíncrono (se ejecuta en el loop del pool)."""
+        return create_client(url=self.url, auth_token=self._auth_token)
+
+    @property
+    def pool(self) -> AsyncConnectionPool:
+        """Pool de conexiones subyacente."""
+        return self._pool
+
+    def execute(self, query: str, params: Optional[list] = None) -> QueryResult:
+        result = self._loop_thread.run(self._pool.execute(query, params or None))
+        return QueryResult.from_result_set(result)
+
+    async def execute_async(self, query: str, params: Optional[list] = None) -> QueryResult:
+        result = await self._loop_thread.run_async(self._pool.execute(query, params or None))
+        return QueryResult.from_result_set(result)
+
+    def batch(self, statements: List) -> List[QueryResult]:
+        results = self._loop_thread.run(self._pool.batch(statements))
+        return [QueryResult.from_result_set(result) for result in results]
+
+    def stats(self) -> dict:
+        return self._loop_thread.run(self._collect_stats())
+
+    async def _collect_stats(self) -> dict:
+        return {"driver": self.name, **self._pool.stats()}
+
+    def close(self) -> None:
+        self._loop_thread.run(self._pool.close())
+        self._loop_thread.stop()
@@ -0,0 +1,185 @@
+"""
+Driver SQLite local (archivo en disco) - Capa de Infraestructura.
+
+Pensado para benchmarks, pruebas de carga, desarrollo sin red y despliegues
+en el edge. Cada hilo usa su propia conexión sqlite3 (los repositorios corren
+en el threadpool de FastAPI) y todas comparten el mismo archivo en modo WAL:
+los lectores no bloquean al escritor ni entre sí.
+"""
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from src.shared.infrastructure.database.drivers.base import DatabaseDriver, QueryResult
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def parse_sqlite_url(url: str) -> Tuple[str, bool]:
+    """
+    Convertir una URL file:/sqlite: en el destino que espera sqlite3.connect.
+
+    Admite "file:ruta.db" (URI de SQLite, con parámetros ?mode=...),
+    "sqlite:///ruta/relativa.db", "sqlite:////ruta/absoluta.db" y "sqlite:ruta.db".
+
+    Returns:
+        (destino, uri): destino para sqlite3.connect y si debe abrirse como URI.
+    """
+    if url.startswith("file:"):
+        return url, True
+    if url.startswith("sqlite:"):
+        path = url[len("sqlite:"):]
+        if path.startswith("///"):
+            path = path[3:]
+        elif path.startswith("//"):
+            path = path[2:]
+        return path, False
+    raise ValueError(f"URL no soportada por el driver SQLite: {url}")
+
+
+class SQLiteDriver(DatabaseDriver):
+    """Driver sobre un archivo SQLite local usando el módulo sqlite3."""
+
+    name = "sqlite"
+    is_local = True
+
+    def __init__(
+        self,
+        url: str,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        mmap_size: int = 268435456,
+        busy_timeout_ms: int = 5000,
+        cache_size_kib: int = 20000,
+    ):
+        """
+        Preparar el driver y validar que el archivo se puede abrir.
+
+        Args:
+            url: URL file: o sqlite: del archivo de base de datos
+            journal_mode: PRAGMA journal_mode (WAL recomendado)
+            synchronous: PRAGMA synchronous (NORMAL es seguro con WAL)
+            mmap_size: Bytes del archivo mapeados en memoria (0 = desactivado)
+            busy_timeout_ms: Espera máxima por un bloqueo antes de fallar
+            cache_size_kib: Tamaño de la caché de páginas por conexión (KiB)
+        """
+        journal_mode = journal_mode.upper()
+        synchronous = synchronous.upper()
+        if journal_mode not in _JOURNAL_MODES:
+            raise ValueError(f"journal_mode inválido: {journal_mode}")
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous inválido: {synchronous}")
+
+        self.url = url
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.mmap_size = int(mmap_size)
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self.cache_size_kib = int(cache_size_kib)
+        self._target, self._uri = parse_sqlite_url(url)
+
+        if not self._uri and self._target != ":memory:":
+            Path(self._target).parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
+        self._queries_total = 0
+        self._batches_total = 0
+
+        # Abrir la primera conexión ya valida la ruta y fija journal_mode,
+        # que es persistente en el archivo.
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Obtener (o abrir) la conexión del hilo actual."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+        if self._closed:
+            raise RuntimeError("El driver SQLite ya fue cerrado")
+
+        connection = sqlite3.connect(
+            self._target,
+            uri=self._uri,
+            isolation_level=None,
+            check_same_thread=False,
+            timeout=self.busy_timeout_ms / 1000,
+        )
+        connection.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        connection.execute(f"PRAGMA synchronous={self.synchronous}")
+        connection.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        connection.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        connection.execute(f"PRAGMA cache_size=-{self.cache_size_kib}")
+
+        self._local.connection = connection
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    @staticmethod
+    def _run(connection: sqlite3.Connection, query: str, params) -> QueryResult:
+        cursor = connection.execute(query, params or ())
+        rows = cursor.fetchall()
+        columns = tuple(description[0] for description in cursor.description or ())
+        rows_affected = cursor.rowcount if cursor.rowcount > 0 else 0
+        return QueryResult.from_values(columns, rows, rows_affected, cursor.lastrowid)
+
+    def execute(self, query: str, params: Optional[list] = None) -> QueryResult:
+        self._queries_total += 1
+        return self._run(self._connection(), query, params)
+
+    async def execute_async(self, query: str, params: Optional[list] = None) -> QueryResult:
+        return await asyncio.to_thread(self.execute, query, params)
+
+    def batch(self, statements: List[Union[str, tuple]]) -> List[QueryResult]:
+        connection = self._connection()
+        self._batches_total += 1
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            results = []
+            for statement in statements:
+                if isinstance(statement, str):
+                    results.append(self._run(connection, statement, None))
+                else:
+                    query, params = statement
+                    results.append(self._run(connection, query, params))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return results
+
+    def stats(self) -> dict:
+        with self._connections_lock:
+            connections = len(self._connections)
+        return {
+            "driver": self.name,
+            "path": self._target,
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "mmap_size": self.mmap_size,
+            "connections": connections,
+            "queries_total": self._queries_total,
+            "batches_total": self._batches_total,
+        }
+
+    def checkpoint(self) -> None:
+        """Forzar un checkpoint del WAL y truncarlo (útil tras cargas masivas)."""
+        if self.journal_mode == "WAL":
+            self._connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        self._closed = True
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
@@ -0,0 +1,296 @@
+"""
+Réplica local embebida (SQLite) - Capa de Infraestructura.
+
+Mantiene una copia local en archivo de las tablas configuradas de la base de
+datos primaria (Turso). Las lecturas sobre esas tablas se resuelven en el
+proceso, sin viaje de red; las escrituras siempre van a la primaria y la réplica
+se resincroniza tras cada escritura y/o cada cierto intervalo.
+
+El enrutamiento es exacto: cada conexión de lectura instala un authorizer de
+SQLite que solo permite leer tablas sincronizadas y vigentes. Si la consulta
+toca cualquier otra tabla, SQLite la rechaza al prepararla y la consulta se
+envía a la primaria.
+"""
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from src.shared.infrastructure.database.drivers.base import QueryResult
+
+READ_QUERY_PATTERN = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+WRITE_QUERY_PATTERN = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+SCHEMA_CHANGE_PATTERN = re.compile(r"^\s*(?:CREATE|ALTER|DROP)\b", re.IGNORECASE)
+
+# Acciones del authorizer permitidas en lecturas locales (además de SQLITE_READ)
+_ALLOWED_READ_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+}
+
+
+def is_read_query(query: str) -> bool:
+    """Indica si la sentencia es una lectura candidata a servirse localmente."""
+    return bool(READ_QUERY_PATTERN.match(query))
+
+
+class LocalReplica:
+    """
+    Réplica local de solo lectura sincronizada desde la base de datos primaria.
+
+    Attributes:
+        path: Ruta del archivo SQLite de la réplica
+        tables: Tablas replicadas (None = todas las tablas de la primaria)
+        sync_on_write: Si es True, una escritura resincroniza de inmediato la
+            tabla afectada; si es False la tabla queda marcada como desactualizada
+            (sus lecturas van a la primaria) hasta la siguiente sincronización.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        primary_execute: Callable[[str], QueryResult],
+        tables: Optional[Iterable[str]] = None,
+        sync_on_write: bool = True,
+    ):
+        """
+        Inicializar la réplica (no sincroniza todavía).
+
+        Args:
+            path: Ruta del archivo SQLite local
+            primary_execute: Función que ejecuta una consulta en la primaria
+            tables: Tablas a replicar; None replica todas
+            sync_on_write: Resincronizar la tabla tras cada escritura
+        """
+        self.path = str(path)
+        self.tables: Optional[Set[str]] = {t.lower() for t in tables} if tables is not None else None
+        self.sync_on_write = sync_on_write
+        self._primary_execute = primary_execute
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._fresh_tables: Set[str] = set()
+        self._generation = 0
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        self._sync_connection = self._open_connection()
+        self._sync_connection.execute("PRAGMA journal_mode=WAL")
+
+        self._stop_event = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
+
+        self.last_sync_at: Optional[float] = None
+        self.local_reads = 0
+        self.primary_fallbacks = 0
+        self.sync_count = 0
+        self.sync_errors = 0
+
+    def is_replicated(self, table: str) -> bool:
+        """Indica si la tabla forma parte de la réplica."""
+        name = table.lower()
+        if name.startswith(("sqlite_", "libsql_", "_")):
+            return False
+        return self.tables is None or name in self.tables
+
+    def try_execute(self, query: str, params: Optional[list] = None) -> Optional[QueryResult]:
+        """
+        Intentar resolver una lectura en la réplica local.
+
+        Args:
+            query: Consulta SQL
+            params: Parámetros de la consulta
+
+        Returns:
+            QueryResult si la consulta se resolvió localmente, None si debe ir a la primaria.
+        """
+        if not self._fresh_tables or not is_read_query(query):
+            return None
+
+        connection = self._reader()
+        try:
+            cursor = connection.execute(query, params or ())
+            rows = cursor.fetchall()
+        except sqlite3.DatabaseError:
+            # Tabla no replicada, desactualizada o inexistente localmente
+            self.primary_fallbacks += 1
+            return None
+
+        self.local_reads += 1
+        columns = tuple(description[0] for description in cursor.description or ())
+        return QueryResult.from_values(columns, rows)
+
+    def notify_write(self, query: str) -> None:
+        """Registrar una escritura ejecutada en la primaria (ver notify_writes)."""
+        self.notify_writes([query])
+
+    def notify_writes(self, queries: Iterable[str]) -> None:
+        """
+        Registrar escrituras ejecutadas en la primaria.
+
+        Resincroniza (o marca como desactualizadas) las tablas afectadas. Nunca
+        lanza excepciones: las escrituras ya se confirmaron en la primaria.
+        """
+        affected: Optional[Set[str]] = set()
+        for query in queries:
+            if is_read_query(query):
+                continue
+            if SCHEMA_CHANGE_PATTERN.match(query):
+                affected = None
+                break
+            match = WRITE_QUERY_PATTERN.match(query)
+            if match and self.is_replicated(match.group(1)):
+                affected.add(match.group(1).lower())
+
+        if affected is not None and not affected:
+            return
+
+        self._mark_stale(affected)
+        if self.sync_on_write:
+            try:
+                self.sync(affected)
+            except Exception as e:
+                self.sync_errors += 1
+                print(f"⚠️  Error al sincronizar réplica local tras escritura: {str(e)}")
+
+    def sync(self, tables: Optional[Set[str]] = None) -> int:
+        """
+        Copiar desde la primaria el esquema y los datos de las tablas replicadas.
+
+        La copia se aplica en una única transacción local: los lectores siguen
+        viendo el snapshot anterior (WAL) hasta el COMMIT.
+
+        Args:
+            tables: Subconjunto de tablas a sincronizar (None = todas las replicadas)
+
+        Returns:
+            Número de tablas sincronizadas.
+        """
+        with self._sync_lock:
+            schema = self._primary_execute(
+                "SELECT type, name, tbl_name, sql FROM sqlite_master "
+                "WHERE type IN ('table', 'index') AND sql IS NOT NULL"
+            )
+            table_sql: Dict[str, str] = {}
+            index_sql: Dict[str, List[str]] = defaultdict(list)
+            for object_type, name, table_name, sql in (tuple(row) for row in schema.rows):
+                if object_type == "table":
+                    table_sql[name] = sql
+                else:
+                    index_sql[table_name].append(sql)
+
+            targets = [
+                name for name in table_sql
+                if self.is_replicated(name) and (tables is None or name.lower() in tables)
+            ]
+            snapshots = {name: self._primary_execute(f'SELECT * FROM "{name}"') for name in targets}
+
+            connection = self._sync_connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for name in targets:
+                    connection.execute(f'DROP TABLE IF EXISTS "{name}"')
+                    connection.execute(table_sql[name])
+                    for sql in index_sql[name]:
+                        connection.execute(sql)
+                    snapshot = snapshots[name]
+                    if snapshot.rows:
+                        placeholders = ", ".join("?" for _ in snapshot.columns)
+                        connection.executemany(
+                            f'INSERT INTO "{name}" VALUES ({placeholders})',
+                            [tuple(row) for row in snapshot.rows],
+                        )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+            self._fresh_tables |= {name.lower() for name in targets}
+            self._generation += 1
+            self.last_sync_at = time.time()
+            self.sync_count += 1
+            return len(targets)
+
+    def start_periodic_sync(self, interval_seconds: float) -> None:
+        """Iniciar un hilo que resincroniza la réplica cada interval_seconds."""
+        if interval_seconds <= 0 or self._sync_thread is not None:
+            return
+
+        def run() -> None:
+            while not self._stop_event.wait(interval_seconds):
+                try:
+                    self.sync()
+                except Exception as e:
+                    self.sync_errors += 1
+                    print(f"⚠️  Error en sincronización periódica de réplica local: {str(e)}")
+
+        self._sync_thread = threading.Thread(target=run, name="local-replica-sync", daemon=True)
+        self._sync_thread.start()
+
+    def stats(self) -> dict:
+        """Obtener métricas de la réplica."""
+        return {
+            "path": self.path,
+            "fresh_tables": sorted(self._fresh_tables),
+            "last_sync_at": self.last_sync_at,
+            "local_reads": self.local_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+            "sync_count": self.sync_count,
+            "sync_errors": self.sync_errors,
+        }
+
+    def close(self) -> None:
+        """Detener la sincronización periódica y cerrar la conexión de sincronización."""
+        self._stop_event.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join(timeout=5)
+            self._sync_thread = None
+        self._sync_connection.close()
+
+    def _mark_stale(self, tables: Optional[Set[str]]) -> None:
+        if tables is None:
+            self._fresh_tables = set()
+        else:
+            self._fresh_tables = self._fresh_tables - tables
+        self._generation += 1
+
+    def _reader(self) -> sqlite3.Connection:
+        """
+        Obtener la conexión de lectura del hilo actual.
+
+        Se recrea cuando cambia el conjunto de tablas vigentes para que ninguna
+        sentencia preparada (y ya autorizada) siga leyendo una tabla desactualizada.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.generation != self._generation:
+            if connection is not None:
+                connection.close()
+            generation = self._generation
+            allowed = frozenset(self._fresh_tables)
+            connection = self._open_connection()
+            connection.set_authorizer(self._build_authorizer(allowed))
+            self._local.connection = connection
+            self._local.generation = generation
+        return connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, isolation_level=None)
+
+    @staticmethod
+    def _build_authorizer(allowed_tables: frozenset):
+        def authorizer(action, arg1, arg2, db_name, trigger):
+            if action == sqlite3.SQLITE_READ:
+                if arg1 and arg1.lower() in allowed_tables:
+                    return sqlite3.SQLITE_OK
+                return sqlite3.SQLITE_DENY
+            if action in _ALLOWED_READ_ACTIONS:
+                return sqlite3.SQLITE_OK
+            return sqlite3.SQLITE_DENY
+
+        return authorizer
@@ -0,0 +1,26 @@
+CREATE TABLE
+    IF NOT EXISTS users (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL UNIQUE,
+        phone TEXT,
+        password_hash TEXT NOT NULL,
+        role_id TEXT NOT NULL,
+        failed_login_attempts INTEGER NOT NULL DEFAULT 0,
+        locked_until TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+
+CREATE TABLE
+    IF NOT EXISTS login_attempts (
+        id TEXT PRIMARY KEY,
+        email TEXT NOT NULL,
+        success INTEGER NOT NULL DEFAULT 0,
+        ip_address TEXT,
+        created_at TEXT NOT NULL
+    );
+
+CREATE INDEX IF NOT EXISTS idx_users_role_id ON users (role_id);
+
+CREATE INDEX IF NOT EXISTS idx_login_attempts_email ON login_attempts (email, created_at);
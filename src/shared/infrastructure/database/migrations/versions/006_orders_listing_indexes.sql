@@ -0,0 +1,9 @@
+CREATE INDEX IF NOT EXISTS idx_orders_waiter_created ON orders (waiter_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_orders_waiter_status_created ON orders (waiter_id, status, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_orders_status_created ON orders (status, created_at, id);
+
+DROP INDEX IF EXISTS idx_orders_waiter_id;
+
+DROP INDEX IF EXISTS idx_orders_status;
@@ -0,0 +1,4 @@
+CREATE TABLE
+    IF NOT EXISTS stock_deduction_guard (
+        ok INTEGER NOT NULL CHECK (ok = 1)
+    );
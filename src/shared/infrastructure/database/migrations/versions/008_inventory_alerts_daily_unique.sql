@@ -0,0 +1,13 @@
+-- Conservar una sola alerta diaria por articulo, tipo y fecha antes de crear la restriccion
+DELETE FROM inventory_alerts
+WHERE check_date IS NOT NULL
+  AND rowid NOT IN (
+      SELECT MIN(rowid)
+      FROM inventory_alerts
+      WHERE check_date IS NOT NULL
+      GROUP BY inventory_item_id, alert_type, check_date
+  );
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_inventory_alerts_item_type_check_date
+ON inventory_alerts (inventory_item_id, alert_type, check_date)
+WHERE check_date IS NOT NULL;
@@ -0,0 +1,37 @@
+-- Tablas de roles y permisos: main.py las crea despues de migrar, aqui se garantizan antes del ALTER
+CREATE TABLE IF NOT EXISTS roles (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS permissions (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS role_permissions (
+    id TEXT PRIMARY KEY,
+    role_id TEXT NOT NULL,
+    permission_id TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(role_id, permission_id)
+);
+
+-- Posicion fija del permiso en la mascara de bits que viaja en el JWT
+ALTER TABLE permissions ADD COLUMN bit INTEGER;
+
+UPDATE permissions
+SET bit = (
+    SELECT COUNT(*)
+    FROM permissions AS previous
+    WHERE previous.name < permissions.name
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_permissions_bit ON permissions (bit);
+
+-- Se incrementa con cada cambio de permisos del rol, los tokens con otra version se rechazan
+ALTER TABLE roles ADD COLUMN permissions_version INTEGER NOT NULL DEFAULT 1;
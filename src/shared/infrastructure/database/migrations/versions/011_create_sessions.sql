@@ -0,0 +1,16 @@
+-- Sesiones de refresh token: una fila por login, el hash del refresh token vigente rota en cada renovacion
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    refresh_token_hash TEXT NOT NULL,
+    ip_address TEXT,
+    created_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL,
+    rotated_at TEXT,
+    revoked_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions (user_id);
+
+-- Carga del filtro de sesiones revocadas (solo las que aun no expiraron)
+CREATE INDEX IF NOT EXISTS idx_sessions_revoked_at ON sessions (revoked_at) WHERE revoked_at IS NOT NULL;
@@ -0,0 +1,16 @@
+-- Busquedas sin distinguir mayusculas: los repositorios filtran por LOWER(columna) = LOWER(?)
+-- y SQLite solo usa un indice si esta definido sobre la misma expresion
+
+CREATE INDEX IF NOT EXISTS idx_users_email_lower ON users (LOWER(email));
+
+-- Conteo de fallos recientes e historial por email (ordenado por fecha)
+CREATE INDEX IF NOT EXISTS idx_login_attempts_email_lower_created ON login_attempts (LOWER(email), created_at);
+
+-- Reemplazado por el indice sobre LOWER(email): ninguna consulta filtra por email sin LOWER
+DROP INDEX IF EXISTS idx_login_attempts_email;
+
+CREATE INDEX IF NOT EXISTS idx_roles_name_lower ON roles (LOWER(name));
+
+CREATE INDEX IF NOT EXISTS idx_permissions_name_lower ON permissions (LOWER(name));
+
+CREATE INDEX IF NOT EXISTS idx_inventory_items_name_lower ON inventory_items (LOWER(name));
@@ -0,0 +1,26 @@
+-- Retencion de login_attempts: los intentos se resumen por dia, email e IP antes de borrarlos
+-- ip_address vacio ('') representa intentos sin IP (NULL no sirve en la clave primaria)
+CREATE TABLE IF NOT EXISTS login_attempt_daily_stats (
+    day TEXT NOT NULL,
+    email TEXT NOT NULL,
+    ip_address TEXT NOT NULL DEFAULT '',
+    success_count INTEGER NOT NULL DEFAULT 0,
+    failure_count INTEGER NOT NULL DEFAULT 0,
+    first_attempt_at TEXT NOT NULL,
+    last_attempt_at TEXT NOT NULL,
+    PRIMARY KEY (day, email, ip_address)
+);
+
+-- Consultas de auditoria por email en un rango de dias (email ya se guarda en minusculas)
+CREATE INDEX IF NOT EXISTS idx_login_attempt_daily_stats_email_day ON login_attempt_daily_stats (email, day);
+
+-- Ultimo dia completo resumido. El borrado nunca pasa de este dia, asi un dia solo se resume
+-- mientras conserva todas sus filas y volver a resumirlo da el mismo resultado
+CREATE TABLE IF NOT EXISTS login_attempt_rollup_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    rolled_up_through TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- Rangos por fecha del resumen diario y del borrado por lotes (los mas antiguos primero)
+CREATE INDEX IF NOT EXISTS idx_login_attempts_created_at ON login_attempts (created_at);
@@ -0,0 +1,10 @@
+-- Concurrencia optimista en pedidos: cada cambio de estado incrementa version y el UPDATE
+-- condicional (WHERE id = ? AND status IN (...) AND version = ?) no pisa cambios ajenos
+ALTER TABLE orders ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+
+-- Si el UPDATE del estado no cambia ninguna fila se inserta ok = 0, el CHECK falla y se
+-- revierte el batch completo (incluido el descuento de inventario de pending a preparing)
+CREATE TABLE
+    IF NOT EXISTS order_transition_guard (
+        ok INTEGER NOT NULL CHECK (ok = 1)
+    );
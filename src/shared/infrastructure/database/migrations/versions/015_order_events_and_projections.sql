@@ -0,0 +1,94 @@
+-- Historial de pedidos solo de insercion: un evento por creacion y por cambio de estado,
+-- escrito en el mismo batch que el cambio. seq da el orden global para reproducir
+CREATE TABLE IF NOT EXISTS order_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    order_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    from_status TEXT,
+    to_status TEXT NOT NULL,
+    service_type TEXT NOT NULL,
+    version INTEGER,
+    actor_id TEXT,
+    preparation_time INTEGER,
+    total_time INTEGER,
+    payload TEXT,
+    occurred_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_order_events_order_seq ON order_events (order_id, seq);
+
+-- Proyeccion del estado actual: pedidos por modalidad y estado
+CREATE TABLE IF NOT EXISTS order_status_counts (
+    service_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    order_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (service_type, status)
+);
+
+-- Proyeccion de tiempos por modalidad y dia (promedios = total / cantidad)
+CREATE TABLE IF NOT EXISTS order_timing_stats (
+    service_type TEXT NOT NULL,
+    day TEXT NOT NULL,
+    ready_count INTEGER NOT NULL DEFAULT 0,
+    preparation_time_total INTEGER NOT NULL DEFAULT 0,
+    preparation_time_max INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    total_time_total INTEGER NOT NULL DEFAULT 0,
+    total_time_max INTEGER NOT NULL DEFAULT 0,
+    cancelled_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (service_type, day)
+);
+
+-- Historial reconstruido de los pedidos existentes a partir de sus columnas de tiempo
+-- (version NULL y payload backfilled). Se inserta en orden cronologico por pedido
+INSERT INTO order_events (
+    event_id, order_id, event_type, from_status, to_status, service_type,
+    version, actor_id, preparation_time, total_time, payload, occurred_at
+)
+SELECT 'backfill-' || step || '-' || order_id, order_id, event_type, from_status, to_status, service_type,
+       NULL, actor_id, preparation_time, total_time, '{"backfilled": true}', occurred_at
+FROM (
+    SELECT 1 AS step, id AS order_id, 'order.created' AS event_type, NULL AS from_status, 'pending' AS to_status,
+           service_type, waiter_id AS actor_id, NULL AS preparation_time, NULL AS total_time, created_at AS occurred_at
+    FROM orders
+    UNION ALL
+    SELECT 2, id, 'order.status_changed', 'pending', 'preparing', service_type, NULL, NULL, NULL, preparation_started_at
+    FROM orders WHERE preparation_started_at IS NOT NULL
+    UNION ALL
+    SELECT 3, id, 'order.status_changed', 'preparing', 'ready', service_type, NULL, preparation_time, NULL, ready_at
+    FROM orders WHERE ready_at IS NOT NULL
+    UNION ALL
+    SELECT 4, id, 'order.status_changed', 'ready', status, service_type, NULL, NULL, total_time, completed_at
+    FROM orders WHERE completed_at IS NOT NULL AND status IN ('served', 'delivered')
+    UNION ALL
+    SELECT 5, id, 'order.status_changed',
+           CASE WHEN ready_at IS NOT NULL THEN 'ready' WHEN preparation_started_at IS NOT NULL THEN 'preparing' ELSE 'pending' END,
+           'cancelled', service_type, cancelled_by, NULL, NULL, cancelled_at
+    FROM orders WHERE status = 'cancelled' AND cancelled_at IS NOT NULL
+)
+WHERE NOT EXISTS (SELECT 1 FROM order_events)
+ORDER BY order_id, step;
+
+-- Proyecciones calculadas desde el historial (misma consulta que OrderEventRepository.rebuild_projections)
+INSERT OR REPLACE INTO order_status_counts (service_type, status, order_count)
+SELECT service_type, to_status, COUNT(*)
+FROM order_events e
+WHERE seq = (SELECT MAX(seq) FROM order_events WHERE order_id = e.order_id)
+GROUP BY service_type, to_status;
+
+INSERT OR REPLACE INTO order_timing_stats (
+    service_type, day, ready_count, preparation_time_total, preparation_time_max,
+    completed_count, total_time_total, total_time_max, cancelled_count
+)
+SELECT service_type, substr(occurred_at, 1, 10),
+       SUM(to_status = 'ready'),
+       SUM(CASE WHEN to_status = 'ready' THEN COALESCE(preparation_time, 0) ELSE 0 END),
+       MAX(CASE WHEN to_status = 'ready' THEN COALESCE(preparation_time, 0) ELSE 0 END),
+       SUM(to_status IN ('served', 'delivered')),
+       SUM(CASE WHEN to_status IN ('served', 'delivered') THEN COALESCE(total_time, 0) ELSE 0 END),
+       MAX(CASE WHEN to_status IN ('served', 'delivered') THEN COALESCE(total_time, 0) ELSE 0 END),
+       SUM(to_status = 'cancelled')
+FROM order_events
+WHERE event_type = 'order.status_changed'
+GROUP BY service_type, substr(occurred_at, 1, 10);
@@ -0,0 +1,3 @@
+-- El trabajo programado de limpieza borra por lotes las sesiones expiradas
+-- (WHERE expires_at < ? ORDER BY expires_at LIMIT ?)
+CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at);
@@ -0,0 +1,9 @@
+-- Valores de configuracion que deben ser iguales en todos los workers.
+-- Por ejemplo, el coste de bcrypt calibrado en el primer arranque
+-- (clave password_hash_rounds): el primero que lo inserta fija el valor
+-- y el resto lo lee.
+CREATE TABLE IF NOT EXISTS app_settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
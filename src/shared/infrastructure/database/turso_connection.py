@@ -1,87 +1,230 @@
 """
 Conexión a Turso DB (LibSQL) - Capa de Infraestructura.
 Este módulo maneja la conexión a la base de datos Turso usando el patrón Singleton.
+El Singleton es una fachada síncrona sobre un driver de base de datos elegido
+por el esquema de la URL (ver drivers/): un pool asíncrono de clientes libsql
+para Turso, o sqlite3 sobre un archivo local para file: / sqlite:. Los endpoints
+async (login, registro, alta masiva) esperan execute_async, que no bloquea su
+event loop mientras dura el viaje a la base. Opcionalmente,
+las lecturas se sirven desde una réplica local embebida (ver local_replica.py).
+Dentro de una UnitOfWork las escrituras se acumulan y se confirman en un único
+batch (ver unit_of_work.py).
 """
-from typing import Optional
-from libsql_client import create_client_sync
+import asyncio
+from typing import List, Optional
 
 from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.database.drivers import DatabaseDriver, QueryResult, create_driver
+from src.shared.infrastructure.database.local_replica import LocalReplica
+from src.shared.infrastructure.database.unit_of_work import current_unit_of_work, is_read_query
 
 
 class TursoConnection:
     """
     Clase Singleton para manejar la conexión a Turso DB.
-    Asegura que solo exista una instancia de la conexión en toda la aplicación.
+    Asegura que solo exista una instancia del driver (y de su pool) en toda la aplicación.
     """
-    
+
     _instance: Optional["TursoConnection"] = None
-    _client = None
-    
+    _driver: Optional[DatabaseDriver] = None
+    _replica: Optional[LocalReplica] = None
+
     def __new__(cls):
         """Implementación del patrón Singleton."""
         if cls._instance is None:
             cls._instance = super(TursoConnection, cls).__new__(cls)
         return cls._instance
-    
+
     def __init__(self):
         """Inicializar la conexión (solo se ejecuta una vez)."""
-        if self._client is None:
+        if self._driver is None:
             self._connect()
-    
+
     def _connect(self) -> None:
-        """Establecer la conexión con Turso DB."""
+        """Crear el driver de base de datos según la URL configurada."""
         try:
-            self._client = create_client_sync(
-                url=settings.TURSO_DATABASE_URL,
-                auth_token=settings.TURSO_AUTH_TOKEN
-            )
-            print(f"✅ Conexión exitosa a Turso DB ({settings.ENVIRONMENT})")
+            self._driver = create_driver(settings.TURSO_DATABASE_URL, settings.TURSO_AUTH_TOKEN)
+            if self._driver.is_local:
+                print(f"✅ Conexión exitosa a SQLite local ({settings.ENVIRONMENT}) - {settings.TURSO_DATABASE_URL}")
+            else:
+                print(
+                    f"✅ Conexión exitosa a Turso DB ({settings.ENVIRONMENT}) - "
+                    f"pool de hasta {settings.DB_POOL_MAX_SIZE} conexiones"
+                )
+            if settings.DB_REPLICA_ENABLED:
+                if self._driver.is_local:
+                    print("ℹ️  Réplica local deshabilitada: la base de datos ya es un archivo local")
+                else:
+                    self._open_replica()
         except Exception as e:
-            print(f"❌ Error al conectar con Turso DB: {str(e)}")
+            print(f"❌ Error al conectar con la base de datos: {str(e)}")
+            if self._driver is not None:
+                self._driver.close()
+            self._driver = None
             raise
-    
+
+    def _open_replica(self) -> None:
+        """Crear y sincronizar la réplica local de lectura."""
+        self._replica = LocalReplica(
+            path=settings.DB_REPLICA_PATH,
+            primary_execute=self._execute_on_primary,
+            tables=settings.replica_tables,
+            sync_on_write=settings.DB_REPLICA_SYNC_ON_WRITE,
+        )
+        synced = self._replica.sync()
+        self._replica.start_periodic_sync(settings.DB_REPLICA_SYNC_INTERVAL_SECONDS)
+        print(f"✅ Réplica local sincronizada ({synced} tablas) en {settings.DB_REPLICA_PATH}")
+
+    @property
+    def driver(self) -> DatabaseDriver:
+        """
+        Obtener el driver de base de datos.
+
+        Raises:
+            RuntimeError: Si no se ha establecido la conexión.
+        """
+        if self._driver is None:
+            raise RuntimeError("No hay conexión activa con la base de datos")
+        return self._driver
+
     @property
-    def client(self):
+    def client(self) -> "TursoConnection":
         """
-        Obtener el cliente de conexión a Turso DB.
-        
+        Obtener el cliente de conexión a la base de datos.
+
+        La propia instancia actúa como cliente: expone execute() y batch()
+        con la misma firma que el cliente síncrono de libsql, delegando en el
+        driver configurado.
+
         Returns:
-            Client: Cliente de libsql para ejecutar consultas.
-        
+            TursoConnection: Fachada para ejecutar consultas.
+
         Raises:
             RuntimeError: Si no se ha establecido la conexión.
         """
-        if self._client is None:
-            raise RuntimeError("No hay conexión activa con Turso DB")
-        return self._client
-    
+        if self._driver is None:
+            raise RuntimeError("No hay conexión activa con la base de datos")
+        return self
+
     def execute(self, query: str, params: Optional[list] = None):
         """
         Ejecutar una consulta SQL.
-        
+
+        Args:
+            query: Consulta SQL a ejecutar.
+            params: Parámetros para la consulta (opcional).
+
+        Returns:
+            Resultado de la consulta. Una escritura dentro de una UnitOfWork
+            se acumula y devuelve un resultado vacío.
+        """
+        if self._defer_to_unit_of_work(query, params):
+            return QueryResult.from_values((), [])
+
+        if self._replica is not None:
+            local_result = self._replica.try_execute(query, params)
+            if local_result is not None:
+                return local_result
+
+        result = self._execute_on_primary(query, params)
+        if self._replica is not None:
+            self._replica.notify_write(query)
+        return result
+
+    @staticmethod
+    def _defer_to_unit_of_work(query: str, params: Optional[list]) -> bool:
+        """Encolar la escritura en la UnitOfWork activa; False si no hay o es una lectura."""
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is None or is_read_query(query):
+            return False
+        unit_of_work.add(query, params)
+        return True
+
+    def _execute_on_primary(self, query: str, params: Optional[list] = None) -> QueryResult:
+        """Ejecutar una consulta en la base de datos primaria a través del driver."""
+        try:
+            return self.driver.execute(query, params)
+        except Exception as e:
+            print(f"❌ Error al ejecutar consulta: {str(e)}")
+            raise
+
+    async def execute_async(self, query: str, params: Optional[list] = None):
+        """
+        Ejecutar una consulta SQL desde código asíncrono sin bloquear el event loop.
+
         Args:
             query: Consulta SQL a ejecutar.
             params: Parámetros para la consulta (opcional).
-        
+
         Returns:
             Resultado de la consulta.
         """
+        if self._defer_to_unit_of_work(query, params):
+            return QueryResult.from_values((), [])
+
+        if self._replica is not None:
+            local_result = self._replica.try_execute(query, params)
+            if local_result is not None:
+                return local_result
+
         try:
-            if params:
-                result = self.client.execute(query, params)
-            else:
-                result = self.client.execute(query)
-            return result
+            result = await self.driver.execute_async(query, params)
         except Exception as e:
             print(f"❌ Error al ejecutar consulta: {str(e)}")
             raise
-    
+
+        if self._replica is not None:
+            await asyncio.to_thread(self._replica.notify_write, query)
+        return result
+
+    def batch(self, statements: List) -> List:
+        """
+        Ejecutar varias sentencias en un único viaje y de forma atómica.
+
+        Args:
+            statements: Lista de sentencias (str o tuplas (sql, params)).
+
+        Returns:
+            Lista de resultados, uno por sentencia.
+        """
+        unit_of_work = current_unit_of_work()
+        if unit_of_work is not None:
+            for statement in statements:
+                if isinstance(statement, str):
+                    unit_of_work.add(statement)
+                else:
+                    unit_of_work.add(*statement)
+            return [QueryResult.from_values((), []) for _ in statements]
+
+        try:
+            results = self.driver.batch(statements)
+        except Exception as e:
+            print(f"❌ Error al ejecutar lote de consultas: {str(e)}")
+            raise
+
+        if self._replica is not None:
+            self._replica.notify_writes(
+                statement if isinstance(statement, str) else statement[0] for statement in statements
+            )
+        return results
+
+    def pool_stats(self) -> dict:
+        """Obtener métricas del driver (pool de conexiones o SQLite local)."""
+        return self.driver.stats()
+
+    def replica_stats(self) -> Optional[dict]:
+        """Obtener métricas de la réplica local (None si está deshabilitada)."""
+        return self._replica.stats() if self._replica is not None else None
+
     def close(self) -> None:
-        """Cerrar la conexión con Turso DB."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
-            print("🔌 Conexión cerrada con Turso DB")
+        """Cerrar todas las conexiones con la base de datos."""
+        if self._replica is not None:
+            self._replica.close()
+            self._replica = None
+        if self._driver is not None:
+            self._driver.close()
+            self._driver = None
+            print("🔌 Conexión cerrada con la base de datos")
 
 
 # Instancia global de la conexión
@@ -92,10 +235,10 @@ turso_db = TursoConnection()
 def get_turso_client():
     """
     Obtener el cliente de Turso DB para usar en repositorios.
-    
+
     Returns:
-        Client: Cliente de libsql.
-    
+        TursoConnection: Fachada sobre el driver de base de datos.
+
     Example:
         >>> client = get_turso_client()
         >>> result = client.execute("SELECT * FROM users")
@@ -0,0 +1,116 @@
+"""
+Unidad de trabajo (Unit of Work) - Capa de Infraestructura.
+
+Agrupa las escrituras de uno o varios repositorios y las confirma juntas en un
+único batch atómico de la base de datos (un solo viaje de red). Si algo falla
+antes de confirmar, o si alguna sentencia del batch falla, no se aplica nada.
+
+Uso:
+    with UnitOfWork():
+        inventory_repo.deduct_stock_bulk([(item_id, 2)])
+        order_repo.transition_status(order_id, OrderStatus.PREPARING, datetime.now())
+    # Aquí ambas escrituras ya están confirmadas (o ninguna).
+
+Mientras la unidad está activa, las escrituras que pasan por la conexión
+global (TursoConnection) se acumulan en lugar de ejecutarse; las lecturas se
+ejecutan de inmediato contra el estado confirmado, por lo que no ven las
+escrituras pendientes de la propia unidad. Una unidad anidada se une a la
+exterior: solo la más externa confirma.
+"""
+import re
+from contextvars import ContextVar, Token
+from typing import Callable, List, Optional, Tuple
+
+# SELECT / WITH / EXPLAIN y PRAGMA de consulta (sin asignación)
+READ_QUERY_PATTERN = re.compile(r"^\s*(?:(?:SELECT|WITH|EXPLAIN)\b|PRAGMA\b[^=]*$)", re.IGNORECASE)
+
+_current_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar("unit_of_work", default=None)
+
+
+def is_read_query(query: str) -> bool:
+    """Indica si la sentencia solo lee datos (se ejecuta aunque haya una unidad activa)."""
+    return bool(READ_QUERY_PATTERN.match(query))
+
+
+def current_unit_of_work() -> Optional["UnitOfWork"]:
+    """Unidad de trabajo activa en el contexto actual (None si no hay)."""
+    return _current_unit_of_work.get()
+
+
+class UnitOfWork:
+    """
+    Contexto transaccional que abarca varios repositorios.
+
+    Attributes:
+        statements: Escrituras pendientes (sql, params) en orden de ejecución
+    """
+
+    def __init__(self, client=None):
+        """
+        Args:
+            client: Cliente con método batch() (por defecto, la conexión global)
+        """
+        self._client = client
+        self.statements: List[Tuple[str, list]] = []
+        self._failure_handlers: List[Callable[[Exception], None]] = []
+        self._token: Optional[Token] = None
+        self._outer: Optional["UnitOfWork"] = None
+
+    def __enter__(self) -> "UnitOfWork":
+        outer = _current_unit_of_work.get()
+        if outer is not None:
+            self._outer = outer
+            return outer
+        self._token = _current_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._outer is not None:
+            self._outer = None
+            return False
+
+        _current_unit_of_work.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def add(self, query: str, params: Optional[list] = None) -> None:
+        """Encolar una escritura para la confirmación."""
+        self.statements.append((query, list(params or [])))
+
+    def on_failure(self, handler: Callable[[Exception], None]) -> None:
+        """
+        Registrar un diagnóstico a ejecutar si el batch falla al confirmar.
+
+        El handler recibe el error de la base de datos y puede lanzar una
+        excepción más descriptiva; si no lanza nada se propaga el error original.
+        """
+        self._failure_handlers.append(handler)
+
+    def commit(self) -> None:
+        """Ejecutar todas las escrituras pendientes en un único batch atómico."""
+        statements, self.statements = self.statements, []
+        handlers, self._failure_handlers = self._failure_handlers, []
+        if not statements:
+            return
+        try:
+            self._get_client().batch(statements)
+        except Exception as error:
+            for handler in handlers:
+                handler(error)
+            raise
+
+    def rollback(self) -> None:
+        """Descartar las escrituras pendientes."""
+        self.statements = []
+        self._failure_handlers = []
+
+    def _get_client(self):
+        if self._client is None:
+            from src.shared.infrastructure.database.turso_connection import get_turso_client
+
+            self._client = get_turso_client()
+        return self._client
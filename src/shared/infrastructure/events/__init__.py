@@ -0,0 +1,6 @@
+"""
+Broker de eventos en memoria del proceso (publicar/suscribir).
+"""
+from src.shared.infrastructure.events.event_broker import BrokerEvent, EventBroker, Subscription, SubscriptionClosed
+
+__all__ = ["BrokerEvent", "EventBroker", "Subscription", "SubscriptionClosed"]
@@ -0,0 +1,249 @@
+"""
+Broker de eventos publicar/suscribir en memoria - Capa de Infraestructura.
+
+Los publicadores (casos de uso que corren en el threadpool de FastAPI) llaman
+a publish() desde cualquier hilo. Cada evento recibe un id "<época>-<secuencia>":
+la época es aleatoria y propia de cada broker (cada proceso) y la secuencia
+crece dentro de ella. El evento se guarda en un historial acotado y se entrega a los suscriptores cuyo filtro lo acepta.
+Los suscriptores (endpoints SSE / WebSocket) esperan en el event loop con
+Subscription.get().
+
+Cada suscriptor tiene una cola acotada. Si un consumidor lento la llena, se le
+expulsa en lugar de acumular memoria o frenar al publicador. El cliente vuelve a
+conectarse con el último id que procesó y recibe lo que se perdió desde el
+historial. Si ese id ya salió del historial, o es de otra época (un proceso
+anterior al reinicio u otro worker), la suscripción se marca con
+resync_required para que el cliente recargue completo.
+"""
+import asyncio
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+EventPredicate = Callable[["BrokerEvent"], bool]
+
+
+@dataclass(frozen=True)
+class BrokerEvent:
+    """
+    Evento publicado; `attributes` son los campos por los que filtran los suscriptores.
+
+    Attributes:
+        epoch: Época del broker que lo publicó
+        sequence: Posición dentro de la época (1, 2, 3...)
+    """
+    epoch: str
+    sequence: int
+    type: str
+    data: Dict[str, Any]
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = ""
+
+    @property
+    def id(self) -> str:
+        """Id que ven los clientes (Last-Event-ID): "<época>-<secuencia>"."""
+        return f"{self.epoch}-{self.sequence}"
+
+    def to_message(self) -> Dict[str, Any]:
+        return {"id": self.id, "type": self.type, "created_at": self.created_at, "data": self.data}
+
+
+class SubscriptionClosed(Exception):
+    """La suscripción se cerró (consumidor lento o broker detenido)."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+        super().__init__(reason)
+
+
+class Subscription:
+    """
+    Cola de eventos de un suscriptor, consumida desde el event loop.
+
+    Attributes:
+        resync_required: El id de reanudación ya no está en el historial; el cliente
+            debe recargar el estado completo
+        closed_reason: Motivo del cierre (None mientras está abierta)
+    """
+
+    def __init__(self, predicate: EventPredicate, max_queue_size: int, loop: asyncio.AbstractEventLoop):
+        self.predicate = predicate
+        self.max_queue_size = max_queue_size
+        self.resync_required = False
+        self.closed_reason: Optional[str] = None
+        self._queue: Deque[BrokerEvent] = deque()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[BrokerEvent]:
+        """
+        Siguiente evento, o None si pasa `timeout` sin eventos (para enviar keepalive).
+
+        Raises:
+            SubscriptionClosed: Si la suscripción fue cerrada
+        """
+        while True:
+            # popleft es atómico respecto a los append del publicador (deque)
+            if self.closed_reason is not None:
+                raise SubscriptionClosed(self.closed_reason)
+            if self._queue:
+                return self._queue.popleft()
+            self._wakeup.clear()
+            if self._queue or self.closed_reason is not None:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def _offer(self, event: BrokerEvent) -> bool:
+        """Encolar un evento (con el lock del broker). False si la cola está llena."""
+        if len(self._queue) >= self.max_queue_size:
+            return False
+        self._queue.append(event)
+        self._notify()
+        return True
+
+    def _close(self, reason: str) -> None:
+        self.closed_reason = reason
+        self._queue.clear()
+        self._notify()
+
+    def _notify(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # El loop del suscriptor ya terminó
+            pass
+
+
+class EventBroker:
+    """
+    Broker publicar/suscribir con historial para reanudar y colas acotadas.
+
+    Attributes:
+        history_size: Eventos recientes que se conservan para reanudar
+        max_queue_size: Eventos pendientes por suscriptor antes de expulsarlo
+        epoch: Prefijo de los ids de este broker; cambia en cada arranque
+    """
+
+    def __init__(self, history_size: int = 1000, max_queue_size: int = 256):
+        self.history_size = max(1, history_size)
+        self.max_queue_size = max(1, max_queue_size)
+        self.epoch = uuid.uuid4().hex[:12]
+        self._history: Deque[BrokerEvent] = deque(maxlen=self.history_size)
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._published_total = 0
+        self._delivered_total = 0
+        self._evicted_total = 0
+        self._resyncs_total = 0
+
+    def publish(self, event_type: str, data: Dict[str, Any], attributes: Optional[Dict[str, Any]] = None) -> BrokerEvent:
+        """Publicar un evento (seguro desde cualquier hilo) y entregarlo a los suscriptores que lo aceptan."""
+        with self._lock:
+            self._last_id += 1
+            event = BrokerEvent(
+                epoch=self.epoch,
+                sequence=self._last_id,
+                type=event_type,
+                data=data,
+                attributes=attributes or {},
+                created_at=datetime.now().isoformat(),
+            )
+            self._history.append(event)
+            self._published_total += 1
+            for subscription in list(self._subscriptions):
+                if not self._matches(subscription, event):
+                    continue
+                if subscription._offer(event):
+                    self._delivered_total += 1
+                else:
+                    self._evict(subscription)
+        return event
+
+    def subscribe(self, predicate: Optional[EventPredicate] = None, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Suscribirse desde el event loop.
+
+        Args:
+            predicate: Filtro de eventos (None = todos)
+            last_event_id: Último id que recibió el cliente; se reenvían los
+                posteriores que sigan en el historial. Un id de otra época o
+                con otro formato pide resync.
+
+        Returns:
+            Suscripción con los eventos perdidos ya encolados (o resync_required)
+        """
+        subscription = Subscription(predicate or (lambda event: True), self.max_queue_size, asyncio.get_running_loop())
+        with self._lock:
+            if last_event_id is not None:
+                sequence = self._sequence_of(last_event_id)
+                oldest_sequence = self._history[0].sequence if self._history else self._last_id + 1
+                if sequence is None or sequence > self._last_id or sequence < oldest_sequence - 1:
+                    subscription.resync_required = True
+                    self._resyncs_total += 1
+                else:
+                    # La reanudación puede superar la cola: se entrega completa
+                    for event in self._history:
+                        if event.sequence > sequence and self._matches(subscription, event):
+                            subscription._queue.append(event)
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def close(self) -> None:
+        """Cerrar todas las suscripciones (al apagar la aplicación)."""
+        with self._lock:
+            for subscription in self._subscriptions:
+                subscription._close("shutdown")
+            self._subscriptions.clear()
+
+    @property
+    def last_event_id(self) -> str:
+        return f"{self.epoch}-{self._last_id}"
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscriptions),
+                "pending_max": max((s.pending() for s in self._subscriptions), default=0),
+                "epoch": self.epoch,
+                "last_event_id": self.last_event_id,
+                "history": len(self._history),
+                "published_total": self._published_total,
+                "delivered_total": self._delivered_total,
+                "evicted_total": self._evicted_total,
+                "resyncs_total": self._resyncs_total,
+            }
+
+    def _evict(self, subscription: Subscription) -> None:
+        """Expulsar a un consumidor lento (con el lock tomado)."""
+        subscription._close("slow_consumer")
+        self._subscriptions.remove(subscription)
+        self._evicted_total += 1
+
+    def _sequence_of(self, event_id: str) -> Optional[int]:
+        """Secuencia de un id de esta época; None si es de otra época o no tiene el formato."""
+        epoch, separator, sequence = str(event_id).rpartition("-")
+        if not separator or epoch != self.epoch or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+    @staticmethod
+    def _matches(subscription: Subscription, event: BrokerEvent) -> bool:
+        try:
+            return subscription.predicate(event)
+        except Exception:
+            return False
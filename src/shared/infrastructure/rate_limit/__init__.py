@@ -0,0 +1,6 @@
+"""
+Limitadores de tasa en memoria del proceso.
+"""
+from src.shared.infrastructure.rate_limit.sliding_window_limiter import SlidingWindowRateLimiter
+
+__all__ = ["SlidingWindowRateLimiter"]
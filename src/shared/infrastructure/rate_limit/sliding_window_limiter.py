@@ -0,0 +1,171 @@
+"""
+Limitador de tasa por ventana deslizante - Capa de Infraestructura.
+
+Cada clave (IP, email...) tiene un anillo fijo de `buckets` contadores que
+cubre `window_seconds`: el bucket actual es epoch % buckets y, al avanzar el
+tiempo, los buckets que salen de la ventana se ponen a cero. El total de la
+ventana se mantiene incrementalmente, así que cada comprobación es O(1) en
+memoria y sin consultar la base de datos ni calcular bcrypt.
+
+Las claves inactivas (todos sus buckets fuera de la ventana) se eliminan
+periódicamente y el número de claves está acotado. Seguro entre hilos.
+"""
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Hashable
+
+
+class _Window:
+    """Anillo de contadores de una clave."""
+
+    __slots__ = ("counts", "last_epoch", "total")
+
+    def __init__(self, buckets: int, epoch: int):
+        self.counts = array("I", bytes(4 * buckets))
+        self.last_epoch = epoch
+        self.total = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    Limitador de `limit` eventos por clave en cualquier ventana de `window_seconds`
+    (con la resolución de window_seconds / buckets).
+
+    Attributes:
+        limit: Eventos permitidos por ventana; 0 desactiva el limitador
+        window_seconds: Duración de la ventana
+        buckets: Contadores del anillo (resolución de la ventana)
+        max_keys: Claves en memoria; al superarlo se descartan las inactivas o las más antiguas
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        buckets: int = 10,
+        max_keys: int = 100000,
+        eviction_interval_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if window_seconds <= 0 or buckets <= 0:
+            raise ValueError("window_seconds y buckets deben ser mayores que 0")
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.buckets = buckets
+        self.max_keys = max_keys
+        self.eviction_interval_seconds = eviction_interval_seconds
+        self._bucket_seconds = window_seconds / buckets
+        self._clock = clock
+        self._windows: Dict[Hashable, _Window] = {}
+        self._lock = threading.Lock()
+        self._last_eviction = clock()
+        self._allowed_total = 0
+        self._rejected_total = 0
+        self._evicted_total = 0
+
+    def hit(self, key: Hashable) -> bool:
+        """
+        Registrar un evento de la clave.
+
+        Returns:
+            True si se permite; False si la clave ya alcanzó el límite
+            (el evento rechazado no se cuenta)
+        """
+        if self.limit <= 0:
+            return True
+        now = self._clock()
+        epoch = self._epoch(now)
+        with self._lock:
+            if now - self._last_eviction >= self.eviction_interval_seconds:
+                self._evict_expired(epoch)
+                self._last_eviction = now
+
+            window = self._windows.get(key)
+            if window is None:
+                if len(self._windows) >= self.max_keys:
+                    self._make_room(epoch)
+                window = self._windows[key] = _Window(self.buckets, epoch)
+            else:
+                self._advance(window, epoch)
+
+            if window.total >= self.limit:
+                self._rejected_total += 1
+                return False
+            window.counts[epoch % self.buckets] += 1
+            window.total += 1
+            self._allowed_total += 1
+            return True
+
+    def retry_after(self, key: Hashable) -> float:
+        """Segundos hasta que la clave vuelva a tener cupo (0 si ya lo tiene)."""
+        now = self._clock()
+        epoch = self._epoch(now)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                return 0.0
+            self._advance(window, epoch)
+            if window.total < self.limit:
+                return 0.0
+            remaining = window.total
+            for oldest_epoch in range(epoch - self.buckets + 1, epoch + 1):
+                remaining -= window.counts[oldest_epoch % self.buckets]
+                if remaining < self.limit:
+                    # El bucket sale de la ventana cuando el epoch actual llega a oldest_epoch + buckets
+                    return max(0.0, (oldest_epoch + self.buckets) * self._bucket_seconds - now)
+            return self.window_seconds
+
+    def reset(self, key: Hashable) -> None:
+        with self._lock:
+            self._windows.pop(key, None)
+
+    def evict_expired(self) -> int:
+        """Eliminar las claves sin eventos dentro de la ventana. Devuelve cuántas se eliminaron."""
+        with self._lock:
+            return self._evict_expired(self._epoch(self._clock()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            keys = len(self._windows)
+        return {
+            "limit": self.limit,
+            "window_seconds": self.window_seconds,
+            "keys": keys,
+            "allowed_total": self._allowed_total,
+            "rejected_total": self._rejected_total,
+            "evicted_total": self._evicted_total,
+        }
+
+    def _epoch(self, now: float) -> int:
+        return int(now // self._bucket_seconds)
+
+    def _advance(self, window: _Window, epoch: int) -> None:
+        """Poner a cero los buckets que salieron de la ventana desde el último evento."""
+        elapsed = epoch - window.last_epoch
+        if elapsed <= 0:
+            return
+        if elapsed >= self.buckets:
+            for index in range(self.buckets):
+                window.counts[index] = 0
+            window.total = 0
+        else:
+            for expired_epoch in range(window.last_epoch + 1, epoch + 1):
+                index = expired_epoch % self.buckets
+                window.total -= window.counts[index]
+                window.counts[index] = 0
+        window.last_epoch = epoch
+
+    def _evict_expired(self, epoch: int) -> int:
+        expired = [key for key, window in self._windows.items() if epoch - window.last_epoch >= self.buckets]
+        for key in expired:
+            del self._windows[key]
+        self._evicted_total += len(expired)
+        return len(expired)
+
+    def _make_room(self, epoch: int) -> None:
+        if self._evict_expired(epoch):
+            return
+        # Todas activas: se descarta la clave creada hace más tiempo
+        del self._windows[next(iter(self._windows))]
+        self._evicted_total += 1
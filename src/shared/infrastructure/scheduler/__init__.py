@@ -0,0 +1,10 @@
+"""
+Planificador de trabajos en segundo plano.
+Programacion cron, estado persistido en scheduled_jobs y lease en base de
+datos para que con varios workers cada ejecucion la corra uno solo.
+"""
+from src.shared.infrastructure.scheduler.cron import CronSchedule
+from src.shared.infrastructure.scheduler.job_scheduler import JobScheduler, ScheduledJob
+from src.shared.infrastructure.scheduler.job_store import SchedulerJobStore
+
+__all__ = ["CronSchedule", "JobScheduler", "ScheduledJob", "SchedulerJobStore"]
@@ -0,0 +1,102 @@
+"""
+Expresiones cron de 5 campos (minuto hora dia-mes mes dia-semana).
+
+Soporta "*", valores, rangos (a-b), listas (a,b) y pasos (*/n, a-b/n).
+El dia de la semana va de 0 (domingo) a 6; 7 tambien es domingo. Como en
+cron, si dia-mes y dia-semana estan restringidos basta con que coincida uno.
+"""
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+
+# (minimo, maximo) de cada campo
+_FIELD_RANGES: Tuple[Tuple[int, int], ...] = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+_FIELD_NAMES = ("minuto", "hora", "dia del mes", "mes", "dia de la semana")
+
+# Tope de busqueda: cualquier expresion valida vuelve a coincidir en menos de 5 años
+_MAX_SEARCH = timedelta(days=366 * 5)
+
+
+def _parse_field(field: str, minimum: int, maximum: int, name: str) -> FrozenSet[int]:
+    values = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Paso invalido en el campo {name}: '{part}'")
+
+        if base == "*":
+            start, end = minimum, maximum
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(base)
+            end = maximum if step_text else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Valor fuera de rango en el campo {name}: '{part}' ({minimum}-{maximum})")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    Programacion cron de 5 campos.
+
+    Ejemplo:
+        CronSchedule("0 6 * * *").next_after(datetime.now())  # proximas 06:00
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"La expresion cron debe tener 5 campos: '{expression}'")
+
+        try:
+            parsed = [
+                _parse_field(field, minimum, maximum, name)
+                for field, (minimum, maximum), name in zip(fields, _FIELD_RANGES, _FIELD_NAMES)
+            ]
+        except ValueError as error:
+            raise ValueError(f"Expresion cron invalida '{expression}': {error}") from error
+
+        self.expression = " ".join(fields)
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 7 y 0 son domingo; se normaliza al weekday() de Python (lunes = 0)
+        self.weekdays = frozenset((day - 1) % 7 for day in weekdays)
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day_match = moment.day in self.days
+        weekday_match = moment.weekday() in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Primer instante (al minuto) estrictamente posterior a `moment` que coincide."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + _MAX_SEARCH
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year = candidate.year + (candidate.month == 12)
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._matches_day(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"La expresion cron '{self.expression}' no coincide con ninguna fecha")
+
+    def __repr__(self) -> str:
+        return f"CronSchedule('{self.expression}')"
@@ -0,0 +1,188 @@
+"""
+Planificador de trabajos en segundo plano - Capa de Infraestructura.
+
+Un hilo propio revisa periodicamente los trabajos vencidos y los ejecuta en un
+pool de hilos, fuera del event loop de FastAPI: una tarea lenta no congela las
+peticiones en curso. La programacion es cron (hora de reloj, no "24h desde que
+arranco el proceso") y el estado se persiste en scheduled_jobs; cada ejecucion
+requiere tomar el lease en la base, asi que con varios workers solo uno la corre.
+"""
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from src.shared.infrastructure.scheduler.cron import CronSchedule
+from src.shared.infrastructure.scheduler.job_store import SchedulerJobStore
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    schedule: CronSchedule
+    func: Callable[[], Any]
+    lease_seconds: float
+    runs: int = 0
+    failures: int = 0
+    running: bool = False
+    last_result: Any = None
+    last_error: Optional[str] = None
+    last_finished_at: Optional[datetime] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class JobScheduler:
+    """
+    Planificador cron con arrendamiento en base de datos.
+
+    Uso:
+        scheduler = JobScheduler()
+        scheduler.add_job("inventory_daily_check", "0 6 * * *", run_check)
+        scheduler.start()
+        ...
+        scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        store: Optional[SchedulerJobStore] = None,
+        poll_interval_seconds: float = 30,
+        max_workers: int = 2,
+        default_lease_seconds: float = 600,
+        owner: Optional[str] = None,
+    ):
+        self.store = store or SchedulerJobStore()
+        self.poll_interval_seconds = poll_interval_seconds
+        self.default_lease_seconds = default_lease_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._max_workers = max_workers
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def add_job(
+        self,
+        name: str,
+        cron_expression: str,
+        func: Callable[[], Any],
+        lease_seconds: Optional[float] = None,
+    ) -> ScheduledJob:
+        """
+        Registrar un trabajo.
+
+        Args:
+            name: Identificador unico (clave en scheduled_jobs)
+            cron_expression: Programacion de 5 campos, p. ej. "0 6 * * *"
+            func: Funcion bloqueante sin argumentos; se ejecuta en el pool de hilos
+            lease_seconds: Duracion maxima esperada; si el worker muere, otro
+                puede retomar el trabajo cuando el lease expira
+        """
+        schedule = CronSchedule(cron_expression)
+        job = ScheduledJob(
+            name=name,
+            schedule=schedule,
+            func=func,
+            lease_seconds=lease_seconds or self.default_lease_seconds,
+        )
+        self.store.register(name, schedule.expression, schedule.next_after(datetime.now()))
+        self._jobs[name] = job
+        return job
+
+    def start(self) -> None:
+        """Arrancar el hilo del planificador."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Detener el planificador; los trabajos en curso no se esperan (su lease expira solo)."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[Future]:
+        """Lanzar los trabajos vencidos cuyo lease se consiga (un ciclo del planificador)."""
+        now = now or datetime.now()
+        futures = []
+        for job in list(self._jobs.values()):
+            with job.lock:
+                if job.running:
+                    continue
+                lease_until = now + timedelta(seconds=job.lease_seconds)
+                if not self.store.try_acquire(job.name, self.owner, now, lease_until):
+                    continue
+                job.running = True
+            futures.append(self._get_executor().submit(self._run_job, job))
+        return futures
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "owner": self.owner,
+            "jobs": {
+                job.name: {
+                    "schedule": job.schedule.expression,
+                    "running": job.running,
+                    "runs": job.runs,
+                    "failures": job.failures,
+                    "last_error": job.last_error,
+                    "last_finished_at": job.last_finished_at.isoformat() if job.last_finished_at else None,
+                }
+                for job in self._jobs.values()
+            },
+        }
+
+    def _loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                print(f"⚠️  Error en el planificador de trabajos: {e}")
+            self._stop_event.wait(self.poll_interval_seconds)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="job")
+        return self._executor
+
+    def _run_job(self, job: ScheduledJob) -> Any:
+        started_at = datetime.now()
+        started = time.perf_counter()
+        status, error = "success", None
+        try:
+            job.last_result = job.func()
+        except Exception as e:
+            status, error = "error", str(e)
+            print(f"⚠️  Error en el trabajo programado '{job.name}': {e}")
+        duration_ms = int((time.perf_counter() - started) * 1000)
+
+        job.runs += 1
+        job.failures += status == "error"
+        job.last_error = error
+        job.last_finished_at = datetime.now()
+        try:
+            self.store.complete(
+                job.name,
+                self.owner,
+                started_at,
+                status,
+                error,
+                duration_ms,
+                job.schedule.next_after(job.last_finished_at),
+            )
+        finally:
+            with job.lock:
+                job.running = False
+        return job.last_result
@@ -0,0 +1,111 @@
+"""
+Persistencia de los trabajos programados (tabla scheduled_jobs).
+
+Guarda la proxima ejecucion y el resultado de la ultima, de modo que un
+reinicio no reprograma el trabajo desde cero (si se perdio una ejecucion, se
+recupera en el primer ciclo). El arrendamiento (lease) se toma con un UPDATE
+condicional: con varios workers de uvicorn solo uno gana cada ejecucion.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+
+class SchedulerJobStore:
+    def __init__(self, client=None):
+        if client is None:
+            from src.shared.infrastructure.database.turso_connection import get_turso_client
+
+            client = get_turso_client()
+        self.client = client
+
+    def register(self, name: str, schedule: str, next_run_at: datetime) -> None:
+        """Registrar el trabajo; si ya existe con la misma programacion conserva su proxima ejecucion."""
+        self.client.execute(
+            """
+            INSERT INTO scheduled_jobs (name, schedule, next_run_at, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                next_run_at = CASE
+                    WHEN scheduled_jobs.schedule = excluded.schedule THEN scheduled_jobs.next_run_at
+                    ELSE excluded.next_run_at
+                END,
+                schedule = excluded.schedule,
+                updated_at = excluded.updated_at
+            """,
+            [name, schedule, next_run_at.isoformat(), datetime.now().isoformat()],
+        )
+
+    def try_acquire(self, name: str, owner: str, now: datetime, lease_until: datetime) -> bool:
+        """Tomar el lease si el trabajo vence y nadie lo tiene (o el lease anterior expiro)."""
+        result = self.client.execute(
+            """
+            UPDATE scheduled_jobs
+            SET lease_owner = ?, lease_expires_at = ?, updated_at = ?
+            WHERE name = ?
+              AND next_run_at <= ?
+              AND (lease_owner IS NULL OR lease_expires_at < ?)
+            RETURNING name
+            """,
+            [owner, lease_until.isoformat(), now.isoformat(), name, now.isoformat(), now.isoformat()],
+        )
+        return bool(result.rows)
+
+    def complete(
+        self,
+        name: str,
+        owner: str,
+        started_at: datetime,
+        status: str,
+        error: Optional[str],
+        duration_ms: int,
+        next_run_at: datetime,
+    ) -> None:
+        """Registrar el resultado, programar la siguiente ejecucion y liberar el lease."""
+        self.client.execute(
+            """
+            UPDATE scheduled_jobs
+            SET last_run_at = ?,
+                last_status = ?,
+                last_error = ?,
+                last_duration_ms = ?,
+                next_run_at = ?,
+                lease_owner = NULL,
+                lease_expires_at = NULL,
+                updated_at = ?
+            WHERE name = ? AND lease_owner = ?
+            """,
+            [
+                started_at.isoformat(),
+                status,
+                error,
+                duration_ms,
+                next_run_at.isoformat(),
+                datetime.now().isoformat(),
+                name,
+                owner,
+            ],
+        )
+
+    def get_all(self) -> List[dict]:
+        result = self.client.execute(
+            """
+            SELECT name, schedule, next_run_at, last_run_at, last_status, last_error,
+                   last_duration_ms, lease_owner, lease_expires_at
+            FROM scheduled_jobs
+            ORDER BY name
+            """
+        )
+        return [
+            {
+                "name": row[0],
+                "schedule": row[1],
+                "next_run_at": row[2],
+                "last_run_at": row[3],
+                "last_status": row[4],
+                "last_error": row[5],
+                "last_duration_ms": row[6],
+                "lease_owner": row[7],
+                "lease_expires_at": row[8],
+            }
+            for row in result.rows
+        ]
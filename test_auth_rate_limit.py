@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test del limitador de tasa de autenticación.
+Valida la ventana deslizante (anillo de buckets), el cálculo de Retry-After, la
+eliminación de claves inactivas y que el login rechaza el exceso con 429 antes
+de consultar la base de datos.
+"""
+
+import asyncio
+import time
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.modules.User.application.dto.login_request import LoginRequest
+from src.modules.User.infrastructure.api import auth_router
+from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.rate_limit import SlidingWindowRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sliding_window():
+    print("🧪 Test Rate Limit - ventana deslizante")
+    print("=" * 50)
+
+    clock = FakeClock()
+    limiter = SlidingWindowRateLimiter(limit=3, window_seconds=10, buckets=10, clock=clock)
+
+    assert limiter.hit("ip") and limiter.hit("ip")
+    clock.now += 4
+    assert limiter.hit("ip")
+    assert not limiter.hit("ip"), "El cuarto evento en la ventana debió rechazarse"
+    # Los dos primeros eventos salen de la ventana 10 s después de ocurrir
+    assert limiter.retry_after("ip") == 6
+    assert limiter.hit("otra-ip"), "Cada clave tiene su propio límite"
+
+    clock.now += 6
+    assert limiter.hit("ip") and limiter.hit("ip")
+    assert not limiter.hit("ip")
+
+    stats = limiter.stats()
+    assert stats["rejected_total"] == 2 and stats["allowed_total"] == 6
+    print("✅ Límite por clave en la ventana y Retry-After exacto")
+
+
+def test_eviction_and_key_bound():
+    print("🧪 Test Rate Limit - limpieza de claves")
+
+    clock = FakeClock()
+    limiter = SlidingWindowRateLimiter(limit=5, window_seconds=10, max_keys=3, clock=clock)
+    for key in ("a", "b", "c"):
+        limiter.hit(key)
+    clock.now += 5
+    limiter.hit("d")  # sin claves inactivas: se descarta la más antigua ("a")
+    assert limiter.stats()["keys"] == 3
+
+    clock.now += 6
+    assert limiter.evict_expired() == 2, "b y c quedaron fuera de la ventana; d sigue activa"
+    assert limiter.stats()["keys"] == 1
+    print("✅ Claves inactivas eliminadas y número de claves acotado")
+
+
+def test_hit_is_fast():
+    print("🧪 Test Rate Limit - coste por comprobación")
+
+    limiter = SlidingWindowRateLimiter(limit=10, window_seconds=60)
+    started = time.perf_counter()
+    for index in range(100000):
+        limiter.hit(f"10.0.{index % 250}.{index % 200}")
+    per_hit_us = (time.perf_counter() - started) / 100000 * 1e6
+    assert per_hit_us < 50, f"{per_hit_us:.1f} µs por comprobación"
+    print(f"✅ {per_hit_us:.2f} µs por comprobación")
+
+
+class FailingRepository:
+    """Cualquier acceso a usuarios falla: el rechazo debe ocurrir antes."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"Acceso inesperado a la base: {name}")
+
+
+def _request(ip: str, forwarded_for: str = None) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(b"x-forwarded-for", (forwarded_for or ip).encode())],
+        "client": (ip, 1234),
+    })
+
+
+def test_login_rejected_before_db_access():
+    print("🧪 Test Rate Limit - login")
+
+    email_limiter = auth_router.email_rate_limiter
+    user_repository = auth_router.user_repository
+    auth_router.email_rate_limiter = SlidingWindowRateLimiter(limit=2, window_seconds=60)
+    auth_router.user_repository = FailingRepository()
+    try:
+        login = LoginRequest(email="fuerza.bruta@test.com", password="Incorrecta123!")
+        auth_router.email_rate_limiter.hit(login.email)
+        auth_router.email_rate_limiter.hit(login.email)
+        try:
+            asyncio.run(auth_router.login(login, _request("10.9.9.9")))
+        except HTTPException as error:
+            assert error.status_code == 429
+            assert int(error.headers["Retry-After"]) >= 1
+        else:
+            raise AssertionError("El login debió rechazarse por límite de email")
+    finally:
+        auth_router.email_rate_limiter = email_limiter
+        auth_router.user_repository = user_repository
+    print("✅ 429 con Retry-After sin consultar usuarios ni calcular bcrypt")
+
+
+def test_spoofed_forwarded_for_does_not_reset_ip_limit():
+    print("🧪 Test Rate Limit - X-Forwarded-For falso")
+
+    ip_limiter = auth_router.ip_rate_limiter
+    user_repository = auth_router.user_repository
+    trusted_proxies = settings.TRUSTED_PROXY_IPS
+    auth_router.ip_rate_limiter = SlidingWindowRateLimiter(limit=2, window_seconds=60)
+    auth_router.user_repository = FailingRepository()
+    try:
+        settings.TRUSTED_PROXY_IPS = ""
+        auth_router.ip_rate_limiter.hit("10.7.7.7")
+        auth_router.ip_rate_limiter.hit("10.7.7.7")
+        # Cada intento cambia la cabecera (y el email): el límite sigue siendo el de la conexión
+        for attempt in range(3):
+            login = LoginRequest(email=f"rotando{attempt}@test.com", password="Incorrecta123!")
+            try:
+                asyncio.run(auth_router.login(login, _request("10.7.7.7", forwarded_for=f"203.0.113.{attempt}")))
+            except HTTPException as error:
+                assert error.status_code == 429
+            else:
+                raise AssertionError("Rotar X-Forwarded-For no debe dar un límite nuevo")
+
+        # Solo detrás de un proxy de confianza se usa la cabecera (la IP más a la derecha que no es proxy)
+        assert auth_router.get_client_ip(_request("10.0.0.1", "1.1.1.1, 198.51.100.4")) == "10.0.0.1"
+        settings.TRUSTED_PROXY_IPS = "10.0.0.1"
+        assert auth_router.get_client_ip(_request("10.0.0.1", "1.1.1.1, 198.51.100.4")) == "198.51.100.4"
+        assert auth_router.get_client_ip(_request("10.0.0.2", "198.51.100.4")) == "10.0.0.2"
+    finally:
+        settings.TRUSTED_PROXY_IPS = trusted_proxies
+        auth_router.ip_rate_limiter = ip_limiter
+        auth_router.user_repository = user_repository
+    print("✅ 429 aunque se rote X-Forwarded-For; la cabecera solo vale desde proxies de confianza")
+
+
+if __name__ == "__main__":
+    test_sliding_window()
+    test_eviction_and_key_bound()
+    test_hit_is_fast()
+    test_login_rejected_before_db_access()
+    test_spoofed_forwarded_for_does_not_reset_ip_limit()
+    print("\n🎉 Limitador de autenticación validado")
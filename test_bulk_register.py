@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test del alta masiva de empleados.
+Valida el endpoint con JSON y CSV (reporte por fila, permisos) contra el
+servidor, y que el caso de uso comprueba los emails en una sola consulta,
+hashea en paralelo e inserta en lotes sin bloquear el event loop, y que con
+la cola de hashing saturada no crea nada y propaga el error (503).
+Requiere el servidor corriendo en http://localhost:8000.
+"""
+
+import asyncio
+import uuid
+
+import requests
+
+from src.modules.User.application.usecases.bulk_register_users import BulkRegisterUsersUseCase
+from src.modules.User.domain.services.password_service import PasswordService
+from src.modules.User.infrastructure.hashing import PasswordHashingExecutor, PasswordHashingSaturatedError
+from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
+from src.modules.User.infrastructure.repositories.user_repository import UserRepository
+
+BASE_URL = "http://localhost:8000"
+
+
+def _token(role: str) -> str:
+    email = f"bulk_{role}_{uuid.uuid4().hex[:8]}@test.com"
+    requests.post(f"{BASE_URL}/api/auth/register", json={
+        "name": "Admin Sucursal",
+        "email": email,
+        "password": "TestPass123!",
+        "role": role,
+    })
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={"email": email, "password": "TestPass123!"})
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+def test_bulk_register_json_report():
+    print("🧪 Test Alta Masiva - JSON con reporte por fila")
+    print("=" * 50)
+
+    tag = uuid.uuid4().hex[:8]
+    headers = {"Authorization": f"Bearer {_token('admin')}"}
+    users = [
+        {"name": "Ana Gomez", "email": f"ana_{tag}@test.com", "password": "TestPass123!", "role": "employee"},
+        {"name": "Luis Diaz", "email": f"luis_{tag}@test.com", "password": "TestPass123!"},
+        {"name": "Sin Clave", "email": f"debil_{tag}@test.com", "password": "debilpass"},
+        {"name": "Repetida", "email": f"ANA_{tag}@test.com", "password": "TestPass123!"},
+        {"name": "Correo Malo", "email": "no-es-un-email", "password": "TestPass123!"},
+    ]
+    response = requests.post(f"{BASE_URL}/api/users/bulk", json={"users": users}, headers=headers)
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert (report["total"], report["created"], report["failed"]) == (5, 2, 3), report
+    statuses = [row["status"] for row in report["results"]]
+    assert statuses == ["created", "created", "error", "error", "error"], report["results"]
+    assert "repetido" in report["results"][3]["error"]
+
+    # Los usuarios creados pueden iniciar sesión con su contraseña
+    login = requests.post(f"{BASE_URL}/api/auth/login", json={"email": f"luis_{tag}@test.com", "password": "TestPass123!"})
+    assert login.status_code == 200 and login.json()["user"]["role_id"] == "uuid-role-waiter"
+
+    # Reenviar el lote: los existentes se rechazan en la comprobación conjunta
+    response = requests.post(f"{BASE_URL}/api/users/bulk", json={"users": users[:2]}, headers=headers)
+    assert response.json()["created"] == 0
+    assert all("ya está registrado" in row["error"] for row in response.json()["results"])
+    print("✅ 2 creados y 3 rechazados con su motivo; los existentes se detectan al reenviar")
+
+
+def test_bulk_register_csv_and_permissions():
+    print("🧪 Test Alta Masiva - CSV y permisos")
+
+    tag = uuid.uuid4().hex[:8]
+    csv_body = (
+        "name,email,phone,password,role\n"
+        f"Mesero Uno,mesero1_{tag}@test.com,,TestPass123!,\n"
+        f"Mesera Dos,mesera2_{tag}@test.com,+18095550002,TestPass123!,waiter\n"
+    )
+    admin_headers = {"Authorization": f"Bearer {_token('admin')}", "Content-Type": "text/csv"}
+    response = requests.post(f"{BASE_URL}/api/users/bulk", data=csv_body.encode(), headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 2
+
+    bad_csv = requests.post(f"{BASE_URL}/api/users/bulk", data=b"nombre,correo\nx,y\n", headers=admin_headers)
+    assert bad_csv.status_code == 400 and "Faltan columnas" in bad_csv.json()["detail"]
+
+    waiter_headers = {"Authorization": f"Bearer {_token('waiter')}", "Content-Type": "text/csv"}
+    response = requests.post(f"{BASE_URL}/api/users/bulk", data=csv_body.encode(), headers=waiter_headers)
+    assert response.status_code == 403
+    print("✅ CSV con celdas opcionales vacías; 400 sin columnas obligatorias y 403 sin manage_users")
+
+
+class CountingUserRepository(UserRepository):
+    def __init__(self):
+        super().__init__()
+        self.existence_queries = 0
+        self.insert_batches = 0
+
+    def email_exists(self, email):
+        raise AssertionError("El alta masiva no debe comprobar los emails uno a uno")
+
+    def find_existing_emails(self, emails):
+        raise AssertionError("El endpoint async no debe consultar la base de forma bloqueante")
+
+    async def find_existing_emails_async(self, emails):
+        self.existence_queries += 1
+        return await super().find_existing_emails_async(emails)
+
+    def save(self, user):
+        raise AssertionError("El alta masiva no debe insertar los usuarios uno a uno")
+
+    def save_many(self, users):
+        raise AssertionError("El endpoint async no debe insertar de forma bloqueante")
+
+    async def save_many_async(self, users):
+        self.insert_batches += 1
+        return await super().save_many_async(users)
+
+
+def test_use_case_is_set_based_and_parallel():
+    print("🧪 Test Alta Masiva - consultas por lote y hash en paralelo")
+
+    tag = uuid.uuid4().hex[:8]
+    rows = [
+        {"name": "Empleado Lote", "email": f"lote{index}_{tag}@test.com", "password": "TestPass123!"}
+        for index in range(12)
+    ]
+    repository = CountingUserRepository()
+    executor = PasswordHashingExecutor(max_workers=2, rounds=10)
+    try:
+        use_case = BulkRegisterUsersUseCase(repository, RoleRepository(), executor)
+        report = asyncio.run(use_case.execute(rows))
+        stats = executor.stats()
+    finally:
+        executor.shutdown()
+
+    assert report.created == 12, report
+    assert repository.existence_queries == 1 and repository.insert_batches == 1
+    assert stats["completed_total"] == 12 and stats["rejected_total"] == 0
+    stored = repository.find_by_email(f"lote0_{tag}@test.com")
+    assert PasswordService.verify_password("TestPass123!", stored.password_hash)
+    print("✅ 12 usuarios con 1 consulta de existencia, 1 INSERT y 12 hashes en 2 procesos")
+
+
+def test_saturated_hashing_aborts_the_batch():
+    print("🧪 Test Alta Masiva - cola de hashing saturada")
+
+    tag = uuid.uuid4().hex[:8]
+    rows = [
+        {"name": "Empleado Saturado", "email": f"sat{index}_{tag}@test.com", "password": "TestPass123!"}
+        for index in range(3)
+    ]
+    repository = UserRepository()
+    # Un proceso y sin cola: un login en curso ocupa la única plaza
+    executor = PasswordHashingExecutor(max_workers=1, max_queue_size=0, rounds=10)
+    executor.start()
+    try:
+        use_case = BulkRegisterUsersUseCase(repository, RoleRepository(), executor)
+
+        async def scenario():
+            login_hash = asyncio.create_task(executor.hash_password("OtraPassword1!"))
+            await asyncio.sleep(0)
+            try:
+                await use_case.execute(rows)
+            except PasswordHashingSaturatedError:
+                return True
+            finally:
+                await login_hash
+            return False
+
+        assert asyncio.run(scenario()), "La saturación debió propagarse para responder 503"
+    finally:
+        executor.shutdown()
+
+    assert all(repository.find_by_email(row["email"]) is None for row in rows), "No debió crearse ninguna fila"
+    print("✅ Con la cola saturada el lote no crea usuarios y el endpoint puede responder 503")
+
+
+if __name__ == "__main__":
+    test_bulk_register_json_report()
+    test_bulk_register_csv_and_permissions()
+    test_use_case_is_set_based_and_parallel()
+    test_saturated_hashing_aborts_the_batch()
+    print("\n🎉 Alta masiva validada")
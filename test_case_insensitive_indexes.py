@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test de los índices para búsquedas sin distinguir mayúsculas.
+Captura la SQL real que ejecutan los repositorios (email de usuarios, intentos
+de login, nombres de roles, permisos e insumos) y comprueba con
+EXPLAIN QUERY PLAN que usan los índices sobre LOWER(...) y no recorren la tabla.
+"""
+
+from src.modules.Inventory.infrastructure.repositories.inventory_repository import InventoryRepository
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+from src.modules.User.infrastructure.repositories.permission_repository import PermissionRepository
+from src.modules.User.infrastructure.repositories.role_repository import RoleRepository
+from src.modules.User.infrastructure.repositories.user_repository import UserRepository
+from src.shared.infrastructure.database.turso_connection import turso_db
+
+
+class PlanRecordingClient:
+    """Ejecuta cada consulta normalmente y guarda también su plan de ejecución."""
+
+    def __init__(self):
+        self.plans = []
+
+    def execute(self, query, params=None):
+        plan = turso_db.execute(f"EXPLAIN QUERY PLAN {query}", params or [])
+        self.plans.append((" ".join(query.split()), [row[-1] for row in plan.rows]))
+        return turso_db.execute(query, params or [])
+
+
+def _assert_uses_index(client: PlanRecordingClient, index_name: str) -> None:
+    assert client.plans, "El repositorio no ejecutó ninguna consulta"
+    for query, details in client.plans:
+        # "SCAN CONSTANT ROW" es el SELECT EXISTS exterior, no un recorrido de tabla
+        full_scans = [detail for detail in details if detail.startswith("SCAN") and detail != "SCAN CONSTANT ROW"]
+        assert not full_scans, f"Recorrido completo en '{query}': {details}"
+        assert any(index_name in detail for detail in details), f"'{query}' no usa {index_name}: {details}"
+    client.plans.clear()
+
+
+def _with_plan_client(repository):
+    client = PlanRecordingClient()
+    repository.client = client
+    return repository, client
+
+
+def test_user_email_lookups():
+    print("🧪 Test Índices - email de usuarios")
+    print("=" * 50)
+
+    repository, client = _with_plan_client(UserRepository())
+    repository.find_by_email("Alguien@Test.com")
+    _assert_uses_index(client, "idx_users_email_lower")
+    repository.email_exists("Alguien@Test.com")
+    _assert_uses_index(client, "idx_users_email_lower")
+    print("✅ find_by_email y email_exists usan idx_users_email_lower")
+
+
+def test_login_attempt_lookups():
+    print("🧪 Test Índices - intentos de login")
+
+    repository, client = _with_plan_client(LoginAttemptRepository())
+    repository.get_recent_failed_attempts("Alguien@Test.com")
+    _assert_uses_index(client, "idx_login_attempts_email_lower_created")
+
+    repository.get_attempts_by_email("Alguien@Test.com")
+    _, details = client.plans[0]
+    assert not any("TEMP B-TREE" in detail for detail in details), f"El historial se ordena aparte: {details}"
+    _assert_uses_index(client, "idx_login_attempts_email_lower_created")
+    print("✅ Conteo de fallos e historial por email sin recorrido ni ordenación extra")
+
+
+def test_name_lookups():
+    print("🧪 Test Índices - nombres de roles, permisos e insumos")
+
+    role_repository, client = _with_plan_client(RoleRepository())
+    role_repository.find_by_name("Waiter")
+    _assert_uses_index(client, "idx_roles_name_lower")
+
+    permission_repository, client = _with_plan_client(PermissionRepository())
+    permission_repository.find_by_name("Manage_Orders")
+    _assert_uses_index(client, "idx_permissions_name_lower")
+
+    inventory_repository, client = _with_plan_client(InventoryRepository())
+    inventory_repository.exists_by_name("Harina")
+    _assert_uses_index(client, "idx_inventory_items_name_lower")
+    inventory_repository.exists_by_name("Harina", excluding_id="otro-id")
+    _assert_uses_index(client, "idx_inventory_items_name_lower")
+    print("✅ Búsquedas por nombre usan sus índices sobre LOWER(name)")
+
+
+if __name__ == "__main__":
+    test_user_email_lookups()
+    test_login_attempt_lookups()
+    test_name_lookups()
+    print("\n🎉 Búsquedas sin distinguir mayúsculas indexadas")
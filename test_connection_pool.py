@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test del pool asíncrono de conexiones.
+Valida concurrencia acotada, health checks, expulsión de conexiones ociosas y
+el acceso desde código asíncrono (el del driver libsql) sin depender de Turso DB (usa clientes simulados).
+"""
+
+import asyncio
+import time
+
+from src.shared.infrastructure.database.connection_pool import (
+    AsyncConnectionPool,
+    EventLoopThread,
+    PoolTimeoutError,
+)
+
+
+class FakeClient:
+    """Cliente simulado: cada consulta tarda un tiempo fijo de red."""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.closed = False
+        self.healthy = True
+        self.executed = 0
+
+    async def execute(self, stmt, args=None):
+        if not self.healthy:
+            raise ConnectionError("conexion caida")
+        await asyncio.sleep(self.latency)
+        self.executed += 1
+        return stmt
+
+    async def batch(self, stmts):
+        await asyncio.sleep(self.latency)
+        return list(stmts)
+
+    async def close(self):
+        self.closed = True
+
+
+def _make_pool(**kwargs):
+    created = []
+
+    async def connect():
+        client = FakeClient()
+        created.append(client)
+        return client
+
+    return AsyncConnectionPool(connect=connect, **kwargs), created
+
+
+def test_pool_runs_queries_concurrently():
+    print("🧪 Test Connection Pool - concurrencia")
+    print("=" * 50)
+
+    async def scenario():
+        pool, created = _make_pool(min_size=1, max_size=4, idle_timeout=0)
+        await pool.open()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(pool.execute("SELECT 1") for _ in range(8)))
+        elapsed = time.perf_counter() - started
+
+        stats = pool.stats()
+        await pool.close()
+        return elapsed, stats, created
+
+    elapsed, stats, created = asyncio.run(scenario())
+
+    # 8 consultas de 50ms con 4 conexiones -> ~2 rondas, no 8 en serie
+    assert elapsed < 0.3, f"Las consultas se serializaron ({elapsed:.3f}s)"
+    assert len(created) == 4, f"Se esperaban 4 conexiones, se crearon {len(created)}"
+    assert stats["size"] <= stats["max_size"]
+    assert stats["acquired_total"] == 8
+    print(f"✅ 8 consultas en {elapsed * 1000:.0f}ms con {len(created)} conexiones")
+
+
+def test_pool_acquire_timeout():
+    print("🧪 Test Connection Pool - timeout de adquisición")
+
+    async def scenario():
+        pool, _ = _make_pool(min_size=0, max_size=1, acquire_timeout=0.05, idle_timeout=0)
+        await pool.open()
+        held = await pool.acquire()
+        try:
+            await pool.acquire()
+        except PoolTimeoutError:
+            timed_out = True
+        else:
+            timed_out = False
+        await pool.release(held)
+        await pool.close()
+        return timed_out, pool.stats()
+
+    timed_out, stats = asyncio.run(scenario())
+    assert timed_out, "acquire() debió fallar con el pool saturado"
+    assert stats["timeouts_total"] == 1
+    print("✅ PoolTimeoutError cuando no hay conexiones libres")
+
+
+def test_pool_health_check_and_idle_eviction():
+    print("🧪 Test Connection Pool - health check y expulsión de ociosas")
+
+    async def scenario():
+        pool, created = _make_pool(
+            min_size=1, max_size=3, idle_timeout=0.05, health_check_interval=0
+        )
+        await pool.open()
+
+        # Conexión caída: el health check la descarta y se crea una nueva
+        created[0].healthy = False
+        await pool.execute("SELECT 1")
+        assert created[0].closed, "La conexión caída debió cerrarse"
+        discarded = pool.stats()["discarded_total"]
+
+        # Abrir 3 conexiones y dejarlas ociosas más que idle_timeout
+        await asyncio.gather(*(pool.execute("SELECT 1") for _ in range(3)))
+        await asyncio.sleep(0.2)
+        stats = pool.stats()
+        await pool.close()
+        return discarded, stats
+
+    discarded, stats = asyncio.run(scenario())
+    assert discarded == 1, "El health check no descartó la conexión caída"
+    assert stats["size"] == 1, f"Se esperaba volver a min_size=1, tamaño actual {stats['size']}"
+    assert stats["evicted_total"] >= 2
+    print("✅ Conexión caída descartada y ociosas expulsadas hasta min_size")
+
+
+def test_event_loop_thread_from_sync_code():
+    print("🧪 Test Connection Pool - fachada síncrona")
+
+    loop_thread = EventLoopThread(name="test-pool")
+    pool, _ = _make_pool(min_size=1, max_size=2, idle_timeout=0)
+    loop_thread.run(pool.open())
+
+    result = loop_thread.run(pool.execute("SELECT 42"))
+    loop_thread.run(pool.close())
+    loop_thread.stop()
+
+    assert result == "SELECT 42"
+    print("✅ Código síncrono ejecuta consultas a través del loop del pool")
+
+
+def test_event_loop_thread_from_async_code():
+    print("🧪 Test Connection Pool - acceso asíncrono")
+
+    loop_thread = EventLoopThread(name="test-pool-async")
+    pool, _ = _make_pool(min_size=1, max_size=4, idle_timeout=0)
+    loop_thread.run(pool.open())
+    try:
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+
+            ticker_task = asyncio.create_task(ticker())
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(loop_thread.run_async(pool.execute(f"SELECT {i}")) for i in range(4))
+            )
+            elapsed = time.perf_counter() - started
+            ticker_task.cancel()
+            return results, elapsed, ticks
+
+        results, elapsed, ticks = asyncio.run(scenario())
+    finally:
+        loop_thread.run(pool.close())
+        loop_thread.stop()
+
+    assert results == [f"SELECT {i}" for i in range(4)]
+    # 4 consultas de 50 ms en 4 conexiones: en paralelo, sin parar el loop que espera
+    assert elapsed < 0.15, f"Las consultas se serializaron ({elapsed * 1000:.0f} ms)"
+    assert ticks >= 5, f"El event loop del llamador se bloqueó ({ticks} ticks)"
+    print(f"✅ 4 consultas esperadas desde otro loop en {elapsed * 1000:.0f} ms; el llamador siguió libre")
+
+
+if __name__ == "__main__":
+    test_pool_runs_queries_concurrently()
+    test_pool_acquire_timeout()
+    test_pool_health_check_and_idle_eviction()
+    test_event_loop_thread_from_sync_code()
+    test_event_loop_thread_from_async_code()
+    print("\n🎉 Pool de conexiones validado")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test de la verificación diaria de stock mínimo (set-based).
+Valida que las alertas se crean con una sola sentencia y que repetir la
+verificación del mismo día no duplica alertas (índice único en la base).
+"""
+
+from datetime import datetime
+import uuid
+
+from src.modules.Inventory.domain.entities.inventory_item import InventoryItem
+from src.modules.Inventory.infrastructure.repositories.inventory_repository import InventoryRepository
+
+
+class CountingClient:
+    """Envoltorio del cliente que cuenta viajes (execute y batch)."""
+
+    def __init__(self, client):
+        self.client = client
+        self.round_trips = 0
+
+    def execute(self, query, params=None):
+        self.round_trips += 1
+        return self.client.execute(query, params)
+
+    def batch(self, statements):
+        self.round_trips += 1
+        return self.client.batch(statements)
+
+
+def test_daily_check_is_single_statement_and_idempotent():
+    print("🧪 Test Daily Low Stock Alerts - set-based e idempotente")
+    print("=" * 50)
+
+    repo = InventoryRepository()
+    now = datetime.now()
+    item = repo.create(InventoryItem(
+        id=str(uuid.uuid4()),
+        name=f"Sal {uuid.uuid4().hex[:6]}",
+        category="test",
+        current_quantity=1,
+        minimum_stock=2,
+        unit="kg",
+        created_at=now,
+        updated_at=now,
+    ))
+    check_date = f"2099-{uuid.uuid4().int % 12 + 1:02d}-{uuid.uuid4().int % 28 + 1:02d}"
+
+    counting = CountingClient(repo.client)
+    repo.client = counting
+    created = repo.create_daily_low_stock_alerts(check_date)
+    repo.client = counting.client
+
+    assert counting.round_trips == 1, f"Se esperaba 1 viaje, hubo {counting.round_trips}"
+    assert created >= 1, "No se creó la alerta diaria"
+
+    assert repo.create_daily_low_stock_alerts(check_date) == 0, "La segunda verificación duplicó alertas"
+
+    alerts = [
+        alert for alert in repo.get_all_alerts()
+        if alert.inventory_item_id == item.id and alert.check_date == check_date
+    ]
+    assert len(alerts) == 1
+    assert alerts[0].message.startswith(f"Verificacion diaria: '{item.name}'")
+    print(f"✅ {created} alertas en 1 viaje; repetir el mismo día no crea ninguna")
+
+
+if __name__ == "__main__":
+    test_daily_check_is_single_statement_and_idempotent()
+    print("\n🎉 Verificación diaria validada")
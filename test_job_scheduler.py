@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test del planificador de trabajos en segundo plano.
+Valida las expresiones cron, que el trabajo corre fuera del hilo que lo lanza,
+que su estado queda persistido y que con dos planificadores (dos workers) el
+lease en base de datos deja ejecutar cada vencimiento a uno solo.
+"""
+
+from datetime import datetime, timedelta
+import threading
+import uuid
+
+from src.shared.infrastructure.database.turso_connection import turso_db
+from src.shared.infrastructure.scheduler import CronSchedule, JobScheduler, SchedulerJobStore
+
+
+def test_cron_next_after():
+    print("🧪 Test Job Scheduler - expresiones cron")
+    print("=" * 50)
+
+    base = datetime(2026, 3, 14, 10, 30, 15)
+    assert CronSchedule("0 6 * * *").next_after(base) == datetime(2026, 3, 15, 6, 0)
+    assert CronSchedule("*/15 * * * *").next_after(base) == datetime(2026, 3, 14, 10, 45)
+    assert CronSchedule("0 9-17/4 * * *").next_after(base) == datetime(2026, 3, 14, 13, 0)
+    # 14/03/2026 es sábado: el próximo lunes (1) es el 16
+    assert CronSchedule("0 8 * * 1").next_after(base) == datetime(2026, 3, 16, 8, 0)
+    assert CronSchedule("0 0 1 1 *").next_after(base) == datetime(2027, 1, 1, 0, 0)
+    # Día del mes y día de la semana restringidos: basta con que coincida uno
+    assert CronSchedule("0 0 20 * 0").next_after(base) == datetime(2026, 3, 15, 0, 0)
+
+    for invalid in ("* * * *", "60 * * * *", "*/0 * * * *", "0 25 * * *"):
+        try:
+            CronSchedule(invalid)
+        except ValueError:
+            continue
+        raise AssertionError(f"La expresión '{invalid}' debió rechazarse")
+    print("✅ Próximas ejecuciones calculadas y expresiones inválidas rechazadas")
+
+
+def _force_due(name: str) -> None:
+    past = (datetime.now() - timedelta(minutes=1)).isoformat()
+    turso_db.execute("UPDATE scheduled_jobs SET next_run_at = ? WHERE name = ?", [past, name])
+
+
+def test_job_runs_in_worker_thread_and_persists_state():
+    print("🧪 Test Job Scheduler - ejecución en hilo y estado persistido")
+
+    name = f"test_job_{uuid.uuid4().hex[:8]}"
+    threads = []
+    scheduler = JobScheduler(store=SchedulerJobStore(turso_db))
+    scheduler.add_job(name, "0 6 * * *", lambda: threads.append(threading.current_thread().name) or 7)
+
+    assert scheduler.run_pending() == [], "El trabajo aún no vence"
+
+    _force_due(name)
+    futures = scheduler.run_pending()
+    assert len(futures) == 1
+    assert futures[0].result(timeout=10) == 7
+    assert threads and threads[0] != threading.current_thread().name, "El trabajo no corrió en el pool"
+
+    job_row = next(row for row in scheduler.store.get_all() if row["name"] == name)
+    assert job_row["last_status"] == "success" and job_row["lease_owner"] is None
+    assert datetime.fromisoformat(job_row["next_run_at"]) > datetime.now(), "No se reprogramó"
+    assert scheduler.stats()["jobs"][name]["runs"] == 1
+    scheduler.stop()
+    print("✅ Trabajo ejecutado en el pool y resultado guardado en scheduled_jobs")
+
+
+def test_lease_allows_single_worker():
+    print("🧪 Test Job Scheduler - lease entre workers")
+
+    name = f"test_job_{uuid.uuid4().hex[:8]}"
+    runs = []
+    release = threading.Event()
+
+    def slow_job():
+        runs.append(1)
+        release.wait(5)
+
+    worker_a = JobScheduler(store=SchedulerJobStore(turso_db), owner="worker-a")
+    worker_b = JobScheduler(store=SchedulerJobStore(turso_db), owner="worker-b")
+    worker_a.add_job(name, "0 6 * * *", slow_job)
+    worker_b.add_job(name, "0 6 * * *", slow_job)
+
+    _force_due(name)
+    futures = worker_a.run_pending() + worker_b.run_pending()
+    assert len(futures) == 1, "Ambos workers tomaron el mismo vencimiento"
+    release.set()
+    futures[0].result(timeout=10)
+
+    # Un lease expirado (worker caído) puede retomarse
+    _force_due(name)
+    stale = (datetime.now() - timedelta(minutes=1)).isoformat()
+    turso_db.execute(
+        "UPDATE scheduled_jobs SET lease_owner = 'worker-muerto', lease_expires_at = ? WHERE name = ?",
+        [stale, name],
+    )
+    futures = worker_b.run_pending()
+    assert len(futures) == 1
+    futures[0].result(timeout=10)
+
+    assert len(runs) == 2
+    worker_a.stop()
+    worker_b.stop()
+    print("✅ Solo un worker ejecuta cada vencimiento; un lease expirado se retoma")
+
+
+if __name__ == "__main__":
+    test_cron_next_after()
+    test_job_runs_in_worker_thread_and_persists_state()
+    test_lease_allows_single_worker()
+    print("\n🎉 Planificador de trabajos validado")
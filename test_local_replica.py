@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test de la réplica local de lectura.
+Usa como "primaria" un archivo SQLite local a través de libsql_client, de modo
+que no depende de Turso DB.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from libsql_client import create_client_sync
+
+from src.shared.infrastructure.database.local_replica import LocalReplica
+
+
+def _make_primary(directory: Path):
+    primary = create_client_sync(f"file:{directory / 'primary.db'}")
+    primary.execute("CREATE TABLE roles (id TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+    primary.execute("CREATE TABLE users (id TEXT PRIMARY KEY, email TEXT, role_id TEXT)")
+    primary.execute("INSERT INTO roles (id, name) VALUES ('r1', 'admin'), ('r2', 'waiter')")
+    primary.execute("INSERT INTO users (id, email, role_id) VALUES ('u1', 'a@kitchai.com', 'r1')")
+    return primary
+
+
+class CountingPrimary:
+    """Envoltorio que cuenta las consultas que llegan a la primaria."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = 0
+
+    def execute(self, query, params=None):
+        self.calls += 1
+        return self.client.execute(query, params)
+
+
+def test_reads_are_served_locally():
+    print("🧪 Test Réplica Local - lecturas locales")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        primary = _make_primary(Path(tmp))
+        counting = CountingPrimary(primary)
+        replica = LocalReplica(str(Path(tmp) / "replica.db"), counting.execute, tables=["roles"])
+        synced = replica.sync()
+        assert synced == 1, f"Se esperaba 1 tabla sincronizada, se sincronizaron {synced}"
+
+        calls_before = counting.calls
+        started = time.perf_counter()
+        for _ in range(200):
+            result = replica.try_execute("SELECT id, name FROM roles WHERE name = ?", ["admin"])
+        elapsed = time.perf_counter() - started
+
+        assert result is not None, "La lectura de una tabla replicada debió resolverse localmente"
+        assert result.rows[0]["id"] == "r1"
+        assert counting.calls == calls_before, "Las lecturas locales no deben tocar la primaria"
+        print(f"✅ 200 lecturas locales en {elapsed * 1000:.1f}ms sin viajes a la primaria")
+
+        replica.close()
+        primary.close()
+
+
+def test_unreplicated_tables_fall_back_to_primary():
+    print("🧪 Test Réplica Local - fallback a la primaria")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        primary = _make_primary(Path(tmp))
+        replica = LocalReplica(str(Path(tmp) / "replica.db"), primary.execute, tables=["roles"])
+        replica.sync()
+
+        join = "SELECT u.email, r.name FROM users u JOIN roles r ON r.id = u.role_id"
+        assert replica.try_execute(join) is None, "Un JOIN con una tabla no replicada debe ir a la primaria"
+        assert replica.try_execute("UPDATE roles SET name = 'x'") is None, "Las escrituras nunca son locales"
+        assert replica.stats()["primary_fallbacks"] == 1
+        print("✅ Consultas con tablas no replicadas y escrituras van a la primaria")
+
+        replica.close()
+        primary.close()
+
+
+def test_write_resyncs_replica():
+    print("🧪 Test Réplica Local - resincronización tras escritura")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        primary = _make_primary(Path(tmp))
+        replica = LocalReplica(str(Path(tmp) / "replica.db"), primary.execute, tables=["roles"])
+        replica.sync()
+
+        insert = "INSERT INTO roles (id, name) VALUES (?, ?)"
+        primary.execute(insert, ["r3", "employee"])
+        replica.notify_write(insert)
+
+        result = replica.try_execute("SELECT COUNT(*) AS total FROM roles")
+        assert result is not None and result.rows[0]["total"] == 3, "La réplica no reflejó la escritura"
+        print("✅ La réplica refleja las escrituras propias de inmediato")
+
+        replica.close()
+        primary.close()
+
+
+def test_stale_tables_route_to_primary():
+    print("🧪 Test Réplica Local - tablas desactualizadas")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        primary = _make_primary(Path(tmp))
+        replica = LocalReplica(
+            str(Path(tmp) / "replica.db"), primary.execute, tables=["roles"], sync_on_write=False
+        )
+        replica.sync()
+        assert replica.try_execute("SELECT * FROM roles") is not None
+
+        replica.notify_write("DELETE FROM roles WHERE id = 'r2'")
+        assert replica.try_execute("SELECT * FROM roles") is None, "Una tabla desactualizada no debe leerse local"
+
+        replica.sync()
+        assert replica.try_execute("SELECT * FROM roles") is not None
+        print("✅ Tablas desactualizadas se leen de la primaria hasta la siguiente sincronización")
+
+        replica.close()
+        primary.close()
+
+
+if __name__ == "__main__":
+    test_reads_are_served_locally()
+    test_unreplicated_tables_fall_back_to_primary()
+    test_write_resyncs_replica()
+    test_stale_tables_route_to_primary()
+    print("\n🎉 Réplica local validada")
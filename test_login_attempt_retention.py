@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test de la retención de intentos de login.
+Valida que los días completos se resumen por email e IP en
+login_attempt_daily_stats, que las filas vencidas se borran por lotes acotados
+sin pasar del último día resumido, que repetir la ejecución no duplica nada y
+que GET /api/users/login-history devuelve intentos recientes y contadores.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from src.modules.User.infrastructure.api.users_router import get_login_history
+from src.modules.User.infrastructure.audit import LoginAttemptRetention
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+
+
+def _set_watermark(repository: LoginAttemptRepository, day) -> None:
+    """Fijar el último día resumido (solo para el test)."""
+    repository.client.execute(
+        """
+        INSERT INTO login_attempt_rollup_state (id, rolled_up_through, updated_at)
+        VALUES (1, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET rolled_up_through = excluded.rolled_up_through
+        """,
+        [day.isoformat(), datetime.now().isoformat()]
+    )
+
+
+def _attempts_for(repository: LoginAttemptRepository, email: str) -> list:
+    return repository.get_attempts_by_email(email, limit=1000)
+
+
+def test_rollup_and_purge():
+    print("🧪 Test Retención Login - resumen diario y borrado por TTL")
+    print("=" * 50)
+
+    repository = LoginAttemptRepository()
+    email = f"Retention_{uuid.uuid4().hex[:8]}@Test.com"
+    now = datetime.now()
+    old = (now - timedelta(days=40)).replace(hour=10, minute=0, second=0, microsecond=0)
+    recent = (now - timedelta(days=2)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    _set_watermark(repository, old.date() - timedelta(days=1))
+    repository.save_attempts([
+        (email, False, "10.0.0.1", old),
+        (email, False, "10.0.0.1", old + timedelta(minutes=1)),
+        (email, True, "10.0.0.1", old + timedelta(minutes=2)),
+        (email.lower(), False, None, old + timedelta(minutes=3)),
+        (email, False, "10.0.0.2", recent),
+        (email, True, "10.0.0.2", now),
+    ])
+
+    retention = LoginAttemptRetention(repository, retention_days=30, batch_size=1000)
+    result = retention.run(now)
+    print(f"   Resultado: {result}")
+
+    assert result["rolled_up_through"] == (now.date() - timedelta(days=1)).isoformat()
+    # El resumen agrupa sin distinguir mayúsculas y separa los intentos sin IP
+    stats = repository.get_daily_stats(email, days=60)
+    by_key = {(row["day"], row["ip_address"]): row for row in stats}
+    old_day, recent_day = old.date().isoformat(), recent.date().isoformat()
+    assert by_key[(old_day, "10.0.0.1")]["failure_count"] == 2
+    assert by_key[(old_day, "10.0.0.1")]["success_count"] == 1
+    assert by_key[(old_day, None)]["failure_count"] == 1
+    assert by_key[(recent_day, "10.0.0.2")]["failure_count"] == 1
+    # El día de hoy está incompleto y todavía no se resume
+    assert all(row["day"] < now.date().isoformat() for row in stats)
+
+    # Las filas de hace 40 días se borran y las recientes se conservan
+    remaining = _attempts_for(repository, email)
+    assert len(remaining) == 2, remaining
+    assert all(row["created_at"] >= recent.isoformat() for row in remaining)
+
+    # Repetir la ejecución no vuelve a resumir ni cambia los contadores
+    again = retention.run(now)
+    assert again["rolled_up_rows"] == 0
+    assert repository.get_daily_stats(email, days=60) == stats
+
+    # El endpoint de auditoría (manage_users lo valida la dependencia) junta ambas fuentes
+    history = get_login_history(email=email.upper(), days=60, limit=1, user={"id": "admin-test"})
+    assert history.email == email.lower()
+    assert [attempt.created_at for attempt in history.recent_attempts] == [now.isoformat()]
+    assert [row.model_dump() for row in history.daily_stats] == stats
+    # Con days=7 quedan fuera los contadores de hace 40 días
+    recent_only = get_login_history(email=email, days=7, limit=20, user={"id": "admin-test"})
+    assert {row.day for row in recent_only.daily_stats} == {recent_day}
+    print("✅ Resumen diario y borrado por TTL correctos")
+
+
+def test_purge_is_bounded_and_never_passes_watermark():
+    print("\n🧪 Test Retención Login - lotes acotados y marca de agua")
+    print("=" * 50)
+
+    repository = LoginAttemptRepository()
+    email = f"retention_batch_{uuid.uuid4().hex[:8]}@test.com"
+    now = datetime.now()
+    old = (now - timedelta(days=45)).replace(hour=9, minute=0, second=0, microsecond=0)
+
+    _set_watermark(repository, old.date() - timedelta(days=1))
+    repository.save_attempts([(email, False, "10.0.0.3", old + timedelta(seconds=i)) for i in range(5)])
+
+    # El borrado nunca pasa del último día resumido aunque el TTL lo permita
+    retention = LoginAttemptRetention(repository, retention_days=30, batch_size=2, max_batches=1)
+    watermark = old.date() - timedelta(days=1)
+    assert retention._purge_cutoff(now, watermark) == datetime.combine(old.date(), datetime.min.time())
+
+    # Con un solo lote de 2 por ejecución se borran 2 filas y el resto queda para después
+    first = retention.run(now)
+    assert first["batches"] == 1 and first["purged"] == 2, first
+    assert len(_attempts_for(repository, email)) == 3
+    # Las filas se contaron en el resumen antes de borrarse
+    assert repository.get_daily_stats(email, days=60)[0]["failure_count"] == 5
+
+    retention.max_batches = 10
+    retention.run(now)
+    assert _attempts_for(repository, email) == []
+    assert repository.get_daily_stats(email, days=60)[0]["failure_count"] == 5
+    print("✅ Borrado por lotes acotado y limitado por el resumen")
+
+
+if __name__ == "__main__":
+    test_rollup_and_purge()
+    test_purge_is_bounded_and_never_passes_watermark()
+    print("\n✅ Todos los tests de retención pasaron")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test del escritor de auditoría de intentos de login.
+Valida que encolar no escribe en la petición, que el hilo vacía el buffer por
+tamaño de lote y por intervalo con INSERTs de varias filas, que el buffer
+acotado descarta el exceso y que stop() escribe lo pendiente.
+"""
+
+import time
+import uuid
+
+from src.modules.User.infrastructure.audit import LoginAttemptAuditWriter
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+
+
+class CountingRepository(LoginAttemptRepository):
+    """Repositorio real que cuenta cuántos INSERT hace."""
+
+    def __init__(self):
+        super().__init__()
+        self.inserts = 0
+
+    def save_attempts(self, attempts):
+        self.inserts += 1
+        return super().save_attempts(attempts)
+
+
+def _wait_until(condition, timeout: float = 5) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+def test_batches_by_size_and_interval():
+    print("🧪 Test Login Audit - vaciado por lote e intervalo")
+    print("=" * 50)
+
+    email = f"audit_{uuid.uuid4().hex[:8]}@test.com"
+    repository = CountingRepository()
+    writer = LoginAttemptAuditWriter(repository, batch_size=10, flush_interval_ms=200)
+
+    for _ in range(25):
+        assert writer.enqueue(email, False, "10.0.0.1")
+    assert repository.inserts == 0, "Encolar no debe escribir en la base"
+
+    writer.start()
+    try:
+        assert _wait_until(lambda: writer.stats()["written_total"] == 25), writer.stats()
+        # 25 intentos en lotes de 10: tres INSERT de varias filas
+        assert repository.inserts == 3
+        assert repository.get_recent_failed_attempts(email) == 25
+
+        # Por debajo del tamaño de lote se escribe al cumplirse el intervalo
+        writer.enqueue(email, True, "10.0.0.1")
+        assert _wait_until(lambda: writer.stats()["written_total"] == 26, timeout=2)
+        history = repository.get_attempts_by_email(email, limit=1)
+        assert history[0]["success"] is True and history[0]["ip_address"] == "10.0.0.1"
+    finally:
+        writer.stop()
+    print(f"✅ 26 intentos escritos en {repository.inserts} INSERT")
+
+
+def test_bounded_buffer_and_flush_on_stop():
+    print("🧪 Test Login Audit - buffer acotado y cierre")
+
+    email = f"audit_{uuid.uuid4().hex[:8]}@test.com"
+    repository = LoginAttemptRepository()
+    writer = LoginAttemptAuditWriter(repository, max_buffer_size=5, batch_size=100, flush_interval_ms=60000)
+
+    accepted = [writer.enqueue(email, False) for _ in range(8)]
+    assert accepted.count(True) == 5 and accepted.count(False) == 3
+    stats = writer.stats()
+    assert stats["pending"] == 5 and stats["dropped_total"] == 3
+
+    writer.start()
+    writer.stop()
+    stats = writer.stats()
+    assert stats["pending"] == 0 and stats["written_total"] == 5 and not stats["running"]
+    assert repository.get_recent_failed_attempts(email) == 5
+    print("✅ 3 intentos descartados con el buffer lleno; stop() escribió los 5 pendientes")
+
+
+def test_failed_batch_does_not_raise():
+    print("🧪 Test Login Audit - error de base")
+
+    class BrokenRepository(LoginAttemptRepository):
+        def save_attempts(self, attempts):
+            raise RuntimeError("base no disponible")
+
+    writer = LoginAttemptAuditWriter(BrokenRepository(), batch_size=2)
+    writer.enqueue("caido@test.com", False)
+    writer.enqueue("caido@test.com", False)
+    assert writer.flush() == 0
+    assert writer.stats()["failed_total"] == 2
+    print("✅ Un lote fallido se contabiliza sin propagar el error al login")
+
+
+if __name__ == "__main__":
+    test_batches_by_size_and_interval()
+    test_bounded_buffer_and_flush_on_stop()
+    test_failed_batch_does_not_raise()
+    print("\n🎉 Auditoría de intentos de login validada")
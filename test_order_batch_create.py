@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test de creación de pedidos en batch.
+Valida que cabecera e items viajan en un único batch atómico (INSERT
+multi-fila), que create_many inserta varios pedidos a la vez y que
+POST /api/orders/batch crea todos los pedidos o ninguno.
+"""
+
+from datetime import datetime
+import uuid
+
+from fastapi import HTTPException
+
+from src.modules.Order.application.dto.order_request import (
+    OrderCreateBatchRequestDTO,
+    OrderItemRequestDTO,
+    OrderRequestDTO,
+)
+from src.modules.Order.infrastructure.api.order_router import create_orders
+from src.modules.Order.infrastructure.events.order_event_publisher import order_event_broker
+from src.modules.Order.domain.entities.order import Order, OrderStatus, ServiceType
+from src.modules.Order.domain.entities.order_item import OrderItem
+from src.modules.Order.infrastructure.repositories.order_repository import (
+    OrderRepository,
+    build_multi_row_insert,
+)
+
+
+def _build_order(item_count: int, order_number: str = None) -> Order:
+    order_id = str(uuid.uuid4())
+    items = [
+        OrderItem(
+            id=str(uuid.uuid4()),
+            order_id=order_id,
+            menu_item_id=f"menu-{index}",
+            menu_item_name=f"Plato {index}",
+            quantity=1,
+            unit_price=10.0,
+            subtotal=10.0,
+        )
+        for index in range(item_count)
+    ]
+    return Order(
+        id=order_id,
+        order_number=order_number or f"ORD-BATCH-{uuid.uuid4().hex[:10].upper()}",
+        customer_name="Cliente Batch",
+        table_number=12,
+        status=OrderStatus.PENDING,
+        service_type=ServiceType.DINE_IN,
+        total_amount=10.0 * item_count,
+        final_amount=11.8 * item_count,
+        waiter_id="waiter-batch-test",
+        items=items,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+class CountingClient:
+    """Envoltorio del cliente que cuenta viajes (execute y batch)."""
+
+    def __init__(self, client):
+        self.client = client
+        self.round_trips = 0
+        self.statements = []
+
+    def execute(self, query, params=None):
+        self.round_trips += 1
+        return self.client.execute(query, params)
+
+    def batch(self, statements):
+        self.round_trips += 1
+        self.statements.extend(statements)
+        return self.client.batch(statements)
+
+
+def test_create_is_single_round_trip():
+    print("🧪 Test Order Batch Create - un solo viaje")
+    print("=" * 50)
+
+    repo = OrderRepository()
+    counting = CountingClient(repo.db)
+    repo.db = counting
+
+    order = _build_order(item_count=12)
+    repo.create(order)
+
+    assert counting.round_trips == 1, f"Se esperaba 1 viaje, hubo {counting.round_trips}"
+    assert len(counting.statements) == 4, "Cabecera, items multi-fila, evento order.created y proyección"
+
+    repo.db = counting.client
+    saved = repo.get_by_id(order.id)
+    assert saved is not None and len(saved.items) == 12
+    print("✅ Pedido de 12 items creado en 1 viaje (antes 13)")
+
+
+def test_multi_row_insert_respects_param_limit():
+    print("🧪 Test Order Batch Create - límite de parámetros")
+
+    rows = [[index, "x", "y"] for index in range(1000)]
+    statements = build_multi_row_insert("t", ("a", "b", "c"), rows)
+    assert all(len(params) <= 999 for _, params in statements)
+    assert sum(len(params) for _, params in statements) == 3000
+    print(f"✅ 1000 filas repartidas en {len(statements)} sentencias")
+
+
+def test_create_many_is_atomic():
+    print("🧪 Test Order Batch Create - create_many atómico")
+
+    repo = OrderRepository()
+    orders = [_build_order(item_count=3) for _ in range(5)]
+    repo.create_many(orders)
+    assert all(repo.get_by_id(order.id) is not None for order in orders)
+
+    duplicated_number = orders[0].order_number
+    failing = [_build_order(item_count=2), _build_order(item_count=2, order_number=duplicated_number)]
+    try:
+        repo.create_many(failing)
+    except Exception:
+        failed = True
+    else:
+        failed = False
+
+    assert failed, "Un order_number duplicado debió hacer fallar el lote"
+    assert repo.get_by_id(failing[0].id) is None, "El lote fallido dejó pedidos a medias"
+    print("✅ create_many inserta todos los pedidos o ninguno")
+
+
+def _order_request(service_type: ServiceType = ServiceType.DINE_IN, table_number: int = 7) -> OrderRequestDTO:
+    return OrderRequestDTO(
+        customer_name="Cliente Batch",
+        customer_phone=None,
+        table_number=table_number,
+        service_type=service_type,
+        items=[OrderItemRequestDTO(menu_item_id="menu-batch", menu_item_name="Tacos", quantity=2, unit_price=5.0)],
+    )
+
+
+def test_create_orders_endpoint():
+    print("🧪 Test Order Batch Create - POST /api/orders/batch")
+
+    # El permiso manage_orders lo valida la dependencia; aquí se llama al endpoint directamente
+    user = {"id": f"waiter-batch-{uuid.uuid4().hex[:6]}"}
+    published_before = order_event_broker.stats()["published_total"]
+    created = create_orders(OrderCreateBatchRequestDTO(orders=[_order_request(), _order_request(table_number=8)]), user)
+
+    assert [order.table_number for order in created] == [7, 8]
+    assert all(order.waiter_id == user["id"] and order.total_amount == 10.0 for order in created)
+    repo = OrderRepository()
+    assert all(repo.get_by_id(order.id) is not None for order in created)
+    assert order_event_broker.stats()["published_total"] == published_before + 2, "Falta un order.created"
+
+    # Un pedido para llevar sin teléfono rechaza el lote completo antes de escribir
+    invalid = OrderCreateBatchRequestDTO(orders=[_order_request(), _order_request(ServiceType.TAKEOUT)])
+    for request in (invalid, OrderCreateBatchRequestDTO(orders=[])):
+        try:
+            create_orders(request, user)
+        except HTTPException as e:
+            assert e.status_code == 400, e.detail
+        else:
+            raise AssertionError("El lote no válido debió rechazarse")
+    assert order_event_broker.stats()["published_total"] == published_before + 2, "Un lote rechazado creó pedidos"
+    print("✅ El lote crea todos sus pedidos o ninguno")
+
+
+if __name__ == "__main__":
+    test_create_is_single_round_trip()
+    test_multi_row_insert_respects_param_limit()
+    test_create_many_is_atomic()
+    test_create_orders_endpoint()
+    print("\n🎉 Creación de pedidos en batch validada")
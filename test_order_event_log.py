@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test del historial de pedidos (order_events) y sus proyecciones.
+Valida que cada creación y cambio de estado escribe su evento en el mismo batch
+(y que una transición rechazada no escribe nada), que order_status_counts y
+order_timing_stats se mantienen al día de forma incremental y coinciden con
+una reconstrucción completa, y que la migración reconstruye el historial de
+los pedidos existentes.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.modules.Order.application.dto.order_request import OrderStatusUpdateRequestDTO
+from src.modules.Order.application.usecases.order_analytics_usecases import OrderAnalyticsService
+from src.modules.Order.application.usecases.order_usecases import OrderService
+from src.modules.Order.domain.entities.order import ServiceType
+from src.modules.Order.infrastructure.repositories.order_event_repository import OrderEventRepository
+from src.shared.infrastructure.database.migrations.migration_runner import MigrationRunner
+from order_test_helpers import create_order
+
+
+def _create_order(service: OrderService, service_type=ServiceType.TAKEOUT):
+    order, _ = create_order(service, service_type=service_type, quantity=1, waiter_id="waiter-events")
+    return order
+
+
+def _change(service: OrderService, order_id: str, new_status: str, **kwargs):
+    return service.update_order_status(
+        order_id, OrderStatusUpdateRequestDTO(new_status=new_status, **kwargs), "cook-events"
+    )
+
+
+def _projections(repo: OrderEventRepository):
+    return repo.get_status_counts(), repo.get_timing_stats(date.today() - timedelta(days=3650))
+
+
+def test_events_follow_transitions():
+    print("🧪 Test Historial - un evento por escritura")
+    print("=" * 50)
+
+    service = OrderService()
+    analytics = OrderAnalyticsService()
+    order = _create_order(service)
+    _change(service, order.id, "preparing")
+    ready = _change(service, order.id, "ready")
+
+    # Transición inválida y versión vieja: no se escribe ningún evento
+    for new_status, kwargs in [("pending", {}), ("cancelled", {"cancellation_reason": "x", "expected_version": 1})]:
+        try:
+            _change(service, order.id, new_status, **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"ready -> {new_status} debió rechazarse")
+
+    delivered = _change(service, order.id, "delivered")
+    history = analytics.get_order_history(order.id).events
+    assert [(event.from_status, event.to_status) for event in history] == [
+        (None, "pending"), ("pending", "preparing"), ("preparing", "ready"), ("ready", "delivered"),
+    ], history
+    assert [event.version for event in history] == [1, 2, 3, 4] == list(range(1, delivered.version + 1))
+    assert history[0].event_type == "order.created" and history[0].actor_id == "waiter-events"
+    assert history[2].actor_id == "cook-events"
+    # Los tiempos del evento son los mismos que quedaron en el pedido
+    assert history[2].preparation_time == ready.preparation_time
+    assert history[3].total_time == delivered.total_time
+
+    cancelled_order = _create_order(service)
+    _change(service, cancelled_order.id, "cancelled", cancellation_reason="Cliente se fue")
+    last = analytics.get_order_history(cancelled_order.id).events[-1]
+    assert last.to_status == "cancelled" and last.payload == {"cancellation_reason": "Cliente se fue"}
+    assert analytics.get_order_history(str(uuid.uuid4())) is None
+    print("✅ Creación y cada transición aplicada dejan exactamente un evento")
+
+
+def test_projections_are_incremental():
+    print("\n🧪 Test Historial - proyecciones incrementales")
+    print("=" * 50)
+
+    service = OrderService()
+    analytics = OrderAnalyticsService()
+    board_before = analytics.get_status_board().by_service_type.get("delivery", {})
+
+    first = _create_order(service, ServiceType.DELIVERY)
+    second = _create_order(service, ServiceType.DELIVERY)
+    _change(service, first.id, "preparing")
+    _change(service, first.id, "ready")
+    _change(service, second.id, "cancelled", cancellation_reason="Sin repartidor")
+
+    board = analytics.get_status_board().by_service_type["delivery"]
+    for status, delta in [("pending", 0), ("ready", 1), ("cancelled", 1)]:
+        assert board.get(status, 0) - board_before.get(status, 0) == delta, (status, board_before, board)
+    assert board.get("preparing", 0) == board_before.get("preparing", 0)
+
+    today = [row for row in analytics.get_timing_stats(days=1, service_type=ServiceType.DELIVERY)]
+    assert len(today) == 1 and today[0].ready_count >= 1 and today[0].cancelled_count >= 1
+    assert today[0].avg_preparation_time is not None
+
+    # Lo mantenido en cada batch coincide con recalcular desde el historial
+    repo = OrderEventRepository()
+    incremental = _projections(repo)
+    repo.rebuild_projections()
+    assert _projections(repo) == incremental
+    print("✅ order_status_counts y order_timing_stats coinciden con la reconstrucción")
+
+
+class _SqliteClient:
+    """Cliente mínimo sobre sqlite3 con la interfaz que usa MigrationRunner."""
+
+    def __init__(self):
+        self.connection = sqlite3.connect(":memory:", isolation_level=None)
+
+    def execute(self, query, params=None):
+        return SimpleNamespace(rows=self.connection.execute(query, params or []).fetchall())
+
+
+def test_migration_backfills_existing_orders():
+    print("\n🧪 Test Historial - migración de pedidos existentes")
+    print("=" * 50)
+
+    versions = Path(MigrationRunner(None).migrations_dir)
+    client = _SqliteClient()
+    with tempfile.TemporaryDirectory() as directory:
+        runner = MigrationRunner(client)
+        runner.migrations_dir = Path(directory)
+        for migration in sorted(versions.glob("*.sql")):
+            if migration.name < "015":
+                shutil.copy(migration, directory)
+        runner.run()
+
+        # Pedidos anteriores al historial: uno entregado y uno cancelado en preparación
+        columns = "id, order_number, customer_name, status, service_type, created_at, updated_at"
+        client.execute(f"""
+            INSERT INTO orders ({columns}, preparation_started_at, ready_at, completed_at, preparation_time, total_time)
+            VALUES ('o1', 'ORD-1', 'A', 'delivered', 'takeout', '2026-01-05T12:00:00', '2026-01-05T12:30:00',
+                    '2026-01-05T12:05:00', '2026-01-05T12:20:00', '2026-01-05T12:30:00', 900, 1800)
+        """)
+        client.execute(f"""
+            INSERT INTO orders ({columns}, preparation_started_at, cancelled_at, cancelled_by)
+            VALUES ('o2', 'ORD-2', 'B', 'cancelled', 'takeout', '2026-01-05T13:00:00', '2026-01-05T13:10:00',
+                    '2026-01-05T13:02:00', '2026-01-05T13:10:00', 'admin')
+        """)
+        for migration in sorted(versions.glob("015_*.sql")):
+            shutil.copy(migration, directory)
+        runner.run()
+
+    events = client.execute("SELECT order_id, from_status, to_status FROM order_events ORDER BY seq").rows
+    assert events == [
+        ("o1", None, "pending"), ("o1", "pending", "preparing"), ("o1", "preparing", "ready"), ("o1", "ready", "delivered"),
+        ("o2", None, "pending"), ("o2", "pending", "preparing"), ("o2", "preparing", "cancelled"),
+    ], events
+    counts = client.execute("SELECT status, order_count FROM order_status_counts ORDER BY status").rows
+    assert counts == [("cancelled", 1), ("delivered", 1)], counts
+    timing = client.execute("""
+        SELECT day, ready_count, preparation_time_total, completed_count, total_time_total, cancelled_count
+        FROM order_timing_stats
+    """).rows
+    assert timing == [("2026-01-05", 1, 900, 1, 1800, 1)], timing
+    print("✅ La migración reconstruye el historial y las proyecciones")
+
+
+if __name__ == "__main__":
+    test_events_follow_transitions()
+    test_projections_are_incremental()
+    test_migration_backfills_existing_orders()
+    print("\n✅ Todos los tests del historial de pedidos pasaron")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test de los cambios de estado con concurrencia optimista.
+Valida que el UPDATE condicional aplica la transición y devuelve el pedido con
+sus tiempos, que dos cambios simultáneos no se pisan (uno recibe conflicto),
+que las transiciones inválidas se rechazan sin escribir y que pending ->
+preparing no descuenta inventario si el pedido cambió entre lectura y escritura.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import uuid
+
+from src.modules.Inventory.infrastructure.repositories.inventory_repository import InventoryRepository
+from src.modules.Order.application.dto.order_request import OrderStatusUpdateRequestDTO
+from src.modules.Order.application.usecases.order_usecases import OrderService
+from src.modules.Order.domain.entities.order import ServiceType
+from src.modules.Order.domain.entities.order_conflict import OrderVersionConflictError
+from order_test_helpers import create_order, create_stock_item
+
+
+def _change(service: OrderService, order_id: str, new_status: str, **kwargs):
+    return service.update_order_status(
+        order_id, OrderStatusUpdateRequestDTO(new_status=new_status, **kwargs), "user-optimistic"
+    )
+
+
+def test_conditional_transitions():
+    print("🧪 Test Estados - UPDATE condicional con versión")
+    print("=" * 50)
+
+    service = OrderService()
+    stock_item = create_stock_item(10)
+    order, _ = create_order(service, stock_item)
+    assert order.version == 1
+
+    preparing = _change(service, order.id, "preparing", expected_version=1)
+    assert preparing.status == "preparing" and preparing.version == 2
+    assert InventoryRepository().get_by_id(stock_item.id).current_quantity == 8
+
+    # Dos tablets marcan "ready" a la vez con la misma versión: solo una gana
+    def mark_ready():
+        try:
+            return _change(OrderService(), order.id, "ready", expected_version=2)
+        except OrderVersionConflictError as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: mark_ready(), range(2)))
+    winners = [result for result in results if not isinstance(result, Exception)]
+    conflicts = [result for result in results if isinstance(result, OrderVersionConflictError)]
+    assert len(winners) == 1 and len(conflicts) == 1, results
+    ready = winners[0]
+    assert ready.version == 3 and ready.ready_at is not None and ready.preparation_time >= 0
+    assert conflicts[0].current_version == 3 and conflicts[0].current_status == "ready"
+    # RETURNING devuelve el pedido completo, con sus items
+    assert [item.menu_item_id for item in ready.items] == [stock_item.id]
+
+    # El tiempo de preparación guardado es el que se devolvió (el perdedor no lo pisó)
+    stored = service.get_order_by_id(order.id)
+    assert stored.ready_at == ready.ready_at and stored.version == 3
+
+    served = _change(service, order.id, "served")
+    assert served.status == "served" and served.payment_status == "PAID"
+    assert served.total_time >= 0 and served.version == 4
+
+    # Sin versión, repetir el cambio se valida contra el estado guardado
+    try:
+        _change(service, order.id, "served")
+    except OrderVersionConflictError:
+        raise AssertionError("Sin expected_version no debe haber conflicto")
+    except ValueError as error:
+        assert "ya está en ese estado" in str(error)
+    else:
+        raise AssertionError("Se esperaba ValueError")
+    assert service.get_order_by_id(order.id).version == 4
+    print("✅ Transiciones atómicas, conflicto para el perdedor y tiempos intactos")
+
+
+def test_invalid_transitions_write_nothing():
+    print("\n🧪 Test Estados - transiciones inválidas")
+    print("=" * 50)
+
+    service = OrderService()
+    order, _ = create_order(service, service_type=ServiceType.TAKEOUT)
+
+    for new_status, expected in [
+        ("ready", "No se puede cambiar de pending a ready"),
+        ("served", "No se puede cambiar de pending a served para takeout"),
+        ("pending", "El pedido ya está en ese estado"),
+    ]:
+        try:
+            _change(service, order.id, new_status)
+        except ValueError as error:
+            assert expected in str(error), (new_status, str(error))
+        else:
+            raise AssertionError(f"pending -> {new_status} debería ser inválido")
+
+    try:
+        _change(service, str(uuid.uuid4()), "ready")
+    except ValueError as error:
+        assert "no encontrado" in str(error)
+    else:
+        raise AssertionError("Se esperaba pedido no encontrado")
+
+    # Versión desactualizada: 409 aunque la transición sea válida
+    try:
+        _change(service, order.id, "cancelled", cancellation_reason="Cliente se fue", expected_version=5)
+    except OrderVersionConflictError as error:
+        assert error.current_version == 1
+    else:
+        raise AssertionError("Se esperaba conflicto de versión")
+
+    cancelled = _change(service, order.id, "cancelled", cancellation_reason="Cliente se fue", expected_version=1)
+    assert cancelled.status == "cancelled" and cancelled.cancelled_by == "user-optimistic"
+    assert cancelled.version == 2
+    print("✅ Las transiciones inválidas no escriben y la versión vieja da conflicto")
+
+
+def test_preparation_guard_reverts_stock():
+    print("\n🧪 Test Estados - guarda de pending -> preparing")
+    print("=" * 50)
+
+    service = OrderService()
+    stock_item = create_stock_item(10)
+    order, _ = create_order(service, stock_item)
+
+    # Otra solicitud cancela el pedido después de que este servicio lo leyera
+    stale_order = service.repo.get_by_id(order.id)
+    _change(OrderService(), order.id, "cancelled", cancellation_reason="Cancelado en caja")
+    service.repo.get_by_id = lambda order_id, include_items=True: (
+        stale_order if include_items else OrderService().repo.get_by_id(order_id, include_items=False)
+    )
+
+    try:
+        _change(service, order.id, "preparing")
+    except OrderVersionConflictError as error:
+        assert error.current_status == "cancelled"
+    else:
+        raise AssertionError("Se esperaba conflicto: el pedido ya estaba cancelado")
+
+    # El batch se revirtió entero: ni estado ni inventario cambiaron
+    assert InventoryRepository().get_by_id(stock_item.id).current_quantity == 10
+    assert OrderService().get_order_by_id(order.id).status == "cancelled"
+    print("✅ El descuento de inventario se revierte si el pedido cambió")
+
+
+if __name__ == "__main__":
+    test_conditional_transitions()
+    test_invalid_transitions_write_nothing()
+    test_preparation_guard_reverts_stock()
+    print("\n✅ Todos los tests de estados con concurrencia optimista pasaron")
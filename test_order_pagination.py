@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test del listado paginado de pedidos (keyset).
+Valida que recorrer las páginas devuelve todos los pedidos una sola vez en
+orden, los filtros y que la consulta usa los índices compuestos sin ordenar
+en memoria.
+"""
+
+from datetime import datetime, timedelta
+import uuid
+
+from src.modules.Order.application.usecases.order_usecases import OrderService
+from src.modules.Order.domain.entities.order import Order, OrderStatus, ServiceType
+from src.modules.Order.infrastructure.repositories.order_repository import OrderRepository
+from src.shared.infrastructure.database.turso_connection import turso_db
+
+
+def _seed_orders(waiter_id: str, count: int) -> list:
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    orders = []
+    for index in range(count):
+        # Pares de pedidos con el mismo created_at para probar el desempate por id
+        created_at = base + timedelta(minutes=index // 2)
+        orders.append(Order(
+            id=str(uuid.uuid4()),
+            order_number=f"ORD-PAGE-{uuid.uuid4().hex[:10].upper()}",
+            customer_name=f"Cliente {index}",
+            table_number=index % 3,
+            status=OrderStatus.PENDING if index % 2 == 0 else OrderStatus.SERVED,
+            service_type=ServiceType.DINE_IN if index % 4 else ServiceType.TAKEOUT,
+            waiter_id=waiter_id,
+            items=[],
+            created_at=created_at,
+            updated_at=created_at,
+        ))
+    OrderRepository().create_many(orders)
+    return orders
+
+
+def test_pages_cover_all_orders_in_order():
+    print("🧪 Test Order Pagination - recorrido completo")
+    print("=" * 50)
+
+    waiter_id = f"waiter-page-{uuid.uuid4().hex[:8]}"
+    seeded = _seed_orders(waiter_id, 23)
+    expected = [o.id for o in sorted(seeded, key=lambda o: (o.created_at.isoformat(), o.id), reverse=True)]
+
+    service = OrderService()
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        page = service.list_orders_page(waiter_id, limit=5, cursor=cursor)
+        pages += 1
+        seen.extend(order.id for order in page.items)
+        if not page.has_more:
+            assert page.next_cursor is None
+            break
+        cursor = page.next_cursor
+
+    assert pages == 5, f"Se esperaban 5 páginas, hubo {pages}"
+    assert seen == expected, "Las páginas no respetan el orden (created_at, id) o repiten pedidos"
+    print(f"✅ 23 pedidos recorridos en {pages} páginas sin duplicados ni saltos")
+
+
+def test_filters():
+    print("🧪 Test Order Pagination - filtros")
+
+    waiter_id = f"waiter-page-{uuid.uuid4().hex[:8]}"
+    _seed_orders(waiter_id, 12)
+    service = OrderService()
+
+    pending = service.list_orders_page(waiter_id, limit=50, status=OrderStatus.PENDING)
+    assert len(pending.items) == 6 and all(o.status == "pending" for o in pending.items)
+
+    takeout = service.list_orders_page(waiter_id, limit=50, service_type=ServiceType.TAKEOUT)
+    assert len(takeout.items) == 3
+
+    table = service.list_orders_page(waiter_id, limit=50, table_number=0)
+    assert len(table.items) == 4
+
+    ranged = service.list_orders_page(
+        waiter_id,
+        limit=50,
+        created_from=datetime(2026, 1, 1, 12, 1),
+        created_to=datetime(2026, 1, 1, 12, 2),
+    )
+    assert len(ranged.items) == 4
+
+    try:
+        service.list_orders_page(waiter_id, cursor="no-es-un-cursor")
+    except ValueError:
+        invalid_rejected = True
+    else:
+        invalid_rejected = False
+    assert invalid_rejected, "Un cursor inválido debe rechazarse"
+    print("✅ Filtros por estado, servicio, mesa y rango de fechas")
+
+
+def test_query_uses_composite_index():
+    print("🧪 Test Order Pagination - plan de consulta")
+
+    plan = turso_db.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT id FROM orders
+        WHERE waiter_id = ? AND (created_at, id) < (?, ?)
+        ORDER BY created_at DESC, id DESC LIMIT 51
+        """,
+        ["waiter-x", "2026-01-01T12:00:00", "z"],
+    )
+    details = " | ".join(str(row[3]) for row in plan.rows)
+    assert "idx_orders_waiter_created" in details, f"No usa el índice compuesto: {details}"
+    assert "TEMP B-TREE" not in details, f"Ordena en memoria: {details}"
+    print(f"✅ Plan: {details}")
+
+
+if __name__ == "__main__":
+    test_pages_cover_all_orders_in_order()
+    test_filters()
+    test_query_uses_composite_index()
+    print("\n🎉 Paginación de pedidos validada")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test del cambio de estado en lote (POST /api/orders/status:batch).
+Valida que el pase de cocina marca varios tickets como ready en una única
+transacción con un resultado por pedido (200 / 400 / 404 / 409), que un pedido
+sin stock no impide aplicar los demás, que el lote se revalida si otro pedido
+cambió entre la lectura y la escritura, y el endpoint HTTP.
+Requiere el servidor corriendo en http://localhost:8000.
+"""
+
+import uuid
+
+import requests
+
+from src.modules.Inventory.infrastructure.repositories.inventory_repository import InventoryRepository
+from src.modules.Order.application.dto.order_request import (
+    OrderStatusBatchItemRequestDTO,
+    OrderStatusUpdateRequestDTO,
+)
+from src.modules.Order.application.usecases.order_usecases import OrderService
+from src.shared.infrastructure.database.turso_connection import get_turso_client
+from order_test_helpers import create_order
+
+BASE_URL = "http://localhost:8000"
+
+
+def _batch(**fields) -> OrderStatusBatchItemRequestDTO:
+    return OrderStatusBatchItemRequestDTO(**fields)
+
+
+def test_pass_marks_tickets_ready_in_one_transaction():
+    print("🧪 Test Status Batch - pase de cocina")
+    print("=" * 50)
+
+    service = OrderService()
+    tickets = []
+    for _ in range(5):
+        order, _ = create_order(service)
+        service.update_order_status(order.id, OrderStatusUpdateRequestDTO(new_status="preparing"), "cook")
+        tickets.append(order.id)
+    untouched, _ = create_order(service)
+    stale, _ = create_order(service)
+
+    client = get_turso_client()
+    original_batch = client.batch
+    batches = []
+    client.batch = lambda statements: batches.append(len(statements)) or original_batch(statements)
+    try:
+        response = service.update_orders_status(
+            [_batch(order_id=order_id, new_status="ready", expected_version=2) for order_id in tickets]
+            + [
+                _batch(order_id=untouched.id, new_status="served"),
+                _batch(order_id=str(uuid.uuid4()), new_status="ready"),
+                _batch(order_id=stale.id, new_status="cancelled", cancellation_reason="x", expected_version=9),
+                _batch(order_id=tickets[0], new_status="served"),
+                _batch(order_id=str(uuid.uuid4()), new_status="volando"),
+            ],
+            "cook-pass",
+        )
+    finally:
+        client.batch = original_batch
+
+    codes = [result.status_code for result in response.results]
+    assert codes == [200] * 5 + [400, 404, 409, 400, 400], codes
+    assert response.applied == 5 and response.failed == 5
+    assert "más de una vez" in response.results[8].error
+    # Los 5 tickets se confirmaron en un único batch
+    assert len(batches) == 1, batches
+    for order_id, result in zip(tickets, response.results):
+        assert result.order_id == order_id and result.order.status == "ready"
+        assert result.order.version == 3 and result.order.ready_at is not None and result.order.items
+    assert service.get_order_by_id(untouched.id).status == "pending"
+    assert service.get_order_by_id(stale.id).status == "pending"
+    print(f"✅ 5 tickets en 1 batch ({batches[0]} sentencias) y errores por pedido")
+
+
+def test_stock_shortage_isolated_to_its_order():
+    print("\n🧪 Test Status Batch - falta de stock en un pedido")
+    print("=" * 50)
+
+    service = OrderService()
+    with_stock, stock_ok = create_order(service, stock_quantity=10)
+    without_stock, stock_short = create_order(service, stock_quantity=1)
+
+    response = service.update_orders_status([
+        _batch(order_id=with_stock.id, new_status="preparing"),
+        _batch(order_id=without_stock.id, new_status="preparing"),
+    ], "cook-pass")
+
+    assert [result.status_code for result in response.results] == [200, 400], response.results
+    inventory = InventoryRepository()
+    assert inventory.get_by_id(stock_ok.id).current_quantity == 8
+    assert inventory.get_by_id(stock_short.id).current_quantity == 1
+    assert service.get_order_by_id(without_stock.id).status == "pending"
+    print("✅ El pedido sin stock falla solo y los demás se aplican")
+
+
+def test_unexpected_error_reported_per_order():
+    print("\n🧪 Test Status Batch - error inesperado en el modo uno por uno")
+    print("=" * 50)
+
+    service = OrderService()
+    applied, _ = create_order(service, stock_quantity=10)
+    failing, _ = create_order(service, stock_quantity=10)
+    after, _ = create_order(service, stock_quantity=1)
+
+    # El batch conjunto falla por stock y se pasa a uno por uno; un pedido da un error de driver
+    real_update = service.update_order_status
+
+    def update_order_status(order_id, request, user_id):
+        if order_id == failing.id:
+            raise RuntimeError("conexión perdida")
+        return real_update(order_id, request, user_id)
+
+    service.update_order_status = update_order_status
+    response = service.update_orders_status([
+        _batch(order_id=applied.id, new_status="preparing"),
+        _batch(order_id=failing.id, new_status="preparing"),
+        _batch(order_id=after.id, new_status="preparing"),
+    ], "cook-pass")
+
+    assert [result.status_code for result in response.results] == [200, 500, 400], response.results
+    assert "conexión perdida" in response.results[1].error
+    assert response.applied == 1 and response.failed == 2
+    print("✅ Un error inesperado queda en su pedido y el informe llega completo")
+
+
+def test_batch_revalidates_after_concurrent_change():
+    print("\n🧪 Test Status Batch - cambio concurrente")
+    print("=" * 50)
+
+    service = OrderService()
+    cancelled_meanwhile, _ = create_order(service)
+    stale_with_version, _ = create_order(service)
+    still_valid, _ = create_order(service)
+    order_ids = [cancelled_meanwhile.id, stale_with_version.id, still_valid.id]
+
+    # Este servicio lee los pedidos y otra solicitud los cambia antes de confirmar
+    stale_orders = service.repo.get_many(order_ids)
+    other = OrderService()
+    for order_id in order_ids[:2]:
+        other.update_order_status(order_id, OrderStatusUpdateRequestDTO(
+            new_status="cancelled", cancellation_reason="Cancelado en caja"
+        ), "cashier")
+    real_get_many = service.repo.get_many
+    reads = []
+
+    def get_many(ids, include_items=True):
+        reads.append(ids)
+        return stale_orders if len(reads) == 1 else real_get_many(ids, include_items)
+
+    service.repo.get_many = get_many
+    response = service.update_orders_status([
+        _batch(order_id=cancelled_meanwhile.id, new_status="preparing"),
+        _batch(order_id=stale_with_version.id, new_status="preparing", expected_version=1),
+        _batch(order_id=still_valid.id, new_status="preparing"),
+    ], "cook-pass")
+
+    codes = [result.status_code for result in response.results]
+    assert codes == [400, 409, 200], response.results
+    assert "cancelled" in response.results[0].error
+    assert OrderService().get_order_by_id(still_valid.id).status == "preparing"
+    print("✅ El batch revertido se revalida: conflicto, transición inválida y aplicado")
+
+
+def _login() -> dict:
+    email = f"pass_{uuid.uuid4().hex[:8]}@test.com"
+    requests.post(f"{BASE_URL}/api/auth/register", json={
+        "name": "Cocina Pase", "email": email, "password": "TestPass123!"
+    })
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={"email": email, "password": "TestPass123!"})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_status_batch_endpoint():
+    print("\n🧪 Test Status Batch - endpoint")
+    print("=" * 50)
+
+    headers = _login()
+    created = requests.post(f"{BASE_URL}/api/orders/", json={
+        "customer_name": "Mesa pase", "table_number": 8, "service_type": "dine_in",
+        "items": [{"menu_item_id": "menu-pase", "menu_item_name": "Arroz", "quantity": 1, "unit_price": 9.0}],
+    }, headers=headers).json()
+
+    response = requests.post(f"{BASE_URL}/api/orders/status:batch", json={"updates": [
+        {"order_id": created["id"], "new_status": "cancelled", "cancellation_reason": "Pase", "expected_version": 1},
+        {"order_id": "no-existe", "new_status": "ready"},
+    ]}, headers=headers)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [result["status_code"] for result in body["results"]] == [200, 404]
+    assert body["results"][0]["order"]["status"] == "cancelled" and body["applied"] == 1
+
+    empty = requests.post(f"{BASE_URL}/api/orders/status:batch", json={"updates": []}, headers=headers)
+    assert empty.status_code == 400
+    print("✅ POST /api/orders/status:batch devuelve un resultado por pedido")
+
+
+if __name__ == "__main__":
+    test_pass_marks_tickets_ready_in_one_transaction()
+    test_stock_shortage_isolated_to_its_order()
+    test_unexpected_error_reported_per_order()
+    test_batch_revalidates_after_concurrent_change()
+    test_status_batch_endpoint()
+    print("\n✅ Todos los tests de cambio de estado en lote pasaron")
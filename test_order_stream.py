@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Test del streaming de pedidos en tiempo real.
+Valida el broker (entrega entre hilos, filtros, reanudación por id, resync por
+historial o por época y expulsión de consumidores lentos), el endpoint SSE
+contra el servidor y el WebSocket con la aplicación en proceso (incluido el
+cierre cuando se revoca la sesión).
+Requiere el servidor corriendo en http://localhost:8000.
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+
+import requests
+from fastapi.testclient import TestClient
+
+from src.modules.Order.infrastructure.api.order_stream_router import _build_filter
+from src.modules.Order.infrastructure.events.order_event_publisher import order_event_broker
+from src.modules.User.infrastructure.api.auth_router import revoked_sessions
+from src.modules.User.domain.services.auth_service import AuthService
+from src.shared.infrastructure.config.settings import settings
+from src.shared.infrastructure.events import EventBroker, SubscriptionClosed
+
+BASE_URL = "http://localhost:8000"
+
+ORDER = {
+    "customer_name": "Mesa en vivo",
+    "table_number": 3,
+    "service_type": "dine_in",
+    "items": [{"menu_item_id": "menu-live", "menu_item_name": "Tacos", "quantity": 1, "unit_price": 8.5}],
+}
+
+
+def test_broker_delivery_resume_and_eviction():
+    print("🧪 Test Order Stream - broker en memoria")
+    print("=" * 50)
+
+    async def scenario():
+        broker = EventBroker(history_size=5, max_queue_size=3)
+        only_w1 = broker.subscribe(lambda event: event.attributes.get("waiter_id") == "w1")
+
+        # Publicar desde otro hilo (como OrderService en el threadpool)
+        publisher = threading.Thread(target=lambda: [
+            broker.publish("order.created", {"n": n}, {"waiter_id": "w1" if n % 2 == 0 else "w2"})
+            for n in range(4)
+        ])
+        publisher.start()
+        publisher.join()
+        received = [await only_w1.get(timeout=1), await only_w1.get(timeout=1)]
+        assert [event.data["n"] for event in received] == [0, 2]
+        assert await only_w1.get(timeout=0.05) is None, "El filtro dejó pasar eventos de otro mesero"
+
+        # Reanudar desde el id 2: se reenvían 3 y 4 desde el historial
+        assert received[1].id == f"{broker.epoch}-3"
+        resumed = broker.subscribe(last_event_id=f"{broker.epoch}-2")
+        assert not resumed.resync_required
+        assert [(await resumed.get(timeout=1)).sequence for _ in range(2)] == [3, 4]
+
+        # Con historial de 5, el id 1 ya no está tras publicar 4 más: resync
+        for n in range(4):
+            broker.publish("order.created", {"n": n})
+        assert broker.subscribe(last_event_id=f"{broker.epoch}-1").resync_required
+        # Un id mayor que el último también pide resync
+        assert broker.subscribe(last_event_id=f"{broker.epoch}-999").resync_required
+
+        # Un id de otra época (proceso anterior u otro worker) pide resync aunque
+        # su secuencia siga en el historial de este broker
+        restarted = EventBroker(history_size=5)
+        assert restarted.epoch != broker.epoch
+        assert broker.subscribe(last_event_id=f"{restarted.epoch}-7").resync_required
+        assert broker.subscribe(last_event_id="7").resync_required
+
+        # `resumed` no consumió: su cola de 3 se llenó y fue expulsado
+        assert resumed.closed_reason == "slow_consumer"
+        try:
+            await resumed.get(timeout=1)
+        except SubscriptionClosed as closed:
+            assert closed.reason == "slow_consumer"
+        else:
+            raise AssertionError("El consumidor lento debió ser expulsado")
+        stats = broker.stats()
+        assert stats["evicted_total"] >= 1 and stats["resyncs_total"] == 4
+        assert stats["last_event_id"] == f"{broker.epoch}-8"
+        print(f"   Estadísticas: {stats}")
+
+    asyncio.run(scenario())
+    print("✅ Entrega entre hilos, filtros, reanudación y expulsión correctas")
+
+
+def test_role_and_station_filters():
+    print("\n🧪 Test Order Stream - filtros por rol y estación")
+    print("=" * 50)
+
+    class Event:
+        def __init__(self, waiter_id, status, service_type="dine_in"):
+            self.attributes = {"waiter_id": waiter_id, "status": status, "service_type": service_type}
+
+    waiter = {"id": "w1", "permissions": frozenset({"manage_orders"})}
+    kitchen = {"id": "k1", "permissions": frozenset({"view_reports", "manage_inventory"})}
+
+    own_only = _build_filter(waiter, None, None, None, None)
+    assert own_only(Event("w1", "pending")) and not own_only(Event("w2", "pending"))
+    try:
+        _build_filter(waiter, None, None, None, "w2")
+    except PermissionError:
+        pass
+    else:
+        raise AssertionError("Un mesero no debe ver pedidos de otro")
+
+    kitchen_station = _build_filter(kitchen, "kitchen", None, ["dine_in"], None)
+    assert kitchen_station(Event("w2", "preparing"))
+    assert not kitchen_station(Event("w2", "served"))
+    assert not kitchen_station(Event("w2", "preparing", "delivery"))
+    print("✅ Los meseros solo ven sus pedidos y la cocina filtra por estación")
+
+
+def _login(prefix: str) -> dict:
+    email = f"{prefix}_{uuid.uuid4().hex[:8]}@test.com"
+    requests.post(f"{BASE_URL}/api/auth/register", json={
+        "name": "Mesero Stream", "email": email, "password": "TestPass123!"
+    })
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={"email": email, "password": "TestPass123!"})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _read_sse_events(lines, count: int) -> list:
+    events, current = [], {}
+    for line in lines:
+        if line.startswith("id: "):
+            current["id"] = line[4:]
+        elif line.startswith("event: "):
+            current["event"] = line[7:]
+        elif line.startswith("data: "):
+            current["data"] = json.loads(line[6:])
+        elif line == "" and current:
+            events.append(current)
+            current = {}
+            if len(events) == count:
+                break
+    return events
+
+
+def test_sse_stream_and_resume():
+    print("\n🧪 Test Order Stream - SSE")
+    print("=" * 50)
+
+    headers = _login("stream")
+    response = requests.get(f"{BASE_URL}/api/orders/stream", headers=headers, stream=True, timeout=10)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+    lines = response.iter_lines(decode_unicode=True)
+    # El primer mensaje (retry) confirma que la suscripción ya está abierta
+    assert next(lines).startswith("retry:")
+
+    created = requests.post(f"{BASE_URL}/api/orders/", json=ORDER, headers=headers).json()
+    requests.put(f"{BASE_URL}/api/orders/{created['id']}/status", json={
+        "new_status": "cancelled", "cancellation_reason": "Prueba de streaming"
+    }, headers=headers)
+
+    events = _read_sse_events(lines, 2)
+    response.close()
+    assert [event["event"] for event in events] == ["order.created", "order.status_changed"], events
+    assert events[0]["data"]["data"]["id"] == created["id"]
+    assert events[1]["data"]["data"]["status"] == "cancelled"
+
+    # Reconectar con Last-Event-ID: llega lo posterior sin recargar todo
+    resumed = requests.get(
+        f"{BASE_URL}/api/orders/stream",
+        headers={**headers, "Last-Event-ID": events[0]["id"]},
+        stream=True,
+        timeout=10,
+    )
+    replay = _read_sse_events(resumed.iter_lines(decode_unicode=True), 1)
+    resumed.close()
+    assert replay[0]["id"] == events[1]["id"] and replay[0]["event"] == "order.status_changed"
+
+    # Un id de otro arranque del servidor no se confunde con uno de este: resync
+    stale = requests.get(
+        f"{BASE_URL}/api/orders/stream",
+        headers={**headers, "Last-Event-ID": "otraepoca-1"},
+        stream=True,
+        timeout=10,
+    )
+    resync = _read_sse_events(stale.iter_lines(decode_unicode=True), 1)
+    stale.close()
+    assert resync[0]["event"] == "resync", resync
+
+    # Un mesero no puede pedir el stream de otro
+    forbidden = requests.get(f"{BASE_URL}/api/orders/stream?waiter_id=otro", headers=headers, timeout=10)
+    assert forbidden.status_code == 403
+    print("✅ SSE entrega creación y cambio de estado y reanuda con Last-Event-ID")
+
+
+def test_websocket_stream():
+    print("\n🧪 Test Order Stream - WebSocket")
+    print("=" * 50)
+
+    from main import app
+
+    auth_service = AuthService(secret_key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    token = auth_service.generate_token("ws-waiter", "ws-waiter@test.com", "uuid-role-waiter")
+    client = TestClient(app)
+
+    with client.websocket_connect(f"/api/orders/ws?token={token}&station=kitchen") as websocket:
+        order_event_broker.publish(
+            "order.created", {"id": "otro"}, {"waiter_id": "otro-mesero", "status": "pending"}
+        )
+        order_event_broker.publish(
+            "order.created", {"id": "propio"}, {"waiter_id": "ws-waiter", "status": "pending"}
+        )
+        message = websocket.receive_json()
+        assert message["type"] == "order.created" and message["data"]["id"] == "propio", message
+
+    # Sin token se rechaza la conexión
+    try:
+        with client.websocket_connect("/api/orders/ws") as websocket:
+            websocket.receive_json()
+    except Exception:
+        pass
+    else:
+        raise AssertionError("El WebSocket sin token debió rechazarse")
+    print("✅ El WebSocket filtra por mesero y exige token")
+
+
+def test_websocket_closes_when_session_is_revoked():
+    print("\n🧪 Test Order Stream - WebSocket con sesión revocada")
+    print("=" * 50)
+
+    from main import app
+
+    session_id = f"ws-session-{uuid.uuid4().hex[:8]}"
+    auth_service = AuthService(secret_key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    token = auth_service.generate_token(
+        "ws-revoked", "ws-revoked@test.com", "uuid-role-waiter", session_id=session_id
+    )
+    client = TestClient(app)
+
+    keepalive_seconds = settings.ORDER_STREAM_KEEPALIVE_SECONDS
+    settings.ORDER_STREAM_KEEPALIVE_SECONDS = 0.1
+    try:
+        with client.websocket_connect(f"/api/orders/ws?token={token}") as websocket:
+            assert websocket.receive_json()["type"] == "keepalive"
+            # Logout en otro lado después del handshake: el siguiente keepalive lo detecta
+            revoked_sessions.add(session_id)
+            message = websocket.receive_json()
+            assert message["type"] == "revoked", message
+    finally:
+        settings.ORDER_STREAM_KEEPALIVE_SECONDS = keepalive_seconds
+    print("✅ El WebSocket se cierra cuando la sesión se revoca")
+
+
+if __name__ == "__main__":
+    test_broker_delivery_resume_and_eviction()
+    test_role_and_station_filters()
+    test_sse_stream_and_resume()
+    test_websocket_stream()
+    test_websocket_closes_when_session_is_revoked()
+    print("\n✅ Todos los tests de streaming de pedidos pasaron")
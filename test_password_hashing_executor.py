@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test del pool de hashing de contraseñas.
+Valida que bcrypt corre fuera del event loop (otras corrutinas siguen
+avanzando), que la cola acotada rechaza el exceso y que se publican métricas.
+El test del login completo requiere las tablas creadas (servidor arrancado
+al menos una vez contra la misma base).
+"""
+
+import asyncio
+import time
+import uuid
+
+from src.modules.User.domain.services.password_service import PasswordService
+from src.modules.User.application.dto.login_request import LoginRequest
+from src.modules.User.application.usecases.login_user import LoginUserUseCase
+from src.modules.User.domain.entities.session import Session
+from src.modules.User.domain.entities.user import User
+from src.modules.User.infrastructure.audit import LoginAttemptAuditWriter
+from src.modules.User.infrastructure.hashing import PasswordHashingExecutor, PasswordHashingSaturatedError
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+from src.modules.User.infrastructure.repositories.session_repository import SessionRepository
+from src.modules.User.infrastructure.repositories.user_repository import UserRepository
+
+
+class SlowClient:
+    """Cliente con la latencia de un viaje de red a Turso en cada consulta."""
+
+    LATENCY_SECONDS = 0.2
+
+    def __init__(self, client):
+        self.client = client
+
+    def execute(self, query, params=None):
+        time.sleep(self.LATENCY_SECONDS)
+        return self.client.execute(query, params)
+
+    async def execute_async(self, query, params=None):
+        await asyncio.sleep(self.LATENCY_SECONDS)
+        return await self.client.execute_async(query, params)
+
+
+def test_hash_and_verify_round_trip():
+    print("🧪 Test Password Hashing - hash y verificación en el pool")
+    print("=" * 50)
+
+    executor = PasswordHashingExecutor(max_workers=1)
+    try:
+        async def scenario():
+            hashed = await executor.hash_password("MiPassword123!")
+            assert PasswordService.verify_password("MiPassword123!", hashed)
+            assert await executor.verify_password("MiPassword123!", hashed)
+            assert not await executor.verify_password("OtraPassword1!", hashed)
+
+        asyncio.run(scenario())
+        stats = executor.stats()
+        assert stats["completed_total"] == 3 and stats["latency"]["count"] == 3
+        print(f"✅ Hash compatible con PasswordService; p50 {stats['latency']['p50_ms']} ms")
+    finally:
+        executor.shutdown()
+
+
+def test_event_loop_stays_responsive():
+    print("🧪 Test Password Hashing - event loop libre")
+
+    executor = PasswordHashingExecutor(max_workers=1)
+    executor.start()
+    try:
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker_task = asyncio.create_task(ticker())
+            await executor.hash_password("MiPassword123!")
+            ticker_task.cancel()
+            return ticks
+
+        ticks = asyncio.run(scenario())
+        # bcrypt coste 12 tarda ~250 ms: con el loop libre el ticker avanza decenas de veces
+        assert ticks >= 5, f"El event loop se bloqueó durante el hash ({ticks} ticks)"
+        print(f"✅ El ticker avanzó {ticks} veces mientras se calculaba el hash")
+    finally:
+        executor.shutdown()
+
+
+def test_bounded_queue_rejects_excess():
+    print("🧪 Test Password Hashing - backpressure")
+
+    executor = PasswordHashingExecutor(max_workers=1, max_queue_size=1)
+    executor.start()
+    try:
+        async def scenario():
+            results = await asyncio.gather(
+                *(executor.hash_password("MiPassword123!") for _ in range(4)),
+                return_exceptions=True,
+            )
+            return results
+
+        results = asyncio.run(scenario())
+        rejected = [r for r in results if isinstance(r, PasswordHashingSaturatedError)]
+        hashed = [r for r in results if isinstance(r, str)]
+        assert len(hashed) == 2 and len(rejected) == 2, results
+
+        stats = executor.stats()
+        assert stats["rejected_total"] == 2 and stats["queue_depth"] == 0
+        print("✅ Con 1 proceso y cola de 1, dos peticiones se atienden y dos se rechazan")
+    finally:
+        executor.shutdown()
+
+
+def test_login_keeps_event_loop_responsive():
+    print("🧪 Test Password Hashing - login completo sin bloquear el loop")
+
+    user_repository = UserRepository()
+    email = f"loop_{uuid.uuid4().hex[:8]}@test.com"
+    user_repository.save(User(
+        id=str(uuid.uuid4()),
+        name="Usuario Loop",
+        email=email,
+        password_hash=PasswordService.hash_password("MiPassword123!", rounds=4),
+        role_id="uuid-role-waiter",
+    ))
+    user_repository.client = SlowClient(user_repository.client)
+    session_repository = SessionRepository()
+    session_repository.client = SlowClient(session_repository.client)
+
+    executor = PasswordHashingExecutor(max_workers=1, rounds=4)
+    executor.start()
+    try:
+        use_case = LoginUserUseCase(user_repository, LoginAttemptAuditWriter(LoginAttemptRepository()), executor)
+
+        async def scenario():
+            max_gap = 0.0
+
+            async def ticker():
+                nonlocal max_gap
+                last = time.perf_counter()
+                while True:
+                    await asyncio.sleep(0.01)
+                    now = time.perf_counter()
+                    max_gap = max(max_gap, now - last)
+                    last = now
+
+            ticker_task = asyncio.create_task(ticker())
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            # Lo mismo que POST /api/auth/login: buscar, verificar, actualizar y abrir la sesión
+            user, error, status_code = await use_case.execute(LoginRequest(email=email, password="MiPassword123!"))
+            assert status_code == 200, error
+            session, _ = Session.open(user.id, expires_in_days=1)
+            await session_repository.save_async(session)
+            elapsed = time.perf_counter() - started
+            ticker_task.cancel()
+            return max_gap, elapsed
+
+        max_gap, elapsed = asyncio.run(scenario())
+        # Tres consultas de 200 ms: si alguna bloqueara el loop el ticker se detendría 200 ms
+        assert elapsed >= 3 * SlowClient.LATENCY_SECONDS
+        assert max_gap < SlowClient.LATENCY_SECONDS / 2, f"El event loop se bloqueó {max_gap * 1000:.0f} ms"
+        print(f"✅ Login de {elapsed * 1000:.0f} ms; el loop nunca estuvo parado más de {max_gap * 1000:.0f} ms")
+    finally:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    test_hash_and_verify_round_trip()
+    test_event_loop_stays_responsive()
+    test_bounded_queue_rejects_excess()
+    test_login_keeps_event_loop_responsive()
+    print("\n🎉 Pool de hashing validado")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test de la calibración del coste de bcrypt y el rehash transparente en login.
+Valida que la calibración respeta el objetivo y los límites, que el coste
+calibrado se comparte entre workers a través de la base, y que un usuario con
+un hash de coste menor queda rehasheado tras un login correcto (nunca a la baja).
+"""
+
+import asyncio
+import uuid
+
+from src.modules.User.application.dto.login_request import LoginRequest
+from src.modules.User.application.usecases.login_user import LoginUserUseCase
+from src.modules.User.domain.entities.user import User
+from src.modules.User.domain.services.password_service import PasswordService
+from src.modules.User.infrastructure.hashing import PasswordHashCostStore, PasswordHashingExecutor
+from src.modules.User.infrastructure.audit import LoginAttemptAuditWriter
+from src.modules.User.infrastructure.repositories.login_attempt_repository import LoginAttemptRepository
+from src.modules.User.infrastructure.repositories.user_repository import UserRepository
+
+
+def test_cost_helpers_and_calibration():
+    print("🧪 Test Password Rehash - calibración")
+    print("=" * 50)
+
+    hashed = PasswordService.hash_password("MiPassword123!", rounds=10)
+    assert PasswordService.get_rounds(hashed) == 10
+    assert PasswordService.get_rounds("no-es-bcrypt") is None
+    assert PasswordService.needs_rehash(hashed, 11) and not PasswordService.needs_rehash(hashed, 10)
+    # Un hash más costoso que el objetivo no se rebaja
+    assert not PasswordService.needs_rehash(hashed, 9)
+    assert PasswordService.needs_rehash("no-es-bcrypt", 10)
+
+    rounds = PasswordService.calibrate_rounds(target_ms=100, min_rounds=4, max_rounds=14)
+    assert 4 <= rounds <= 14
+    elapsed_ms = PasswordService.measure_hash_time(rounds) * 1000
+    # Margen para el ruido de la medición en máquinas compartidas
+    assert rounds == 4 or elapsed_ms <= 100 * 1.5, f"Coste {rounds} tarda {elapsed_ms:.0f} ms"
+    assert PasswordService.calibrate_rounds(target_ms=1, min_rounds=10) == 10, "No respeta el mínimo"
+    assert PasswordService.MIN_ROUNDS >= PasswordService.DEFAULT_ROUNDS, "La calibración podría bajar el coste por defecto"
+    print(f"✅ Coste calibrado para 100 ms: {rounds} ({elapsed_ms:.0f} ms por hash)")
+
+
+def test_calibrated_cost_is_shared_between_workers():
+    print("🧪 Test Password Rehash - coste compartido")
+
+    # Clave propia para no tocar el coste que usa el servidor
+    store = PasswordHashCostStore(key=f"test_rounds_{uuid.uuid4().hex[:8]}")
+    assert store.get() is None
+    # El primer worker guarda su coste; el segundo calibró otro pero recibe el primero
+    assert store.save_if_absent(13) == 13
+    assert store.save_if_absent(14) == 13
+
+    # Un worker que arranca con el coste ya guardado no recalibra
+    executor = PasswordHashingExecutor(max_workers=1)
+    try:
+        assert executor.calibrate_shared(store, target_ms=1, min_rounds=12) == 13
+        assert executor.calibrated_hash_ms is None, "Recalibró aunque había un coste guardado"
+        # Un valor guardado por debajo del mínimo vigente no se usa
+        assert executor.calibrate_shared(store, target_ms=1, min_rounds=14) == 14
+    finally:
+        executor.shutdown()
+    print("✅ Todos los workers usan el coste guardado por el primero")
+
+
+def test_login_rehashes_stale_cost():
+    print("🧪 Test Password Rehash - rehash en login")
+
+    user_repository = UserRepository()
+    email = f"rehash_{uuid.uuid4().hex[:8]}@test.com"
+    user_repository.save(User(
+        id=str(uuid.uuid4()),
+        name="Usuario Rehash",
+        email=email,
+        password_hash=PasswordService.hash_password("MiPassword123!", rounds=10),
+        role_id="uuid-role-waiter",
+    ))
+
+    executor = PasswordHashingExecutor(max_workers=1, rounds=11)
+    try:
+        use_case = LoginUserUseCase(user_repository, LoginAttemptAuditWriter(LoginAttemptRepository()), executor)
+
+        user, error, status_code = asyncio.run(
+            use_case.execute(LoginRequest(email=email, password="MiPassword123!"))
+        )
+        assert status_code == 200, error
+        stored = user_repository.find_by_email(email).password_hash
+        assert PasswordService.get_rounds(stored) == 11, "El hash no se actualizó al coste actual"
+
+        # El nuevo hash sigue validando y ya no requiere rehash
+        hashes_before = executor.stats()["submitted_total"]
+        user, error, status_code = asyncio.run(
+            use_case.execute(LoginRequest(email=email, password="MiPassword123!"))
+        )
+        assert status_code == 200, error
+        assert executor.stats()["submitted_total"] == hashes_before + 1, "Se rehasheó sin necesidad"
+        print("✅ Hash de coste 10 actualizado a 11 en el login y reutilizado después")
+    finally:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    test_cost_helpers_and_calibration()
+    test_calibrated_cost_is_shared_between_workers()
+    test_login_rehashes_stale_cost()
+    print("\n🎉 Calibración y rehash validados")
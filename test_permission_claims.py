@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Test de los claims de permisos en el JWT.
+Valida que el login emite la máscara de permisos del rol y su versión, que
+get_current_user los decodifica sin consultar la base y que cambiar los
+permisos del rol invalida los tokens emitidos con la versión anterior.
+Los tokens con un rol desconocido se rechazan sin consultar la base y los
+de una versión más nueva recargan la matriz como mucho una vez por intervalo.
+"""
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.modules.User.domain.services.auth_service import AuthService
+from src.modules.User.infrastructure.api import auth_router as auth_router_module
+from src.modules.User.infrastructure.api.auth_router import get_current_user, permission_matrix
+from src.modules.User.infrastructure.api.dependencies import require_permission
+from src.modules.User.infrastructure.repositories.permission_repository import PermissionRepository
+from src.shared.infrastructure.config.settings import settings
+
+
+class FailingClient:
+    """Cliente que falla si se consulta: la autorización no debe tocar la base."""
+
+    def execute(self, query, params=None):
+        raise AssertionError(f"Consulta inesperada en el camino de la petición: {query}")
+
+
+auth_service = AuthService(secret_key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _login_token(role_id: str, user_id: str) -> str:
+    mask, version = permission_matrix.claims_for_role(role_id)
+    return auth_service.generate_token(
+        user_id=user_id,
+        email=f"{user_id}@test.com",
+        role_id=role_id,
+        permissions_mask=mask,
+        permissions_version=version,
+    )
+
+
+def test_token_carries_role_permissions():
+    print("🧪 Test Permission Claims - máscara en el token")
+    print("=" * 50)
+
+    permission_matrix.load()
+    token = _login_token("uuid-role-waiter", "user-claims")
+    payload = auth_service.verify_token(token)
+    assert isinstance(payload["perms"], str) and isinstance(payload["pv"], int)
+
+    role_client = permission_matrix.role_repository.client
+    permission_client = permission_matrix.permission_repository.client
+    permission_matrix.role_repository.client = FailingClient()
+    permission_matrix.permission_repository.client = FailingClient()
+    try:
+        user = get_current_user(_credentials(token))
+        assert user["permissions"] == frozenset({"manage_orders", "view_tables"})
+        assert user["permissions_version"] == payload["pv"]
+        assert require_permission("manage_orders")(user=user) == user
+        try:
+            require_permission("manage_inventory")(user=user)
+        except HTTPException as error:
+            assert error.status_code == 403
+        else:
+            raise AssertionError("Un mesero no debe gestionar inventario")
+    finally:
+        permission_matrix.role_repository.client = role_client
+        permission_matrix.permission_repository.client = permission_client
+    print(f"✅ Claim perms={payload['perms']} decodificado sin consultas a la base")
+
+
+def test_permission_change_forces_new_token():
+    print("🧪 Test Permission Claims - versión de permisos")
+
+    role_id = "uuid-role-waiter"
+    repository = PermissionRepository()
+    permission = repository.find_by_name("view_reports")
+    permission_matrix.load()
+    old_token = _login_token(role_id, "user-version")
+    assert get_current_user(_credentials(old_token))["id"] == "user-version"
+
+    try:
+        assert repository.assign_to_role(role_id, permission.id)
+        # El token anterior está en la caché de JWT: aun así se rechaza
+        try:
+            get_current_user(_credentials(old_token))
+        except HTTPException as error:
+            assert error.status_code == 401 and "permisos" in error.detail
+        else:
+            raise AssertionError("El token con la versión anterior debió rechazarse")
+
+        # Renovar no sirve para saltarse el cambio: conserva la versión vieja
+        refreshed = auth_service.refresh_token(old_token)
+        try:
+            get_current_user(_credentials(refreshed))
+        except HTTPException as error:
+            assert error.status_code == 401
+        else:
+            raise AssertionError("El token renovado conservó permisos obsoletos")
+
+        new_user = get_current_user(_credentials(_login_token(role_id, "user-version")))
+        assert "view_reports" in new_user["permissions"]
+        print("✅ Asignar un permiso invalida los tokens anteriores; el nuevo login lo incluye")
+    finally:
+        repository.revoke_from_role(role_id, permission.id)
+
+
+def test_refresh_detects_changes_from_other_workers():
+    print("🧪 Test Permission Claims - cambios de otro worker")
+
+    role_id = "uuid-role-employee"
+    permission_matrix.load()
+    version = permission_matrix.role_version(role_id)
+    assert not permission_matrix.refresh_if_changed()
+
+    # Otro proceso incrementa la versión directamente en la base
+    permission_matrix.role_repository.client.execute(
+        "UPDATE roles SET permissions_version = permissions_version + 1 WHERE id = ?", [role_id]
+    )
+    assert permission_matrix.role_version(role_id) == version
+    assert permission_matrix.refresh_if_changed()
+    assert permission_matrix.role_version(role_id) == version + 1
+    print("✅ La revisión periódica detecta versiones cambiadas fuera de este proceso")
+
+
+def test_newer_token_version_refreshes_stale_worker():
+    print("🧪 Test Permission Claims - token de un worker más actualizado")
+
+    role_id = "uuid-role-employee"
+    permission_matrix.load()
+    auth_router_module._last_token_refresh = 0.0
+    version = permission_matrix.role_version(role_id)
+    old_token = _login_token(role_id, "user-stale-worker")
+
+    # Otro worker cambió los permisos y emitió un token con la versión nueva;
+    # este proceso aún no hizo su revisión periódica
+    permission_matrix.role_repository.client.execute(
+        "UPDATE roles SET permissions_version = permissions_version + 1 WHERE id = ?", [role_id]
+    )
+    new_token = auth_service.generate_token(
+        user_id="user-stale-worker",
+        email="user-stale-worker@test.com",
+        role_id=role_id,
+        permissions_mask=permission_matrix.claims_for_role(role_id)[0],
+        permissions_version=version + 1,
+    )
+    assert permission_matrix.role_version(role_id) == version
+
+    user = get_current_user(_credentials(new_token))
+    assert user["permissions_version"] == version + 1
+    assert permission_matrix.role_version(role_id) == version + 1, "El worker debió ponerse al día"
+
+    # El token con la versión anterior sí se rechaza
+    try:
+        get_current_user(_credentials(old_token))
+    except HTTPException as error:
+        assert error.status_code == 401
+    else:
+        raise AssertionError("El token con la versión anterior debió rechazarse")
+    print("✅ Una versión más nueva recarga la matriz; solo se rechazan versiones anteriores")
+
+
+def test_unknown_role_and_newer_versions_do_not_hit_the_database():
+    print("🧪 Test Permission Claims - sin consultas provocadas por tokens")
+
+    role_id = "uuid-role-employee"
+    permission_matrix.load()
+    version = permission_matrix.role_version(role_id)
+    mask = permission_matrix.claims_for_role(role_id)[0]
+    unknown_role_token = auth_service.generate_token(
+        user_id="user-deleted-role",
+        email="user-deleted-role@test.com",
+        role_id="uuid-role-eliminado",
+        permissions_mask=mask,
+        permissions_version=1,
+    )
+
+    def newer_token(user_id: str) -> str:
+        return auth_service.generate_token(
+            user_id=user_id,
+            email=f"{user_id}@test.com",
+            role_id=role_id,
+            permissions_mask=mask,
+            permissions_version=version + 5,
+        )
+
+    # Acaba de haber una recarga provocada por un token: dentro del intervalo no se repite
+    auth_router_module._last_token_refresh = auth_router_module.time.monotonic()
+    client = permission_matrix.role_repository.client
+    permission_matrix.role_repository.client = FailingClient()
+    try:
+        for _ in range(3):
+            try:
+                get_current_user(_credentials(unknown_role_token))
+            except HTTPException as error:
+                assert error.status_code == 401
+            else:
+                raise AssertionError("El token de un rol desconocido debió rechazarse")
+        # Una versión más nueva se acepta (sus permisos firmados son los actuales)
+        for index in range(3):
+            user = get_current_user(_credentials(newer_token(f"user-newer-{index}")))
+            assert user["permissions_version"] == version + 5
+    finally:
+        permission_matrix.role_repository.client = client
+    assert permission_matrix.role_version(role_id) == version
+    print("✅ Rol desconocido: 401 sin consultas; versión más nueva: aceptada sin recargar en cada petición")
+
+
+if __name__ == "__main__":
+    test_token_carries_role_permissions()
+    test_permission_change_forces_new_token()
+    test_refresh_detects_changes_from_other_workers()
+    test_newer_token_version_refreshes_stale_worker()
+    test_unknown_role_and_newer_versions_do_not_hit_the_database()
+    print("\n🎉 Claims de permisos validados")
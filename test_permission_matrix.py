@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test de la autorización por permisos (matriz RBAC en memoria).
+Valida que la matriz refleja roles y permisos de la base, que las
+comprobaciones no consultan la base y que asignar/quitar permisos la recarga.
+"""
+
+from fastapi import HTTPException
+
+from src.modules.User.infrastructure.api.dependencies import require_permission
+from src.modules.User.infrastructure.authorization import PermissionMatrix
+from src.modules.User.infrastructure.repositories.permission_repository import PermissionRepository
+
+
+class FailingClient:
+    """Cliente que falla si se consulta: las comprobaciones no deben tocar la base."""
+
+    def execute(self, query, params=None):
+        raise AssertionError(f"Consulta inesperada en el camino de la petición: {query}")
+
+
+def test_matrix_reflects_seeded_roles():
+    print("🧪 Test Permission Matrix - roles por defecto")
+    print("=" * 50)
+
+    matrix = PermissionMatrix()
+    try:
+        matrix.load()
+        matrix.role_repository.client = FailingClient()
+        matrix.permission_repository.client = FailingClient()
+
+        assert matrix.has_permission("uuid-role-admin", "manage_inventory")
+        assert matrix.has_permission("uuid-role-employee", "manage_inventory")
+        assert not matrix.has_permission("uuid-role-waiter", "manage_inventory")
+        assert matrix.has_permission("uuid-role-waiter", "manage_orders")
+        assert not matrix.has_permission("rol-inexistente", "manage_orders")
+        assert not matrix.has_permission("uuid-role-admin", "permiso_inexistente")
+        assert set(matrix.permissions_for_role("uuid-role-waiter")) == {"manage_orders", "view_tables"}
+    finally:
+        matrix.stop_auto_refresh()
+    print("✅ Admin, employee y waiter con sus permisos; sin consultas por comprobación")
+
+
+def test_writes_reload_matrix():
+    print("🧪 Test Permission Matrix - invalidación")
+
+    role_id = "uuid-role-waiter"
+    repository = PermissionRepository()
+    permission = repository.find_by_name("view_reports")
+    matrix = PermissionMatrix()
+    matrix.load()
+    assert not matrix.has_permission(role_id, "view_reports")
+
+    try:
+        assert repository.assign_to_role(role_id, permission.id)
+        assert not repository.assign_to_role(role_id, permission.id), "La asignación debe ser idempotente"
+        assert matrix.has_permission(role_id, "view_reports"), "La matriz no se recargó tras asignar"
+
+        assert repository.revoke_from_role(role_id, permission.id)
+        assert not repository.revoke_from_role(role_id, permission.id)
+        assert not matrix.has_permission(role_id, "view_reports"), "La matriz no se recargó tras quitar"
+        print("✅ Asignar y quitar permisos recarga la matriz de inmediato")
+    finally:
+        repository.revoke_from_role(role_id, permission.id)
+        matrix.stop_auto_refresh()
+
+
+def test_failed_reload_keeps_matrix_and_listener_is_removed():
+    print("🧪 Test Permission Matrix - recarga fallida y baja del listener")
+
+    matrix = PermissionMatrix()
+    matrix.load()
+    loads = matrix.stats()["loads_total"]
+    role_client = matrix.role_repository.client
+    matrix.role_repository.client = FailingClient()
+    matrix.permission_repository.client = FailingClient()
+
+    # La base no responde: se conserva la matriz anterior y las comprobaciones no la consultan
+    matrix.invalidate()
+    assert matrix.stats()["loaded"] and matrix.stats()["loads_total"] == loads
+    assert matrix.has_permission("uuid-role-waiter", "manage_orders")
+
+    # Tras detenerla, las escrituras de permisos ya no la recargan
+    assert matrix.invalidate in PermissionRepository._change_listeners
+    matrix.stop_auto_refresh()
+    assert matrix.invalidate not in PermissionRepository._change_listeners
+    PermissionRepository.notify_change()
+    assert matrix.has_permission("uuid-role-waiter", "manage_orders")
+    matrix.role_repository.client = role_client
+    print("✅ Una recarga fallida conserva la matriz y stop_auto_refresh quita el listener")
+
+
+def test_require_permission_dependency():
+    print("🧪 Test Permission Matrix - dependencia require_permission")
+
+    dependency = require_permission("manage_inventory")
+    admin = {"id": "u1", "email": "admin@test.com", "role_id": "uuid-role-admin"}
+    assert dependency(user=admin) == admin
+
+    waiter = {"id": "u2", "email": "waiter@test.com", "role_id": "uuid-role-waiter"}
+    try:
+        dependency(user=waiter)
+    except HTTPException as error:
+        assert error.status_code == 403
+    else:
+        raise AssertionError("Un mesero no debe gestionar inventario")
+    print("✅ 403 para roles sin el permiso")
+
+
+if __name__ == "__main__":
+    test_matrix_reflects_seeded_roles()
+    test_writes_reload_matrix()
+    test_failed_reload_keeps_matrix_and_listener_is_removed()
+    test_require_permission_dependency()
+    print("\n🎉 Autorización por permisos validada")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Test de las sesiones de refresh token.
+Valida el flujo login -> refresh (con rotación) -> logout contra el servidor,
+la detección de reutilización de un refresh token ya rotado, y que el filtro
+de sesiones revocadas responde sin consultar la base y se sincroniza con las
+revocaciones de otros workers.
+También valida que cambiar el rol cierra las sesiones del usuario y que la
+limpieza borra las sesiones expiradas y reduce el filtro al recargarlo.
+Requiere el servidor corriendo en http://localhost:8000.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import requests
+
+from src.modules.User.domain.entities.session import Session
+from src.modules.User.infrastructure.authorization import RevokedSessionFilter
+from src.modules.User.infrastructure.repositories.session_repository import SessionRepository
+from src.shared.infrastructure.cache import BloomFilter
+
+BASE_URL = "http://localhost:8000"
+
+
+class FailingClient:
+    """Cliente que falla si se consulta: la comprobación debe ser en memoria."""
+
+    def execute(self, query, params=None):
+        raise AssertionError(f"Consulta inesperada en el camino de la petición: {query}")
+
+
+_email = None
+
+
+def _login() -> dict:
+    # Un solo usuario por módulo (cada login abre su propia sesión): menos
+    # solicitudes contra el límite por IP de los endpoints de autenticación
+    global _email
+    if _email is None:
+        _email = f"sesion_{uuid.uuid4().hex[:8]}@test.com"
+        requests.post(f"{BASE_URL}/api/auth/register", json={
+            "name": "Usuario Sesion",
+            "email": _email,
+            "password": "TestPass123!",
+        })
+    response = requests.post(f"{BASE_URL}/api/auth/login", json={"email": _email, "password": "TestPass123!"})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _me(access_token: str) -> int:
+    # Cualquier endpoint protegido con get_current_user
+    return requests.get(
+        f"{BASE_URL}/api/orders", headers={"Authorization": f"Bearer {access_token}"}
+    ).status_code
+
+
+def test_refresh_rotates_and_detects_reuse():
+    print("🧪 Test Sesiones - refresh con rotación")
+    print("=" * 50)
+
+    login = _login()
+    assert login["refresh_token"], "El login no devolvió refresh token"
+
+    response = requests.post(f"{BASE_URL}/api/auth/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 200, response.text
+    renewed = response.json()
+    assert renewed["refresh_token"] != login["refresh_token"], "El refresh token no rotó"
+    assert renewed["user"]["id"] == login["user"]["id"]
+    assert _me(renewed["access_token"]) == 200
+
+    # Reutilizar el refresh token anterior revoca la sesión completa
+    response = requests.post(f"{BASE_URL}/api/auth/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 401
+    response = requests.post(f"{BASE_URL}/api/auth/refresh", json={"refresh_token": renewed["refresh_token"]})
+    assert response.status_code == 401, "La sesión debió revocarse al detectar la reutilización"
+    assert _me(renewed["access_token"]) == 401
+
+    assert requests.post(f"{BASE_URL}/api/auth/refresh", json={"refresh_token": "no-es-un-token"}).status_code == 401
+    print("✅ Refresh rota el token; reutilizar uno viejo cierra la sesión")
+
+
+def test_logout_revokes_access_and_refresh_tokens():
+    print("🧪 Test Sesiones - logout")
+
+    login = _login()
+    headers = {"Authorization": f"Bearer {login['access_token']}"}
+    assert _me(login["access_token"]) == 200  # queda en la caché de JWT
+
+    assert requests.post(f"{BASE_URL}/api/auth/logout", headers=headers).status_code == 204
+    assert _me(login["access_token"]) == 401, "El access token de una sesión cerrada siguió funcionando"
+    response = requests.post(f"{BASE_URL}/api/auth/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 401
+    print("✅ Logout invalida el access token (aunque esté en caché) y el refresh token")
+
+
+def test_revoked_filter_in_memory_and_sync():
+    print("🧪 Test Sesiones - filtro de revocadas")
+
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    members = [str(uuid.uuid4()) for _ in range(1000)]
+    for member in members:
+        bloom.add(member)
+    assert all(bloom.might_contain(member) for member in members), "Un Bloom no puede dar falsos negativos"
+    false_positives = sum(bloom.might_contain(str(uuid.uuid4())) for _ in range(10000))
+    assert false_positives < 300, f"{false_positives} falsos positivos en 10000"
+
+    repository = SessionRepository()
+    session, _ = Session.open(f"user-{uuid.uuid4().hex[:8]}", expires_in_days=1)
+    repository.save(session)
+
+    revocation_filter = RevokedSessionFilter(repository, capacity=4)
+    revocation_filter.load()
+    assert not revocation_filter.is_revoked(session.id)
+
+    # Otro worker revoca la sesión: la sincronización incremental la trae
+    assert SessionRepository().revoke(session.id)
+    assert not revocation_filter.is_revoked(session.id)
+    revocation_filter.sync()
+
+    client = repository.client
+    repository.client = FailingClient()
+    try:
+        assert revocation_filter.is_revoked(session.id)
+        # Superar la capacidad reconstruye el filtro sin perder elementos
+        extra = [str(uuid.uuid4()) for _ in range(10)]
+        revocation_filter.add_many(extra)
+        assert all(revocation_filter.is_revoked(session_id) for session_id in extra + [session.id])
+        assert not revocation_filter.is_revoked(str(uuid.uuid4()))
+    finally:
+        repository.client = client
+    print(f"✅ Bloom con {false_positives} falsos positivos en 10000; revocaciones sincronizadas y en memoria")
+
+
+def test_role_change_revokes_sessions():
+    print("🧪 Test Sesiones - cambio de rol")
+
+    login = _login()
+    assert _me(login["access_token"]) == 200
+
+    new_role = "waiter" if login["user"]["role_id"] == "uuid-role-employee" else "employee"
+    response = requests.put(
+        f"{BASE_URL}/api/roles/users/{login['user']['id']}/role", json={"role": new_role}
+    )
+    assert response.status_code == 200, response.text
+    assert _me(login["access_token"]) == 401, "El token emitido con el rol anterior siguió funcionando"
+    # El refresh token también queda inservible: la sesión está revocada en la base
+    session = SessionRepository().find_by_id(Session.parse_session_id(login["refresh_token"]))
+    assert session is not None and not session.is_active()
+    print("✅ Cambiar el rol revoca las sesiones abiertas del usuario")
+
+
+def test_cleanup_purges_expired_sessions_and_shrinks_filter():
+    print("🧪 Test Sesiones - limpieza de expiradas")
+
+    repository = SessionRepository()
+    user_id = f"user-{uuid.uuid4().hex[:8]}"
+    expired = []
+    for _ in range(3):
+        session, _ = Session.open(user_id, expires_in_days=1)
+        session.expires_at = datetime.now() - timedelta(minutes=5)
+        repository.save(session)
+        expired.append(session)
+    live, _ = Session.open(user_id, expires_in_days=1)
+    repository.save(live)
+
+    revocation_filter = RevokedSessionFilter(repository, capacity=4)
+    revocation_filter.load()
+    revocation_filter.add_many(session.id for session in expired)
+    revocation_filter.add_many(str(uuid.uuid4()) for _ in range(10))
+    grown_capacity = revocation_filter.capacity
+    assert grown_capacity > 4
+
+    # Lotes de una fila: todas las expiradas acaban borradas, la vigente no
+    purged = 0
+    while True:
+        deleted = repository.purge_expired(datetime.now(), batch_size=1)
+        purged += deleted
+        if deleted < 1:
+            break
+    assert purged >= len(expired)
+    assert all(repository.find_by_id(session.id) is None for session in expired)
+    assert repository.find_by_id(live.id) is not None
+
+    # Recargar descarta las revocaciones que ya no están en la base y vuelve a la capacidad configurada
+    revocation_filter.load()
+    assert not any(revocation_filter.is_revoked(session.id) for session in expired)
+    assert revocation_filter.capacity < grown_capacity
+    print(f"✅ {purged} sesiones expiradas borradas; el filtro pasó de {grown_capacity} a {revocation_filter.capacity}")
+
+
+if __name__ == "__main__":
+    test_refresh_rotates_and_detects_reuse()
+    test_logout_revokes_access_and_refresh_tokens()
+    test_revoked_filter_in_memory_and_sync()
+    test_role_change_revokes_sessions()
+    test_cleanup_purges_expired_sessions_and_shrinks_filter()
+    print("\n🎉 Sesiones de refresh token validadas")
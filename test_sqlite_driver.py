@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test del driver SQLite local.
+Valida la selección de driver por URL, la forma de los resultados
+(.rows / fetchone / fetchall), los PRAGMAs de rendimiento y la atomicidad
+de batch() sin depender de Turso DB.
+"""
+
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+from src.shared.infrastructure.database.drivers import QueryResult, SQLiteDriver, create_driver, is_local_url
+from src.shared.infrastructure.database.drivers.sqlite_driver import parse_sqlite_url
+
+
+def _make_driver(directory: Path, **kwargs) -> SQLiteDriver:
+    driver = SQLiteDriver(f"file:{directory / 'kitchai_test.db'}", **kwargs)
+    driver.execute("CREATE TABLE roles (id TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+    return driver
+
+
+def test_driver_selected_by_url_scheme():
+    print("🧪 Test Driver SQLite - selección por URL")
+    print("=" * 50)
+
+    assert is_local_url("file:kitchai.db")
+    assert is_local_url("sqlite:///kitchai.db")
+    assert not is_local_url("libsql://kitchai.turso.io")
+    assert not is_local_url("https://kitchai.turso.io")
+
+    assert parse_sqlite_url("sqlite:///data/kitchai.db") == ("data/kitchai.db", False)
+    assert parse_sqlite_url("sqlite:////tmp/kitchai.db") == ("/tmp/kitchai.db", False)
+    assert parse_sqlite_url("file:kitchai.db?mode=ro") == ("file:kitchai.db?mode=ro", True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = create_driver(f"sqlite:///{tmp}/kitchai_test.db")
+        assert isinstance(driver, SQLiteDriver)
+        driver.close()
+    print("✅ file: y sqlite: usan el driver SQLite; el resto usa libsql")
+
+
+def test_result_shape():
+    print("🧪 Test Driver SQLite - forma de los resultados")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = _make_driver(Path(tmp))
+        insert = driver.execute("INSERT INTO roles (id, name) VALUES (?, ?)", ["r1", "admin"])
+        assert insert.rows_affected == 1
+        assert insert.last_insert_rowid is not None
+
+        result = driver.execute("SELECT id, name FROM roles WHERE id = ?", ["r1"])
+        assert isinstance(result, QueryResult)
+        assert result.columns == ("id", "name")
+        assert result.rows[0][1] == "admin"
+        assert result.fetchone()["name"] == "admin"
+        assert len(result.fetchall()) == 1
+        assert driver.execute("SELECT * FROM roles WHERE id = 'x'").fetchone() is None
+
+        # execute_async devuelve el mismo resultado desde código asíncrono
+        result = asyncio.run(driver.execute_async("SELECT id, name FROM roles WHERE id = ?", ["r1"]))
+        assert isinstance(result, QueryResult) and result.fetchone()["name"] == "admin"
+        driver.close()
+    print("✅ .rows, .columns, fetchone() y fetchall() igual que el ResultSet de libsql (también en execute_async)")
+
+
+def test_pragmas_applied():
+    print("🧪 Test Driver SQLite - PRAGMAs")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = _make_driver(Path(tmp), synchronous="NORMAL", mmap_size=64 * 1024 * 1024)
+        assert driver.execute("PRAGMA journal_mode").rows[0][0] == "wal"
+        assert driver.execute("PRAGMA synchronous").rows[0][0] == 1  # NORMAL
+        assert driver.execute("PRAGMA mmap_size").rows[0][0] == 64 * 1024 * 1024
+        driver.close()
+    print("✅ WAL, synchronous=NORMAL y mmap_size configurados en cada conexión")
+
+
+def test_batch_is_atomic():
+    print("🧪 Test Driver SQLite - batch atómico")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = _make_driver(Path(tmp))
+        results = driver.batch([
+            ("INSERT INTO roles (id, name) VALUES (?, ?)", ["r1", "admin"]),
+            ("INSERT INTO roles (id, name) VALUES (?, ?)", ["r2", "waiter"]),
+        ])
+        assert len(results) == 2
+
+        try:
+            driver.batch([
+                ("INSERT INTO roles (id, name) VALUES (?, ?)", ["r3", "employee"]),
+                ("INSERT INTO roles (id, name) VALUES (?, ?)", ["r4", "admin"]),  # nombre duplicado
+            ])
+        except Exception:
+            failed = True
+        else:
+            failed = False
+
+        total = driver.execute("SELECT COUNT(*) FROM roles").rows[0][0]
+        driver.close()
+
+    assert failed, "El lote con un nombre duplicado debió fallar"
+    assert total == 2, f"El lote fallido no se revirtió ({total} filas)"
+    print("✅ Un error dentro del lote revierte todas sus sentencias")
+
+
+def test_connections_per_thread():
+    print("🧪 Test Driver SQLite - conexiones por hilo")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        driver = _make_driver(Path(tmp))
+        driver.execute("INSERT INTO roles (id, name) VALUES ('r1', 'admin')")
+        counts = []
+
+        def read():
+            for _ in range(50):
+                counts.append(driver.execute("SELECT COUNT(*) FROM roles").rows[0][0])
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = driver.stats()
+        driver.close()
+
+    assert counts == [1] * 200
+    assert stats["connections"] == 5, f"Se esperaban 5 conexiones, hay {stats['connections']}"
+    print("✅ Cada hilo lee con su propia conexión sobre el mismo archivo")
+
+
+if __name__ == "__main__":
+    test_driver_selected_by_url_scheme()
+    test_result_shape()
+    test_pragmas_applied()
+    test_batch_is_atomic()
+    test_connections_per_thread()
+    print("\n🎉 Driver SQLite validado")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test del descuento de stock atómico (UPDATE condicional + RETURNING).
+Valida que descuentos concurrentes no pierden actualizaciones, que un pedido
+con una línea sin stock no descuenta ninguna y que se informan las líneas que
+fallaron.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import uuid
+
+from src.modules.Inventory.domain.entities.inventory_item import InventoryItem
+from src.modules.Inventory.domain.entities.stock_shortage import InsufficientStockError
+from src.modules.Inventory.infrastructure.repositories.inventory_repository import InventoryRepository
+from src.shared.infrastructure.database.unit_of_work import UnitOfWork
+
+
+def _create_item(repo: InventoryRepository, quantity: float, minimum_stock: float = 0) -> InventoryItem:
+    now = datetime.now()
+    return repo.create(InventoryItem(
+        id=str(uuid.uuid4()),
+        name=f"Insumo {uuid.uuid4().hex[:6]}",
+        category="test",
+        current_quantity=quantity,
+        minimum_stock=minimum_stock,
+        unit="kg",
+        created_at=now,
+        updated_at=now,
+    ))
+
+
+def test_returning_values():
+    print("🧪 Test Stock Deduction - RETURNING")
+    print("=" * 50)
+
+    repo = InventoryRepository()
+    flour = _create_item(repo, 10)
+    sugar = _create_item(repo, 4)
+
+    # Las líneas repetidas del mismo artículo se acumulan
+    updated = repo.deduct_stock_bulk([(flour.id, 2), (sugar.id, 1), (flour.id, 3)])
+    quantities = {item.id: item.current_quantity for item in updated}
+    assert quantities == {flour.id: 5, sugar.id: 3}, quantities
+    assert repo.get_by_id(flour.id).current_quantity == 5
+    print("✅ Un solo batch devuelve el stock actualizado de cada artículo")
+
+
+def test_failed_line_deducts_nothing():
+    print("🧪 Test Stock Deduction - sin descuentos parciales")
+
+    repo = InventoryRepository()
+    flour = _create_item(repo, 10)
+    sugar = _create_item(repo, 1)
+    missing_id = str(uuid.uuid4())
+
+    try:
+        repo.deduct_stock_bulk([(flour.id, 2), (sugar.id, 3), (missing_id, 1)])
+    except InsufficientStockError as error:
+        shortages = {shortage.inventory_item_id: shortage for shortage in error.shortages}
+    else:
+        shortages = None
+
+    assert shortages is not None, "Se esperaba InsufficientStockError"
+    assert set(shortages) == {sugar.id, missing_id}, shortages
+    assert shortages[sugar.id].available == 1 and shortages[sugar.id].requested == 3
+    assert repo.get_by_id(flour.id).current_quantity == 10, "La harina se descontó a medias"
+
+    # Dentro de una UnitOfWork el fallo se detecta al confirmar
+    try:
+        with UnitOfWork():
+            repo.deduct_stock_bulk([(flour.id, 2), (sugar.id, 3)])
+    except InsufficientStockError as error:
+        assert [shortage.inventory_item_id for shortage in error.shortages] == [sugar.id]
+    else:
+        raise AssertionError("La unidad de trabajo debió fallar")
+    assert repo.get_by_id(flour.id).current_quantity == 10
+    print("✅ Ninguna línea se descuenta y se informan las que fallaron")
+
+
+def test_concurrent_deductions_do_not_oversell():
+    print("🧪 Test Stock Deduction - concurrencia")
+
+    repo = InventoryRepository()
+    item = _create_item(repo, 5)
+
+    def confirm_order(_):
+        try:
+            InventoryRepository().deduct_stock_bulk([(item.id, 5)])
+            return True
+        except InsufficientStockError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        outcomes = list(executor.map(confirm_order, range(6)))
+
+    assert outcomes.count(True) == 1, f"Solo un pedido tenía stock: {outcomes}"
+    assert repo.get_by_id(item.id).current_quantity == 0
+    print("✅ 6 confirmaciones simultáneas: una descuenta, el resto se rechaza")
+
+
+if __name__ == "__main__":
+    test_returning_values()
+    test_failed_line_deducts_nothing()
+    test_concurrent_deductions_do_not_oversell()
+    print("\n🎉 Descuento de stock atómico validado")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test de la caché de JWT verificados.
+Valida la caché LRU con TTL y que get_current_user sirve tokens repetidos desde
+la caché sin aceptar tokens manipulados ni expirados.
+"""
+
+from datetime import datetime, timedelta
+import time
+
+import jwt
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.modules.User.infrastructure.api.auth_router import get_current_user, token_cache
+from src.shared.infrastructure.cache import TTLLRUCache
+from src.shared.infrastructure.config.settings import settings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _token(expires_in: timedelta, user_id: str = "user-cache") -> str:
+    payload = {
+        "user_id": user_id,
+        "email": "cache@test.com",
+        "role_id": "uuid-role-waiter",
+        "exp": datetime.utcnow() + expires_in,
+        "iat": datetime.utcnow(),
+    }
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+def test_ttl_lru_cache():
+    print("🧪 Test Token Cache - LRU con TTL")
+    print("=" * 50)
+
+    clock = FakeClock()
+    cache = TTLLRUCache(max_entries=2, clock=clock)
+    cache.set("a", 1, expires_at=clock.now + 10)
+    cache.set("b", 2, expires_at=clock.now + 10)
+    assert cache.get("a") == 1  # "a" pasa a ser la más reciente
+    cache.set("c", 3, expires_at=clock.now + 10)
+    assert cache.get("b") is None, "Debió descartarse la entrada menos usada"
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    clock.now += 11
+    assert cache.get("a") is None, "La entrada expirada se siguió sirviendo"
+
+    stats = cache.stats()
+    assert stats["hits"] == 3 and stats["misses"] == 2
+    assert stats["evictions"] == 1 and stats["expirations"] == 1
+    print("✅ Descarte LRU, expiración por entrada y contadores")
+
+
+def test_get_current_user_uses_cache():
+    print("🧪 Test Token Cache - get_current_user")
+
+    token = _token(timedelta(minutes=5))
+    hits_before = token_cache.stats()["hits"]
+    first = get_current_user(_credentials(token))
+    second = get_current_user(_credentials(token))
+    assert first == second == {
+        "id": "user-cache",
+        "email": "cache@test.com",
+        "role_id": "uuid-role-waiter",
+        "permissions": None,
+        "permissions_version": None,
+        "session_id": None,
+    }
+    assert token_cache.stats()["hits"] == hits_before + 1, "La segunda resolución no usó la caché"
+
+    # Modificar el usuario devuelto no altera la entrada cacheada
+    second["role_id"] = "uuid-role-admin"
+    assert get_current_user(_credentials(token))["role_id"] == "uuid-role-waiter"
+
+    # Un token con la firma alterada no coincide con ninguna entrada y se rechaza
+    tampered = token[:-2] + ("AA" if token[-2:] != "AA" else "BB")
+    try:
+        get_current_user(_credentials(tampered))
+    except HTTPException as error:
+        assert error.status_code == 401
+    else:
+        raise AssertionError("Se aceptó un token manipulado")
+    print("✅ Token repetido servido desde la caché; token manipulado rechazado")
+
+
+def test_cached_token_expires_with_exp():
+    print("🧪 Test Token Cache - expiración")
+
+    token = _token(timedelta(seconds=1), user_id="user-short")
+    assert get_current_user(_credentials(token))["id"] == "user-short"
+    time.sleep(1.2)
+    try:
+        get_current_user(_credentials(token))
+    except HTTPException as error:
+        assert error.status_code == 401 and error.detail == "Token expirado"
+    else:
+        raise AssertionError("Se sirvió desde la caché un token expirado")
+    print("✅ La entrada caduca con el exp del token")
+
+
+if __name__ == "__main__":
+    test_ttl_lru_cache()
+    test_get_current_user_uses_cache()
+    test_cached_token_expires_with_exp()
+    print("\n🎉 Caché de tokens validada")
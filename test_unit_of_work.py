@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test de la unidad de trabajo (UnitOfWork).
+Valida que las escrituras de varios repositorios se confirman juntas en un
+único batch, que un fallo a mitad de camino no deja cambios parciales y que
+execute_async respeta la unidad de trabajo igual que execute.
+"""
+
+import asyncio
+import uuid
+
+from src.shared.infrastructure.database.turso_connection import turso_db
+from src.shared.infrastructure.database.unit_of_work import UnitOfWork, current_unit_of_work
+
+
+def _create_stock_table() -> str:
+    table = f"uow_test_stock_{uuid.uuid4().hex[:8]}"
+    turso_db.execute(
+        f"""
+        CREATE TABLE {table} (
+            id TEXT PRIMARY KEY,
+            quantity REAL NOT NULL CHECK (quantity >= 0)
+        )
+        """
+    )
+    turso_db.execute(f"INSERT INTO {table} (id, quantity) VALUES ('a', 5), ('b', 1)")
+    return table
+
+
+def _quantities(table: str) -> dict:
+    result = turso_db.execute(f"SELECT id, quantity FROM {table} ORDER BY id")
+    return {row[0]: row[1] for row in result.rows}
+
+
+def test_writes_are_committed_together():
+    print("🧪 Test Unit of Work - confirmación en un solo batch")
+    print("=" * 50)
+
+    table = _create_stock_table()
+    try:
+        batches = []
+        original_batch = turso_db.batch
+
+        def counting_batch(statements):
+            batches.append(len(statements))
+            return original_batch(statements)
+
+        turso_db.batch = counting_batch
+        try:
+            with UnitOfWork():
+                turso_db.execute(f"UPDATE {table} SET quantity = quantity - 2 WHERE id = 'a'")
+                with UnitOfWork():  # anidada: se une a la exterior
+                    turso_db.execute(f"UPDATE {table} SET quantity = quantity - 1 WHERE id = 'b'")
+                # Las lecturas ven el estado confirmado, no las escrituras pendientes
+                assert _quantities(table) == {"a": 5, "b": 1}
+        finally:
+            del turso_db.batch
+
+        assert current_unit_of_work() is None
+        assert batches == [2], f"Se esperaba un único batch de 2 sentencias, hubo {batches}"
+        assert _quantities(table) == {"a": 3, "b": 0}
+        print("✅ Dos escrituras (una en unidad anidada) confirmadas en un solo batch")
+    finally:
+        turso_db.execute(f"DROP TABLE {table}")
+
+
+def test_failure_leaves_no_partial_changes():
+    print("🧪 Test Unit of Work - sin cambios parciales")
+
+    table = _create_stock_table()
+    try:
+        # Error de la aplicación antes de confirmar: se descarta todo
+        try:
+            with UnitOfWork():
+                turso_db.execute(f"UPDATE {table} SET quantity = quantity - 1 WHERE id = 'a'")
+                raise ValueError("fallo de negocio")
+        except ValueError:
+            pass
+        assert _quantities(table) == {"a": 5, "b": 1}
+
+        # Una sentencia del batch viola el CHECK: se revierte el batch completo
+        try:
+            with UnitOfWork():
+                turso_db.execute(f"UPDATE {table} SET quantity = quantity - 2 WHERE id = 'a'")
+                turso_db.execute(f"UPDATE {table} SET quantity = quantity - 2 WHERE id = 'b'")
+        except Exception:
+            failed = True
+        else:
+            failed = False
+
+        assert failed, "El batch con stock negativo debió fallar"
+        assert _quantities(table) == {"a": 5, "b": 1}, "El descuento de 'a' no se revirtió"
+        print("✅ Un fallo antes o durante la confirmación no deja inventario a medias")
+    finally:
+        turso_db.execute(f"DROP TABLE {table}")
+
+
+def test_execute_async_joins_unit_of_work():
+    print("🧪 Test Unit of Work - execute_async")
+
+    table = _create_stock_table()
+    try:
+        async def scenario():
+            with UnitOfWork():
+                await turso_db.execute_async(f"UPDATE {table} SET quantity = quantity - 2 WHERE id = 'a'")
+                # La lectura asíncrona va a la base y todavía no ve la escritura pendiente
+                pending = await turso_db.execute_async(f"SELECT quantity FROM {table} WHERE id = 'a'")
+                assert pending.rows[0][0] == 5
+            confirmed = await turso_db.execute_async(f"SELECT quantity FROM {table} WHERE id = 'a'")
+            return confirmed.rows[0][0]
+
+        assert asyncio.run(scenario()) == 3
+        print("✅ Las escrituras de execute_async se confirman con la unidad de trabajo")
+    finally:
+        turso_db.execute(f"DROP TABLE {table}")
+
+
+if __name__ == "__main__":
+    test_writes_are_committed_together()
+    test_failure_leaves_no_partial_changes()
+    test_execute_async_joins_unit_of_work()
+    print("\n🎉 Unit of Work validada")